@@ -41,6 +41,10 @@ THEME_OPTIONS: List[str] = [THEME_DARK]
 DEFAULT_THEME: str = THEME_DARK
 CURRENT_THEME: str = DEFAULT_THEME
 
+# Compiled theme cache (QSS + palette stored next to each style.json, keyed by its hash)
+THEME_CACHE_ENABLED: bool = True
+THEME_CACHE_FILENAME: str = "style.compiled.json"
+
 # Theme Defaults
 THEME_DEFAULTS: Dict[str, str] = {
     'font_family': 'Arial',
@@ -99,6 +103,43 @@ BACKUP_COUNT: int = 5
 LOG_TIMESTAMP_FORMAT: str = '%Y-%m-%d'
 LOG_FILENAME_TEMPLATE: str = 'log_{timestamp}.log'
 
+# Structured Logging
+STRUCTURED_LOGGING: bool = False  # Write compact JSONL records instead of the text log file
+STRUCTURED_LOG_FILENAME_TEMPLATE: str = 'log_{timestamp}.jsonl'
+COMPRESS_LOG_BACKUPS: bool = True  # gzip rotated log files
+# Keep only a fraction of DEBUG records per category ("module" or "module.function" prefix)
+DEBUG_LOG_SAMPLING: Dict[str, float] = {
+    'Page.handle_ai_response': 0.1,
+    'Page.update_token_counter': 0.05,
+}
+
+# Tracing / Profiling
+TRACING_ENABLED: bool = False  # Record hot-path spans (can also be set with NODEX_TRACE=1)
+TRACE_BUFFER_SIZE: int = 50000  # Number of spans kept in the ring buffer
+TRACE_EXPORT_DIR: str = "./logs/traces"
+
+# Startup Profiling (enable with NODEX_PROFILE_IMPORTS=1)
+STARTUP_PROFILE_DIR: str = "./logs/startup"
+STARTUP_IMPORT_BUDGET_MS: int = 1500  # Import time allowed before the main window is shown
+# Packages that must not be imported before the main window is shown
+STARTUP_HEAVY_MODULES: List[str] = [
+    'langchain', 'langchain_core', 'langchain_community', 'langchain_openai',
+    'langchain_anthropic', 'langchain_groq', 'langchain_google_genai', 'langchain_huggingface',
+    'openai', 'anthropic', 'pandas', 'faster_whisper', 'ctranslate2', 'pyaudio',
+    'torch', 'transformers', 'sentence_transformers',
+]
+# Modules imported on the critical path from launch to the first window
+STARTUP_CRITICAL_MODULES: List[str] = [
+    'Config.AppConfig.config', 'log.logger', 'log.tracer', 'Styles.theme_manager',
+    'frontend.DynamicMain.error_handler', 'frontend.DynamicMain.ui_setup',
+    'frontend.DynamicMain.page_manager', 'frontend.DynamicMain.keybindings',
+]
+
+# Markdown/CSV Extraction
+EXTRACTION_PROGRESS_MAX_RATE: int = 10  # Progress/status signals per second per worker
+EXTRACTION_MAX_WORKERS: int = 2  # Presets extracted concurrently
+EXTRACTION_WRITE_WORKERS: int = 8  # Threads writing recovered files in the reverse extractors
+
 # Error Messages
 ERROR_MESSAGES: Dict[str, str] = {
     "page_not_found": "Page '{page_name}' not found.",
@@ -120,6 +161,13 @@ SENSITIVE_PATTERNS: List[str] = [
 LAST_PAGE_KEY: str = "last_page"
 DEFAULT_LAST_PAGE: str = ""
 
+# Page Discovery
+PAGE_MANIFEST_FILENAME: str = "page.json"  # title/icon/order read without importing the page
+LAZY_PAGE_LOADING: bool = True  # Import a page module on first navigation
+PAGE_PREFETCH_ENABLED: bool = True  # Import likely-next pages in the background after the first paint
+PAGE_PREFETCH_DELAY_MS: int = 1500
+PAGE_PREFETCH_COUNT: int = 2
+
 # Feature Toggles
 DEBUG_WORKFLOW: bool = True
 ENABLE_BACKUP: bool = True
@@ -259,14 +307,22 @@ __all__ = [
     'UI_ICON_SIZE', 'UI_STATUS_TIMEOUT',
     'UI_FONT_SIZES',
     'THEME_DARK', 'THEME_LIGHT', 'THEME_OPTIONS', 'DEFAULT_THEME', 
-    'CURRENT_THEME', 'THEME_DEFAULTS',
+    'CURRENT_THEME', 'THEME_DEFAULTS', 'THEME_CACHE_ENABLED', 'THEME_CACHE_FILENAME',
     'DESKTOP_LAYOUT_DIR', 'ANDROID_LAYOUT_DIR', 'CONSTANTS_DIR', 'UTILS_DIR', 
     'LOGS_DIR', 'SYSTEM_PROMPTS_PATH', 'OUTPUT_DIRECTORY', 'LOG_DIR', 'LOG_FILE',
     'FILE_ENCODING', 'FILE_EXTENSIONS',
     'LOG_COLORS', 'LOGGING_LEVEL', 'MAX_LOG_FILE_SIZE', 'BACKUP_COUNT',
     'LOG_TIMESTAMP_FORMAT', 'LOG_FILENAME_TEMPLATE',
+    'STRUCTURED_LOGGING', 'STRUCTURED_LOG_FILENAME_TEMPLATE', 'COMPRESS_LOG_BACKUPS',
+    'DEBUG_LOG_SAMPLING',
+    'TRACING_ENABLED', 'TRACE_BUFFER_SIZE', 'TRACE_EXPORT_DIR',
+    'STARTUP_PROFILE_DIR', 'STARTUP_IMPORT_BUDGET_MS', 'STARTUP_HEAVY_MODULES',
+    'STARTUP_CRITICAL_MODULES',
+    'EXTRACTION_PROGRESS_MAX_RATE', 'EXTRACTION_MAX_WORKERS', 'EXTRACTION_WRITE_WORKERS',
     'ERROR_MESSAGES', 'SENSITIVE_PATTERNS',
     'LAST_PAGE_KEY', 'DEFAULT_LAST_PAGE',
+    'PAGE_MANIFEST_FILENAME', 'LAZY_PAGE_LOADING', 'PAGE_PREFETCH_ENABLED',
+    'PAGE_PREFETCH_DELAY_MS', 'PAGE_PREFETCH_COUNT',
     'DEBUG_WORKFLOW', 'ENABLE_BACKUP', 'ENABLE_FORMATTING', 'ENABLE_INTEGRATION',
     'ENABLE_REMOVAL', 'ENABLE_VALIDATION', 'ENABLE_VERSION_CONTROL', 'STRICT_PARSING',
     'CREATE_MISSING_MODULES', 'PRESERVE_FORMATTING', 'USE_WORKSPACE_ROOT',
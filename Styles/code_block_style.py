@@ -73,8 +73,7 @@ class CodeBlockHighlighter(QSyntaxHighlighter):
         Apply syntax highlighting to the given block of text.
         """
         for pattern, format in self.highlightingRules:
-            expression = QRegularExpression(pattern.pattern())
-            iterator = expression.globalMatch(text)
+            iterator = pattern.globalMatch(text)
             while iterator.hasNext():
                 match = iterator.next()
                 self.setFormat(match.capturedStart(), match.capturedLength(), format)
@@ -163,8 +162,16 @@ def apply_code_block_style(widget, styles):
     """
     try:
         if isinstance(widget, (QTextEdit, QTextBrowser)):
-            highlighter = CodeBlockHighlighter(widget.document(), styles)
-            logger.debug(f"Code block style applied to {widget}.")
+            highlighter = getattr(widget, '_code_block_highlighter', None)
+            if highlighter is not None and highlighter.document() is widget.document():
+                # Reuse the existing highlighter instead of stacking another one on the document
+                highlighter.styles = styles
+                highlighter.highlightingRules = []
+                highlighter.initialize_highlighting_rules()
+                highlighter.rehighlight()
+            else:
+                widget._code_block_highlighter = CodeBlockHighlighter(widget.document(), styles)
+            logger.debug("Code block style applied to %s.", widget)
         else:
             logger.warning("Widget is not a QTextEdit or QTextBrowser. Cannot apply code block style.")
     except Exception as e:
@@ -1,9 +1,12 @@
 # ./shared/theme/theme_manager.py
 
 
+import hashlib
 import json
 import os
 import sys
+import threading
+import weakref
 
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QTextEdit, QTextBrowser
@@ -11,6 +14,7 @@ from PySide6.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QTextE
 from .code_block_style import apply_code_block_style  # Import only the necessary function
 
 from log.logger import logger, message_collector  # **Updated Import**
+from Config.AppConfig.config import THEME_CACHE_ENABLED, THEME_CACHE_FILENAME
 
 # def add_project_subdirectories_to_syspath(root_dir):
 #     """
@@ -29,6 +33,13 @@ class ThemeManager:
     current_theme = None
     current_theme_name = None
     themes = {}
+    theme_paths = {}        # theme name -> style.json path
+    compiled_themes = {}    # theme name -> compiled QSS and palette values
+    _compile_lock = threading.Lock()
+    # Bump when construct_qss/_palette_values change so cached themes are rebuilt
+    COMPILER_VERSION = 2
+    # Text widgets that receive code block highlighting; entries vanish with their widgets
+    text_widgets = weakref.WeakSet()
 
     DEFAULT_THEME = {
         'TYPOGRAPHY': {
@@ -80,14 +91,19 @@ class ThemeManager:
     @staticmethod
     def load_themes(themes_directory="./Styles/theme"):
         """
-        Load all theme JSON files from the specified directory.
+        Discover theme JSON files in the specified directory.
         Each subdirectory represents a theme (e.g., dark, light).
+
+        Theme files are only hashed here. A compiled stylesheet and palette
+        stored next to each style.json is reused when its hash still matches;
+        stale or missing caches are rebuilt on a background thread.
         """
         if not os.path.isdir(themes_directory):
             logger.error(f"Themes directory not found: {themes_directory}")
             message_collector.add_message("themes_directory_missing", f"Themes directory not found: {themes_directory}")
             return
 
+        stale = []
         for theme_name in os.listdir(themes_directory):
             # Skip non-theme directories like __pycache__
             if theme_name == "__pycache__" or not os.path.isdir(os.path.join(themes_directory, theme_name)):
@@ -96,19 +112,109 @@ class ThemeManager:
             theme_dir = os.path.join(themes_directory, theme_name)
             theme_path = os.path.join(theme_dir, "style.json")
             if os.path.isfile(theme_path):
-                with open(theme_path, 'r') as f:
-                    try:
-                        data = json.load(f)
-                        ThemeManager.themes[theme_name] = data
-                        logger.info(f"Loaded theme '{theme_name}' from {theme_path}")
-                        message_collector.add_message("discovered_page", f"Loaded theme '{theme_name}'")
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error decoding JSON for theme '{theme_name}': {e}")
-                        message_collector.add_message("error_decoding_theme", f"Theme '{theme_name}': {str(e)}")
+                ThemeManager.theme_paths[theme_name] = theme_path
+                ThemeManager.themes.pop(theme_name, None)
+                compiled = ThemeManager._read_compiled_cache(theme_name)
+                if compiled is not None:
+                    ThemeManager.compiled_themes[theme_name] = compiled
+                else:
+                    ThemeManager.compiled_themes.pop(theme_name, None)
+                    stale.append(theme_name)
+                logger.info(f"Loaded theme '{theme_name}' from {theme_path}")
+                message_collector.add_message("discovered_page", f"Loaded theme '{theme_name}'")
             else:
                 logger.warning(f"No style.json found for theme '{theme_name}' in {theme_dir}")
                 message_collector.add_message("missing_style_json", f"No style.json found for theme '{theme_name}'")
 
+        if stale and THEME_CACHE_ENABLED:
+            threading.Thread(
+                target=ThemeManager._rebuild_themes, args=(stale,), name="ThemeCompiler", daemon=True
+            ).start()
+
+    @staticmethod
+    def _theme_hash(theme_path):
+        with open(theme_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @staticmethod
+    def _cache_path(theme_name):
+        return os.path.join(os.path.dirname(ThemeManager.theme_paths[theme_name]), THEME_CACHE_FILENAME)
+
+    @staticmethod
+    def _read_compiled_cache(theme_name):
+        """Return the compiled theme from disk if it matches the current style.json, else None."""
+        if not THEME_CACHE_ENABLED:
+            return None
+        try:
+            digest = ThemeManager._theme_hash(ThemeManager.theme_paths[theme_name])
+            with open(ThemeManager._cache_path(theme_name), 'r', encoding='utf-8') as f:
+                compiled = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if compiled.get('hash') != digest or compiled.get('version') != ThemeManager.COMPILER_VERSION:
+            return None
+        return compiled
+
+    @staticmethod
+    def _write_compiled_cache(theme_name, compiled):
+        cache_path = ThemeManager._cache_path(theme_name)
+        temp_path = f"{cache_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(compiled, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write compiled theme cache '{cache_path}': {e}")
+
+    @staticmethod
+    def _get_theme_data(theme_name):
+        """Parse a theme's style.json on first use."""
+        theme = ThemeManager.themes.get(theme_name)
+        if theme is None:
+            with open(ThemeManager.theme_paths[theme_name], 'r') as f:
+                theme = json.load(f)
+            ThemeManager.themes[theme_name] = theme
+        return theme
+
+    @staticmethod
+    def compile_theme(theme_name):
+        """
+        Return {'hash', 'version', 'qss', 'palette', 'theme'} for a theme,
+        building and caching it on disk if there is no up-to-date compiled copy.
+        'theme' is the parsed style.json, so applying a cached theme never has
+        to read the source file.
+        """
+        with ThemeManager._compile_lock:
+            compiled = ThemeManager.compiled_themes.get(theme_name)
+            if compiled is not None:
+                return compiled
+
+            digest = None  # Themes registered only in memory are not cached on disk
+            if theme_name in ThemeManager.theme_paths:
+                digest = ThemeManager._theme_hash(ThemeManager.theme_paths[theme_name])
+            theme = ThemeManager._get_theme_data(theme_name)
+            compiled = {
+                'hash': digest,
+                'version': ThemeManager.COMPILER_VERSION,
+                'qss': ThemeManager.construct_qss(theme),
+                'palette': ThemeManager._palette_values(theme),
+                'theme': theme,
+            }
+            ThemeManager.compiled_themes[theme_name] = compiled
+            if digest and THEME_CACHE_ENABLED:
+                ThemeManager._write_compiled_cache(theme_name, compiled)
+            logger.debug(f"Compiled theme '{theme_name}'")
+            return compiled
+
+    @staticmethod
+    def _rebuild_themes(theme_names):
+        for theme_name in theme_names:
+            try:
+                ThemeManager.compile_theme(theme_name)
+            except Exception as e:
+                logger.error(f"Error compiling theme '{theme_name}': {e}")
+                message_collector.add_message("error_decoding_theme", f"Theme '{theme_name}': {str(e)}")
+
     @staticmethod
     def apply_theme(theme_name='dark'):
         """
@@ -118,19 +224,26 @@ class ThemeManager:
             logger.debug(f"Theme '{theme_name}' is already applied. Skipping re-application.")
             return  # Exit early to prevent duplicate applications
 
-        if theme_name not in ThemeManager.themes:
+        if theme_name not in ThemeManager.theme_paths and theme_name not in ThemeManager.themes:
             logger.error(f"Theme '{theme_name}' not found in themes.")
             message_collector.add_message("theme_not_found", f"Theme '{theme_name}' not found.")
             return
-        
-        theme = ThemeManager.themes[theme_name]
+
+        try:
+            compiled = ThemeManager.compile_theme(theme_name)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Error decoding JSON for theme '{theme_name}': {e}")
+            message_collector.add_message("error_decoding_theme", f"Theme '{theme_name}': {str(e)}")
+            return
+
+        theme = compiled['theme']
+        ThemeManager.themes.setdefault(theme_name, theme)
         ThemeManager.current_theme = theme
         ThemeManager.current_theme_name = theme_name
         
-        qss = ThemeManager.construct_qss(theme)
-        QApplication.instance().setStyleSheet(qss)
+        QApplication.instance().setStyleSheet(compiled['qss'])
         
-        ThemeManager.apply_palette(theme)
+        ThemeManager._apply_palette_values(compiled['palette'])
         logger.info(f"Applied theme: {theme_name}")
         message_collector.add_message("applied_theme", f"CURRENT_THEME = {theme_name}")
         
@@ -144,17 +257,33 @@ class ThemeManager:
         Construct the QSS stylesheet string from the theme dictionary.
         """
         try:
-            qss = ""
+            parts = [ThemeManager._build_typography(theme)]
             for key, value in theme.items():
                 if key.endswith("_style"):
                     widget_class = key.replace("_style", "")
-                    qss += ThemeManager.build_widget_style(widget_class, value)
-            return qss
+                    parts.append(ThemeManager.build_widget_style(widget_class, value))
+            return "".join(parts)
         except Exception as e:
             logger.error(f"Error constructing QSS: {e}")
             message_collector.add_message("error_constructing_qss", f"Error constructing QSS: {str(e)}")
             return ""
 
+    @staticmethod
+    def _build_typography(theme):
+        """
+        Base font rule for every widget. Listed first so that the
+        per-class rules from the theme file take precedence.
+        """
+        from Config.AppConfig.config import THEME_DEFAULTS
+
+        typography = theme.get('TYPOGRAPHY', {})
+        return (
+            "QWidget {\n"
+            f"    font-family: {typography.get('font_family', THEME_DEFAULTS['font_family'])};\n"
+            f"    font-size: {typography.get('body_font_size', THEME_DEFAULTS['font_size'])};\n"
+            "}\n\n"
+        )
+
     @staticmethod
     def build_widget_style(widget_class, styles):
         """
@@ -327,50 +456,42 @@ class ThemeManager:
             message_collector.add_message("error_constructing_gradient", f"{prop_name}: {str(e)}")
             return ""
     
+    # Palette roles and the theme values they are taken from: (section, key, default)
+    PALETTE_ROLES = {
+        'Window': ('BASE', 'primary_color', '#FFFFFF'),
+        'WindowText': ('BASE', 'text_color', '#000000'),
+        'Base': ('QWidget_style', 'background_color', '#FFFFFF'),
+        'AlternateBase': ('BASE', 'secondary_color', '#F0F0F0'),
+        'ToolTipBase': ('TOOLTIP', 'tooltip_background_gradient_start', '#FFFFFF'),
+        'ToolTipText': ('TOOLTIP', 'tooltip_text_color', '#000000'),
+        'Text': ('BASE', 'text_color', '#000000'),
+        'Button': ('BUTTON', 'button_background_gradient_start', '#FFFFFF'),
+        'ButtonText': ('BUTTON', 'button_text_color', '#000000'),
+        'Highlight': ('UI_ELEMENT', 'selection_color', '#0000FF'),
+        'HighlightedText': ('BASE', 'text_color', '#FFFFFF'),
+    }
+
+    @staticmethod
+    def _palette_values(theme):
+        """Palette role name -> colour string, resolved from the theme."""
+        return {
+            role: theme.get(section, {}).get(key, default)
+            for role, (section, key, default) in ThemeManager.PALETTE_ROLES.items()
+        }
+
     @staticmethod
     def apply_palette(theme):
         """
         Apply the palette based on theme colors.
         """
+        ThemeManager._apply_palette_values(ThemeManager._palette_values(theme))
+
+    @staticmethod
+    def _apply_palette_values(values):
         palette = QPalette()
         try:
-            # Window
-            window_color = QColor(theme.get('BASE', {}).get('primary_color', '#FFFFFF'))
-            palette.setColor(QPalette.Window, window_color)
-
-            # WindowText
-            window_text_color = QColor(theme.get('BASE', {}).get('text_color', '#000000'))
-            palette.setColor(QPalette.WindowText, window_text_color)
-
-            # Base
-            base_color = QColor(theme.get('QWidget_style', {}).get('background_color', '#FFFFFF'))
-            palette.setColor(QPalette.Base, base_color)
-
-            # AlternateBase
-            alternate_base_color = QColor(theme.get('BASE', {}).get('secondary_color', '#F0F0F0'))
-            palette.setColor(QPalette.AlternateBase, alternate_base_color)
-
-            # ToolTipBase and ToolTipText
-            tooltip_base = QColor(theme.get('TOOLTIP', {}).get('tooltip_background_gradient_start', '#FFFFFF'))
-            tooltip_text = QColor(theme.get('TOOLTIP', {}).get('tooltip_text_color', '#000000'))
-            palette.setColor(QPalette.ToolTipBase, tooltip_base)
-            palette.setColor(QPalette.ToolTipText, tooltip_text)
-
-            # Text
-            text_color = QColor(theme.get('BASE', {}).get('text_color', '#000000'))
-            palette.setColor(QPalette.Text, text_color)
-
-            # Button
-            button_color = QColor(theme.get('BUTTON', {}).get('button_background_gradient_start', '#FFFFFF'))
-            palette.setColor(QPalette.Button, button_color)
-            button_text_color = QColor(theme.get('BUTTON', {}).get('button_text_color', '#000000'))
-            palette.setColor(QPalette.ButtonText, button_text_color)
-
-            # Highlight
-            highlight_color = QColor(theme.get('UI_ELEMENT', {}).get('selection_color', '#0000FF'))
-            palette.setColor(QPalette.Highlight, highlight_color)
-            highlighted_text_color = QColor(theme.get('BASE', {}).get('text_color', '#FFFFFF'))
-            palette.setColor(QPalette.HighlightedText, highlighted_text_color)
+            for role, color in values.items():
+                palette.setColor(getattr(QPalette, role), QColor(color))
 
             QApplication.instance().setPalette(palette)
             logger.debug("Palette applied successfully.")
@@ -397,30 +518,24 @@ class ThemeManager:
     @staticmethod
     def apply_widget_theme(widget: QWidget, theme_name: str):
         """
-        Recursively apply theme to a widget and its children.
+        Apply the theme to a widget and all of its descendants in one traversal.
+
+        Fonts and colours come from the application stylesheet set by
+        apply_theme(), so no per-widget stylesheet is needed; this only
+        registers new text widgets for code block styling.
         """
-        from Config.AppConfig.config import THEME_DEFAULTS
-        
+        if not isinstance(widget, QWidget):
+            return
+
         theme = ThemeManager.get_theme()
-        
-        if isinstance(widget, QWidget):
-            widget.setStyleSheet(f"""
-                font-family: {theme.get('TYPOGRAPHY', {}).get('font_family', THEME_DEFAULTS['font_family'])};
-                font-size: {theme.get('TYPOGRAPHY', {}).get('body_font_size', THEME_DEFAULTS['font_size'])};
-            """)
-        
-        # Register text widgets for code block styling
-        if isinstance(widget, (QTextEdit, QTextBrowser)):
-            if not hasattr(QApplication.instance(), 'text_widgets'):
-                QApplication.instance().text_widgets = []
-            if widget not in QApplication.instance().text_widgets:
-                QApplication.instance().text_widgets.append(widget)
-                code_block_styles = theme.get('CODE_BLOCK_STYLE', {})
-                apply_code_block_style(widget, code_block_styles)
+        code_block_styles = theme.get('CODE_BLOCK_STYLE', {})
+        registered = ThemeManager.text_widgets
 
-        # Recursively apply to child widgets
-        for child in widget.findChildren(QWidget):
-            ThemeManager.apply_widget_theme(child, theme_name)
+        # findChildren() already returns every descendant, so no recursion
+        for child in [widget, *widget.findChildren(QWidget)]:
+            if isinstance(child, (QTextEdit, QTextBrowser)) and child not in registered:
+                registered.add(child)
+                apply_code_block_style(child, code_block_styles)
 
     @staticmethod
     def set_icon_theme(theme_name: str):
@@ -630,9 +745,13 @@ class ThemeManager:
         Args:
             code_block_styles (dict): The code block style configurations from the theme.
         """
-        if hasattr(QApplication.instance(), 'text_widgets'):
-            for widget in QApplication.instance().text_widgets:
-                apply_code_block_style(widget, code_block_styles)
+        if ThemeManager.text_widgets:
+            for widget in list(ThemeManager.text_widgets):
+                try:
+                    apply_code_block_style(widget, code_block_styles)
+                except RuntimeError:
+                    # The C++ widget was deleted while its wrapper is still alive
+                    ThemeManager.text_widgets.discard(widget)
             logger.debug("Applied code block styles to all registered text widgets.")
             message_collector.add_message("code_block_styles_applied", "CODE_BLOCK_STYLES = Applied to all text widgets")
         else:
@@ -0,0 +1,141 @@
+# ./Utils/file_sync.py
+
+"""
+Checksummed file writes for the reverse extraction pipelines.
+
+Restoring a project over an existing checkout mostly rewrites files with the
+content they already have. sync_file() compares the new bytes with what is on
+disk (size first, then a SHA-256 digest of the file read in chunks) and only
+writes when they differ, so unchanged targets cost a stat and at most one read.
+
+write_files() runs such writes on a bounded thread pool. Jobs are submitted a
+few at a time so a stop request takes effect quickly, and progress/error
+callbacks run on the calling thread.
+"""
+
+import hashlib
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+def text_bytes(content: str, encoding: str = 'utf-8') -> bytes:
+    """The bytes open(path, 'w', encoding=encoding).write(content) would produce."""
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    return content.encode(encoding)
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> Optional[str]:
+    """SHA-256 of a file read in chunks, or None if it doesn't exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+def read_bytes(path: str) -> Optional[bytes]:
+    """Current file content, or None if the file doesn't exist."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def file_matches(path: str, data: bytes) -> bool:
+    """True if path already holds exactly data."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+    except OSError:
+        return False
+    return file_digest(path) == content_digest(data)
+
+def sync_file(path: str, data: bytes, current: Optional[bytes] = None) -> bool:
+    """
+    Write data to path unless it already holds it.
+
+    Args:
+        current: The file's content if the caller has already read it
+
+    Returns:
+        True if the file was written, False if it was unchanged
+    """
+    if current is not None:
+        if current == data:
+            return False
+    elif file_matches(path, data):
+        return False
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+
+@dataclass
+class WriteSummary:
+    written: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    cancelled: int = 0
+
+    @property
+    def completed(self) -> int:
+        return self.written + self.unchanged + self.failed
+
+def write_files(
+    jobs: Dict[str, Callable[[], bool]],
+    max_workers: int = 8,
+    is_running: Optional[Callable[[], bool]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    on_error: Optional[Callable[[str, Exception], None]] = None,
+) -> WriteSummary:
+    """
+    Run one write job per target path on a thread pool.
+
+    Each job returns True if it wrote its file and False if the file was
+    already up to date. Once is_running() returns False no further jobs are
+    started; jobs already running are allowed to finish.
+
+    Args:
+        on_progress: Called with (completed, total) after every job
+        on_error: Called with (path, exception) for jobs that raised
+    """
+    summary = WriteSummary()
+    total = len(jobs)
+    queued = iter(jobs.items())
+    in_flight = {}
+    max_workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='file-sync') as pool:
+        while True:
+            while len(in_flight) < max_workers * 2 and (is_running is None or is_running()):
+                item = next(queued, None)
+                if item is None:
+                    break
+                path, job = item
+                in_flight[pool.submit(job)] = path
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = in_flight.pop(future)
+                try:
+                    if future.result():
+                        summary.written += 1
+                    else:
+                        summary.unchanged += 1
+                except Exception as e:
+                    summary.failed += 1
+                    if on_error is not None:
+                        on_error(path, e)
+                if on_progress is not None:
+                    on_progress(summary.completed, total)
+    summary.cancelled = total - summary.completed
+    return summary
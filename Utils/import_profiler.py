@@ -0,0 +1,209 @@
+# ./Utils/import_profiler.py
+
+"""
+In-process import-time profiler, similar to `python -X importtime`.
+
+ImportProfiler installs a finder at the front of sys.meta_path that wraps each
+module's loader and times create_module/exec_module. Nested imports are tracked
+per thread so every module gets a self time (its own top-level code) and a
+cumulative time (including the imports it triggered). Only the standard
+library is used here so the profiler can be started before any project module
+is imported.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+PROFILE_ENV_VAR = 'NODEX_PROFILE_IMPORTS'
+
+class _TimedLoader:
+    """Wraps a loader so module creation and execution are timed."""
+
+    def __init__(self, loader: Any, profiler: 'ImportProfiler', name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, 'create_module', None)
+        if create_module is None:
+            return None
+        self._profiler._enter(self._name)
+        try:
+            return create_module(spec)
+        finally:
+            self._profiler._exit()
+
+    def exec_module(self, module) -> None:
+        self._profiler._enter(self._name)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit()
+            # Hand the real loader back so nothing downstream sees the wrapper
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self._loader
+            spec = getattr(module, '__spec__', None)
+            if spec is not None and spec.loader is self:
+                spec.loader = self._loader
+
+    def __getattr__(self, attr: str):
+        return getattr(self._loader, attr)
+
+class ImportProfiler:
+    """Meta path finder recording per-module import cost while started."""
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def active(self) -> bool:
+        return self in sys.meta_path
+
+    def start(self) -> None:
+        if self.active:
+            return
+        self.records.clear()
+        self.started_at = time.perf_counter()
+        self.stopped_at = None
+        sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        if self.active:
+            sys.meta_path.remove(self)
+            self.stopped_at = time.perf_counter()
+
+    # ------------------- Finder ------------------- #
+    def find_spec(self, fullname: str, path=None, target=None):
+        if getattr(self._local, 'finding', False):
+            return None
+        self._local.finding = True
+        try:
+            spec = None
+            for finder in list(sys.meta_path):
+                if finder is self:
+                    continue
+                find_spec = getattr(finder, 'find_spec', None)
+                if find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.finding = False
+
+        if spec is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    # ------------------- Timing ------------------- #
+    def _stack(self) -> List[list]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name: str) -> None:
+        stack = self._stack()
+        parent = stack[-1][0] if stack else None
+        stack.append([name, time.perf_counter(), 0.0, parent])
+
+    def _exit(self) -> None:
+        stack = self._stack()
+        name, start, children, parent = stack.pop()
+        elapsed = time.perf_counter() - start
+        if stack:
+            stack[-1][2] += elapsed
+        with self._lock:
+            record = self.records.get(name)
+            if record is None:
+                record = self.records[name] = {
+                    'module': name,
+                    'self_ms': 0.0,
+                    'cumulative_ms': 0.0,
+                    'parent': parent,
+                    'thread': threading.current_thread().name,
+                    'order': len(self.records),
+                }
+            record['self_ms'] += (elapsed - children) * 1000
+            record['cumulative_ms'] += elapsed * 1000
+
+    # ------------------- Reporting ------------------- #
+    def elapsed_ms(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.stopped_at if self.stopped_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000
+
+    def report(self, heavy_modules: Iterable[str] = (), budget_ms: Optional[float] = None) -> Dict[str, Any]:
+        """Summarise the recorded imports, slowest self time first."""
+        with self._lock:
+            modules = sorted((dict(record) for record in self.records.values()),
+                             key=lambda record: record['self_ms'], reverse=True)
+        import_ms = sum(record['self_ms'] for record in modules)
+        result = {
+            'elapsed_ms': self.elapsed_ms(),
+            'import_ms': import_ms,
+            'module_count': len(modules),
+            'heavy_modules': heavy_modules_loaded(heavy_modules),
+            'modules': modules,
+        }
+        if budget_ms is not None:
+            result['budget_ms'] = budget_ms
+            result['over_budget'] = import_ms > budget_ms
+        return result
+
+    def format_report(self, report: Dict[str, Any], top: int = 40) -> str:
+        lines = [
+            f"Startup: {report['elapsed_ms']:.1f}ms elapsed, {report['import_ms']:.1f}ms importing "
+            f"{report['module_count']} modules",
+        ]
+        if 'budget_ms' in report:
+            status = 'OVER BUDGET' if report['over_budget'] else 'within budget'
+            lines.append(f"Import budget: {report['budget_ms']:.0f}ms ({status})")
+        if report['heavy_modules']:
+            lines.append(f"Heavy modules imported: {', '.join(report['heavy_modules'])}")
+        lines.append('')
+        lines.append(f"{'self ms':>10} {'cumul ms':>10}  module (imported by)")
+        for record in report['modules'][:top]:
+            parent = f"  ({record['parent']})" if record['parent'] else ''
+            lines.append(f"{record['self_ms']:>10.2f} {record['cumulative_ms']:>10.2f}  {record['module']}{parent}")
+        return '\n'.join(lines)
+
+    def write_report(self, output_dir: str, report: Optional[Dict[str, Any]] = None) -> str:
+        """Write text and JSON reports and return the text report's path."""
+        if report is None:
+            report = self.report()
+        os.makedirs(output_dir, exist_ok=True)
+        base_path = os.path.join(output_dir, f"imports_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        with open(f"{base_path}.json", 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        with open(f"{base_path}.txt", 'w', encoding='utf-8') as f:
+            f.write(self.format_report(report))
+            f.write('\n')
+        return f"{base_path}.txt"
+
+def heavy_modules_loaded(heavy_modules: Iterable[str], modules: Optional[Iterable[str]] = None) -> List[str]:
+    """Return the listed top-level packages that appear among the loaded modules."""
+    heavy = set(heavy_modules)
+    loaded = sys.modules if modules is None else modules
+    return sorted({name.split('.', 1)[0] for name in list(loaded)} & heavy)
+
+# Shared profiler; dynamic_main_ref.py starts it when NODEX_PROFILE_IMPORTS=1
+import_profiler = ImportProfiler()
+
+def start_if_requested() -> bool:
+    """Start the shared profiler if the environment asks for it."""
+    if os.environ.get(PROFILE_ENV_VAR) == '1':
+        import_profiler.start()
+        return True
+    return False
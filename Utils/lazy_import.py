@@ -0,0 +1,68 @@
+# ./Utils/lazy_import.py
+
+"""
+Deferred imports for heavy optional dependencies.
+
+lazy_import("pandas") returns a module proxy that performs the real import on
+first attribute access, so modules can keep a top-level name for a dependency
+without paying for it on the startup path. Missing packages surface as the
+usual ImportError at the point of use rather than at import time.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Union
+
+_load_lock = threading.Lock()
+
+class LazyModule(ModuleType):
+    """Module proxy that imports the named module when an attribute is first read."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__['_lazy_target']
+        if module is None:
+            with _load_lock:
+                module = self.__dict__['_lazy_target']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_target'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_target'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+def lazy_import(name: str) -> Union[ModuleType, LazyModule]:
+    """Return the module if it is already imported, otherwise a LazyModule proxy."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+def is_loaded(module: ModuleType) -> bool:
+    """True if a lazy_import() result has actually been imported."""
+    if isinstance(module, LazyModule):
+        return module.__dict__['_lazy_target'] is not None
+    return True
+
+def is_available(name: str) -> bool:
+    """Check whether a module can be imported without importing it (parents excepted)."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
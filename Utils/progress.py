@@ -0,0 +1,108 @@
+# ./Utils/progress.py
+
+"""
+Rate-limited progress reporting for long-running workers.
+
+Extractors report progress and status once per file, which on large trees
+means tens of thousands of cross-thread signals. ProgressThrottle sits between
+the extractor callbacks and the real emitters: it keeps only the newest
+progress value and status message, and forwards them at most max_per_second
+times. A value held back inside the interval is sent by a timer once the
+interval ends, so a long step doesn't leave an old status on screen until the
+next report. flush() forwards whatever is still pending, so the final state is
+never lost.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+_UNSET = object()
+
+class ProgressThrottle:
+    """Coalesce progress/status updates to at most max_per_second emissions."""
+
+    def __init__(
+        self,
+        emit_progress: Optional[Callable[[int], None]] = None,
+        emit_status: Optional[Callable[[str], None]] = None,
+        max_per_second: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+        timer: Callable[[float, Callable[[], None]], threading.Timer] = threading.Timer,
+    ):
+        self.emit_progress = emit_progress
+        self.emit_status = emit_status
+        self.interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self._clock = clock
+        self._timer_factory = timer
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._last_emit: Optional[float] = None
+        self._pending_progress = _UNSET
+        self._pending_status = _UNSET
+        self.emitted = 0
+        self.dropped = 0
+
+    def progress(self, value: int) -> None:
+        self._offer(value, _UNSET)
+
+    def status(self, message: str) -> None:
+        self._offer(_UNSET, message)
+
+    def flush(self) -> None:
+        """Forward any pending progress/status immediately."""
+        with self._lock:
+            self._cancel_timer()
+            pending = self._take()
+        self._emit(*pending)
+
+    def _offer(self, value, message) -> None:
+        with self._lock:
+            if value is not _UNSET:
+                if self._pending_progress is not _UNSET:
+                    self.dropped += 1
+                self._pending_progress = value
+            if message is not _UNSET:
+                if self._pending_status is not _UNSET:
+                    self.dropped += 1
+                self._pending_status = message
+            now = self._clock()
+            if self._last_emit is not None and now - self._last_emit < self.interval:
+                if self._timer is None:
+                    self._timer = self._timer_factory(self.interval - (now - self._last_emit), self._emit_held)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._cancel_timer()
+            self._last_emit = now
+            pending = self._take()
+        self._emit(*pending)
+
+    def _emit_held(self) -> None:
+        """Trailing edge: send what was held back during the last interval."""
+        with self._lock:
+            self._timer = None
+            pending = self._take()
+            if pending == (_UNSET, _UNSET):
+                return
+            self._last_emit = self._clock()
+        self._emit(*pending)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _take(self):
+        pending = (self._pending_progress, self._pending_status)
+        self._pending_progress = _UNSET
+        self._pending_status = _UNSET
+        return pending
+
+    def _emit(self, value, message) -> None:
+        if value is not _UNSET and self.emit_progress is not None:
+            self.emitted += 1
+            self.emit_progress(value)
+        if message is not _UNSET and self.emit_status is not None:
+            self.emitted += 1
+            self.emit_status(message)
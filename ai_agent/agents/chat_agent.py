@@ -5,6 +5,7 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from .base_agent import BaseAgent
+from ai_agent.utils.telemetry import telemetry, model_label
 
 logger = logging.getLogger(__name__)
 
@@ -77,10 +78,12 @@ class ChatAgent(BaseAgent):
             start_time = datetime.now()
             
             try:
-                if accepts_messages:
-                    response = self._process_message_based(messages)
-                else:
-                    response = self._process_text_based(messages)
+                with telemetry.track(model_label(self.model)) as call:
+                    if accepts_messages:
+                        response = self._process_message_based(messages)
+                    else:
+                        response = self._process_text_based(messages)
+                    call.set_usage_from_response(response)
                 
                 self.last_response_time = datetime.now()
                 self._update_history(messages, response)
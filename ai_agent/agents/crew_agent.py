@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .base_agent import BaseAgent
+from ai_agent.utils.telemetry import telemetry, ModelCallRecord
 
 logger = logging.getLogger(__name__)
 
@@ -402,6 +403,12 @@ class CrewAIAgent(BaseAgent):
         if success:
             self.success_count += 1
         self.last_workflow_execution = datetime.now()
+        telemetry.add(ModelCallRecord(
+            model=f"crew:{self.current_workflow or 'none'}",
+            latency=execution_time,
+            time_to_first_token=execution_time,
+            error=None if success else "workflow failed",
+        ))
 
         if execution_time:
             success_rate = (self.success_count / self.execution_count) * 100 if self.execution_count > 0 else 0
@@ -10,6 +10,7 @@ from PySide6.QtCore import Qt, QObject, Signal
 from PySide6.QtWidgets import QListWidgetItem, QInputDialog, QMessageBox, QFileDialog
 
 from log.logger import logger  # Custom logger import
+from log.tracer import traced
 from ai_agent.config.ai_config import CHAT_HISTORY_FOLDER  # Import constants from ai_config
 from ai_agent.memory.memory_manager import load_memory
 from ai_agent.code_block_manager.code_block_manager import (
@@ -64,6 +65,7 @@ class ShortTermHistory(QObject):
             logger.error(f"Error saving history: {e}")
 
 
+@traced("chat_manager.save_chat_log")
 def save_chat_log(chat_id, chat_data):
     """
     Save chat history to a JSON file.
@@ -451,6 +453,7 @@ def handle_file_patterns(user_message):
     return user_message, file_contents
 
 
+@traced("chat_manager.prepare_messages")
 def prepare_messages(system_message, user_message, current_model_name, config):
     """
     Prepare the messages for the AI model.
@@ -3,10 +3,13 @@ import os
 import re
 import logging
 from openpyxl import Workbook
-from openai import OpenAI
-import pandas as pd
+from Utils.lazy_import import lazy_import
 from ai_agent.config.ai_config import Config
 
+# Heavy clients, imported on first use
+openai = lazy_import("openai")
+pd = lazy_import("pandas")
+
 config = Config()
 logger = logging.getLogger(__name__)
 
@@ -103,7 +106,7 @@ def process_llm_output(output, base_filename='auto_llm_data_'):
         return None
 
 def generate_data(api_key, system_prompt, user_prompt, model, temperature, max_tokens):
-    client = OpenAI(api_key=api_key)
+    client = openai.OpenAI(api_key=api_key)
 
     try:
         # Ensure prompts are UTF-8 encoded
@@ -2,15 +2,17 @@
 
 import os
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI, OpenAI, OpenAIEmbeddings, AzureChatOpenAI, AzureOpenAIEmbeddings, AzureOpenAI
-from langchain_community.llms.ollama import Ollama
-from langchain_community.embeddings import OllamaEmbeddings
-from langchain_anthropic import ChatAnthropic
-from langchain_groq import ChatGroq
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_google_genai import ChatGoogleGenerativeAI, HarmBlockThreshold, HarmCategory
-from pydantic.v1.types import SecretStr
+from Utils.lazy_import import lazy_import
 from ai_agent.config.ai_config import Config
+
+# Provider packages are imported on first use so importing this module stays cheap
+langchain_openai = lazy_import("langchain_openai")
+langchain_ollama_llms = lazy_import("langchain_community.llms.ollama")
+langchain_embeddings = lazy_import("langchain_community.embeddings")
+langchain_anthropic = lazy_import("langchain_anthropic")
+langchain_groq = lazy_import("langchain_groq")
+langchain_huggingface = lazy_import("langchain_huggingface")
+langchain_google_genai = lazy_import("langchain_google_genai")
 config = Config()
 
 
@@ -85,52 +87,52 @@ def get_model(model_key, temperature=None, api_key=None):
             api_key = api_key or API_KEYS.get(company)
 
             if company == "Anthropic":
-                return ChatAnthropic(model_name=model_name, temperature=temp, api_key=api_key)
+                return langchain_anthropic.ChatAnthropic(model_name=model_name, temperature=temp, api_key=api_key)
             elif company == "OpenAI":
-                return ChatOpenAI(model_name=model_name, temperature=temp, api_key=api_key)
+                return langchain_openai.ChatOpenAI(model_name=model_name, temperature=temp, api_key=api_key)
             elif company == "Groq":
-                return ChatGroq(model_name=model_name, temperature=temp, api_key=api_key)
+                return langchain_groq.ChatGroq(model_name=model_name, temperature=temp, api_key=api_key)
             elif company == "Ollama":
-                return Ollama(model=model_name, temperature=temp)
+                return langchain_ollama_llms.Ollama(model=model_name, temperature=temp)
             elif company == "Google":
-                return ChatGoogleGenerativeAI(
+                genai = langchain_google_genai
+                return genai.ChatGoogleGenerativeAI(
                     model=model_name, temperature=temp, google_api_key=api_key,
-                    safety_settings={HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE}
+                    safety_settings={genai.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: genai.HarmBlockThreshold.BLOCK_NONE}
                 )
             elif company == "LM Studio":
                 return get_lm_studio_model(temperature=temp)
             elif company == "OpenRouter":
-                return ChatOpenAI(
+                return langchain_openai.ChatOpenAI(
                     api_key=api_key, base_url="https://openrouter.ai/api/v1", model=model_name, temperature=temp
                 )
     
     if model_key in EMBEDDING_MODELS:
         if model_key == "HuggingFace Embeddings":
-            return HuggingFaceEmbeddings(model_name=EMBEDDING_MODELS[model_key])
+            return langchain_huggingface.HuggingFaceEmbeddings(model_name=EMBEDDING_MODELS[model_key])
         elif model_key == "OpenAI Embeddings":
-            return OpenAIEmbeddings(api_key=api_key)
+            return langchain_openai.OpenAIEmbeddings(api_key=api_key)
         elif model_key == "Ollama Embeddings":
-            return OllamaEmbeddings(model=EMBEDDING_MODELS[model_key], temperature=temperature)
+            return langchain_embeddings.OllamaEmbeddings(model=EMBEDDING_MODELS[model_key], temperature=temperature)
         elif model_key == "LM Studio Embeddings":
             return get_lm_studio_embedding()
         elif model_key == "Azure OpenAI Embeddings":
             azure_endpoint = os.getenv("OPENAI_AZURE_ENDPOINT")
-            return AzureOpenAIEmbeddings(
+            return langchain_openai.AzureOpenAIEmbeddings(
                 deployment_name=model_key, api_key=api_key, azure_endpoint=azure_endpoint
             )
     
     raise ValueError(f"Unknown model key: {model_key}")
 
 # Specific model retrieval functions for LM Studio
-from langchain_openai import ChatOpenAI
 
 def get_lm_studio_model(temperature=0.1):
     # Assuming you're using LM Studio, the base URL and API key are specific to LM Studio
     base_url = "http://localhost:1234/v1"
-    return ChatOpenAI(model_name="model-identifier", temperature=temperature, openai_api_key="lm-studio", base_url=base_url)
+    return langchain_openai.ChatOpenAI(model_name="model-identifier", temperature=temperature, openai_api_key="lm-studio", base_url=base_url)
 
 
 
 def get_lm_studio_embedding(model="model-identifier"):
-    client = OpenAI(base_url="http://localhost:1234/v1", api_key="lm-studio")
+    client = langchain_openai.OpenAI(base_url="http://localhost:1234/v1", api_key="lm-studio")
     return lambda text: client.embeddings.create(input=[text.replace("\n", " ")], model=model).data[0].embedding
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from ai_agent.models.llm_models import get_model
+from ai_agent.utils.telemetry import telemetry
 from log.logger import logger
 
 class AIService:
@@ -14,6 +15,7 @@ class AIService:
         model_name = self.config.CHAT_MODEL
         temperature = self.config.CHAT_TEMPERATURE
         client = get_model(model_name, temperature=temperature)
+        self.model_name = model_name
         logger.info(f"AIService initialized with model: {model_name}")
         return client
 
@@ -63,14 +65,24 @@ class AIService:
             logger.error(f"Error updating agent: {e}")
             return False
 
-    def get_response(self, messages):
+    def get_response(self, messages, queued_at=None):
+        """
+        Send messages to the current model and return the response text.
+
+        Args:
+            messages (list): Chat messages to send.
+            queued_at (float, optional): time.monotonic() timestamp of when the request
+                was queued, used to record queue wait in telemetry.
+        """
         try:
-            accepts_messages = self.client.__class__.__name__ in ['OpenAIChat', 'AzureChatOpenAI', 'ChatOpenAI']
-            if accepts_messages:
-                response = self.client(messages)
-            else:
-                concatenated_messages = ' '.join(m['content'] for m in messages)
-                response = self.client.invoke(concatenated_messages) if hasattr(self.client, 'invoke') else self.client(concatenated_messages)
+            with telemetry.track(self.model_name, queued_at) as call:
+                accepts_messages = self.client.__class__.__name__ in ['OpenAIChat', 'AzureChatOpenAI', 'ChatOpenAI']
+                if accepts_messages:
+                    response = self.client(messages)
+                else:
+                    concatenated_messages = ' '.join(m['content'] for m in messages)
+                    response = self.client.invoke(concatenated_messages) if hasattr(self.client, 'invoke') else self.client(concatenated_messages)
+                call.set_usage_from_response(response)
 
             if isinstance(response, str):
                 response_content = response
@@ -88,4 +100,5 @@ class AIService:
 
     def update_model(self, model_name, temperature=None):
         self.client = get_model(model_name, temperature=temperature if temperature else self.config.CHAT_TEMPERATURE)
+        self.model_name = model_name
         logger.info(f"AIService updated to model: {model_name}")
\ No newline at end of file
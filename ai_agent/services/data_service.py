@@ -4,9 +4,11 @@
 
 from ai_agent.generation_manager.auto_gen import generate_data_and_save_excel as auto_generate_data
 from log.logger import logger
+from log.tracer import traced
 
 class DataService:
     @staticmethod
+    @traced("DataService.auto_generate_data")
     def auto_generate_data(response_content):
         try:
             saved_file = auto_generate_data(response_content)
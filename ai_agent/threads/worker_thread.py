@@ -1,8 +1,10 @@
 # ai_agent/threads/worker_thread.py
 
 import re
+import time
 from PySide6.QtCore import QThread, Signal
 from log.logger import logger
+from log.tracer import tracer
 from ai_agent.utils.code_extractor import CodeBlockExtractor  # Import CodeBlockExtractor
 from ai_agent.services.data_service import DataService
 from ai_agent.services.ai_service import AIService
@@ -24,24 +26,28 @@ class WorkerThread(QThread):
         self.messages = messages
         self.ai_service = ai_service
         self.code_extractor = CodeBlockExtractor()  # Instantiate CodeBlockExtractor
+        self.queued_at = time.monotonic()  # Used for queue-wait telemetry
 
     def run(self):
         """
         Execute the thread's activity: fetch AI response, process it, and emit signals.
         """
         try:
-            # Get the response from the AI model
-            response_content = self.ai_service.get_response(self.messages)
-
-            # Extract code blocks from the response using CodeBlockExtractor
-            code_blocks = self.code_extractor.extract_code_blocks(response_content)  # Correctly call the method
-            if code_blocks:
-                self.code_blocks_found.emit(code_blocks)  # Emit the found code blocks
-
-            # Handle data list saving
-            saved_file = DataService.auto_generate_data(response_content)
-            if saved_file:
-                logger.info(f"Data list saved to {saved_file}")
+            with tracer.profile("chat_request"), tracer.span("WorkerThread.run"):
+                # Get the response from the AI model
+                with tracer.span("AIService.get_response"):
+                    response_content = self.ai_service.get_response(self.messages, queued_at=self.queued_at)
+
+                # Extract code blocks from the response using CodeBlockExtractor
+                with tracer.span("CodeBlockExtractor.extract_code_blocks"):
+                    code_blocks = self.code_extractor.extract_code_blocks(response_content)  # Correctly call the method
+                if code_blocks:
+                    self.code_blocks_found.emit(code_blocks)  # Emit the found code blocks
+
+                # Handle data list saving
+                saved_file = DataService.auto_generate_data(response_content)
+                if saved_file:
+                    logger.info(f"Data list saved to {saved_file}")
 
             # Emit the AI response
             self.response_ready.emit(response_content, {})
@@ -0,0 +1,210 @@
+# ai_agent/utils/telemetry.py
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+DEFAULT_BUFFER_SIZE = 2048
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class ModelCallRecord:
+    """A single model call as seen by the instrumentation layer."""
+    model: str
+    timestamp: float = field(default_factory=time.time)
+    queue_wait: Optional[float] = None
+    time_to_first_token: Optional[float] = None
+    latency: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cache_hit: bool = False
+    error: Optional[str] = None
+
+
+class CallTracker:
+    """Collects timings for one in-flight call; handed out by ModelTelemetry.track()."""
+
+    def __init__(self, model: str, queued_at: Optional[float] = None):
+        self.started = time.monotonic()
+        self.record = ModelCallRecord(model=model)
+        if queued_at is not None:
+            self.record.queue_wait = max(0.0, self.started - queued_at)
+
+    def mark_first_token(self) -> None:
+        """Record time-to-first-token. Only the first call counts."""
+        if self.record.time_to_first_token is None:
+            self.record.time_to_first_token = time.monotonic() - self.started
+
+    def set_usage(self, prompt_tokens: Optional[int] = None,
+                  completion_tokens: Optional[int] = None,
+                  cache_hit: Optional[bool] = None) -> None:
+        if prompt_tokens is not None:
+            self.record.prompt_tokens = prompt_tokens
+        if completion_tokens is not None:
+            self.record.completion_tokens = completion_tokens
+        if cache_hit is not None:
+            self.record.cache_hit = cache_hit
+
+    def set_usage_from_response(self, response: Any) -> None:
+        """Pull token usage and cache information out of a provider response."""
+        self.set_usage(**extract_usage(response))
+
+    def finish(self, error: Optional[BaseException] = None) -> ModelCallRecord:
+        self.record.latency = time.monotonic() - self.started
+        # Non-streaming calls deliver the first token together with the last one
+        if self.record.time_to_first_token is None:
+            self.record.time_to_first_token = self.record.latency
+        if error is not None:
+            self.record.error = f"{type(error).__name__}: {error}"
+        return self.record
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def extract_usage(response: Any) -> Dict[str, Any]:
+    """
+    Best-effort extraction of token counts from LangChain/OpenAI/Anthropic responses.
+
+    Returns a dict with any of 'prompt_tokens', 'completion_tokens' and 'cache_hit'.
+    """
+    usage: Dict[str, Any] = {}
+    if response is None or isinstance(response, str):
+        return usage
+
+    # LangChain >= 0.2 normalised usage
+    meta = _as_dict(getattr(response, 'usage_metadata', None))
+    if meta:
+        # Keys left out here are filled from the raw provider usage below
+        for key, meta_key in (('prompt_tokens', 'input_tokens'), ('completion_tokens', 'output_tokens')):
+            if meta.get(meta_key) is not None:
+                usage[key] = meta[meta_key]
+        details = _as_dict(meta.get('input_token_details'))
+        if details.get('cache_read'):
+            usage['cache_hit'] = True
+
+    # Raw provider metadata (OpenAI: token_usage, Anthropic: usage)
+    response_meta = _as_dict(getattr(response, 'response_metadata', None))
+    if not response_meta and isinstance(response, dict):
+        response_meta = response
+    raw = _as_dict(response_meta.get('token_usage')) or _as_dict(response_meta.get('usage'))
+    if raw:
+        usage.setdefault('prompt_tokens', raw.get('prompt_tokens', raw.get('input_tokens')))
+        usage.setdefault('completion_tokens', raw.get('completion_tokens', raw.get('output_tokens')))
+        cached = (_as_dict(raw.get('prompt_tokens_details')).get('cached_tokens')
+                  or raw.get('cache_read_input_tokens'))
+        if cached:
+            usage['cache_hit'] = True
+
+    return {k: v for k, v in usage.items() if isinstance(v, (int, bool))}
+
+
+def model_label(client: Any) -> str:
+    """Readable model name for a LangChain client, falling back to its class name."""
+    for attr in ('model_name', 'model'):
+        value = getattr(client, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return client.__class__.__name__
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class ModelTelemetry:
+    """
+    In-process ring buffer of model call records with per-model aggregates.
+
+    Thread-safe; records are appended from worker threads and read by the UI.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_SIZE):
+        self._records: Deque[ModelCallRecord] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.enabled = True
+
+    @property
+    def capacity(self) -> int:
+        return self._records.maxlen
+
+    def add(self, record: ModelCallRecord) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._records.append(record)
+
+    @contextmanager
+    def track(self, model: str, queued_at: Optional[float] = None) -> Iterator[CallTracker]:
+        """
+        Time a model call.
+
+        Usage:
+            with telemetry.track(model_name, queued_at) as call:
+                response = client.invoke(prompt)
+                call.set_usage_from_response(response)
+        """
+        tracker = CallTracker(model, queued_at)
+        try:
+            yield tracker
+        except BaseException as e:
+            self.add(tracker.finish(error=e))
+            raise
+        self.add(tracker.finish())
+
+    def records(self, model: Optional[str] = None) -> List[ModelCallRecord]:
+        with self._lock:
+            snapshot = list(self._records)
+        if model is not None:
+            snapshot = [r for r in snapshot if r.model == model]
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def aggregates(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model counts, token totals and p50/p95/p99 for each timing."""
+        by_model: Dict[str, List[ModelCallRecord]] = {}
+        for record in self.records():
+            by_model.setdefault(record.model, []).append(record)
+
+        result = {}
+        for model, records in by_model.items():
+            stats: Dict[str, Any] = {
+                'calls': len(records),
+                'errors': sum(1 for r in records if r.error),
+                'cache_hits': sum(1 for r in records if r.cache_hit),
+                'prompt_tokens': sum(r.prompt_tokens or 0 for r in records),
+                'completion_tokens': sum(r.completion_tokens or 0 for r in records),
+            }
+            for metric in ('queue_wait', 'time_to_first_token', 'latency'):
+                values = sorted(getattr(r, metric) for r in records
+                                if getattr(r, metric) is not None and not r.error)
+                for pct in PERCENTILES:
+                    stats[f'{metric}_p{pct}'] = percentile(values, pct)
+            result[model] = stats
+        return result
+
+    def export_jsonl(self, file_path: str) -> int:
+        """Write every buffered record as one JSON object per line. Returns the count."""
+        records = self.records()
+        with open(file_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(asdict(record)) + '\n')
+        return len(records)
+
+
+# Shared instance used by AIService, the agents and the dashboard
+telemetry = ModelTelemetry()
@@ -7,6 +7,7 @@ import zipfile
 import shutil
 import toml
 from pathlib import Path
+from log.tracer import traced
 
 class MarkdownEx:
     def __init__(self, base_dir, output_dir, settings_path):
@@ -185,6 +186,7 @@ class MarkdownEx:
 
         return main_output_path, where_file_lines_path
 
+    @traced("MarkdownEx.run")
     def run(self):
         if not os.path.exists(self.settings_path):
             raise FileNotFoundError(f"Settings file not found: {self.settings_path}")
@@ -436,6 +438,7 @@ class CSVEx:
                 self.update_status(f"Error saving Excel file: {str(e)}")
             raise
 
+    @traced("CSVEx.run")
     def run(self):
         if not os.path.exists(self.settings_path):
             raise FileNotFoundError(f"Settings file not found: {self.settings_path}")
@@ -485,6 +488,7 @@ class CSVEx:
 
 
 # Function to handle reverse operations
+@traced("reverse_csv_extraction")
 def reverse_csv_extraction(file_path, output_dir):
     """Reverse the CSV extraction process"""
     try:
@@ -504,6 +508,7 @@ def reverse_csv_extraction(file_path, output_dir):
         print(f"Error during reverse CSV extraction: {str(e)}")
         raise
 
+@traced("reverse_markdown_extraction")
 def reverse_markdown_extraction(markdown_path, output_dir):
     """Reverse the Markdown extraction process"""
     try:
@@ -687,7 +687,7 @@ class ProcessCodeBlock:
         self.formatter = formatter
         self.config = config
         self.extractor = ExtractAndRemoveSpecialImports()
-        self.path_extractor = ModulePathExtractor()
+        self.path_extractor = ModulePathExtractor(config)
         self.code_processor = CodeBlockProcessor()
 
     def implementation_version1(self, block: Dict, return_diff: bool = False) -> Tuple[bool, str, Optional[str]]:
@@ -704,8 +704,8 @@ class ProcessCodeBlock:
             # Process the code block
             processed_block = self.code_processor.process_code_block(new_code_block)
             
-            # Extract special imports and removals
-            imports, cleaned_code, removals = self.extractor.extract_and_remove_special_imports(processed_block['code'])
+            # Extract special imports
+            imports, cleaned_code = self.extractor.extract_and_remove_special_imports(processed_block['code'])
 
             # Handle file operations
             if not self.file_manager.validate_path(module_path):
@@ -719,10 +719,6 @@ class ProcessCodeBlock:
             # Parse and update the AST
             tree = self.parser.parse_code(original_code)
             
-            # Handle removals
-            for removal in removals:
-                self.integrator.remove_node(tree, removal)
-            
             # Handle additions
             for addition in processed_block['additions']:
                 self.integrator.add_node(tree, self.parser.parse_code(addition).body[0])
@@ -741,7 +737,7 @@ class ProcessCodeBlock:
             updated_code = self.parser.ast_to_code(tree)
 
             # Validate and format
-            if not self.validator.validate_syntax(updated_code, module_path):
+            if not self.validator.validate_syntax_optional(updated_code, module_path):
                 raise SyntaxError("Updated code has syntax errors")
 
             if not self.config.get_config_value('preserve_formatting', True):
@@ -1,18 +1,25 @@
 from PySide6.QtCore import QObject, Signal, Slot
 
+from Config.AppConfig.config import EXTRACTION_PROGRESS_MAX_RATE
+from Utils.progress import ProgressThrottle
+
 class ExtractionWorker(QObject):
     finished = Signal()
     error = Signal(str)
     progress = Signal(int)
     status = Signal(str)
 
-    def __init__(self, extractor_class, input_path, output_path, settings_path):
+    def __init__(self, extractor_class, input_path, output_path, settings_path,
+                 max_updates_per_second=EXTRACTION_PROGRESS_MAX_RATE):
         super().__init__()
         self.extractor_class = extractor_class
         self.input_path = input_path
         self.output_path = output_path
         self.settings_path = settings_path
         self._is_running = True
+        self._extractor = None
+        # Extractors report once per file; forward at most a few updates per second
+        self._throttle = ProgressThrottle(self._handle_progress, self._handle_status, max_updates_per_second)
 
     @Slot()
     def run(self):
@@ -23,19 +30,24 @@ class ExtractionWorker(QObject):
                 self.output_path,
                 self.settings_path
             )
-            
+            self._extractor = extractor
+
             # Connect progress updates if the extractor supports them
             if hasattr(extractor, 'update_progress'):
-                extractor.update_progress = self._handle_progress
+                extractor.update_progress = self._throttle.progress
             if hasattr(extractor, 'update_status'):
-                extractor.update_status = self._handle_status
+                extractor.update_status = self._throttle.status
 
             # Run the extraction
             if self._is_running:
                 extractor.run()
+                self._throttle.flush()
                 self.finished.emit()
         except Exception as e:
+            self._throttle.flush()
             self.error.emit(str(e))
+        finally:
+            self._extractor = None
 
     def _handle_progress(self, value):
         if self._is_running:
@@ -47,3 +59,7 @@ class ExtractionWorker(QObject):
 
     def stop(self):
         self._is_running = False
+        # The extractor checks its own flag inside the per-file loops
+        extractor = self._extractor
+        if extractor is not None and hasattr(extractor, 'stop'):
+            extractor.stop()
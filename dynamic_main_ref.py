@@ -3,17 +3,24 @@
 
 import sys
 from typing import Optional, Any, NoReturn
+# Start the import profiler before anything else is imported
+from Utils.import_profiler import import_profiler, start_if_requested
+start_if_requested()
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox
-from PySide6.QtCore import QSize, qInstallMessageHandler
+from PySide6.QtCore import QSize, QTimer, qInstallMessageHandler
 from frontend.DynamicMain.logger_setup import setup_logger
 from log.logger import logger, ic, qt_message_handler
+from log.tracer import tracer
 from Styles.theme_manager import ThemeManager
 from Config.AppConfig.config import (
     ConfigManager, 
     THEME_OPTIONS, 
     CURRENT_THEME,
     WINDOW_WIDTH,
-    WINDOW_HEIGHT
+    WINDOW_HEIGHT,
+    STARTUP_PROFILE_DIR,
+    STARTUP_IMPORT_BUDGET_MS,
+    STARTUP_HEAVY_MODULES
 )
 
 class MainWindow(QMainWindow):
@@ -168,6 +175,8 @@ class MainWindow(QMainWindow):
         """Clean up application resources."""
         if hasattr(self, 'page_manager'):
             self.page_manager.cleanup()
+        if tracer.enabled and tracer.events():
+            logger.info(f"Trace written to {tracer.export_chrome_trace()}")
 
 
 class ApplicationManager:
@@ -195,7 +204,6 @@ class ApplicationManager:
     def create_application() -> QApplication:
         """Create and configure the Qt application."""
         app = QApplication(sys.argv)
-        app.text_widgets = []  # Initialize list for code block styling
         qInstallMessageHandler(qt_message_handler)
         logger.info("Qt message handler installed.")
         return app
@@ -211,6 +219,7 @@ class ApplicationManager:
             window = MainWindow()
             window.show()
             logger.info("Application window displayed. Entering event loop.")
+            QTimer.singleShot(0, cls.report_startup)
             ic("Application started")
 
             return_code = app.exec()
@@ -222,6 +231,23 @@ class ApplicationManager:
         except Exception as e:
             cls._handle_critical_error(str(e))
 
+    @staticmethod
+    def report_startup() -> None:
+        """Stop the import profiler once the first frame is up and write its report."""
+        if not import_profiler.active:
+            return
+        import_profiler.stop()
+        report = import_profiler.report(STARTUP_HEAVY_MODULES, STARTUP_IMPORT_BUDGET_MS)
+        report_path = import_profiler.write_report(STARTUP_PROFILE_DIR, report)
+        logger.info(
+            f"Startup took {report['elapsed_ms']:.0f}ms ({report['import_ms']:.0f}ms importing "
+            f"{report['module_count']} modules). Report written to {report_path}"
+        )
+        if report['over_budget']:
+            logger.warning(f"Startup imports exceeded the {STARTUP_IMPORT_BUDGET_MS}ms budget")
+        if report['heavy_modules']:
+            logger.warning(f"Heavy modules imported during startup: {', '.join(report['heavy_modules'])}")
+
     @staticmethod
     def _handle_startup_error(error_message: str) -> NoReturn:
         """Handle errors during application startup."""
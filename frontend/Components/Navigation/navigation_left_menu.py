@@ -3,7 +3,7 @@
 
 import logging
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import (
@@ -46,6 +46,7 @@ class NavigationLeftMenu(QWidget):
     def _initialize_properties(self) -> None:
         """Initialize basic properties and state."""
         self.pages: List[str] = []
+        self.page_manifests: Dict[str, dict] = {}
         self.is_phone_layout = self.parent.config.get('enable_phone_layout', False)
         self.is_expanded = not self.is_phone_layout
         self._verify_configuration()
@@ -186,9 +187,10 @@ class NavigationLeftMenu(QWidget):
             logger.error(f"Error updating theme: {e}")
             raise ThemeUpdateError(f"Failed to update theme: {str(e)}")
 
-    def update_page_list(self, pages: List[str]) -> None:
-        """Update the list of available pages."""
+    def update_page_list(self, pages: List[str], manifests: Optional[Dict[str, dict]] = None) -> None:
+        """Update the list of available pages (manifests supply title and icon)."""
         self.pages = pages
+        self.page_manifests = manifests or {}
         self.create_page_buttons()
 
     def create_page_buttons(self) -> None:
@@ -214,7 +216,8 @@ class NavigationLeftMenu(QWidget):
 
     def _create_page_button(self, page_name: str) -> QPushButton:
         """Create a button for a page."""
-        btn = QPushButton(page_name.replace("_", " ").capitalize())
+        title = self.page_manifests.get(page_name, {}).get('title')
+        btn = QPushButton(title or page_name.replace("_", " ").capitalize())
         if self.is_phone_layout:
             btn.setMinimumHeight(self.PHONE_BUTTON_HEIGHT)
         btn.setObjectName(f"navigationButton_{page_name}")
@@ -225,7 +228,7 @@ class NavigationLeftMenu(QWidget):
 
     def _setup_button_icon(self, button: QPushButton, page_name: str) -> None:
         """Set up the icon for a page button."""
-        icon_key = page_name.lower()
+        icon_key = self.page_manifests.get(page_name, {}).get('icon') or page_name.lower()
         icon_path = ICONS.get(icon_key, '')
         
         if self._is_valid_icon_path(icon_path):
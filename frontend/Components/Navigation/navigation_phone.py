@@ -24,6 +24,7 @@ class Navigation_Phone_Menu(QFrame):
         self.parent = parent
         self.is_expanded = False
         self.pages = []
+        self.page_manifests = {}
         
         self._init_ui()
         self._connect_signals()
@@ -102,9 +103,10 @@ class Navigation_Phone_Menu(QFrame):
         
         self.menuToggled.emit(self.is_expanded)
         
-    def update_page_list(self, pages):
-        """Update the list of available pages."""
+    def update_page_list(self, pages, manifests=None):
+        """Update the list of available pages (manifests supply title and icon)."""
         self.pages = pages
+        self.page_manifests = manifests or {}
         self._create_page_buttons()
         
     def _create_page_buttons(self):
@@ -118,11 +120,12 @@ class Navigation_Phone_Menu(QFrame):
         
         # Create new buttons
         for page_name in self.pages:
-            btn = QPushButton(page_name.replace("_", " ").capitalize())
+            manifest = self.page_manifests.get(page_name, {})
+            btn = QPushButton(manifest.get('title') or page_name.replace("_", " ").capitalize())
             btn.setMinimumHeight(48)  # Touch-friendly height
             
             # Add icon
-            icon_key = page_name.lower()
+            icon_key = manifest.get('icon') or page_name.lower()
             icon_path = ICONS.get(icon_key, '')
             if icon_path:
                 btn.setIcon(QIcon(icon_path))
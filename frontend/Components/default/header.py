@@ -28,7 +28,6 @@ from Config.AppConfig.config import (
 from Config.AppConfig.icon_config import ICONS
 from Styles.theme_manager import ThemeManager
 from log.logger import logger
-from modules.fast_whisper_v2.main import WhisperTranscription  # Assuming WhisperTranscription is PySide6-based
 from .terminal_widget import TerminalWidget  # Import the PySide6 TerminalWidget
 
 class DropdownPanel(QFrame):
@@ -69,7 +68,8 @@ class WhisperPanel(DropdownPanel):
     def __init__(self, parent=None):
         try:
             super().__init__(parent, width=400, height=500)
-            # Instantiate WhisperTranscription (PySide6-based)
+            # Imported here: faster_whisper and pyaudio are too heavy for the startup path
+            from modules.fast_whisper_v2.main import WhisperTranscription
             self.whisper_widget = WhisperTranscription()
             self.layout.addWidget(self.whisper_widget)
             logger.debug("WhisperPanel initialized successfully with WhisperTranscription")
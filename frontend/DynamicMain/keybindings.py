@@ -10,6 +10,7 @@ from Utils.keybindnings.keybindnings import (
     Keybind_Shift_Enter, Keybind_Ctrl_N, Keybind_Alt_S, Keybind_Alt_C
 )
 from log.logger import logger
+from log.tracer import tracer
 
 class KeyBindings:
     """Initializes and manages key bindings."""
@@ -46,7 +47,9 @@ class KeyBindings:
                 ("Alt+A", lambda: Keybind_Alt_a(self.main_window.get_current_chat_page())),
                 ("Ctrl+N", lambda: Keybind_Ctrl_N(self.main_window)),
                 ("Alt+S", lambda: Keybind_Alt_S(self.main_window)),
-                ("Alt+C", lambda: Keybind_Alt_C(self.main_window.get_current_chat_page()))
+                ("Alt+C", lambda: Keybind_Alt_C(self.main_window.get_current_chat_page())),
+                ("Ctrl+Shift+P", self.arm_profiler),
+                ("Ctrl+Shift+T", self.export_trace)
             ]
 
             for key_sequence, callback in other_bindings:
@@ -67,3 +70,19 @@ class KeyBindings:
 
         except Exception as e:
             logger.error(f"Critical error during key binding initialization: {str(e)}")
+
+    def arm_profiler(self):
+        """Profile the next chat request (cProfile dump in the trace directory)."""
+        tracer.arm_profiler()
+        logger.info("Profiler armed for the next chat request")
+
+    def export_trace(self):
+        """Write collected spans as Chrome trace-event JSON (open in Perfetto)."""
+        if not tracer.enabled:
+            logger.warning("Tracing is disabled; set TRACING_ENABLED or NODEX_TRACE=1")
+            return
+        try:
+            file_path = tracer.export_chrome_trace()
+            logger.info(f"Trace exported to {file_path}")
+        except Exception as e:
+            logger.error(f"Error exporting trace: {e}")
@@ -2,15 +2,19 @@
 # ./frontend/DynamicMain/page_manager.py
 
 import os
+import sys
 import json
 import importlib
+import threading
 from typing import Optional, Any, Dict, List
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QStackedWidget, QMessageBox
 from Config.AppConfig.config import ConfigManager
 from Config.AppConfig.config import *
 from log.logger import logger
+from log.tracer import tracer, traced
 from Styles.theme_manager import ThemeManager
-from Utils.loader import load_module, get_subdirectories
+from Utils.loader import load_module, get_subdirectories, has_page_module
 from .page_state_handler import PageStateHandler
 
 class PageManager:
@@ -56,11 +60,14 @@ class PageManager:
         logger.debug(f"Built module path: {module_path}")
         return module_path
 
+    @traced("PageManager.discover_pages")
     def discover_pages(self) -> None:
         """
-        Discover available page directories and attempt to load them immediately.
-        If you prefer a lazy-load approach, comment out the immediate module load
-        and store only directory names here.
+        Discover available page directories without importing them.
+
+        Each page directory may contain a small manifest (page.json) with its
+        title, icon and order. Page modules are imported on first navigation
+        (see _get_page_module), or immediately when LAZY_PAGE_LOADING is off.
         """
         logger.info("Starting page discovery process...")
 
@@ -77,7 +84,7 @@ class PageManager:
 
         discovered_pages = self._process_page_directories(layout_dir, page_dirs)
         if discovered_pages:
-            self.main_window.navigation.update_page_list(list(discovered_pages.keys()))
+            self.main_window.navigation.update_page_list(list(discovered_pages.keys()), discovered_pages)
             logger.info(f"Added {len(discovered_pages)} pages to navigation menu")
         else:
             logger.error("No pages discovered")
@@ -85,39 +92,93 @@ class PageManager:
 
         logger.info("Page discovery completed")
 
-    # ------------------------------------------------------------------------
-    # Example lazy loading approach
-
-    # def discover_pages(self) -> None:
-    #     logger.info("Starting (LAZY) page discovery process...")
-    #     layout_dir = self._get_layout_dir()
-    #     if not os.path.isdir(layout_dir):
-    #         self._handle_error("no_pages_available", f"Layout dir '{layout_dir}' does not exist.")
-    #         return
-    #
-    #     all_subdirs = get_subdirectories(layout_dir)
-    #     page_dirs = [d for d in all_subdirs if d not in {"__pycache__", "venv"}]
-    #     self.main_window.available_page_dirs = page_dirs  # Store only directories
-    #     self.main_window.navigation.update_page_list(page_dirs)
-    #     logger.info(f"Discovered {len(page_dirs)} page directories. Lazy load enabled.")
-    # ------------------------------------------------------------------------
-
-    def _process_page_directories(self, layout_dir: str, page_dirs: List[str]) -> Dict[str, Any]:
-        discovered_pages = {}
+    def _process_page_directories(self, layout_dir: str, page_dirs: List[str]) -> Dict[str, Dict[str, Any]]:
+        manifests = []
         for page_dir in page_dirs:
-            try:
-                module_path = self._build_module_path(layout_dir, page_dir)
-                module = load_module(module_path)
-                if module and hasattr(module, 'Page'):
-                    discovered_pages[page_dir] = module
-                    self.main_window.available_pages[page_dir] = module
-                    logger.info(f"Page '{page_dir}' discovered and loaded")
-                else:
-                    logger.warning(f"Module '{module_path}' missing Page class")
-            except Exception as e:
-                logger.error(f"Error discovering page '{page_dir}': {e}")
+            page_path = os.path.join(layout_dir, page_dir)
+            if not has_page_module(page_path):
+                logger.debug(f"Skipping '{page_dir}': no Page.py")
+                continue
+            manifests.append((page_dir, self._read_manifest(page_path, page_dir)))
+
+        manifests.sort(key=lambda item: (item[1]['order'], item[0]))
+        discovered_pages = {}
+        for page_dir, manifest in manifests:
+            discovered_pages[page_dir] = manifest
+            self.main_window.available_pages[page_dir] = manifest
+            logger.debug(f"Page '{page_dir}' discovered")
+
+        if not LAZY_PAGE_LOADING:
+            for page_dir in list(discovered_pages):
+                if self._get_page_module(page_dir) is None:
+                    del discovered_pages[page_dir]
+                    del self.main_window.available_pages[page_dir]
         return discovered_pages
 
+    def _read_manifest(self, page_path: str, page_dir: str) -> Dict[str, Any]:
+        """Read the page manifest, falling back to values derived from the directory name."""
+        prefix, _, rest = page_dir.partition('_')
+        manifest = {
+            'title': (rest if prefix.isdigit() and rest else page_dir).replace('_', ' ').capitalize(),
+            'icon': page_dir.lower(),
+            'order': int(prefix) if prefix.isdigit() else sys.maxsize,
+        }
+        manifest_path = os.path.join(page_path, PAGE_MANIFEST_FILENAME)
+        if os.path.isfile(manifest_path):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    manifest.update(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Invalid page manifest '{manifest_path}': {e}")
+        return manifest
+
+    def _get_page_module(self, page_name: str) -> Optional[Any]:
+        """Import a page module on first use; safe to call from the prefetch thread."""
+        module = self.main_window.module_cache.get(page_name)
+        if module is not None:
+            return module
+
+        layout_dir = self._get_layout_dir()
+        module_path = self._build_module_path(layout_dir, page_name)
+        with tracer.span("PageManager.import_page", page=page_name):
+            module = load_module(module_path)
+        if module is None or not hasattr(module, 'Page'):
+            logger.warning(f"Module '{module_path}' missing Page class")
+            return None
+
+        self.main_window.module_cache[page_name] = module
+        logger.info(f"Page '{page_name}' imported")
+        return module
+
+    def prefetch_pages(self, current_page: Optional[str] = None) -> None:
+        """
+        Import the pages following current_page in navigation order on a
+        background thread so the first click on them only pays for construction.
+        """
+        page_names = list(self.main_window.available_pages)
+        start = page_names.index(current_page) + 1 if current_page in page_names else 0
+        candidates = [
+            name for name in page_names[start:] + page_names[:start]
+            if name != current_page and name not in self.main_window.module_cache
+        ][:PAGE_PREFETCH_COUNT]
+        if not candidates:
+            return
+
+        def run():
+            for name in candidates:
+                try:
+                    self._get_page_module(name)
+                except Exception as e:
+                    logger.error(f"Error prefetching page '{name}': {e}")
+
+        threading.Thread(target=run, name="PagePrefetch", daemon=True).start()
+        logger.debug(f"Prefetching pages: {candidates}")
+
+    def _schedule_prefetch(self, current_page: Optional[str]) -> None:
+        if LAZY_PAGE_LOADING and PAGE_PREFETCH_ENABLED:
+            # Fires once the event loop is running, i.e. after the first paint
+            QTimer.singleShot(PAGE_PREFETCH_DELAY_MS, lambda: self.prefetch_pages(current_page))
+
     def load_page(self, page_name: str) -> bool:
         logger.info(f"Attempting to load page: {page_name}")
 
@@ -141,9 +202,10 @@ class PageManager:
             return False
         return True
 
+    @traced("PageManager.initialize_page")
     def _initialize_new_page(self, page_name: str) -> bool:
         try:
-            module = self.main_window.available_pages[page_name]
+            module = self._get_page_module(page_name)
             page_class = getattr(module, 'Page', None)
 
             if not page_class:
@@ -258,6 +320,9 @@ class PageManager:
             logger.error(f"Error loading last page: {e}")
             self.load_first_available_page()
 
+        current = next(iter(self.main_window.loaded_pages), None)
+        self._schedule_prefetch(current)
+
     def load_first_available_page(self) -> bool:
         logger.info("Attempting to load first available page")
         if not self.main_window.available_pages:
@@ -298,6 +363,7 @@ class PageManager:
         if page_name in self.main_window.available_pages:
             del self.main_window.available_pages[page_name]
             logger.debug(f"Removed '{page_name}' from available_pages")
+        self.main_window.module_cache.pop(page_name, None)
 
         # Update last page if needed
         if self.state_handler and self.state_handler.get_last_page() == page_name:
@@ -341,7 +407,7 @@ class PageManager:
 
     def _get_page_class(self) -> Optional[type]:
         try:
-            for module in self.main_window.available_pages.values():
+            for module in list(self.main_window.module_cache.values()):
                 if hasattr(module, 'Page'):
                     return module.Page
             logger.warning("No Page class found in available modules")
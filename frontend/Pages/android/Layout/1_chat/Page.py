@@ -640,7 +640,7 @@ class Page(QWidget):
             self.workflow_status.setStyleSheet("color: green;")
             self.update_status_message(f"Switched to {workflow} workflow", is_agent_message=True)
         except Exception as e:
-            logger.error(f"Error updating workflow: {e}")
+            logger.error("Error updating workflow: %s", e)
             QMessageBox.warning(self, "Workflow Error", f"Failed to update workflow: {e}")
             self.workflow_status.setText("Workflow: Error")
             self.workflow_status.setStyleSheet("color: red;")
@@ -857,7 +857,7 @@ class Page(QWidget):
         for code_block in code_blocks:
             language = code_block['language']
             code = code_block['code']
-            logger.info(f"Code block found ({language}): {code}")
+            logger.info("Code block found (%s): %s", language, code)
 
     def display_user_message(self, message):
         """
@@ -1086,7 +1086,7 @@ class Page(QWidget):
             self.chats[self.current_chat_id]['messages'] = []
             self.chat_display.setMarkdown("")
             save_chat_log(self.current_chat_id, self.chats[self.current_chat_id])
-            logger.info(f"Cleared chat: {self.current_chat_id}")
+            logger.info("Cleared chat: %s", self.current_chat_id)
         else:
             QMessageBox.warning(self, "No Chat Selected", "No chat session is currently active.")
 
@@ -1272,7 +1272,7 @@ class Page(QWidget):
         Toggle the agent (developer) mode based on the QCheckBox state.
         """
         # Debug: skriv ut till logg/console vilket state vi får
-        logger.info(f"toggle_agent_mode called with state: {state}")
+        logger.info("toggle_agent_mode called with state: %s", state)
 
         # Om state == Qt.Checked (vilket oftast är värdet 2) så ska agenten aktiveras
         if state == Qt.Checked:
@@ -61,7 +61,7 @@ class Page(TabModulePage):  # You can also use SplitModulePage or StackedModuleP
 
     def update_theme(self, theme):
         super().update_theme(theme)
-        logger.info(f"Page theme updated to {theme}")
+        logger.info("Page theme updated to %s", theme)
 
 # For a simple page without modules, you can use BasePage directly
 class SimplePage(BasePage):
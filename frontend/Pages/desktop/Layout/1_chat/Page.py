@@ -37,6 +37,7 @@ from ai_agent.utils.helpers import insert_file_name, show_file_suggestions
 from Utils.llm_util.llm_sorted_func import process_files
 
 from log.logger import logger
+from log.tracer import tracer, traced
 from Config.AppConfig.icon_config import ICONS
 from Styles.theme_manager import apply_theme, ThemeManager
 from Styles.code_block_style import MarkdownRenderer  # For code block styling
@@ -196,7 +197,7 @@ class CodeDisplayWindow(QWidget):
             QMessageBox.information(self, "Copied", "Code copied to clipboard!")
             logger.info("Code block copied to clipboard.")
         except Exception as e:
-            logger.error(f"Error copying code to clipboard: {e}")
+            logger.error("Error copying code to clipboard: %s", e)
             QMessageBox.warning(self, "Error", f"Failed to copy code: {e}")
 
     def save_code(self):
@@ -210,9 +211,9 @@ class CodeDisplayWindow(QWidget):
                 with open(file_path, 'w', encoding='utf-8') as file:
                     file.write(self.code_block)
                 QMessageBox.information(self, "Saved", f"Code saved to {file_path}")
-                logger.info(f"Code block saved to {file_path}.")
+                logger.info("Code block saved to %s.", file_path)
         except Exception as e:
-            logger.error(f"Unexpected error saving code block: {e}")
+            logger.error("Unexpected error saving code block: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to save code block: {e}")
 
 def show_code_window(code_block, language='python'):
@@ -224,14 +225,14 @@ def show_code_window(code_block, language='python'):
         language (str): The programming language of the code block.
     """
     try:
-        logger.debug(f"Showing code window with code block:\n{code_block}")
+        logger.debug("Showing code window with code block:\n%s", code_block)
         code_window = CodeDisplayWindow(code_block, language=language)
         code_window.show()
         # Keep a reference to prevent garbage collection
         CodeDisplayWindow.instances.append(code_window)
         logger.info("Code window displayed successfully.")
     except Exception as e:
-        logger.error(f"Unexpected error showing code window: {e}")
+        logger.error("Unexpected error showing code window: %s", e)
 
 # Initialize a list to keep references to open code windows
 CodeDisplayWindow.instances = []
@@ -1129,7 +1130,7 @@ class Page(QWidget):
         content = self.user_message_textedit.toPlainText()
         token_count = count_tokens_in_string(content)
         self.token_count_label.setText(f"Tokens: {token_count}")
-        logger.debug(f"Token counter updated: {token_count} tokens.")
+        logger.debug("Token counter updated: %s tokens.", token_count)
 
     def eventFilter(self, source, event):
         """
@@ -1878,7 +1879,7 @@ class Page(QWidget):
         content = self.user_message_textedit.toPlainText()
         token_count = count_tokens_in_string(content)
         self.token_count_label.setText(f"Tokens: {token_count}")
-        logger.debug(f"Token counter updated: {token_count} tokens.")
+        logger.debug("Token counter updated: %s tokens.", token_count)
 
     def eventFilter(self, source, event):
         """
@@ -2267,43 +2268,46 @@ class Page(QWidget):
         """
         Handle sending a message.
         """
-        logger.debug("send_message called.")
-        message = self.user_message_textedit.toPlainText().strip()
-        logger.debug("User message retrieved: '%s'", message)
-        if message:
-            # Display the user's message
-            self.display_user_message(message)
-            logger.debug("User message displayed.")
-
-            # Add the message to the chat history
-            add_to_chat_history(self.current_chat_id, self.chats, {'role': 'user', 'content': message})
-            logger.debug("User message added to chat history.")
-
-            # Prepare the messages for the AI model
-            system_prompt = self.agent_system_prompt_content
-            user_message = message
-            memory = load_memory()
-            messages = prepare_messages(system_prompt, user_message, self.current_model_name, self.config)
-            logger.debug("Messages prepared for AI model: %s", messages)
-
-            # Update status to show processing
-            self.update_status_message("Processing message...", is_agent_message=True)
-            logger.debug("Status message updated to 'Processing message...'.")
-
-            # Start a worker thread to get AI response
-            self.worker_thread = WorkerThread(messages, self.ai_service)
-            self.worker_thread.response_ready.connect(self.handle_ai_response)
-            self.worker_thread.error_occurred.connect(self.handle_ai_error)
-            self.worker_thread.code_blocks_found.connect(self.handle_code_blocks)
-            self.worker_thread.start()
-            logger.debug("Worker thread started for AI response.")
-
-            # Clear the user message text edit
-            self.user_message_textedit.clear()
-            logger.debug("User message text edit cleared.")
-        else:
-            logger.debug("No message to send.")
+        # Span instead of @traced: clicked(bool) inspects this slot's signature
+        with tracer.span("Page.send_message"):
+            logger.debug("send_message called.")
+            message = self.user_message_textedit.toPlainText().strip()
+            logger.debug("User message retrieved: '%s'", message)
+            if message:
+                # Display the user's message
+                self.display_user_message(message)
+                logger.debug("User message displayed.")
+
+                # Add the message to the chat history
+                add_to_chat_history(self.current_chat_id, self.chats, {'role': 'user', 'content': message})
+                logger.debug("User message added to chat history.")
+
+                # Prepare the messages for the AI model
+                system_prompt = self.agent_system_prompt_content
+                user_message = message
+                memory = load_memory()
+                messages = prepare_messages(system_prompt, user_message, self.current_model_name, self.config)
+                logger.debug("Messages prepared for AI model: %s", messages)
+
+                # Update status to show processing
+                self.update_status_message("Processing message...", is_agent_message=True)
+                logger.debug("Status message updated to 'Processing message...'.")
+
+                # Start a worker thread to get AI response
+                self.worker_thread = WorkerThread(messages, self.ai_service)
+                self.worker_thread.response_ready.connect(self.handle_ai_response)
+                self.worker_thread.error_occurred.connect(self.handle_ai_error)
+                self.worker_thread.code_blocks_found.connect(self.handle_code_blocks)
+                self.worker_thread.start()
+                logger.debug("Worker thread started for AI response.")
+
+                # Clear the user message text edit
+                self.user_message_textedit.clear()
+                logger.debug("User message text edit cleared.")
+            else:
+                logger.debug("No message to send.")
 
+    @traced("Page.handle_ai_response")
     def handle_ai_response(self, response_content, additional_data):
         """
         Handle the AI's response when it's ready.
@@ -2,6 +2,9 @@
 # ./frontend/Pages/desktop/Layout/Markdown_CSV_Extr/Extractorz.py
 
 from PySide6.QtCore import QObject, Signal, Slot
+from log.tracer import traced
+from Config.AppConfig.config import EXTRACTION_WRITE_WORKERS
+from Utils.file_sync import read_bytes, sync_file, text_bytes, write_files
 
 import os
 import pandas as pd
@@ -12,7 +15,8 @@ import os
 import re
 import toml
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Any
+from functools import partial
+from typing import List, Dict, Iterator, Optional, Tuple, Any
 
 import os
 import re
@@ -40,6 +44,7 @@ class MarkdownEx:
         self.settings = self.load_settings()
         self.update_progress = None  # For GUI progress
         self.update_status = None    # For GUI status messages
+        self.presets = None          # Restrict run() to these preset names
         self._is_running = True
         os.makedirs(self.output_dir, exist_ok=True)
 
@@ -47,6 +52,13 @@ class MarkdownEx:
         """Stop the extraction process gracefully."""
         self._is_running = False
 
+    def selected_presets(self):
+        """Presets from settings, limited to self.presets when it is set."""
+        presets = self.settings.get('presets', {})
+        if self.presets is None:
+            return presets
+        return {name: files for name, files in presets.items() if name in self.presets}
+
     def load_settings(self):
         """Load TOML settings and normalize paths."""
         try:
@@ -356,13 +368,14 @@ class MarkdownEx:
 
         return main_output_path, where_file_lines_path
 
+    @traced("MarkdownEx.run")
     def run(self):
         """Main entry point for running the Markdown extraction."""
         if not os.path.exists(self.settings_path):
             raise FileNotFoundError(f"Settings file not found: {self.settings_path}")
 
         output_dir = self.settings['paths']['output_dir']
-        presets = self.settings.get('presets', {})
+        presets = self.selected_presets()
         total_presets = len(presets)
 
         if total_presets == 0:
@@ -395,6 +408,9 @@ class MarkdownEx:
                     continue
 
                 markdown_content, where_file_lines = self.create_markdown_for_files(file_paths)
+                if not self._is_running:
+                    # Don't leave a partial document behind
+                    break
                 main_output_path, where_file_lines_path = self.save_markdown(
                     markdown_content,
                     where_file_lines,
@@ -428,6 +444,7 @@ class CSVEx:
         self.settings = self.load_settings()
         self.update_progress = None  # For GUI progress
         self.update_status = None    # For GUI status messages
+        self.presets = None          # Restrict run() to these preset names
         self._is_running = True
         os.makedirs(self.output_dir, exist_ok=True)
 
@@ -435,6 +452,13 @@ class CSVEx:
         """Stop the extraction process gracefully."""
         self._is_running = False
 
+    def selected_presets(self):
+        """Presets from settings, limited to self.presets when it is set."""
+        presets = self.settings.get('presets', {})
+        if self.presets is None:
+            return presets
+        return {name: files for name, files in presets.items() if name in self.presets}
+
     def load_settings(self):
         """Load TOML settings for CSV extraction."""
         try:
@@ -674,6 +698,7 @@ class CSVEx:
                 self.update_status(f"Error saving Excel file: {str(e)}")
             raise
 
+    @traced("CSVEx.run")
     def run(self):
         """Main entry point for CSV extraction, saving results to Excel."""
         if not os.path.exists(self.settings_path):
@@ -683,7 +708,7 @@ class CSVEx:
             if self.update_status:
                 self.update_status("Starting extraction process...")
 
-            presets = self.settings.get('presets', {})
+            presets = self.selected_presets()
             total_presets = len(presets)
 
             if total_presets == 0:
@@ -719,6 +744,9 @@ class CSVEx:
                         self.update_status(f"Generating directory tree for preset: {preset_name}")
 
                     directory_tree_with_detailed_metrics = self.generate_directory_tree_with_detailed_metrics()
+                    if not self._is_running:
+                        # Don't leave a partial workbook behind
+                        break
 
                     if self.update_status:
                         self.update_status(f"Saving to Excel file for preset: {preset_name}")
@@ -749,6 +777,30 @@ class CSVEx:
             raise
 
 
+# Patterns for ReverseMarkdownEx.extract_code_blocks, compiled once.
+# A section starts at a line beginning with '#' or at a ---/***/___ rule line.
+# Matching the preceding newline (rather than ^ with MULTILINE) lets the regex
+# engine skip ahead with a fast literal search.
+SECTION_START_PATTERN = re.compile(r'\n(?=#|[^\S\n]*(?:---|\*\*\*|___)[^\S\n]*(?:\n|\Z))')
+
+# Tried in order against the start of a section; the first that matches wins
+HEADER_PATH_PATTERNS = [
+    re.compile(r'^#\s*(?:title\s*=\s*)(.*?\.[\w]+)$', re.MULTILINE),
+    re.compile(r'^#+\s*(?:File|Path|Location|Source|Module Path|Container Path):\s*(.*?\.[\w]+)$', re.MULTILINE),
+    re.compile(r'^#\s*\[(.*?\.[\w]+)\]$', re.MULTILINE),
+    re.compile(r'^#\s*(.*?\.[\w]+)$', re.MULTILINE),
+]
+
+# Opening of a ```lang block; the body runs to the next ``` (found with str.find)
+CODE_FENCE_OPEN_PATTERN = re.compile(r'```(\w+)\n')
+
+# Path comments on the first line of a code block
+CODE_COMMENT_PATH_PATTERNS = [
+    re.compile(r'^(?://|#)\s*(.*?\.[\w]+)$'),
+    re.compile(r'^(?://|#)\s*\[(.*?\.[\w]+)\]$'),
+    re.compile(r'^(?://|#)\s*(?:File|Path|Location|Source):\s*(.*?\.[\w]+)$'),
+]
+
 @dataclass
 class CodeBlock:
     path: str
@@ -822,111 +874,105 @@ class ReverseMarkdownEx:
             formatted_path = os.path.join('.', path).replace('\\', '/')
         return formatted_path
 
+    @traced("ReverseMarkdownEx.extract_code_blocks")
     def extract_code_blocks(self, content: str) -> List[CodeBlock]:
         """
         Enhanced extraction of code blocks supporting multiple formats.
         Handles various path locations and formats.
+
+        Sections start at every line beginning with '#' and at ---/***/___
+        rules. Each section yields at most one block: the path comes from the
+        section header or, failing that, a path comment on the first line of
+        a fenced block; the content is that of the section's last fence.
         """
         code_blocks = []
-        
-        # Define all pattern sets
-        header_patterns = [
-            (r'^#\s*(?:title\s*=\s*)(.*?\.[\w]+)$', False),
-            (r'^#+\s*(?:File|Path|Location|Source|Module Path|Container Path):\s*(.*?\.[\w]+)$', False),
-            (r'^#\s*\[(.*?\.[\w]+)\]$', False),
-            (r'^#\s*(.*?\.[\w]+)$', False),
-        ]
-        
-        code_comment_patterns = [
-            (r'^(?://|#)\s*(.*?\.[\w]+)$', False),
-            (r'^(?://|#)\s*\[(.*?\.[\w]+)\]$', False),
-            (r'^(?://|#)\s*(?:File|Path|Location|Source):\s*(.*?\.[\w]+)$', False),
-        ]
-        
-        section_patterns = [
-            r'^\s*---\s*$',
-            r'^\s*\*\*\*\s*$',
-            r'^\s*___\s*$',
-            r'^#+\s*.*$'
-        ]
-        
-        # Split content into sections using any delimiter
-        sections = self._split_into_sections(content, section_patterns)
-        
-        for section in sections:
+
+        for start, end in self._section_spans(content):
+            # Sections without a fence can't produce a block
+            if content.find('```', start, end) == -1:
+                continue
             try:
-                # Extract path from section header or content
-                file_path = None
-                code_content = None
-                language = None
-                
-                # Try header patterns first
-                for pattern, is_update in header_patterns:
-                    matches = re.finditer(pattern, section, re.MULTILINE)
-                    for match in matches:
-                        file_path = match.group(1)
-                        break
-                    if file_path:
-                        break
-                
-                # Look for code blocks
-                code_block_pattern = r'```(\w+)\n(.*?)```'
-                code_matches = list(re.finditer(code_block_pattern, section, re.DOTALL))
-                
-                if code_matches:
-                    for code_match in code_matches:
-                        language = code_match.group(1)
-                        code_content = code_match.group(2).strip()
-                        
-                        # If no path found in header, try code comments
-                        if not file_path:
-                            code_lines = code_content.split('\n')
-                            if code_lines:
-                                for pattern, is_update in code_comment_patterns:
-                                    comment_match = re.match(pattern, code_lines[0])
-                                    if comment_match:
-                                        file_path = comment_match.group(1)
-                                        # Remove the comment line if path was found there
-                                        code_content = '\n'.join(code_lines[1:]).strip()
-                                        break
-                
-                if file_path and code_content:
-                    normalized_path = self._normalize_path(file_path)
-                    code_blocks.append(CodeBlock(
-                        path=normalized_path,
-                        language=language or self._detect_language(normalized_path),
-                        content=code_content,
-                        style='windows' if '\\' in file_path else 'unix'
-                    ))
-                    
+                block = self._extract_section(content, start, end)
+                if block is not None:
+                    code_blocks.append(block)
             except Exception as e:
                 print(f"Error processing section: {str(e)}")
                 continue
-                
+
         return code_blocks
 
-    def _split_into_sections(self, content: str, section_patterns: List[str]) -> List[str]:
+    def _section_spans(self, content: str) -> Iterator[Tuple[int, int]]:
         """
-        Split content into sections based on various delimiter patterns.
+        Yield (start, end) offsets of each section in one scan of content.
+
+        A section runs from a boundary line up to (not including) the newline
+        before the next boundary; text before the first boundary forms its
+        own section (a boundary on the first line just opens section one).
         """
-        # Combine all patterns into one
-        combined_pattern = '|'.join(f'({pattern})' for pattern in section_patterns)
-        
-        # Split content
-        sections = []
-        current_section = []
-        
-        for line in content.split('\n'):
-            if any(re.match(pattern, line) for pattern in section_patterns):
-                if current_section:
-                    sections.append('\n'.join(current_section))
-                    current_section = []
-            current_section.append(line)
-            
-        if current_section:
-            sections.append('\n'.join(current_section))
-            
-        return sections if sections else [content]
+        start = 0
+        for match in SECTION_START_PATTERN.finditer(content):
+            newline = match.start()
+            yield start, newline
+            start = newline + 1
+        yield start, len(content)
+
+    @staticmethod
+    def _code_fences(content: str, start: int, end: int) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (language, body) for each ```lang block in content[start:end].
+
+        Same matches as re.finditer(r'```(\\w+)\\n(.*?)```', section, re.DOTALL),
+        but the closing fence is located with str.find.
+        """
+        pos = start
+        while True:
+            opening = CODE_FENCE_OPEN_PATTERN.search(content, pos, end)
+            if opening is None:
+                return
+            closing = content.find('```', opening.end(), end)
+            if closing == -1:
+                # No later opening can be closed either
+                return
+            yield opening.group(1), content[opening.end():closing]
+            pos = closing + 3
+
+    def _extract_section(self, content: str, start: int, end: int) -> Optional[CodeBlock]:
+        """Build the code block for content[start:end], if it has a path and code."""
+        file_path = None
+        code_content = None
+        language = None
+
+        # Header lines start with '#', and only a section's first line can
+        if content.startswith('#', start):
+            for pattern in HEADER_PATH_PATTERNS:
+                match = pattern.match(content, start, end)
+                if match:
+                    file_path = match.group(1)
+                    break
+
+        for language, code_content in self._code_fences(content, start, end):
+            code_content = code_content.strip()
+
+            # If no path found in header, try code comments
+            if not file_path:
+                first_line, _, rest = code_content.partition('\n')
+                for pattern in CODE_COMMENT_PATH_PATTERNS:
+                    comment_match = pattern.match(first_line)
+                    if comment_match:
+                        file_path = comment_match.group(1)
+                        # Remove the comment line if path was found there
+                        code_content = rest.strip()
+                        break
+
+        if not (file_path and code_content):
+            return None
+        normalized_path = self._normalize_path(file_path)
+        return CodeBlock(
+            path=normalized_path,
+            language=language or self._detect_language(normalized_path),
+            content=code_content,
+            style='windows' if '\\' in file_path else 'unix'
+        )
 
     def _detect_language(self, file_path: str) -> str:
         """
@@ -993,129 +1039,135 @@ class ReverseMarkdownEx:
             
         return path
 
+    @staticmethod
+    def _replace_class(content: str, class_name: str, new_content: str) -> Optional[str]:
+        """Return content with class_name's definition replaced, or None if it isn't there."""
+        class_pattern = re.compile(
+            f'class\\s+{re.escape(class_name)}\\s*(?:\\([^)]*\\))?\\s*:\\s*[^#]*?(?=\\s*class\\s+|$)',
+            re.DOTALL | re.MULTILINE
+        )
+        match = class_pattern.search(content)
+        if not match:
+            return None
+        return content[:match.start()] + new_content + content[match.end():]
+
     def update_class_in_file(self, file_path: str, class_name: str, new_content: str) -> bool:
         """Update a specific class in a file while preserving all other content."""
+        if not os.path.exists(file_path):
+            print(f"File not found: {file_path}")
+            return False
+        block = CodeBlock(path=file_path, language='', content=new_content, style='unix', update_class=class_name)
         try:
-            # Read existing file content
-            if not os.path.exists(file_path):
-                print(f"File not found: {file_path}")
-                return False
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Find the target class using improved pattern
-            class_pattern = re.compile(
-                f'class\\s+{re.escape(class_name)}\\s*(?:\\([^)]*\\))?\\s*:\\s*[^#]*?(?=\\s*class\\s+|$)',
-                re.DOTALL | re.MULTILINE
-            )
-
-            match = class_pattern.search(content)
-            if not match:
-                print(f"Class {class_name} not found in {file_path}")
-                return False
-
-            # Get the full match and its position
-            start = match.start()
-            end = match.end()
-
-            # Print debug info
-            print(f"Found class {class_name} at position {start}-{end}")
-            print("Original content around match:")
-            context_before = content[max(0, start-50):start]
-            context_after = content[end:min(len(content), end+50)]
-            print(f"Before: {context_before}")
-            print(f"After: {context_after}")
+            _, applied = self._restore_file(file_path, [block])
+        except Exception as e:
+            print(f"Error updating class {class_name} in {file_path}: {str(e)}")
+            return False
+        return applied == 1
 
-            # Construct updated content
-            updated = content[:start] + new_content + content[end:]
+    def _restore_file(self, full_path: str, blocks: List[CodeBlock]) -> Tuple[bool, int]:
+        """
+        Apply every block targeting one file with a single read-modify-write.
 
-            # Write the updated content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated)
+        Blocks are applied in order: a full block replaces the file content, a
+        class block replaces that class in the content so far (skipped when the
+        file doesn't exist yet). The file is only written if the result differs
+        from what is on disk.
 
-            print(f"Successfully updated class {class_name} in {file_path}")
-            return True
+        Returns:
+            (written, number of blocks applied)
+        """
+        current = None
+        text = None
+        if any(block.update_class for block in blocks):
+            current = read_bytes(full_path)
+            if current is not None:
+                # Same text the file would give when opened in text mode
+                text = current.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+        applied = 0
+        for block in blocks:
+            if block.update_class:
+                if text is None:
+                    continue
+                updated = self._replace_class(text, block.update_class, block.content)
+                if updated is None:
+                    print(f"Class {block.update_class} not found in {full_path}")
+                    continue
+                text = updated
+            else:
+                text = block.content.strip()
+            applied += 1
 
-        except Exception as e:
-            print(f"Error updating class {class_name} in {file_path}: {str(e)}")
-            return False
+        if text is None:
+            return False, applied
+        return sync_file(full_path, text_bytes(text), current), applied
 
+    @traced("ReverseMarkdownEx.run")
     def run(self) -> None:
         """Process the markdown content and create/update files."""
         try:
-            print("1. Starting ReverseMarkdownEx.run()")
-
             if not os.path.exists(self.markdown_path):
                 print(f"Error: Markdown file not found at {self.markdown_path}")
                 raise FileNotFoundError(f"Markdown file not found: {self.markdown_path}")
 
-            print("2. Loading Markdown file...")
             if self.update_status:
                 self.update_status("Loading Markdown file...")
 
             with open(self.markdown_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-                print(f"3. Read {len(content)} bytes from file")
 
             # Extract all code blocks
-            print("4. Extracting code blocks...")
             code_blocks = self.extract_code_blocks(content)
-            print(f"5. Found {len(code_blocks)} code blocks")
             total_blocks = len(code_blocks)
+            print(f"ReverseMarkdownEx: Found {total_blocks} code blocks")
 
             if total_blocks == 0:
-                print("6. No code blocks found")
                 if self.update_status:
                     self.update_status("No valid code blocks found to extract.")
                 return
 
-            processed_count = 0
-            for idx, block in enumerate(code_blocks, 1):
-                if not self._is_running:
-                    print("Process stopped by user")
-                    if self.update_status:
-                        self.update_status("Extraction stopped by user.")
-                    return
-
-                try:
-                    print(f"7. Processing block {idx}/{total_blocks}: {block.path}")
-                    file_path = block.path
-                    relative_path = file_path.replace('\\', '/').replace('../', '').replace('./', '')
-                    full_path = os.path.join(self.output_dir, relative_path).replace('\\', '/')
-                    
-                    # Create directory
-                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                    print(f"8. Created directory: {os.path.dirname(full_path)}")
-
-                    if block.update_class:
-                        # Handle class update
-                        if os.path.exists(full_path):
-                            success = self.update_class_in_file(full_path, block.update_class, block.content)
-                            if success:
-                                processed_count += 1
-                    else:
-                        # Handle full file creation/update
-                        print(f"9. Writing to file: {full_path}")
-                        with open(full_path, 'w', encoding='utf-8') as out_file:
-                            cleaned_content = block.content.strip()
-                            out_file.write(cleaned_content)
-                            processed_count += 1
-                            print(f"10. Successfully wrote file {processed_count}")
-
-                    if self.update_progress:
-                        progress = int(idx * 100 / total_blocks)
-                        print(f"11. Progress: {progress}%")
-                        self.update_progress(progress)
+            # Group blocks per target so each file is read and written at most once.
+            # Spellings of the same path ('src//a.py', 'src/A.py' on Windows) share
+            # one job; the first spelling seen is the one written.
+            targets: Dict[str, List[CodeBlock]] = {}
+            paths: Dict[str, str] = {}
+            for block in code_blocks:
+                relative_path = block.path.replace('\\', '/').replace('../', '').replace('./', '')
+                full_path = os.path.normpath(os.path.join(self.output_dir, relative_path)).replace('\\', '/')
+                key = os.path.normcase(os.path.normpath(full_path))
+                paths.setdefault(key, full_path)
+                targets.setdefault(key, []).append(block)
+
+            applied_counts: Dict[str, int] = {}
+
+            def restore(key: str) -> bool:
+                written, applied_counts[key] = self._restore_file(paths[key], targets[key])
+                return written
+
+            summary = write_files(
+                {key: partial(restore, key) for key in targets},
+                max_workers=EXTRACTION_WRITE_WORKERS,
+                is_running=lambda: self._is_running,
+                on_progress=self._report_write_progress,
+                on_error=self._report_write_error,
+            )
+            processed_count = sum(applied_counts.values())
+            print(
+                f"ReverseMarkdownEx: Processed {processed_count} blocks "
+                f"({summary.written} files written, {summary.unchanged} unchanged)"
+            )
 
-                except Exception as e:
-                    print(f"Error processing file {file_path}: {str(e)}")
-                    continue
+            if not self._is_running:
+                if self.update_status:
+                    self.update_status("Extraction stopped by user.")
+                return
 
-            print(f"12. Extraction complete. Processed {processed_count} files")
-            if self.update_status and self._is_running:
+            if self.update_status:
                 if processed_count > 0:
-                    self.update_status(f"Successfully processed {processed_count} files in: {self.output_dir}")
+                    self.update_status(
+                        f"Successfully processed {processed_count} files in: {self.output_dir} "
+                        f"({summary.unchanged} already up to date)"
+                    )
                 else:
                     self.update_status("No files were processed.")
 
@@ -1125,6 +1177,13 @@ class ReverseMarkdownEx:
                 self.update_status(f"Error during extraction: {str(e)}")
             raise
 
+    def _report_write_progress(self, completed: int, total: int) -> None:
+        if self.update_progress:
+            self.update_progress(int(completed * 100 / total))
+
+    def _report_write_error(self, file_path: str, error: Exception) -> None:
+        print(f"Error processing file {file_path}: {str(error)}")
+
 
 def reverse_markdown_extraction(markdown_path: str, output_dir: str, settings_path: Optional[str] = None) -> None:
     """Convenience function for reversing markdown -> files."""
@@ -1143,6 +1202,7 @@ class ReverseCSVEx:
         """Stop the reverse extraction process gracefully."""
         self._is_running = False
 
+    @traced("ReverseCSVEx.run")
     def run(self):
         """Reverse the CSV extraction process by recreating files from an Excel sheet."""
         try:
@@ -1157,30 +1217,35 @@ class ReverseCSVEx:
                     self.update_status("No records found in the Excel file.")
                 return
 
-            for idx, row in df.iterrows():
-                if not self._is_running:
-                    if self.update_status:
-                        self.update_status("Reverse CSV extraction stopped by user.")
-                    break
-
-                try:
-                    out_path = os.path.join(self.output_dir, row['Path'])
-                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-
-                    with open(out_path, 'w', encoding='utf-8') as f:
-                        f.write(row['Code'])
-
-                    if self.update_progress:
-                        self.update_progress(int((idx + 1) * 100 / total_files))
-
-                except Exception as e:
-                    print(f"Error processing file {row['Path']}: {str(e)}")
-                    if self.update_status:
-                        self.update_status(f"Error processing {row['Path']}: {str(e)}")
+            # The last row for a path wins, as it did when rows were written in order,
+            # including rows that spell the same path differently
+            files: Dict[str, Tuple[str, Any]] = {}
+            for relative_path, code in zip(df['Path'], df['Code']):
+                if not isinstance(relative_path, str):
+                    print(f"Skipping row without a path: {relative_path!r}")
                     continue
+                out_path = os.path.join(self.output_dir, relative_path)
+                files[os.path.normcase(os.path.normpath(out_path))] = (out_path, code)
+
+            summary = write_files(
+                {key: partial(self._write_file, out_path, code) for key, (out_path, code) in files.items()},
+                max_workers=EXTRACTION_WRITE_WORKERS,
+                is_running=lambda: self._is_running,
+                on_progress=self._report_write_progress,
+                on_error=self._report_write_error,
+            )
+            print(f"ReverseCSVEx: {summary.written} files written, {summary.unchanged} unchanged")
 
-            if self.update_status and self._is_running:
-                self.update_status(f"Files have been recreated in: {self.output_dir}")
+            if not self._is_running:
+                if self.update_status:
+                    self.update_status("Reverse CSV extraction stopped by user.")
+                return
+
+            if self.update_status:
+                self.update_status(
+                    f"Files have been recreated in: {self.output_dir} "
+                    f"({summary.unchanged} already up to date)"
+                )
 
         except Exception as e:
             print(f"Error during reverse CSV extraction: {str(e)}")
@@ -1188,6 +1253,20 @@ class ReverseCSVEx:
                 self.update_status(f"Error during reverse CSV extraction: {str(e)}")
             raise
 
+    @staticmethod
+    def _write_file(out_path: str, code: str) -> bool:
+        return sync_file(out_path, text_bytes(code))
+
+    def _report_write_progress(self, completed: int, total: int) -> None:
+        if self.update_progress:
+            self.update_progress(int(completed * 100 / total))
+
+    def _report_write_error(self, out_path: str, error: Exception) -> None:
+        relative_path = os.path.relpath(out_path, self.output_dir)
+        print(f"Error processing file {relative_path}: {str(error)}")
+        if self.update_status:
+            self.update_status(f"Error processing {relative_path}: {str(error)}")
+
 
 def reverse_csv_extraction(file_path, output_dir):
     """Convenience function for reversing Excel -> files."""
@@ -11,7 +11,8 @@ from PySide6.QtCore import QObject, Signal, Qt, QTimer, QThread, Slot, QThreadPo
 from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
-from threading import Lock
+from threading import Lock, RLock
+from collections import deque
 from PySide6.QtGui import QColor, QPalette, QFont, QKeyEvent
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QPushButton, QLabel, 
@@ -24,6 +25,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import QEvent
 from PySide6.QtGui import QColor, QPalette, QFont, QKeyEvent
 
+from Config.AppConfig.config import EXTRACTION_PROGRESS_MAX_RATE, EXTRACTION_MAX_WORKERS
+from Utils.progress import ProgressThrottle
+
 
 class ResourceManager:
     """Centralized resource management for better memory handling"""
@@ -93,54 +97,73 @@ class ExtractionWorker(QObject):
     progress = Signal(int)
     status = Signal(str)
 
-    def __init__(self, extractor_class, input_path, output_path, settings_path):
+    def __init__(self, extractor_class, input_path, output_path, settings_path,
+                 presets: Optional[List[str]] = None,
+                 max_updates_per_second: float = EXTRACTION_PROGRESS_MAX_RATE):
         """
         Initialize the worker with extraction parameters.
+
+        Args:
+            presets: Only run these presets (all presets when None)
+            max_updates_per_second: Upper bound on progress/status signals
         """
         super().__init__()
         self.extractor_class = extractor_class
         self.input_path = input_path
         self.output_path = output_path
         self.settings_path = settings_path
+        self.presets = presets
         self._extractor = None
         self._is_running = True
         self._lock = Lock()
+        # Extractors report once per file; forward at most a few updates per second
+        self._throttle = ProgressThrottle(
+            self._safe_emit_progress,
+            self._safe_emit_status,
+            max_updates_per_second
+        )
 
     def run(self):
         """
         Main execution method that runs in a separate thread.
+
+        finished is emitted on every exit path (after error when the
+        extraction failed) so the owning thread always winds down.
         """
         try:
             # Create the extractor instance
-            self._extractor = self.extractor_class(
+            extractor = self.extractor_class(
                 self.input_path,
                 self.output_path,
                 self.settings_path
             )
-
-            print(f"ExtractionWorker: Starting extraction with {self._extractor.__class__.__name__}")
-            
-            if not self._is_running:
-                print("ExtractionWorker: Process stopped before starting")
-                return
-
-            # Connect progress and status signals
-            if hasattr(self._extractor, 'update_progress'):
-                self._extractor.update_progress = lambda value: self._safe_emit_progress(value)
-            if hasattr(self._extractor, 'update_status'):
-                self._extractor.update_status = lambda msg: self._safe_emit_status(msg)
-
-            # Run the extraction
-            if self._is_running:
-                self._extractor.run()
-                print("ExtractionWorker: Extraction completed successfully")
-                self.finished.emit()
+            if self.presets is not None and hasattr(extractor, 'presets'):
+                extractor.presets = list(self.presets)
+
+            # Connect progress and status callbacks through the throttle
+            if hasattr(extractor, 'update_progress'):
+                extractor.update_progress = self._throttle.progress
+            if hasattr(extractor, 'update_status'):
+                extractor.update_status = self._throttle.status
+
+            with self._lock:
+                self._extractor = extractor
+                if not self._is_running:
+                    print("ExtractionWorker: Process stopped before starting")
+                    return
+
+            print(f"ExtractionWorker: Starting extraction with {extractor.__class__.__name__}")
+            extractor.run()
+            self._throttle.flush()
+            print("ExtractionWorker: Extraction completed successfully")
 
         except Exception as e:
             print(f"ExtractionWorker: Error during extraction: {str(e)}")
+            self._throttle.flush()
             self.error.emit(str(e))
         finally:
             self._cleanup()
+            self.finished.emit()
 
     def _safe_emit_progress(self, value: int):
         """
@@ -172,8 +195,8 @@ class ExtractionWorker(QObject):
 
     def stop(self):
         """
-        Properly stop the worker and cleanup.
-        This method is thread-safe.
+        Ask the extractor to stop; it checks the flag before every file.
+        This method is thread-safe and does not block.
         """
         print("ExtractionWorker: Stop requested")
         with self._lock:
@@ -211,82 +234,271 @@ class ExtractionWorker(QObject):
 
 
 
+class _WorkerRelay(QObject):
+    """
+    Receives one worker's signals on the manager's thread and tags them with
+    the worker's key. Queued calls still arrive after the worker itself has
+    been deleted, which rules out looking the key up through sender().
+    """
+
+    def __init__(self, manager: 'ExtractionManager', key: str, worker: ExtractionWorker):
+        super().__init__(manager)
+        self.manager = manager
+        self.key = key
+        self.worker = worker
+
+    @Slot(int)
+    def on_progress(self, value: int):
+        self.manager._handle_progress(self.key, value)
+
+    @Slot(str)
+    def on_status(self, message: str):
+        self.manager._handle_status(self.key, message)
+
+    @Slot(str)
+    def on_error(self, error_msg: str):
+        self.manager._handle_extraction_error(self.key, error_msg)
+
+    @Slot()
+    def on_finished(self):
+        self.manager._handle_worker_finished(self.key, self.worker)
+        self.worker = None
+        self.deleteLater()
+
+
 class ExtractionManager(QObject):
-    """Improved extraction manager with better thread handling"""
+    """
+    Runs extraction workers on their own threads under a global worker budget.
+
+    Each worker is registered under a key: either a plain extraction type
+    ("Markdown") or "type:preset" when a type is split into one worker per
+    preset with start_presets(). At most max_workers run at once; the rest
+    wait in a queue. Progress of all keys of a type is averaged into one
+    value, and extraction_finished(type) fires once every key of that type
+    is done (successfully or not; failures are reported via extraction_error).
+    """
     all_finished = Signal()
     extraction_error = Signal(str)
+    extraction_finished = Signal(str)   # extraction type
+    progress = Signal(str, int)         # extraction type, averaged progress
+    status = Signal(str, str)           # extraction type, status message
 
-    def __init__(self):
+    def __init__(self, max_workers: int = EXTRACTION_MAX_WORKERS):
         super().__init__()
-        self._active_workers = {}
-        self._lock = Lock()
+        self.max_workers = max(1, max_workers)
+        self._active_workers = {}        # key -> (worker, thread)
+        self._queue = deque()            # (key, worker) waiting for a free slot
+        self._stopping = []              # (key, worker, thread) asked to stop
+        self._groups = {}                # extraction type -> {key: progress}
+        self._lock = RLock()
         self._error_count = 0
+        self._cancelled = False
+
+    @staticmethod
+    def extraction_type_of(key: str) -> str:
+        return key.split(":", 1)[0]
 
     def start_extraction(self, extraction_type: str, worker: ExtractionWorker):
-        """Start a new extraction with proper thread management"""
+        """Queue a worker under a key and start it when a slot is free"""
         with self._lock:
-            # Cleanup any existing extraction of same type
+            # Cleanup any existing extraction under the same key
             self.stop_extraction(extraction_type)
+            self._groups.setdefault(self.extraction_type_of(extraction_type), {})[extraction_type] = 0
+            self._queue.append((extraction_type, worker))
+            self._start_queued()
 
-            # Create and setup new thread
-            thread = QThread()
-            worker.moveToThread(thread)
-
-            # Store worker and thread
-            self._active_workers[extraction_type] = (worker, thread)
+    def start_presets(self, extraction_type: str, extractor_class, input_path: str,
+                      output_path: str, settings_path: str,
+                      presets: Optional[List[str]] = None) -> List[str]:
+        """
+        Start one worker per preset so presets are extracted concurrently.
 
-            # Connect signals
-            thread.started.connect(worker.run)
-            worker.finished.connect(lambda: self._handle_extraction_finished(extraction_type))
-            worker.error.connect(lambda err: self._handle_extraction_error(extraction_type, err))
-            
-            # Cleanup connections
-            worker.finished.connect(thread.quit)
-            thread.finished.connect(thread.deleteLater)
-            worker.finished.connect(worker.deleteLater)
+        Returns:
+            The keys the workers were registered under
+        """
+        if presets is None:
+            try:
+                presets = list(toml.load(settings_path).get('presets', {}))
+            except (OSError, toml.TomlDecodeError) as e:
+                print(f"ExtractionManager: Could not read presets: {str(e)}")
+                presets = []
+
+        if not presets:
+            # Let the extractor report that there is nothing to do
+            worker = ExtractionWorker(extractor_class, input_path, output_path, settings_path)
+            self.start_extraction(extraction_type, worker)
+            return [extraction_type]
+
+        keys = []
+        with self._lock:
+            for preset in presets:
+                key = f"{extraction_type}:{preset}"
+                worker = ExtractionWorker(
+                    extractor_class, input_path, output_path, settings_path, presets=[preset]
+                )
+                self.start_extraction(key, worker)
+                keys.append(key)
+        return keys
 
-            # Start thread
-            thread.start()
+    def _start_queued(self):
+        """Launch queued workers while the budget allows"""
+        with self._lock:
+            stopping_keys = {key for key, _, _ in self._stopping}
+            waiting = deque()
+            while self._queue and len(self._active_workers) < self.max_workers:
+                key, worker = self._queue.popleft()
+                if key in stopping_keys:
+                    # The previous run for this key is still winding down
+                    waiting.append((key, worker))
+                    continue
+                self._launch(key, worker)
+            self._queue.extendleft(reversed(waiting))
+
+    def _launch(self, key: str, worker: ExtractionWorker):
+        # Parented so the thread outlives our bookkeeping until deleteLater runs
+        thread = QThread(self)
+        worker.moveToThread(thread)
+        self._active_workers[key] = (worker, thread)
+
+        # Connect signals through a relay living on the manager's thread
+        relay = _WorkerRelay(self, key, worker)
+        thread.started.connect(worker.run)
+        worker.progress.connect(relay.on_progress, Qt.QueuedConnection)
+        worker.status.connect(relay.on_status, Qt.QueuedConnection)
+        worker.error.connect(relay.on_error, Qt.QueuedConnection)
+        worker.finished.connect(relay.on_finished, Qt.QueuedConnection)
+
+        # Cleanup connections
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(thread.deleteLater)
+        worker.finished.connect(worker.deleteLater)
+
+        # Start thread
+        thread.start()
 
     def stop_extraction(self, extraction_type: str):
-        """Stop specific extraction with cleanup"""
+        """
+        Stop a key, or every key of an extraction type, without blocking.
+
+        Queued workers are dropped; running ones are asked to stop and are
+        released once their thread finishes.
+        """
         with self._lock:
-            if extraction_type in self._active_workers:
-                worker, thread = self._active_workers[extraction_type]
+            def matches(key):
+                return key == extraction_type or self.extraction_type_of(key) == extraction_type
+
+            queued = len(self._queue)
+            self._queue = deque(item for item in self._queue if not matches(item[0]))
+            if len(self._queue) != queued:
+                self._cancelled = True
+            for key in [key for key in self._active_workers if matches(key)]:
+                worker, thread = self._active_workers.pop(key)
                 worker.stop()
-                thread.quit()
-                thread.wait()  # Wait for thread to finish
-                self._active_workers.pop(extraction_type)
+                self._stopping.append((key, worker, thread))
+                self._cancelled = True
+
+            for group_type in list(self._groups):
+                group = self._groups[group_type]
+                for key in [key for key in group if matches(key)]:
+                    del group[key]
+                if not group:
+                    del self._groups[group_type]
 
-    def stop_all(self):
-        """Stop all extractions and cleanup"""
+    def stop_all(self, wait: bool = False, timeout_ms: int = 5000):
+        """
+        Stop all extractions and cleanup.
+
+        Args:
+            wait: Block until the worker threads have exited (used on shutdown)
+        """
         with self._lock:
-            for extraction_type in list(self._active_workers.keys()):
-                self.stop_extraction(extraction_type)
+            self._queue.clear()
+            for key in list(self._active_workers.keys()):
+                self.stop_extraction(key)
+        if wait:
+            # Includes threads that finished their work but haven't exited yet
+            for thread in self.findChildren(QThread):
+                try:
+                    thread.quit()
+                    thread.wait(timeout_ms)
+                except RuntimeError:
+                    # Already deleted via deleteLater
+                    pass
 
-    def _handle_extraction_finished(self, extraction_type: str):
-        """Handle successful extraction completion"""
+    def _handle_progress(self, key: str, value: int):
         with self._lock:
-            if extraction_type in self._active_workers:
-                self._active_workers.pop(extraction_type)
-            
-            if not self._active_workers and self._error_count == 0:
+            extraction_type = self.extraction_type_of(key)
+            group = self._groups.get(extraction_type)
+            if group is None or key not in group:
+                return
+            group[key] = value
+            average = sum(group.values()) // len(group)
+        self.progress.emit(extraction_type, average)
+
+    def _handle_status(self, key: str, message: str):
+        with self._lock:
+            if key not in self._active_workers:
+                return
+        extraction_type = self.extraction_type_of(key)
+        if key != extraction_type:
+            message = f"[{key.split(':', 1)[1]}] {message}"
+        self.status.emit(extraction_type, message)
+
+    def _handle_worker_finished(self, key: str, worker: ExtractionWorker):
+        """Release a finished worker, start queued work and report completion"""
+        with self._lock:
+            stopped = [entry for entry in self._stopping if entry[1] is worker]
+            if stopped:
+                self._stopping.remove(stopped[0])
+                self._start_queued()
+                self._check_all_finished()
+                return
+
+            if self._active_workers.get(key, (None,))[0] is not worker:
+                return
+            self._active_workers.pop(key)
+            extraction_type = self.extraction_type_of(key)
+            group = self._groups.get(extraction_type, {})
+            if key in group:
+                group[key] = 100
+                self.progress.emit(extraction_type, sum(group.values()) // len(group))
+
+            self._start_queued()
+
+            queued_keys = {queued_key for queued_key, _ in self._queue}
+            if group and not any(k in self._active_workers or k in queued_keys for k in group):
+                del self._groups[extraction_type]
+                self.extraction_finished.emit(extraction_type)
+
+            self._check_all_finished()
+
+    def _check_all_finished(self):
+        with self._lock:
+            if self._active_workers or self._queue or self._stopping or self._groups:
+                return
+            if self._error_count == 0 and not self._cancelled:
                 self.all_finished.emit()
+            self._error_count = 0
+            self._cancelled = False
 
-    def _handle_extraction_error(self, extraction_type: str, error_msg: str):
-        """Handle extraction error"""
+    def _handle_extraction_error(self, key: str, error_msg: str):
+        """Handle extraction error; the worker still emits finished afterwards"""
         with self._lock:
+            if key not in self._active_workers:
+                return
             self._error_count += 1
-            if extraction_type in self._active_workers:
-                self._active_workers.pop(extraction_type)
-            self.extraction_error.emit(f"{extraction_type}: {error_msg}")
+        self.extraction_error.emit(f"{key}: {error_msg}")
 
     def is_running(self, extraction_type: str = None) -> bool:
-        """Check if specific or any extraction is running"""
+        """Check if specific or any extraction is running or queued"""
         with self._lock:
+            keys = list(self._active_workers) + [key for key, _ in self._queue]
             if extraction_type:
-                return extraction_type in self._active_workers
-            return bool(self._active_workers)
+                return any(
+                    key == extraction_type or self.extraction_type_of(key) == extraction_type
+                    for key in keys
+                )
+            return bool(keys)
 
     def get_active_extractions(self) -> list:
         """Get list of currently running extractions"""
@@ -1896,6 +2108,12 @@ class EntryRunFrame(QFrame):
         
         # Track active extractions
         self.active_extractions = []
+        self.extraction_manager = ExtractionManager()
+        self.extraction_manager.progress.connect(self.update_progress)
+        self.extraction_manager.status.connect(self.update_status)
+        self.extraction_manager.extraction_error.connect(self.handle_extraction_error)
+        self.extraction_manager.extraction_finished.connect(self.handle_extraction_finished)
+        self.extraction_manager.all_finished.connect(self.handle_all_finished)
 
         # Set initial directory from settings
         base_dir = self.settings_manager.get_setting("paths", "base_dir", "")
@@ -2026,8 +2244,6 @@ class EntryRunFrame(QFrame):
             "Extraction Error",
             f"An error occurred during extraction:\n{error_message}"
         )
-        # Re-enable run button
-        self.run_button.setEnabled(True)
 
     def handle_extraction_finished(self, extraction_type: str):
         """Handle completion of a specific extraction"""
@@ -2040,24 +2256,31 @@ class EntryRunFrame(QFrame):
             else:
                 self.markdown_group.hide()
         
-        # If all extractions are done
+        # Re-enable run button once every extraction is done
         if not self.active_extractions:
             self.run_button.setEnabled(True)
-            QMessageBox.information(
-                self,
-                "Extraction Complete",
-                "All selected extractions completed successfully."
-            )
-            self.run_triggered.emit()
+
+    def handle_all_finished(self):
+        """Handle completion of all extractions without errors"""
+        QMessageBox.information(
+            self,
+            "Extraction Complete",
+            "All selected extractions completed successfully."
+        )
+        self.run_triggered.emit()
 
     def run_command(self):
-        """Execute the extraction process with improved thread handling"""
+        """Execute the selected extractions, one worker per preset"""
         from frontend.Pages.desktop.Layout.Markdown_CSV_Extr.extractorz import CSVEx, MarkdownEx
 
         if not self.entry_path.text():
             QMessageBox.warning(self, "No Directory Selected", "Please select a directory first.")
             return
 
+        if self.extraction_manager.is_running():
+            QMessageBox.warning(self, "Extraction Running", "Please wait for the current extraction to finish.")
+            return
+
         selected_path = self.entry_path.text()
         output_path = os.path.join(selected_path, 'output')
         
@@ -2074,202 +2297,51 @@ class EntryRunFrame(QFrame):
 
         checkbox_frame = main_window.checkbox_frame
         
+        selected = []
+        if checkbox_frame.extract_markdown:
+            selected.append(("Markdown", MarkdownEx, self.markdown_group, self.markdown_progress, self.markdown_status))
+        if checkbox_frame.extract_csv:
+            selected.append(("CSV", CSVEx, self.csv_group, self.csv_progress, self.csv_status))
+
+        if not selected:
+            QMessageBox.information(self, "No Extraction Selected", 
+                                "Please select at least one extraction option.")
+            return
+
         # Reset active extractions
         self.active_extractions = []
-        
-        # Create and start threads for each selected extraction
-        if checkbox_frame.extract_markdown:
-            try:
-                print("Setting up Markdown extraction...")
-                
-                # Create thread first
-                self.markdown_thread = QThread()
-                
-                # Create worker with class and paths
-                self.markdown_worker = ExtractionWorker(
-                    MarkdownEx,
-                    selected_path,
-                    output_path,
-                    self.window().settings_path
-                )
-                print("Created ExtractionWorker instance")
-                
-                # Move worker to thread
-                self.markdown_worker.moveToThread(self.markdown_thread)
-                print("Moved worker to thread")
-                
-                # Connect all signals before starting the thread
-                print("Setting up signal connections...")
-                
-                # Main worker signals
-                self.markdown_thread.started.connect(
-                    self.markdown_worker.run,
-                    Qt.QueuedConnection
-                )
-                
-                self.markdown_worker.progress.connect(
-                    lambda v: self.update_progress("Markdown", v),
-                    Qt.QueuedConnection
-                )
-                self.markdown_worker.status.connect(
-                    lambda s: self.update_status("Markdown", s),
-                    Qt.QueuedConnection
-                )
-                self.markdown_worker.error.connect(
-                    self.handle_extraction_error,
-                    Qt.QueuedConnection
-                )
-                self.markdown_worker.finished.connect(
-                    lambda: self.handle_extraction_finished("Markdown"),
-                    Qt.QueuedConnection
-                )
-                
-                # Cleanup connections
-                self.markdown_worker.finished.connect(
-                    self.markdown_thread.quit,
-                    Qt.QueuedConnection
-                )
-                self.markdown_worker.finished.connect(
-                    self.markdown_worker.deleteLater,
-                    Qt.QueuedConnection
-                )
-                self.markdown_thread.finished.connect(
-                    self.markdown_thread.deleteLater,
-                    Qt.QueuedConnection
-                )
-                
-                print("All signals connected")
-                
-                # Show progress UI
-                self.markdown_group.show()
-                self.markdown_progress.setValue(0)
-                self.markdown_status.setText("Starting extraction...")
-                
-                # Add to active extractions
-                self.active_extractions.append("Markdown")
-                
-                # Start thread
-                print("Starting Markdown thread...")
-                self.markdown_thread.start()
-                print("Markdown thread started")
-                
-            except Exception as e:
-                print(f"Error in Markdown extraction setup: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                QMessageBox.critical(self, "Setup Error", 
-                                f"Failed to setup Markdown extraction:\n{str(e)}")
 
-        # Similar setup for CSV extraction
-        if checkbox_frame.extract_csv:
+        # Presets of all selected types share the manager's worker budget
+        for extraction_type, extractor_class, group, progress, status in selected:
             try:
-                print("Setting up CSV extraction...")
-                
-                # Create thread first
-                self.csv_thread = QThread()
-                
-                # Create worker with class and paths
-                self.csv_worker = ExtractionWorker(
-                    CSVEx,
+                group.show()
+                progress.setValue(0)
+                status.setText("Starting extraction...")
+                self.active_extractions.append(extraction_type)
+                self.extraction_manager.start_presets(
+                    extraction_type,
+                    extractor_class,
                     selected_path,
                     output_path,
                     self.window().settings_path
                 )
-                print("Created ExtractionWorker instance")
-                
-                # Move worker to thread
-                self.csv_worker.moveToThread(self.csv_thread)
-                print("Moved worker to thread")
-                
-                # Connect all signals before starting the thread
-                print("Setting up signal connections...")
-                
-                # Main worker signals
-                self.csv_thread.started.connect(
-                    self.csv_worker.run,
-                    Qt.QueuedConnection
-                )
-                
-                self.csv_worker.progress.connect(
-                    lambda v: self.update_progress("CSV", v),
-                    Qt.QueuedConnection
-                )
-                self.csv_worker.status.connect(
-                    lambda s: self.update_status("CSV", s),
-                    Qt.QueuedConnection
-                )
-                self.csv_worker.error.connect(
-                    self.handle_extraction_error,
-                    Qt.QueuedConnection
-                )
-                self.csv_worker.finished.connect(
-                    lambda: self.handle_extraction_finished("CSV"),
-                    Qt.QueuedConnection
-                )
-                
-                # Cleanup connections
-                self.csv_worker.finished.connect(
-                    self.csv_thread.quit,
-                    Qt.QueuedConnection
-                )
-                self.csv_worker.finished.connect(
-                    self.csv_worker.deleteLater,
-                    Qt.QueuedConnection
-                )
-                self.csv_thread.finished.connect(
-                    self.csv_thread.deleteLater,
-                    Qt.QueuedConnection
-                )
-                
-                print("All signals connected")
-                
-                # Show progress UI
-                self.csv_group.show()
-                self.csv_progress.setValue(0)
-                self.csv_status.setText("Starting extraction...")
-                
-                # Add to active extractions
-                self.active_extractions.append("CSV")
-                
-                # Start thread
-                print("Starting CSV thread...")
-                self.csv_thread.start()
-                print("CSV thread started")
-                
             except Exception as e:
-                print(f"Error in CSV extraction setup: {str(e)}")
+                print(f"Error in {extraction_type} extraction setup: {str(e)}")
                 import traceback
                 traceback.print_exc()
-                QMessageBox.critical(self, "Setup Error",
-                                f"Failed to setup CSV extraction:\n{str(e)}")
-
-        if not self.active_extractions:
-            QMessageBox.information(self, "No Extraction Selected", 
-                                "Please select at least one extraction option.")
-            return
+                if extraction_type in self.active_extractions:
+                    self.active_extractions.remove(extraction_type)
+                group.hide()
+                QMessageBox.critical(self, "Setup Error", 
+                                f"Failed to setup {extraction_type} extraction:\n{str(e)}")
 
         # Disable run button while extracting
-        self.run_button.setEnabled(False)
-
-
-
-
+        if self.active_extractions:
+            self.run_button.setEnabled(False)
 
     def cleanup(self):
-        """Clean up all running threads and resources"""
-        if hasattr(self, 'markdown_thread') and self.markdown_thread is not None:
-            if hasattr(self, 'markdown_worker'):
-                self.markdown_worker.deleteLater()
-            self.markdown_thread.quit()
-            self.markdown_thread.wait()
-            self.markdown_thread.deleteLater()
-
-        if hasattr(self, 'csv_thread') and self.csv_thread is not None:
-            if hasattr(self, 'csv_worker'):
-                self.csv_worker.deleteLater()
-            self.csv_thread.quit()
-            self.csv_thread.wait()
-            self.csv_thread.deleteLater()
+        """Stop running extractions and wait for their threads"""
+        self.extraction_manager.stop_all(wait=True)
 
     def closeEvent(self, event):
         """Handle widget closure"""
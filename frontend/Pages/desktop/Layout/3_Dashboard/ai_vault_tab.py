@@ -9,20 +9,27 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QMessageBox, QComboBox,
-    QHBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QInputDialog
+    QHBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QInputDialog, QFileDialog
 )
 from frontend.Pages.desktop.Layout.Dashboard.utils.card_utils import create_card
 from frontend.Pages.desktop.Layout.Dashboard.utils.theme_utils import apply_dark_theme
 from frontend.Pages.desktop.Layout.Dashboard.search_tab import StyledButton  # reuse the same StyledButton
+from .utils.prompt_store import PromptStore
+
+PROMPT_PAGE_SIZE = 200  # Prompts fetched per scroll page
+PROMPT_SEARCH_LIMIT = 500  # Rows listed for a prompt search
 
 class PromptVaultWidget(QWidget):
     """
     A widget for managing an AI prompt vault with categorized prompts.
     """
-    def __init__(self, json_path="./prompt_vault.json", parent=None):
+    def __init__(self, json_path="./prompt_vault.json", db_path=None, parent=None):
         super().__init__(parent)
         self.json_path = json_path
-        self.data = {}  # Structure: {category: [prompt, ...], "tags": {category: [tag, ...]}}
+        self.db_path = db_path or os.path.splitext(json_path)[0] + ".db"
+        self.store = PromptStore(self.db_path)
+        self.loaded_count = 0
+        self.search_active = False
         self.load_data()
         self.initUI()
     
@@ -59,6 +66,7 @@ class PromptVaultWidget(QWidget):
         prompt_layout = prompt_card.layout()
         self.prompt_list = QListWidget()
         self.prompt_list.setSelectionMode(QListWidget.SingleSelection)
+        self.prompt_list.verticalScrollBar().valueChanged.connect(self.on_prompt_list_scrolled)
         prompt_layout.addWidget(self.prompt_list)
         input_layout = QHBoxLayout()
         self.prompt_input = QLineEdit()
@@ -79,10 +87,11 @@ class PromptVaultWidget(QWidget):
         # Toolbox panel for filtering by tag (for vault entries)
         toolbox_panel = QWidget()
         toolbox_layout = QHBoxLayout(toolbox_panel)
-        tag_filter_label = QLabel("Filter by Tag:")
+        tag_filter_label = QLabel("Filter / Search:")
         toolbox_layout.addWidget(tag_filter_label)
         self.vault_filter_input = QLineEdit()
-        self.vault_filter_input.setPlaceholderText("Enter tag...")
+        self.vault_filter_input.setPlaceholderText("Enter tag or words from a prompt...")
+        self.vault_filter_input.returnPressed.connect(self.apply_filter)
         toolbox_layout.addWidget(self.vault_filter_input)
         filter_btn = StyledButton("Apply Filter", font_size=12)
         filter_btn.clicked.connect(self.apply_filter)
@@ -90,40 +99,67 @@ class PromptVaultWidget(QWidget):
         clear_filter_btn = StyledButton("Clear Filter", font_size=12)
         clear_filter_btn.clicked.connect(self.clear_filter)
         toolbox_layout.addWidget(clear_filter_btn)
+        import_btn = StyledButton("Import JSON", font_size=12)
+        import_btn.clicked.connect(self.import_json)
+        toolbox_layout.addWidget(import_btn)
+        export_btn = StyledButton("Export JSON", font_size=12)
+        export_btn.clicked.connect(self.export_json)
+        toolbox_layout.addWidget(export_btn)
         main_layout.addWidget(toolbox_panel)
         
         self.refresh_category_combo()
     
-    def refresh_category_combo(self):
+    def refresh_category_combo(self, categories=None):
         current = self.category_combo.currentText()
-        self.category_combo.clear()
-        categories = list(self.data.keys())
+        if categories is None:
+            categories = self.store.categories()
         if not categories:
-            self.data["Default"] = []
+            self.store.add_category("Default")
             categories = ["Default"]
+        self.category_combo.blockSignals(True)
+        self.category_combo.clear()
         self.category_combo.addItems(categories)
         if current in categories:
             self.category_combo.setCurrentText(current)
+        self.category_combo.blockSignals(False)
         self.refresh_prompt_list()
     
     def refresh_prompt_list(self):
+        self.search_active = False
         self.prompt_list.clear()
+        self.loaded_count = 0
+        self.load_more_prompts()
+
+    def load_more_prompts(self):
+        """Append the next page of the current category's prompts."""
         category = self.category_combo.currentText()
-        if category and category in self.data:
-            for prompt in self.data[category]:
-                li = QListWidgetItem(prompt)
-                li.setFlags(li.flags() | Qt.ItemIsEditable)
-                self.prompt_list.addItem(li)
+        if not category:
+            return
+        rows = self.store.list_prompts(category, offset=self.loaded_count, limit=PROMPT_PAGE_SIZE)
+        for prompt_id, text in rows:
+            self.add_prompt_item(prompt_id, text)
+        self.loaded_count += len(rows)
+
+    def on_prompt_list_scrolled(self, value):
+        scroll_bar = self.prompt_list.verticalScrollBar()
+        if not self.search_active and value >= scroll_bar.maximum() - 2:
+            self.load_more_prompts()
+
+    def add_prompt_item(self, prompt_id, text, label=None):
+        li = QListWidgetItem(label or text)
+        li.setData(Qt.UserRole, prompt_id)
+        li.setFlags(li.flags() | Qt.ItemIsEditable)
+        self.prompt_list.addItem(li)
+        return li
     
     def add_category(self):
         text, ok = QInputDialog.getText(self, "Add Category", "Category Name:")
         if ok and text:
-            if text in self.data:
+            if self.store.has_category(text):
                 QMessageBox.warning(self, "Duplicate", f"Category '{text}' exists.")
                 return
-            self.data[text] = []
+            self.store.add_category(text)
             self.refresh_category_combo()
-            self.save_data()
     
     def edit_category(self):
         current = self.category_combo.currentText()
@@ -131,12 +167,11 @@ class PromptVaultWidget(QWidget):
             return
         new_text, ok = QInputDialog.getText(self, "Edit Category", "New Category Name:", text=current)
         if ok and new_text and new_text != current:
-            if new_text in self.data:
+            if self.store.has_category(new_text):
                 QMessageBox.warning(self, "Duplicate", f"Category '{new_text}' exists.")
                 return
-            self.data[new_text] = self.data.pop(current)
-            self.refresh_category_combo()
-            self.save_data()
+            self.store.rename_category(current, new_text)
+            self.category_combo.setItemText(self.category_combo.currentIndex(), new_text)
     
     def delete_category(self):
         current = self.category_combo.currentText()
@@ -144,9 +179,8 @@ class PromptVaultWidget(QWidget):
             return
         reply = QMessageBox.question(self, "Delete Category", f"Delete category '{current}'?", QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            del self.data[current]
+            self.store.delete_category(current)
             self.refresh_category_combo()
-            self.save_data()
     
     def add_prompt(self):
         category = self.category_combo.currentText()
@@ -154,74 +188,90 @@ class PromptVaultWidget(QWidget):
         if not prompt_text:
             QMessageBox.warning(self, "Empty Prompt", "Enter prompt text.")
             return
-        self.data[category].append(prompt_text)
+        prompt_id = self.store.add_prompt(category, prompt_text)
         self.prompt_input.clear()
-        self.refresh_prompt_list()
-        self.save_data()
+        if not self.search_active and self.loaded_count == self.store.count_prompts(category) - 1:
+            # The whole category is loaded, so the new prompt belongs at the end of the list
+            self.add_prompt_item(prompt_id, prompt_text)
+            self.loaded_count += 1
     
     def edit_prompt(self):
-        category = self.category_combo.currentText()
         current_item = self.prompt_list.currentItem()
         if not current_item:
             QMessageBox.warning(self, "Select Prompt", "Select a prompt to edit.")
             return
-        old_text = current_item.text()
+        prompt_id = current_item.data(Qt.UserRole)
+        old_text = self.store.get_prompt(prompt_id)
         new_text, ok = QInputDialog.getText(self, "Edit Prompt", "Prompt Text:", text=old_text)
         if ok and new_text:
-            index = self.data[category].index(old_text)
-            self.data[category][index] = new_text
-            self.refresh_prompt_list()
-            self.save_data()
+            self.store.update_prompt(prompt_id, new_text)
+            # Search results are labelled "[category] text"; keep the label prefix
+            prefix = current_item.text()[:len(current_item.text()) - len(old_text)]
+            current_item.setText(prefix + new_text)
     
     def remove_prompt(self):
-        category = self.category_combo.currentText()
         current_item = self.prompt_list.currentItem()
         if not current_item:
             QMessageBox.warning(self, "Select Prompt", "Select a prompt to remove.")
             return
-        prompt_text = current_item.text()
+        prompt_id = current_item.data(Qt.UserRole)
+        prompt_text = self.store.get_prompt(prompt_id)
         reply = QMessageBox.question(self, "Delete Prompt", f"Delete prompt:\n{prompt_text}?", QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            self.data[category].remove(prompt_text)
-            self.refresh_prompt_list()
-            self.save_data()
+            self.store.delete_prompt(prompt_id)
+            self.prompt_list.takeItem(self.prompt_list.row(current_item))
+            if not self.search_active:
+                self.loaded_count -= 1
     
     def apply_filter(self):
+        """Narrow the categories by name/tag, or full-text search prompt bodies if none match."""
         tag = self.vault_filter_input.text().strip().lower()
         if not tag:
             QMessageBox.warning(self, "Empty Filter", "Enter a tag to filter.")
             return
-        # For illustration, assume we have stored tags per category (this can be extended)
-        filtered = {}
-        for cat, prompts in self.data.items():
-            # For each category, if the category name contains the tag (or you could store separate tags)
-            if tag in cat.lower():
-                filtered[cat] = prompts
-        if not filtered:
-            QMessageBox.information(self, "No Results", f"No categories found with tag '{tag}'.")
-        else:
-            self.data = filtered
-            self.refresh_category_combo()
+        categories = self.store.categories_matching(tag)
+        if categories:
+            self.refresh_category_combo(categories)
+            return
+        results = self.store.search(tag, limit=PROMPT_SEARCH_LIMIT)
+        if not results:
+            QMessageBox.information(self, "No Results", f"No categories or prompts found matching '{tag}'.")
+            return
+        self.search_active = True
+        self.prompt_list.clear()
+        for prompt_id, category, text in results:
+            self.add_prompt_item(prompt_id, text, label=f"[{category}] {text}")
     
     def clear_filter(self):
         self.vault_filter_input.clear()
-        self.load_data(self.json_path)
+        self.refresh_category_combo(self.store.categories())
     
     def load_data(self, file_name=None):
+        """Import the legacy JSON vault the first time the database is created."""
         if file_name is None:
             file_name = self.json_path
-        try:
-            with open(file_name, "r") as f:
-                self.data = json.load(f)
-        except Exception:
-            self.data = {}
+        if self.store.is_empty() and os.path.exists(file_name):
+            try:
+                self.store.import_json(file_name)
+            except Exception as e:
+                QMessageBox.critical(self, "Error Loading Data", str(e))
+
+    def import_json(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Import Prompt Vault", "", "JSON Files (*.json)")
+        if file_name:
+            try:
+                self.store.import_json(file_name)
+            except Exception as e:
+                QMessageBox.critical(self, "Error Importing Data", str(e))
+            self.refresh_category_combo()
     
-    def save_data(self):
-        try:
-            with open(self.json_path, "w") as f:
-                json.dump(self.data, f, indent=4)
-        except Exception as e:
-            QMessageBox.critical(self, "Error Saving Data", str(e))
+    def export_json(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, "Export Prompt Vault", self.json_path, "JSON Files (*.json)")
+        if file_name:
+            try:
+                self.store.export_json(file_name)
+            except Exception as e:
+                QMessageBox.critical(self, "Error Saving Data", str(e))
 
 class AIVaultTab(QWidget):
     """
@@ -12,6 +12,7 @@ from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QAp
 #from frontend.Pages.desktop.Layout.Dashboard.utils.theme_utils import apply_dark_theme
 from frontend.Pages.desktop.Layout.Dashboard.search_tab import SearchTabWrapper
 from frontend.Pages.desktop.Layout.Dashboard.ai_vault_tab import AIVaultTab
+from frontend.Pages.desktop.Layout.Dashboard.telemetry_tab import TelemetryTab
 
 class TitleBar(QWidget):
     """
@@ -80,7 +81,7 @@ class Dashboard(QMainWindow):
         self.title_bar = TitleBar(self)
         main_layout.addWidget(self.title_bar)
         
-        # Add tabs for Search and AI Vault
+        # Add tabs for Search, AI Vault and Telemetry
         tabs = QTabWidget()
         tabs.setStyleSheet("""
             QTabBar::tab:selected { background: #2E2E2E; }
@@ -89,8 +90,10 @@ class Dashboard(QMainWindow):
         """)
         self.search_tab = SearchTabWrapper()
         self.ai_vault_tab = AIVaultTab()
+        self.telemetry_tab = TelemetryTab()
         tabs.addTab(self.search_tab, "Search Dashboard")
         tabs.addTab(self.ai_vault_tab, "AI Prompt Vault")
+        tabs.addTab(self.telemetry_tab, "Model Telemetry")
         main_layout.addWidget(tabs)
         
         #apply_dark_theme(main_widget)
@@ -5,8 +5,9 @@ import sys
 import glob
 import json
 import ast
+import copy
 
-from PySide6.QtCore import Qt, Signal, QMimeData, QPoint
+from PySide6.QtCore import Qt, Signal, QMimeData, QPoint, QTimer
 from PySide6.QtGui import QFont, QAction, QKeySequence, QDrag, QIcon, QColor, QLinearGradient, QPalette
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
@@ -16,6 +17,13 @@ from PySide6.QtWidgets import (
 
 from frontend.Pages.desktop.Layout.Dashboard.utils.theme_utils import apply_dark_theme
 from frontend.Pages.desktop.Layout.Dashboard.utils.card_utils import create_card
+from .utils.search_index import SearchIndex
+from .utils.search_fields import SearchFieldsModel
+from .utils.json_saver import BackgroundJsonWriter
+
+SEARCH_RESULT_LIMIT = 50  # Results listed per global search
+HISTORY_LIMIT = 500  # Undo steps kept per page
+SAVE_DEBOUNCE_MS = 400  # Quiet period before edits are written to disk
 
 IS_PHONE = False  # Adjust as needed
 
@@ -28,7 +36,7 @@ class StyledButton(QPushButton):
 
 class SearchFieldWidget(QFrame):
     itemAdded = Signal(str, str)
-    itemRemoved = Signal(str, str)
+    itemRemoved = Signal(str, int, str)
     fieldRemoved = Signal(str)
     
     def __init__(self, field_id, field_name, swap_words=False, swap_sites=False,
@@ -185,11 +193,17 @@ class SearchFieldWidget(QFrame):
         if self.item_list.findItems(new_item, Qt.MatchExactly):
             QMessageBox.warning(self, "Duplicate", f'"{new_item}" already exists.')
         else:
-            list_item = QListWidgetItem(new_item)
-            list_item.setFlags(list_item.flags() | Qt.ItemIsEditable)
-            self.item_list.addItem(list_item)
+            self.insert_item(self.item_list.count(), new_item)
             self.itemAdded.emit(self.field_id, new_item)
         self.item_input.clear()
+
+    def insert_item(self, row, text):
+        list_item = QListWidgetItem(text)
+        list_item.setFlags(list_item.flags() | Qt.ItemIsEditable)
+        self.item_list.insertItem(row, list_item)
+
+    def remove_row(self, row):
+        self.item_list.takeItem(row)
     
     def edit_name(self):
         new_name, ok = QInputDialog.getText(self, "Edit Field Name", "New name:", QLineEdit.Normal, self.field_name)
@@ -209,8 +223,9 @@ class SearchFieldWidget(QFrame):
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Delete:
             for item in self.item_list.selectedItems():
-                self.itemRemoved.emit(self.field_id, item.text())
-                self.item_list.takeItem(self.item_list.row(item))
+                row = self.item_list.row(item)
+                self.itemRemoved.emit(self.field_id, row, item.text())
+                self.item_list.takeItem(row)
         else:
             super().keyPressEvent(event)
     
@@ -244,6 +259,8 @@ class SearchTab(QWidget):
     The Search Fields tab containing a list of search fields,
     along with a toolbox panel for internal filtering.
     """
+    saveFailed = Signal(str)
+
     def __init__(self, json_directory="././frontend/Pages/desktop/Layout/Dashboard/Dashboard/json/"):
         super().__init__()
         self.json_directory = json_directory
@@ -254,14 +271,40 @@ class SearchTab(QWidget):
             with open(self.json_files[0], "w") as f:
                 json.dump([], f, indent=4)
         self.current_file_index = 0
-        self.search_fields = []
-        self.history = []
-        self.history_index = -1
+        self.field_widgets = {}
+        self.search_index = SearchIndex()
+        self.model = SearchFieldsModel(self.search_index, HISTORY_LIMIT)
+        self.writer = BackgroundJsonWriter(on_error=lambda path, e: self.saveFailed.emit(str(e)))
+        self.saveFailed.connect(lambda message: QMessageBox.critical(self, "Error", message))
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DEBOUNCE_MS)
+        self.save_timer.timeout.connect(self.flush_save)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown_writer)
         self.initUI()
         self.load_data(self.json_files[self.current_file_index])
+        self.build_search_index()
     
     def ensure_directory_exists(self):
         os.makedirs(self.json_directory, exist_ok=True)
+
+    @property
+    def current_page(self):
+        return os.path.basename(self.json_files[self.current_file_index])
+
+    def build_search_index(self):
+        """Index every page once; later edits update the index incrementally."""
+        for file_name in self.json_files:
+            page = os.path.basename(file_name)
+            if page == self.current_page:
+                continue
+            try:
+                with open(file_name, "r") as f:
+                    self.search_index.index_page(page, json.load(f))
+            except (OSError, ValueError):
+                continue
     
     def initUI(self):
         main_layout = QVBoxLayout(self)
@@ -355,20 +398,10 @@ class SearchTab(QWidget):
         main_layout.addWidget(toolbox_panel)
     
     def add_search_field(self):
-        field_id = str(len(self.search_fields))
-        field_name = f"Search Field {len(self.search_fields) + 1}"
-        widget = SearchFieldWidget(field_id, field_name)
-        widget.itemAdded.connect(self.on_item_added)
-        widget.itemRemoved.connect(self.on_item_removed)
-        widget.fieldRemoved.connect(self.on_field_removed)
-        if IS_PHONE:
-            self.fields_layout.addWidget(widget)
-        else:
-            row, col = divmod(len(self.search_fields), 2)
-            self.fields_layout.addWidget(widget, row, col)
-        self.search_fields.append({
+        field_id = self.model.next_field_id()
+        field = {
             "id": field_id,
-            "name": field_name,
+            "name": f"Search Field {len(self.model.fields) + 1}",
             "items": [],
             "swap_words": False,
             "swap_sites": False,
@@ -377,104 +410,142 @@ class SearchTab(QWidget):
             "swap_sites_before": "",
             "swap_sites_after": "",
             "tags": []
-        })
-        self.update_history()
-        self.save_data()
-    
+        }
+        self.perform({"op": "add_field", "field": field, "position": len(self.model.fields)})
+
     def on_item_added(self, field_id, item):
-        for field in self.search_fields:
-            if field["id"] == field_id:
-                field["items"].append(item)
-                break
-        self.update_history()
-        self.save_data()
-    
-    def on_item_removed(self, field_id, item):
-        for field in self.search_fields:
-            if field["id"] == field_id:
-                field["items"].remove(item)
-                break
-        self.update_history()
-        self.save_data()
-    
+        # The widget has already shown the item; only the model, index and history change
+        _, field = self.model.find_field(field_id)
+        if field is None:
+            return
+        if self.model.perform({"op": "add_item", "field_id": field_id, "item": item, "position": len(field["items"])}):
+            self.save_data()
+
+    def on_item_removed(self, field_id, row, item):
+        if self.model.perform({"op": "remove_item", "field_id": field_id, "item": item, "position": row}):
+            self.save_data()
+
     def on_field_removed(self, field_id):
-        for i, field in enumerate(self.search_fields):
-            if field["id"] == field_id:
-                del self.search_fields[i]
-                break
-        self.refresh_ui()
-        self.update_history()
-        self.save_data()
-    
-    def update_history(self):
-        self.history = self.history[:self.history_index + 1]
-        self.history.append(json.loads(json.dumps(self.search_fields)))
-        self.history_index += 1
-    
-    def undo(self):
-        if self.history_index > 0:
-            self.history_index -= 1
-            self.search_fields = json.loads(json.dumps(self.history[self.history_index]))
-            self.refresh_ui()
+        position, field = self.model.find_field(field_id)
+        if field is None:
+            return
+        self.perform({"op": "remove_field", "field": copy.deepcopy(field), "position": position})
+
+    # ------------------- History ------------------- #
+    def perform(self, operation):
+        """Apply and record an operation started from the tab itself, then schedule a save."""
+        if self.model.perform(operation):
+            self.update_widgets(operation)
             self.save_data()
-        else:
+
+    def update_widgets(self, operation):
+        """Bring only the widgets affected by an applied operation in line with the model."""
+        kind = operation["op"]
+        if kind in ("add_item", "remove_item"):
+            widget = self.field_widgets.get(operation["field_id"])
+            if widget is None:
+                return
+            if kind == "add_item":
+                widget.insert_item(operation["position"], operation["item"])
+            else:
+                widget.remove_row(operation["position"])
+        elif kind == "add_field":
+            field_id = operation["field"]["id"]
+            _, field = self.model.find_field(field_id)
+            self.field_widgets[field_id] = self.create_field_widget(field)
+            self.layout_fields()
+        elif kind == "remove_field":
+            widget = self.field_widgets.pop(operation["field"]["id"], None)
+            if widget is not None:
+                self.fields_layout.removeWidget(widget)
+                widget.deleteLater()
+            self.layout_fields()
+
+    def undo(self):
+        operation = self.model.undo()
+        if operation is None:
             QMessageBox.information(self, "Info", "Nothing to undo.")
-    
+            return
+        self.update_widgets(operation)
+        self.save_data()
+
     def redo(self):
-        if self.history_index < len(self.history) - 1:
-            self.history_index += 1
-            self.search_fields = json.loads(json.dumps(self.history[self.history_index]))
-            self.refresh_ui()
-            self.save_data()
-        else:
+        operation = self.model.redo()
+        if operation is None:
             QMessageBox.information(self, "Info", "Nothing to redo.")
-    
+            return
+        self.update_widgets(operation)
+        self.save_data()
+
+    # ------------------- Widgets ------------------- #
+    def create_field_widget(self, field):
+        widget = SearchFieldWidget(
+            field["id"], field["name"],
+            swap_words=field.get("swap_words", False),
+            swap_sites=field.get("swap_sites", False),
+            swap_words_before=field.get("swap_words_before", ""),
+            swap_words_after=field.get("swap_words_after", ""),
+            swap_sites_before=field.get("swap_sites_before", ""),
+            swap_sites_after=field.get("swap_sites_after", "")
+        )
+        widget.tags = field.get("tags", [])
+        widget.itemAdded.connect(self.on_item_added)
+        widget.itemRemoved.connect(self.on_item_removed)
+        widget.fieldRemoved.connect(self.on_field_removed)
+        for row, item in enumerate(field["items"]):
+            widget.insert_item(row, item)
+        return widget
+
+    def layout_fields(self):
+        """Place the existing field widgets in model order without recreating them."""
+        for idx, field in enumerate(self.model.visible_fields()):
+            widget = self.field_widgets.get(field["id"])
+            if widget is None:
+                continue
+            self.fields_layout.removeWidget(widget)
+            if IS_PHONE:
+                self.fields_layout.insertWidget(idx, widget)
+            else:
+                row, col = divmod(idx, 2)
+                self.fields_layout.addWidget(widget, row, col)
+
     def refresh_ui(self):
+        """Rebuild every visible field widget; used when a page is loaded or the filter changes."""
         for i in reversed(range(self.fields_layout.count())):
             widget = self.fields_layout.itemAt(i).widget()
             if widget:
                 self.fields_layout.removeWidget(widget)
                 widget.deleteLater()
-        for idx, field in enumerate(self.search_fields):
-            widget = SearchFieldWidget(
-                field["id"], field["name"],
-                swap_words=field.get("swap_words", False),
-                swap_sites=field.get("swap_sites", False),
-                swap_words_before=field.get("swap_words_before", ""),
-                swap_words_after=field.get("swap_words_after", ""),
-                swap_sites_before=field.get("swap_sites_before", ""),
-                swap_sites_after=field.get("swap_sites_after", "")
-            )
-            widget.tags = field.get("tags", [])
-            widget.itemAdded.connect(self.on_item_added)
-            widget.itemRemoved.connect(self.on_item_removed)
-            widget.fieldRemoved.connect(self.on_field_removed)
-            for item in field["items"]:
-                li = QListWidgetItem(item)
-                li.setFlags(li.flags() | Qt.ItemIsEditable)
-                widget.item_list.addItem(li)
-            if IS_PHONE:
-                self.fields_layout.addWidget(widget)
-            else:
-                row, col = divmod(idx, 2)
-                self.fields_layout.addWidget(widget, row, col)
-    
+        self.field_widgets = {field["id"]: self.create_field_widget(field) for field in self.model.visible_fields()}
+        self.layout_fields()
+
+    # ------------------- Persistence ------------------- #
     def save_data(self):
-        file_name = self.json_files[self.current_file_index]
-        try:
-            with open(file_name, "w") as f:
-                json.dump(self.search_fields, f, indent=4)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-    
+        """Debounce: restart the timer so a burst of edits results in one write."""
+        self.save_timer.start()
+
+    def flush_save(self):
+        self.save_timer.stop()
+        self.writer.submit(self.json_files[self.current_file_index], self.model.snapshot())
+
+    def flush_pending_save(self):
+        """Write out edits still waiting on the debounce timer (before switching pages)."""
+        if self.save_timer.isActive():
+            self.flush_save()
+
+    def shutdown_writer(self):
+        self.flush_pending_save()
+        self.writer.close(timeout=5)
+
     def load_data(self, file_name=None):
         if file_name is None:
             file_name = self.json_files[self.current_file_index]
+        self.flush_pending_save()
+        self.writer.flush()
         try:
             with open(file_name, "r") as f:
-                self.search_fields = json.load(f)
+                self.model.load(os.path.basename(file_name), json.load(f))
             self.refresh_ui()
-            self.update_history()
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
     
@@ -483,20 +554,23 @@ class SearchTab(QWidget):
         if not tag:
             QMessageBox.warning(self, "Empty Filter", "Enter a tag to filter.")
             return
-        filtered = [field for field in self.search_fields if "tags" in field and any(tag == t.lower() for t in field["tags"])]
-        if not filtered:
+        tagged = {field_id for _, field_id in self.search_index.fields_with_tag(tag, self.current_page)}
+        if not any(field["id"] in tagged for field in self.model.fields):
             QMessageBox.information(self, "No Results", f"No fields found with tag '{tag}'.")
         else:
-            self.search_fields = filtered
+            # Only the view is narrowed; edits and saves still cover every field
+            self.model.set_filter(tagged)
             self.refresh_ui()
     
     def clear_filter(self):
         self.filter_input.clear()
-        self.load_data(self.json_files[self.current_file_index])
+        self.model.clear_filter()
+        self.refresh_ui()
     
     def add_page(self):
         new_index = len(self.json_files)
         new_file = os.path.join(self.json_directory, f"search_fields_{new_index}.json")
+        self.flush_pending_save()
         try:
             with open(new_file, "w") as f:
                 json.dump([], f, indent=4)
@@ -514,7 +588,11 @@ class SearchTab(QWidget):
         reply = QMessageBox.question(self, "Remove Page", f"Remove page '{current}'?", QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             try:
+                self.save_timer.stop()
+                self.writer.discard(current)
+                self.writer.flush()
                 os.remove(current)
+                self.search_index.remove_page(os.path.basename(current))
                 self.json_files.pop(self.current_file_index)
                 if self.current_file_index >= len(self.json_files):
                     self.current_file_index = len(self.json_files) - 1
@@ -527,12 +605,11 @@ class SearchTab(QWidget):
         if not term:
             QMessageBox.warning(self, "Empty Search", "Enter a search term.")
             return
+        results = self.search_index.search(term, limit=SEARCH_RESULT_LIMIT)
         matching = []
-        for field in self.search_fields:
-            for item in field["items"]:
-                if term.lower() in item.lower():
-                    matching.append(field["name"])
-                    break
+        for result in results:
+            location = result.field_name if result.page == self.current_page else f"{result.field_name} ({result.page})"
+            matching.append(f"{location}: {result.item}")
         if matching:
             QMessageBox.information(self, "Results", f"Found in fields:\n" + "\n".join(matching))
         else:
@@ -0,0 +1,124 @@
+# ./telemetry_tab.py
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMessageBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog
+)
+from ai_agent.utils.telemetry import telemetry
+from frontend.Pages.desktop.Layout.Dashboard.utils.card_utils import create_card
+from frontend.Pages.desktop.Layout.Dashboard.utils.theme_utils import apply_dark_theme
+from frontend.Pages.desktop.Layout.Dashboard.search_tab import StyledButton  # reuse the same StyledButton
+
+REFRESH_INTERVAL_MS = 2000
+
+# (header, aggregate key, is_seconds)
+COLUMNS = [
+    ("Model", None, False),
+    ("Calls", "calls", False),
+    ("Errors", "errors", False),
+    ("Cache hits", "cache_hits", False),
+    ("Prompt tok", "prompt_tokens", False),
+    ("Completion tok", "completion_tokens", False),
+    ("Queue p50", "queue_wait_p50", True),
+    ("TTFT p50", "time_to_first_token_p50", True),
+    ("Latency p50", "latency_p50", True),
+    ("Latency p95", "latency_p95", True),
+    ("Latency p99", "latency_p99", True),
+]
+
+class TelemetryWidget(QWidget):
+    """
+    Shows per-model latency and token aggregates from the shared telemetry buffer.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.initUI()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(REFRESH_INTERVAL_MS)
+        self.refresh()
+
+    def initUI(self):
+        main_layout = QVBoxLayout(self)
+        apply_dark_theme(self)
+        header_label = QLabel("Model Telemetry")
+        header_label.setFont(QFont("Arial", 16, QFont.Bold))
+        header_label.setStyleSheet("color: #FFFFFF; background: transparent;")
+        main_layout.addWidget(header_label)
+
+        stats_card = create_card("Per-model aggregates")
+        stats_layout = stats_card.layout()
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([c[0] for c in COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        stats_layout.addWidget(self.table)
+        self.summary_label = QLabel()
+        self.summary_label.setStyleSheet("color: #CCCCCC; background: transparent;")
+        stats_layout.addWidget(self.summary_label)
+        main_layout.addWidget(stats_card)
+
+        button_layout = QHBoxLayout()
+        refresh_btn = StyledButton("Refresh", font_size=12)
+        refresh_btn.clicked.connect(self.refresh)
+        button_layout.addWidget(refresh_btn)
+        export_btn = StyledButton("Export JSONL", font_size=12)
+        export_btn.clicked.connect(self.export_jsonl)
+        button_layout.addWidget(export_btn)
+        clear_btn = StyledButton("Clear", font_size=12)
+        clear_btn.clicked.connect(self.clear)
+        button_layout.addWidget(clear_btn)
+        button_layout.addStretch()
+        main_layout.addLayout(button_layout)
+
+    def refresh(self):
+        # Skip work while the tab is hidden
+        if not self.isVisible() and self.table.rowCount():
+            return
+        aggregates = telemetry.aggregates()
+        self.table.setRowCount(len(aggregates))
+        for row, (model, stats) in enumerate(sorted(aggregates.items())):
+            for col, (_, key, is_seconds) in enumerate(COLUMNS):
+                if key is None:
+                    text = model
+                else:
+                    value = stats.get(key)
+                    if value is None:
+                        text = "-"
+                    elif is_seconds:
+                        text = f"{value * 1000:.0f} ms"
+                    else:
+                        text = str(value)
+                item = QTableWidgetItem(text)
+                if key is not None:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, col, item)
+        self.summary_label.setText(
+            f"{len(telemetry.records())} of {telemetry.capacity} buffered calls"
+        )
+
+    def export_jsonl(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, "Export Telemetry", "telemetry.jsonl", "JSON Lines (*.jsonl)")
+        if not file_name:
+            return
+        try:
+            count = telemetry.export_jsonl(file_name)
+            QMessageBox.information(self, "Export Complete", f"Exported {count} records to {file_name}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error Exporting Telemetry", str(e))
+
+    def clear(self):
+        telemetry.clear()
+        self.refresh()
+
+class TelemetryTab(QWidget):
+    """
+    Wrapper for the Model Telemetry tab.
+    """
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        self.telemetry_widget = TelemetryWidget()
+        layout.addWidget(self.telemetry_widget)
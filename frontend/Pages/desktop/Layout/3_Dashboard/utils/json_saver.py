@@ -0,0 +1,75 @@
+# ./utils/json_saver.py
+
+"""
+Background JSON writer that coalesces saves per file.
+
+submit() only records the latest snapshot for a path and wakes the writer
+thread, so a burst of edits results in a single write of the newest data.
+Files are written to a temporary sibling and moved into place, so a crash
+mid-write never leaves a truncated JSON page behind.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+class BackgroundJsonWriter:
+    """Single writer thread; the newest snapshot per path wins."""
+
+    def __init__(self, on_error: Optional[Callable[[str, Exception], None]] = None):
+        self.on_error = on_error
+        self._pending: Dict[str, Any] = {}
+        self._writing = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="SearchFieldsWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: str, data: Any) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("writer is closed")
+            self._pending[path] = data
+            self._condition.notify_all()
+
+    def discard(self, path: str) -> None:
+        """Drop a pending write, e.g. because the file is being deleted."""
+        with self._condition:
+            self._pending.pop(path, None)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted snapshot has been written."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                path, data = self._pending.popitem()
+                self._writing += 1
+            try:
+                self._write(path, data)
+            except Exception as e:
+                if self.on_error is not None:
+                    self.on_error(path, e)
+            finally:
+                with self._condition:
+                    self._writing -= 1
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _write(path: str, data: Any) -> None:
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(temp_path, path)
@@ -0,0 +1,268 @@
+# ./utils/prompt_store.py
+
+"""
+SQLite storage for the AI prompt vault.
+
+Categories and prompts live in ordinary tables; an FTS5 table mirrors each
+prompt's text and category name so prompt bodies can be searched with ranked
+prefix queries. Every edit runs in its own transaction and keeps the FTS rows in
+step. If the SQLite build lacks FTS5, search falls back to LIKE matching.
+
+The legacy prompt_vault.json layout ({category: [prompt, ...]}, optionally with
+a "tags" mapping of {category: [tag, ...]}) can be imported and exported.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS prompts (
+    id INTEGER PRIMARY KEY,
+    category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+    text TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS prompts_by_category ON prompts(category_id, position);
+CREATE TABLE IF NOT EXISTS category_tags (
+    category_id INTEGER NOT NULL REFERENCES categories(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (category_id, tag)
+);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS prompts_fts USING fts5(
+    text, category, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+"""
+
+PromptRow = Tuple[int, str]             # (prompt id, text)
+SearchRow = Tuple[int, str, str]        # (prompt id, category, text)
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query where every word must match as a prefix."""
+    terms = []
+    for word in text.split():
+        word = word.replace('"', '""')
+        terms.append(f'"{word}"*')
+    return " ".join(terms)
+
+class PromptStore:
+    """Categories and prompts in SQLite with an FTS5 index over prompt text."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and db_path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+        try:
+            with self.connection:
+                self.connection.executescript(FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            self.fts_enabled = False
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several edits into one commit (rolled back on error)."""
+        with self.connection:
+            yield self.connection
+
+    # ------------------- Categories ------------------- #
+    def categories(self) -> List[str]:
+        rows = self.connection.execute("SELECT name FROM categories ORDER BY position, id")
+        return [name for (name,) in rows]
+
+    def has_category(self, name: str) -> bool:
+        return self._category_id(name) is not None
+
+    def _category_id(self, name: str) -> Optional[int]:
+        row = self.connection.execute("SELECT id FROM categories WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def add_category(self, name: str, tags: Optional[List[str]] = None) -> int:
+        with self.connection:
+            position = self.connection.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM categories").fetchone()[0]
+            category_id = self.connection.execute(
+                "INSERT INTO categories (name, position) VALUES (?, ?)", (name, position)
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO category_tags (category_id, tag) VALUES (?, ?)",
+                [(category_id, tag.strip().lower()) for tag in tags or [] if tag.strip()],
+            )
+        return category_id
+
+    def rename_category(self, old_name: str, new_name: str) -> None:
+        with self.connection:
+            category_id = self._require_category(old_name)
+            self.connection.execute("UPDATE categories SET name = ? WHERE id = ?", (new_name, category_id))
+            if self.fts_enabled:
+                self.connection.execute(
+                    "UPDATE prompts_fts SET category = ? "
+                    "WHERE rowid IN (SELECT id FROM prompts WHERE category_id = ?)",
+                    (new_name, category_id),
+                )
+
+    def delete_category(self, name: str) -> None:
+        with self.connection:
+            category_id = self._require_category(name)
+            if self.fts_enabled:
+                self.connection.execute(
+                    "DELETE FROM prompts_fts WHERE rowid IN (SELECT id FROM prompts WHERE category_id = ?)",
+                    (category_id,),
+                )
+            self.connection.execute("DELETE FROM categories WHERE id = ?", (category_id,))
+
+    def categories_matching(self, text: str) -> List[str]:
+        """Categories whose name or tags contain text (case-insensitive)."""
+        pattern = f"%{text.strip().lower()}%"
+        rows = self.connection.execute(
+            "SELECT name FROM categories c WHERE lower(c.name) LIKE ? "
+            "OR EXISTS (SELECT 1 FROM category_tags t WHERE t.category_id = c.id AND t.tag LIKE ?) "
+            "ORDER BY position, id",
+            (pattern, pattern),
+        )
+        return [name for (name,) in rows]
+
+    def _require_category(self, name: str) -> int:
+        category_id = self._category_id(name)
+        if category_id is None:
+            raise KeyError(f"Unknown category '{name}'")
+        return category_id
+
+    # ------------------- Prompts ------------------- #
+    def count_prompts(self, category: str) -> int:
+        row = self.connection.execute(
+            "SELECT COUNT(*) FROM prompts p JOIN categories c ON c.id = p.category_id WHERE c.name = ?",
+            (category,),
+        ).fetchone()
+        return row[0]
+
+    def list_prompts(self, category: str, offset: int = 0, limit: Optional[int] = None) -> List[PromptRow]:
+        """One page of a category's prompts in insertion order."""
+        rows = self.connection.execute(
+            "SELECT p.id, p.text FROM prompts p JOIN categories c ON c.id = p.category_id "
+            "WHERE c.name = ? ORDER BY p.position, p.id LIMIT ? OFFSET ?",
+            (category, -1 if limit is None else limit, offset),
+        )
+        return rows.fetchall()
+
+    def get_prompt(self, prompt_id: int) -> Optional[str]:
+        row = self.connection.execute("SELECT text FROM prompts WHERE id = ?", (prompt_id,)).fetchone()
+        return row[0] if row else None
+
+    def add_prompt(self, category: str, text: str) -> int:
+        with self.connection:
+            return self._insert_prompt(self._require_category(category), category, text)
+
+    def _insert_prompt(self, category_id: int, category: str, text: str) -> int:
+        position = self.connection.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) FROM prompts WHERE category_id = ?", (category_id,)
+        ).fetchone()[0]
+        prompt_id = self.connection.execute(
+            "INSERT INTO prompts (category_id, text, position) VALUES (?, ?, ?)", (category_id, text, position)
+        ).lastrowid
+        if self.fts_enabled:
+            self.connection.execute(
+                "INSERT INTO prompts_fts (rowid, text, category) VALUES (?, ?, ?)", (prompt_id, text, category)
+            )
+        return prompt_id
+
+    def update_prompt(self, prompt_id: int, text: str) -> None:
+        with self.connection:
+            self.connection.execute("UPDATE prompts SET text = ? WHERE id = ?", (text, prompt_id))
+            if self.fts_enabled:
+                self.connection.execute("UPDATE prompts_fts SET text = ? WHERE rowid = ?", (text, prompt_id))
+
+    def delete_prompt(self, prompt_id: int) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM prompts WHERE id = ?", (prompt_id,))
+            if self.fts_enabled:
+                self.connection.execute("DELETE FROM prompts_fts WHERE rowid = ?", (prompt_id,))
+
+    def search(self, text: str, category: Optional[str] = None, limit: int = 200) -> List[SearchRow]:
+        """Prompts whose text or category matches every word of text, best match first."""
+        if not text.split():
+            return []
+        if self.fts_enabled:
+            sql = ("SELECT p.id, c.name, p.text FROM prompts_fts f "
+                   "JOIN prompts p ON p.id = f.rowid JOIN categories c ON c.id = p.category_id "
+                   "WHERE prompts_fts MATCH ?")
+            params: list = [fts_query(text)]
+            order = " ORDER BY bm25(prompts_fts) LIMIT ?"
+        else:
+            sql = "SELECT p.id, c.name, p.text FROM prompts p JOIN categories c ON c.id = p.category_id WHERE 1"
+            params = []
+            for word in text.split():
+                sql += " AND (p.text LIKE ? OR c.name LIKE ?)"
+                params += [f"%{word}%", f"%{word}%"]
+            order = " ORDER BY c.position, p.position LIMIT ?"
+        if category is not None:
+            sql += " AND c.name = ?"
+            params.append(category)
+        return self.connection.execute(sql + order, params + [limit]).fetchall()
+
+    # ------------------- JSON compatibility ------------------- #
+    def is_empty(self) -> bool:
+        return self.connection.execute("SELECT 1 FROM categories LIMIT 1").fetchone() is None
+
+    def import_data(self, data: Dict) -> None:
+        """Merge a legacy vault dict in a single transaction."""
+        tags = data.get("tags") if isinstance(data.get("tags"), dict) else {}
+        with self.connection:
+            for category, prompts in data.items():
+                if category == "tags" and prompts is tags:
+                    continue
+                category_id = self._category_id(category)
+                if category_id is None:
+                    position = self.connection.execute(
+                        "SELECT COALESCE(MAX(position) + 1, 0) FROM categories"
+                    ).fetchone()[0]
+                    category_id = self.connection.execute(
+                        "INSERT INTO categories (name, position) VALUES (?, ?)", (category, position)
+                    ).lastrowid
+                for prompt in prompts:
+                    self._insert_prompt(category_id, category, prompt)
+            for category, category_tags in tags.items():
+                category_id = self._category_id(category)
+                if category_id is not None:
+                    self.connection.executemany(
+                        "INSERT OR IGNORE INTO category_tags (category_id, tag) VALUES (?, ?)",
+                        [(category_id, tag.strip().lower()) for tag in category_tags if tag.strip()],
+                    )
+
+    def export_data(self) -> Dict:
+        data: Dict = {category: [text for _, text in self.list_prompts(category)] for category in self.categories()}
+        tags: Dict[str, List[str]] = {}
+        rows = self.connection.execute(
+            "SELECT c.name, t.tag FROM category_tags t JOIN categories c ON c.id = t.category_id ORDER BY c.position, t.tag"
+        )
+        for category, tag in rows:
+            tags.setdefault(category, []).append(tag)
+        if tags and "tags" not in data:
+            data["tags"] = tags
+        return data
+
+    def import_json(self, json_path: str) -> None:
+        with open(json_path, "r") as f:
+            self.import_data(json.load(f))
+
+    def export_json(self, json_path: str) -> None:
+        with open(json_path, "w") as f:
+            json.dump(self.export_data(), f, indent=4)
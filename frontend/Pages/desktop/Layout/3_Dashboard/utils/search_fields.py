@@ -0,0 +1,134 @@
+# ./utils/search_fields.py
+
+"""
+Search fields of one page plus the undo/redo log of edits made to them.
+
+Every edit is an operation dict ({"op": "add_item", ...}) that records the
+position it touched, so undoing it changes that exact entry even when a field
+holds the same text twice. The model also keeps the search index in step.
+
+A tag filter only narrows which fields are shown (visible_fields); the model
+itself always holds, and snapshot() always returns, every field of the page.
+"""
+
+import copy
+from collections import deque
+from typing import Iterable, List, Optional, Set, Tuple
+
+INVERSE_OPS = {"add_item": "remove_item", "remove_item": "add_item",
+               "add_field": "remove_field", "remove_field": "add_field"}
+
+class SearchFieldsModel:
+    """Fields of the current page, the tag filter and a bounded operation log."""
+
+    def __init__(self, search_index, history_limit: int = 500):
+        self.search_index = search_index
+        self.page = ""
+        self.fields: List[dict] = []
+        self.visible_ids: Optional[Set[str]] = None  # None: no filter
+        self.undo_stack = deque(maxlen=history_limit)
+        self.redo_stack: List[dict] = []
+
+    def load(self, page: str, fields: List[dict]) -> None:
+        """Replace the model with a freshly read page; history and filter start over."""
+        self.page = page
+        self.fields = fields
+        self.visible_ids = None
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.search_index.index_page(page, fields)
+
+    def snapshot(self) -> List[dict]:
+        """Copy of every field for saving, whatever the filter shows."""
+        return [dict(field, items=list(field["items"]), tags=list(field.get("tags", [])))
+                for field in self.fields]
+
+    # ------------------- Filter ------------------- #
+    def set_filter(self, field_ids: Iterable[str]) -> None:
+        self.visible_ids = set(field_ids)
+
+    def clear_filter(self) -> None:
+        self.visible_ids = None
+
+    def visible_fields(self) -> List[dict]:
+        if self.visible_ids is None:
+            return self.fields
+        return [field for field in self.fields if field["id"] in self.visible_ids]
+
+    # ------------------- Lookup ------------------- #
+    def find_field(self, field_id: str) -> Tuple[Optional[int], Optional[dict]]:
+        for position, field in enumerate(self.fields):
+            if field["id"] == field_id:
+                return position, field
+        return None, None
+
+    def next_field_id(self) -> str:
+        ids = [int(field["id"]) for field in self.fields if str(field["id"]).isdigit()]
+        return str(max(ids) + 1 if ids else 0)
+
+    # ------------------- Operations ------------------- #
+    def apply(self, operation: dict) -> bool:
+        """Apply one operation to the fields and the search index; False if it no longer fits."""
+        kind = operation["op"]
+        if kind in ("add_item", "remove_item"):
+            _, field = self.find_field(operation["field_id"])
+            if field is None:
+                return False
+            items, item = field["items"], operation["item"]
+            if kind == "add_item":
+                items.insert(min(operation["position"], len(items)), item)
+            else:
+                position = operation["position"]
+                if position >= len(items) or items[position] != item:
+                    return False
+                items.pop(position)
+            update = self.search_index.add_item if kind == "add_item" else self.search_index.remove_item
+            update(self.page, field["id"], item)
+        elif kind == "add_field":
+            field = copy.deepcopy(operation["field"])
+            self.fields.insert(min(operation["position"], len(self.fields)), field)
+            self.search_index.set_field(self.page, field)
+            for item in field["items"]:
+                self.search_index.add_item(self.page, field["id"], item)
+            if self.visible_ids is not None:
+                self.visible_ids.add(field["id"])
+        elif kind == "remove_field":
+            position, _ = self.find_field(operation["field"]["id"])
+            if position is None:
+                return False
+            del self.fields[position]
+            self.search_index.remove_field(self.page, operation["field"]["id"])
+        return True
+
+    def record(self, operation: dict) -> None:
+        """Push an already applied operation onto the undo log."""
+        self.undo_stack.append(operation)
+        self.redo_stack.clear()
+
+    def perform(self, operation: dict) -> bool:
+        if not self.apply(operation):
+            return False
+        self.record(operation)
+        return True
+
+    @staticmethod
+    def invert(operation: dict) -> dict:
+        return dict(operation, op=INVERSE_OPS[operation["op"]])
+
+    def undo(self) -> Optional[dict]:
+        """Revert the last operation; returns the operation that was applied to do so."""
+        if not self.undo_stack:
+            return None
+        operation = self.undo_stack.pop()
+        inverse = self.invert(operation)
+        self.apply(inverse)
+        self.redo_stack.append(operation)
+        return inverse
+
+    def redo(self) -> Optional[dict]:
+        if not self.redo_stack:
+            return None
+        operation = self.redo_stack.pop()
+        self.apply(operation)
+        self.undo_stack.append(operation)
+        return operation
@@ -0,0 +1,248 @@
+# ./utils/search_index.py
+
+"""
+Inverted index over the saved search-field items of every JSON page.
+
+Items are tokenized into lowercase words; each token maps to the items that
+contain it. Queries match whole tokens, token prefixes and (for longer tokens)
+single-edit typos, and results are ranked by match quality weighted by how
+rare the matched token is. Adding or removing an item only touches that item's
+tokens, so the index is built once and then kept in step with the UI.
+"""
+
+import bisect
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Relative weight of each kind of token match
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.6
+FUZZY_WEIGHT = 0.4
+
+# Bonus when the whole query appears verbatim inside the item
+PHRASE_BONUS = 1.0
+
+# Tokens shorter than this are not matched fuzzily (too many false hits)
+FUZZY_MIN_LENGTH = 4
+
+# Upper bound on vocabulary tokens a single short prefix may expand to
+MAX_PREFIX_EXPANSIONS = 500
+
+ItemKey = Tuple[str, str, str]  # (page, field_id, item)
+FieldKey = Tuple[str, str]      # (page, field_id)
+
+@dataclass(frozen=True)
+class SearchResult:
+    page: str
+    field_id: str
+    field_name: str
+    item: str
+    score: float
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _deletes(token: str) -> Set[str]:
+    """All strings one deletion away from token."""
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insertion, deletion, substitution or transposition."""
+    if a == b:
+        return True
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > 1:
+        return False
+    i = 0
+    while i < min(len_a, len_b) and a[i] == b[i]:
+        i += 1
+    if len_a == len_b:
+        if a[i + 1:] == b[i + 1:]:
+            return True
+        return a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:]
+    if len_a > len_b:
+        return a[i + 1:] == b[i:]
+    return a[i:] == b[i + 1:]
+
+class SearchIndex:
+    """Token → item postings for all search-field pages, plus a tag → field index."""
+
+    def __init__(self):
+        self.postings: Dict[str, Set[ItemKey]] = {}
+        self.vocabulary: List[str] = []          # sorted, for prefix lookups
+        self.item_tokens: Dict[ItemKey, Tuple[str, ...]] = {}
+        self.item_counts: Dict[ItemKey, int] = {}  # the same text can be saved twice in a field
+        self.field_names: Dict[FieldKey, str] = {}
+        self.field_tags: Dict[FieldKey, Set[str]] = {}
+        self.tag_fields: Dict[str, Set[FieldKey]] = {}
+        self._delete_map: Dict[str, Set[str]] = {}  # one-deletion variant -> vocabulary tokens
+
+    def __len__(self) -> int:
+        return len(self.item_tokens)
+
+    # ------------------- Building ------------------- #
+    def index_page(self, page: str, fields: Iterable[dict]) -> None:
+        """(Re)index every field and item of a page, replacing what was there."""
+        self.remove_page(page)
+        for field in fields:
+            self.set_field(page, field)
+            for item in field.get("items", []):
+                self.add_item(page, field["id"], item)
+
+    def remove_page(self, page: str) -> None:
+        for field_key in [key for key in self.field_names if key[0] == page]:
+            self.remove_field(*field_key)
+        for item_key in [key for key in self.item_tokens if key[0] == page]:
+            self._drop_item(item_key)
+
+    def set_field(self, page: str, field: dict) -> None:
+        """Record a field's name and tags (items are added separately)."""
+        field_key = (page, field["id"])
+        self.field_names[field_key] = field.get("name", "")
+        self._set_tags(field_key, field.get("tags", []))
+
+    def remove_field(self, page: str, field_id: str) -> None:
+        field_key = (page, field_id)
+        self._set_tags(field_key, [])
+        self.field_names.pop(field_key, None)
+        self.field_tags.pop(field_key, None)
+        for item_key in [key for key in self.item_tokens if key[:2] == field_key]:
+            self._drop_item(item_key)
+
+    def add_item(self, page: str, field_id: str, item: str) -> None:
+        item_key = (page, field_id, item)
+        if item_key in self.item_counts:
+            self.item_counts[item_key] += 1
+            return
+        tokens = tuple(dict.fromkeys(tokenize(item)))
+        self.item_counts[item_key] = 1
+        self.item_tokens[item_key] = tokens
+        for token in tokens:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = set()
+                self._add_to_vocabulary(token)
+            postings.add(item_key)
+
+    def remove_item(self, page: str, field_id: str, item: str) -> None:
+        item_key = (page, field_id, item)
+        count = self.item_counts.get(item_key)
+        if count is None:
+            return
+        if count > 1:
+            self.item_counts[item_key] = count - 1
+        else:
+            self._drop_item(item_key)
+
+    def _drop_item(self, item_key: ItemKey) -> None:
+        self.item_counts.pop(item_key, None)
+        for token in self.item_tokens.pop(item_key, ()):
+            postings = self.postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(item_key)
+            if not postings:
+                del self.postings[token]
+                self._remove_from_vocabulary(token)
+
+    def _add_to_vocabulary(self, token: str) -> None:
+        bisect.insort(self.vocabulary, token)
+        for variant in _deletes(token) | {token}:
+            self._delete_map.setdefault(variant, set()).add(token)
+
+    def _remove_from_vocabulary(self, token: str) -> None:
+        position = bisect.bisect_left(self.vocabulary, token)
+        if position < len(self.vocabulary) and self.vocabulary[position] == token:
+            del self.vocabulary[position]
+        for variant in _deletes(token) | {token}:
+            tokens = self._delete_map.get(variant)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._delete_map[variant]
+
+    def _set_tags(self, field_key: FieldKey, tags: Iterable[str]) -> None:
+        for tag in self.field_tags.get(field_key, ()):
+            fields = self.tag_fields.get(tag)
+            if fields is not None:
+                fields.discard(field_key)
+                if not fields:
+                    del self.tag_fields[tag]
+        normalized = {tag.strip().lower() for tag in tags if tag.strip()}
+        self.field_tags[field_key] = normalized
+        for tag in normalized:
+            self.tag_fields.setdefault(tag, set()).add(field_key)
+
+    # ------------------- Queries ------------------- #
+    def expand_token(self, token: str) -> Dict[str, float]:
+        """Vocabulary tokens matching a query token, with their match weight."""
+        matches: Dict[str, float] = {}
+        if token in self.postings:
+            matches[token] = EXACT_WEIGHT
+
+        position = bisect.bisect_left(self.vocabulary, token)
+        for candidate in self.vocabulary[position:position + MAX_PREFIX_EXPANSIONS]:
+            if not candidate.startswith(token):
+                break
+            matches.setdefault(candidate, PREFIX_WEIGHT)
+
+        if len(token) >= FUZZY_MIN_LENGTH:
+            for variant in _deletes(token) | {token}:
+                for candidate in self._delete_map.get(variant, ()):
+                    if candidate not in matches and _within_one_edit(token, candidate):
+                        matches[candidate] = FUZZY_WEIGHT
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = 50, page: Optional[str] = None) -> List[SearchResult]:
+        """
+        Items matching every query token (exactly, by prefix or by one typo),
+        best first. Restrict to one page by passing its name.
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+
+        total = max(len(self.item_tokens), 1)
+        per_token_scores: List[Dict[ItemKey, float]] = []
+        for query_token in query_tokens:
+            scores: Dict[ItemKey, float] = {}
+            for token, weight in self.expand_token(query_token).items():
+                postings = self.postings[token]
+                score = weight * math.log(1 + total / len(postings))
+                for item_key in postings:
+                    if page is not None and item_key[0] != page:
+                        continue
+                    if score > scores.get(item_key, 0.0):
+                        scores[item_key] = score
+            if not scores:
+                return []
+            per_token_scores.append(scores)
+
+        per_token_scores.sort(key=len)
+        candidates = set(per_token_scores[0])
+        for scores in per_token_scores[1:]:
+            candidates.intersection_update(scores)
+            if not candidates:
+                return []
+
+        phrase = query.strip().lower()
+        results = []
+        for item_key in candidates:
+            score = sum(scores[item_key] for scores in per_token_scores)
+            if phrase and phrase in item_key[2].lower():
+                score += PHRASE_BONUS
+            field_name = self.field_names.get(item_key[:2], "")
+            results.append(SearchResult(item_key[0], item_key[1], field_name, item_key[2], score))
+
+        results.sort(key=lambda result: (-result.score, len(result.item), result.page, result.field_id, result.item))
+        return results[:limit] if limit is not None else results
+
+    def fields_with_tag(self, tag: str, page: Optional[str] = None) -> Set[FieldKey]:
+        fields = self.tag_fields.get(tag.strip().lower(), set())
+        if page is None:
+            return set(fields)
+        return {field_key for field_key in fields if field_key[0] == page}
@@ -13,12 +13,16 @@ from .logger import (
     
     # Formatters and Filters
     SensitiveDataFilter,
+    SamplingFilter,
     ColoredFormatter,
+    JsonLinesFormatter,
     
     # Handlers and utilities
+    LazyQueueHandler,
     qt_message_handler,
     get_console_handler,
     get_file_handler,
+    get_structured_file_handler,
     log_uncaught_exceptions,
     
     # Color and formatting utilities
@@ -46,6 +50,13 @@ from .message_collector import (
     message_collector
 )
 
+from .tracer import (
+    Tracer,
+    tracer,
+    span,
+    traced,
+)
+
 # Define package exports
 __all__ = [
     # Core logging components
@@ -54,12 +65,16 @@ __all__ = [
     
     # Formatters and Filters
     "SensitiveDataFilter",
+    "SamplingFilter",
     "ColoredFormatter",
+    "JsonLinesFormatter",
     
     # Handlers and utilities
+    "LazyQueueHandler",
     "qt_message_handler",
     "get_console_handler",
     "get_file_handler",
+    "get_structured_file_handler",
     "log_uncaught_exceptions",
     
     # Color and formatting utilities
@@ -84,4 +99,10 @@ __all__ = [
     # Message collection utilities
     "MessageCollector",
     "message_collector",
+    
+    # Tracing utilities
+    "Tracer",
+    "tracer",
+    "span",
+    "traced",
 ]
\ No newline at end of file
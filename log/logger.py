@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 # ./log/logger.py
 
+import gzip
 import inspect
+import json
 import logging
 import os
 import re
+import shutil
 import sys
 import threading
 from datetime import datetime
@@ -25,6 +28,10 @@ from Config.AppConfig.config import (
     LOG_TIMESTAMP_FORMAT,
     LOG_FILENAME_TEMPLATE,
     FILE_ENCODING,
+    STRUCTURED_LOGGING,
+    STRUCTURED_LOG_FILENAME_TEMPLATE,
+    COMPRESS_LOG_BACKUPS,
+    DEBUG_LOG_SAMPLING,
 )
 
 from .message_collector import MessageCollector
@@ -43,12 +50,14 @@ DISABLE_COLOR_PRINTING = False
 # ------------------- Formatters ------------------- #
 class ColoredFormatter(logging.Formatter):
     """Adds colors to log messages based on log level."""
+
+    _color_codes = {level: f"\033[{code}m" for level, code in LOG_COLORS.items()}
     
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with appropriate colors."""
         level_name = record.levelname
-        if level_name in LOG_COLORS and not DISABLE_COLOR_PRINTING:
-            color_code = f"\033[{LOG_COLORS.get(level_name, '0')}m"
+        color_code = self._color_codes.get(level_name)
+        if color_code and not DISABLE_COLOR_PRINTING:
             formatted_message = (
                 f"{color_code}{self.formatTime(record, self.datefmt)} - "
                 f"{record.name}:{level_name} - {record.filename}:{record.lineno} - "
@@ -63,13 +72,41 @@ file_formatter = logging.Formatter(
     datefmt='%Y-%m-%d %H:%M:%S',
 )
 
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as compact single-line JSON objects for the structured log sink."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'src': f"{record.filename}:{record.lineno}",
+            'func': record.funcName,
+            'thread': record.threadName,
+            'msg': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        data = getattr(record, 'data', None)
+        if data is not None:
+            entry['data'] = data
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'), default=str)
+
 # ------------------- Filters ------------------- #
 class SensitiveDataFilter(logging.Filter):
-    """Filters out sensitive information from logs."""
+    """
+    Filters out sensitive information from logs.
+
+    Attached to the output handlers, so it runs on the listener thread and only
+    for records that pass the handler level, i.e. records that are emitted.
+    """
 
     def __init__(self):
         super().__init__()
         self.patterns = self._compile_patterns(SENSITIVE_PATTERNS)
+        self.keywords = tuple({pattern.lower() for pattern in SENSITIVE_PATTERNS})
 
     @staticmethod
     def _compile_patterns(patterns: List[str]) -> List[re.Pattern]:
@@ -84,13 +121,98 @@ class SensitiveDataFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter sensitive data from log records."""
+        if getattr(record, '_redacted', False):
+            return True
         msg = record.getMessage()
-        for pattern in self.patterns:
-            msg = pattern.sub(r"\1=******\5", msg)
+        lowered = msg.lower()
+        # Cheap substring check before running any regex
+        if any(keyword in lowered for keyword in self.keywords):
+            for pattern in self.patterns:
+                msg = pattern.sub(r"\1=******\5", msg)
         record.msg = msg
+        record.args = None
+        record._redacted = True
         return True
 
+class SamplingFilter(logging.Filter):
+    """
+    Keeps only a fraction of DEBUG records for high-volume categories.
+
+    Rates are keyed by "module.function" or "module" (e.g. "Page.handle_ai_response"),
+    a rate of 0.1 keeps every tenth record. Records above DEBUG are never sampled.
+    """
+
+    def __init__(self, rates: Mapping[str, float]):
+        super().__init__()
+        self.rates = dict(rates)
+        self._counters: dict = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or not self.rates:
+            return True
+        key = f"{record.module}.{record.funcName}"
+        rate = self.rates.get(key, self.rates.get(record.module))
+        if rate is None or rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        count = self._counters.get(key, 0)
+        self._counters[key] = count + 1
+        return count % max(1, round(1 / rate)) == 0
+
 # ------------------- Handlers ------------------- #
+# Argument types whose value can't change after the log call
+_DEFERRABLE_ARG_TYPES = (str, int, float, bool, bytes, type(None))
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Enqueues records without formatting them where that is safe.
+
+    The stock QueueHandler merges msg % args on the calling thread. Here only
+    records whose args are all primitives (str, numbers, bool, bytes, None)
+    keep them and are formatted in the listener; any other argument (a list,
+    a dict, an object) could change before the listener gets to it, so those
+    records are merged on the calling thread as before. Exception tracebacks
+    are always rendered into exc_text before the record is queued.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, Mapping) else args
+            if not all(isinstance(value, _DEFERRABLE_ARG_TYPES) for value in values):
+                record.msg = record.getMessage()
+                record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+def _rotating_handler(file_name: str) -> RotatingFileHandler:
+    os.makedirs(LOG_DIR, exist_ok=True)
+    handler = RotatingFileHandler(
+        os.path.join(LOG_DIR, file_name),
+        maxBytes=MAX_LOG_FILE_SIZE,
+        backupCount=BACKUP_COUNT,
+        encoding=FILE_ENCODING
+    )
+    if COMPRESS_LOG_BACKUPS:
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+    handler.setLevel(logging.DEBUG if DEBUG_MODE else logging.INFO)
+    return handler
+
 def get_console_handler() -> logging.Handler:
     """Create and configure console handler."""
     console_handler = logging.StreamHandler()
@@ -104,21 +226,20 @@ def get_console_handler() -> logging.Handler:
 
 def get_file_handler() -> logging.Handler:
     """Create and configure file handler."""
-    os.makedirs(LOG_DIR, exist_ok=True)
     timestamp = datetime.now().strftime(LOG_TIMESTAMP_FORMAT)
     file_name = LOG_FILENAME_TEMPLATE.format(timestamp=timestamp)
-    file_path = os.path.join(LOG_DIR, file_name)
-    
-    file_handler = RotatingFileHandler(
-        file_path,
-        maxBytes=MAX_LOG_FILE_SIZE,
-        backupCount=BACKUP_COUNT,
-        encoding=FILE_ENCODING
-    )
-    file_handler.setLevel(logging.DEBUG if DEBUG_MODE else logging.INFO)
+    file_handler = _rotating_handler(file_name)
     file_handler.setFormatter(file_formatter)
     return file_handler
 
+def get_structured_file_handler() -> logging.Handler:
+    """Create a JSONL file handler with size-based rotation."""
+    timestamp = datetime.now().strftime(LOG_TIMESTAMP_FORMAT)
+    file_name = STRUCTURED_LOG_FILENAME_TEMPLATE.format(timestamp=timestamp)
+    file_handler = _rotating_handler(file_name)
+    file_handler.setFormatter(JsonLinesFormatter())
+    return file_handler
+
 # ------------------- Logger Setup ------------------- #
 # Initialize the central logger
 try:
@@ -131,14 +252,19 @@ try:
         
         # Create and configure handlers
         console_handler = get_console_handler()
-        file_handler = get_file_handler()
-        queue_handler = QueueHandler(log_queue)
+        file_handler = get_structured_file_handler() if STRUCTURED_LOGGING else get_file_handler()
+        queue_handler = LazyQueueHandler(log_queue)
         
         # Add queue handler to logger
         logger.addHandler(queue_handler)
         
-        # Add sensitive data filter
-        logger.addFilter(SensitiveDataFilter())
+        # Drop sampled-out DEBUG records before they are enqueued
+        logger.addFilter(SamplingFilter(DEBUG_LOG_SAMPLING))
+        
+        # Redact only what is actually emitted (runs on the listener thread)
+        sensitive_filter = SensitiveDataFilter()
+        console_handler.addFilter(sensitive_filter)
+        file_handler.addFilter(sensitive_filter)
         
         # Prevent propagation to root logger
         logger.propagate = False
@@ -275,10 +401,14 @@ __all__ = [
     'logger',
     'LoggerManager',
     'SensitiveDataFilter',
+    'SamplingFilter',
     'ColoredFormatter',
+    'JsonLinesFormatter',
+    'LazyQueueHandler',
     'qt_message_handler',
     'get_console_handler',
     'get_file_handler',
+    'get_structured_file_handler',
     'log_uncaught_exceptions',
     'RESET_CODE',
     'ICECREAM_AVAILABLE',
@@ -1,11 +1,23 @@
 # ./shared/log/message_collector.py
 
+import atexit
+import queue
 import threading
 from collections import defaultdict
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional
 
 class MessageCollector:
-    """Collects and groups similar log messages for batch processing."""
+    """
+    Collects and groups similar log messages for batch processing.
+
+    add_message() only appends to a SimpleQueue and never takes a lock, so it is
+    safe to call from any thread (including from inside log_function). Messages
+    are grouped and emitted by a background flusher thread, either every
+    flush_interval seconds or as soon as flush_threshold messages are pending.
+    When max_pending messages are queued, new messages are dropped and counted.
+    Each thread counts its own drops, so counting needs no lock either; flush()
+    adds the per-thread counts up and reports what is new since the last flush.
+    """
     _instance = None
     _lock = threading.Lock()
 
@@ -17,30 +29,108 @@ class MessageCollector:
                     cls._instance._initialized = False
         return cls._instance
 
-    def __init__(self, log_function: Optional[Callable] = None):
+    def __init__(self, log_function: Optional[Callable] = None,
+                 flush_threshold: int = 100, flush_interval: float = 1.0,
+                 max_pending: int = 10000):
         if not getattr(self, '_initialized', False):
-            self._messages = defaultdict(list)
-            self._lock = threading.Lock()
-            self._flush_threshold = 100  # Auto-flush after this many messages
+            self._queue = queue.SimpleQueue()
+            self._flush_lock = threading.Lock()      # Serialises flushes only, never taken by add_message
+            self._wakeup = threading.Event()
+            self._flusher: Optional[threading.Thread] = None
+            self._flusher_start_lock = threading.Lock()
+            self._local = threading.local()
+            self._drop_counts: List[Dict[str, int]] = []   # one per thread that dropped, only written by it
+            self._dropped_reported: Dict[str, int] = {}     # totals already reported, only touched by flush()
+            self._flush_threshold = flush_threshold  # Wake the flusher after this many messages
+            self._flush_interval = flush_interval    # Seconds between periodic flushes
+            self._max_pending = max_pending          # Bound on queued messages
             self.log_function = log_function or print  # Use print if no logger provided
             self._initialized = True
+            atexit.register(self.flush)
+        elif log_function is not None:
+            # The module-level instance is created before the logger exists;
+            # let the logger attach itself afterwards.
+            self.log_function = log_function
+
+    @property
+    def pending(self) -> int:
+        """Number of messages waiting to be flushed (O(1))."""
+        return self._queue.qsize()
+
+    @property
+    def dropped(self) -> int:
+        """Number of messages dropped because the buffer was full, not yet reported by flush()."""
+        return max(0, sum(self._dropped_totals().values()) - sum(self._dropped_reported.values()))
+
+    def _count_drop(self, message_type: str):
+        counts = getattr(self._local, 'drop_counts', None)
+        if counts is None:
+            counts = self._local.drop_counts = defaultdict(int)
+            self._drop_counts.append(counts)
+        counts[message_type] += 1
+
+    def _dropped_totals(self) -> Dict[str, int]:
+        totals: Dict[str, int] = defaultdict(int)
+        for counts in list(self._drop_counts):
+            for message_type, count in counts.copy().items():
+                totals[message_type] += count
+        return totals
 
     def add_message(self, message_type: str, content: str, level: str = 'INFO'):
         """Add a message to be collected."""
-        with self._lock:
-            self._messages[message_type].append({
+        pending = self._queue.qsize()
+        if pending >= self._max_pending:
+            self._count_drop(message_type)
+            return
+
+        self._queue.put((message_type, content, level))
+        self._ensure_flusher()
+
+        # Wake the flusher early if threshold reached
+        if pending + 1 >= self._flush_threshold:
+            self._wakeup.set()
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._flusher_start_lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name="MessageCollectorFlusher", daemon=True
+                )
+                self._flusher.start()
+
+    def _run_flusher(self):
+        while True:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"ERROR: MessageCollector flush failed: {e}")
+
+    def _drain(self) -> Dict[str, list]:
+        messages = defaultdict(list)
+        while True:
+            try:
+                message_type, content, level = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            messages[message_type].append({
                 'content': content,
                 'level': level
             })
-
-            # Auto-flush if threshold reached
-            if sum(len(msgs) for msgs in self._messages.values()) >= self._flush_threshold:
-                self.flush()
+        return messages
 
     def flush(self):
         """Flush collected messages and log them as groups."""
-        with self._lock:
-            for message_type, messages in self._messages.items():
+        with self._flush_lock:
+            messages_by_type = self._drain()
+            totals = self._dropped_totals()
+            dropped = {k: v - self._dropped_reported.get(k, 0) for k, v in totals.items()}
+            self._dropped_reported = dict(totals)
+
+            for message_type, messages in messages_by_type.items():
                 if not messages:
                     continue
 
@@ -71,7 +161,10 @@ class MessageCollector:
                         for content in contents:
                             self.log_function(f"{level}: {message_type.upper()} - {content}")
 
-            self._messages.clear()
+            dropped = {k: v for k, v in dropped.items() if v}
+            if dropped:
+                summary = ", ".join(f"{k}={v}" for k, v in dropped.items())
+                self.log_function(f"WARNING: MessageCollector buffer full, dropped messages: {summary}")
 
 # Expose the message_collector instance for general use
 message_collector = MessageCollector()
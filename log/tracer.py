@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# ./log/tracer.py
+
+"""
+Lightweight span tracer for hot paths.
+
+Spans record monotonic start/duration and the thread id into a ring buffer and
+can be exported as Chrome trace-event JSON (open in Perfetto or chrome://tracing).
+When tracing is disabled, span() returns a shared no-op context manager and
+@traced functions pay a single attribute check.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from Config.AppConfig.config import (
+    TRACING_ENABLED,
+    TRACE_BUFFER_SIZE,
+    TRACE_EXPORT_DIR,
+)
+
+class _NullSpan:
+    """Shared no-op span used while tracing is disabled."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **kwargs) -> None:
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """A single timed region; use via Tracer.span()."""
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def set(self, **kwargs) -> None:
+        """Attach extra arguments to the span (shown in the trace viewer)."""
+        self.args.update(kwargs)
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.tracer._record(self.name, self.start, end - self.start, self.args)
+        return False
+
+class Tracer:
+    """Collects spans from any thread into a bounded buffer."""
+
+    def __init__(self, enabled: bool = False, capacity: int = TRACE_BUFFER_SIZE):
+        self.enabled = enabled
+        self._events: Deque[tuple] = deque(maxlen=capacity)
+        self._profile_armed: Optional[Dict[str, Any]] = None
+        self._profile_lock = threading.Lock()
+
+    # ------------------- Spans ------------------- #
+    def span(self, name: str, **args: Any):
+        """Context manager timing the enclosed block."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """Decorator form of span(); the span name defaults to the function's qualname."""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, {}):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def instant(self, name: str, **args: Any) -> None:
+        """Record a zero-length marker event."""
+        if self.enabled:
+            self._record(name, time.perf_counter_ns(), None, args)
+
+    def _record(self, name: str, start_ns: int, duration_ns: Optional[int], args: Dict[str, Any]) -> None:
+        # deque.append is atomic, no lock needed on the hot path
+        self._events.append((name, start_ns, duration_ns, threading.get_ident(),
+                             threading.current_thread().name, args))
+
+    # ------------------- Buffer ------------------- #
+    def events(self) -> List[tuple]:
+        return list(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build a Chrome trace-event document from the buffered spans."""
+        pid = os.getpid()
+        trace_events = []
+        thread_names = {}
+        for name, start_ns, duration_ns, tid, thread_name, args in self.events():
+            thread_names[tid] = thread_name
+            event = {
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ts': start_ns / 1000.0,
+                'pid': pid,
+                'tid': tid,
+            }
+            if duration_ns is None:
+                event.update(ph='i', s='t')
+            else:
+                event.update(ph='X', dur=duration_ns / 1000.0)
+            if args:
+                event['args'] = {k: v if isinstance(v, (int, float, bool)) else str(v) for k, v in args.items()}
+            trace_events.append(event)
+        for tid, thread_name in thread_names.items():
+            trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                                 'args': {'name': thread_name}})
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path: Optional[str] = None) -> str:
+        """Write the buffer as Chrome trace-event JSON and return the file path."""
+        if file_path is None:
+            os.makedirs(TRACE_EXPORT_DIR, exist_ok=True)
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            file_path = os.path.join(TRACE_EXPORT_DIR, f"trace_{timestamp}.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return file_path
+
+    # ------------------- Profiling ------------------- #
+    def arm_profiler(self, output_dir: str = TRACE_EXPORT_DIR, use_pyinstrument: bool = False) -> None:
+        """Profile the next block wrapped in profile(); disarms itself afterwards."""
+        with self._profile_lock:
+            self._profile_armed = {'output_dir': output_dir, 'use_pyinstrument': use_pyinstrument}
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """Run cProfile (or pyinstrument) around the block if the profiler is armed."""
+        if self._profile_armed is None:
+            yield
+            return
+        with self._profile_lock:
+            options, self._profile_armed = self._profile_armed, None
+        if options is None:
+            yield
+            return
+
+        os.makedirs(options['output_dir'], exist_ok=True)
+        base_path = os.path.join(options['output_dir'],
+                                 f"profile_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        profiler = None
+        if options['use_pyinstrument']:
+            try:
+                from pyinstrument import Profiler
+                profiler = Profiler()
+            except ImportError:
+                profiler = None
+
+        if profiler is not None:
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                with open(f"{base_path}.html", 'w', encoding='utf-8') as f:
+                    f.write(profiler.output_html())
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(f"{base_path}.prof")
+
+# Shared tracer; enable with TRACING_ENABLED or NODEX_TRACE=1
+tracer = Tracer(enabled=TRACING_ENABLED or os.environ.get('NODEX_TRACE') == '1')
+span = tracer.span
+traced = tracer.traced
+
+__all__ = ['Tracer', 'Span', 'tracer', 'span', 'traced']
@@ -0,0 +1,369 @@
+# ./fast_whisper_v2/batch.py
+
+"""
+Batch transcription of existing audio files.
+
+Files (or whole folders) are added to a JobQueue kept in SQLite, so a batch
+that is interrupted - closed window, crash, power cut - picks up where it
+stopped the next time it runs. BatchTranscriber works through the queue with
+a small pool of threads sharing one WhisperModel (created with num_workers
+equal to the pool size so the transcriptions really run in parallel) and
+writes the result next to each source file as .txt, .srt and/or .json,
+keeping the audio extension in the name (talk.mp3 -> talk.mp3.txt) so
+talk.wav and talk.mp3 in one folder don't overwrite each other's outputs.
+
+Results are also stored by the SHA-256 of the audio, so a file that has
+already been transcribed - the same recording queued again, or a copy of it
+elsewhere - is skipped and only has its missing output files written.
+
+Run from the repository root to transcribe a backlog without the GUI:
+
+    python -m modules.fast_whisper_v2.batch path/to/recordings [more paths...]
+
+With no paths it resumes the jobs left in the queue.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".webm", ".mp4", ".mkv")
+OUTPUT_FORMATS = ("txt", "srt", "json")
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'config.json')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    path TEXT PRIMARY KEY,
+    status TEXT NOT NULL,           -- pending, running, done, skipped, failed
+    digest TEXT,
+    error TEXT,
+    queued_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs(status, queued_at);
+-- Results from before they were keyed by model and options can't be trusted
+DROP TABLE IF EXISTS results;
+CREATE TABLE IF NOT EXISTS transcripts (
+    cache_key TEXT PRIMARY KEY,     -- see result_key()
+    result TEXT NOT NULL
+);
+"""
+
+def find_audio_files(paths: Iterable[str], extensions=AUDIO_EXTENSIONS) -> List[str]:
+    """Absolute paths of the given files plus the audio files found under the given folders."""
+    found = []
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            found.extend(
+                os.path.join(root, name) for name in sorted(files)
+                if name.lower().endswith(extensions)
+            )
+    return found
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def result_key(digest: str, model_name: str, compute_type: str, transcribe_options: dict) -> str:
+    """Identifies a transcript: the same audio run through the same model with the same options."""
+    settings = json.dumps([digest, model_name, compute_type, transcribe_options], sort_keys=True, default=str)
+    return hashlib.sha256(settings.encode("utf-8")).hexdigest()
+
+def format_timestamp(seconds: float) -> str:
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+def render(result: dict, output_format: str) -> str:
+    segments = result["segments"]
+    if output_format == "txt":
+        return "\n".join(segment["text"].strip() for segment in segments) + "\n"
+    if output_format == "srt":
+        blocks = [
+            f"{index}\n{format_timestamp(segment['start'])} --> {format_timestamp(segment['end'])}\n"
+            f"{segment['text'].strip()}\n"
+            for index, segment in enumerate(segments, start=1)
+        ]
+        return "\n".join(blocks)
+    if output_format == "json":
+        return json.dumps(result, ensure_ascii=False, indent=2)
+    raise ValueError(f"Unknown output format: {output_format}")
+
+def output_path(source_path: str, output_format: str) -> str:
+    return f"{source_path}.{output_format}"
+
+def write_outputs(source_path: str, result: dict, formats=OUTPUT_FORMATS, overwrite: bool = True) -> List[str]:
+    """Write the result next to the source file; returns the paths written."""
+    written = []
+    for output_format in formats:
+        path = output_path(source_path, output_format)
+        if not overwrite and os.path.exists(path):
+            continue
+        # Written under a temporary name so an interrupted batch never leaves half a file
+        temp_path = path + ".part"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(render(result, output_format))
+        os.replace(temp_path, path)
+        written.append(path)
+    return written
+
+
+class BatchStopped(Exception):
+    """Raised inside a transcription when the batch is stopped."""
+
+
+class JobQueue:
+    """Batch jobs and finished results in SQLite, safe to share between worker threads."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and db_path != ":memory:":
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.executescript(SCHEMA)
+            # Jobs that were running when the last batch died start over
+            self.connection.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add(self, paths: Iterable[str]) -> int:
+        """Queue files; files queued before are queued again and skipped if unchanged."""
+        now = time.time()
+        with self._lock, self.connection:
+            before = self.connection.total_changes
+            self.connection.executemany(
+                "INSERT INTO jobs (path, status, queued_at) VALUES (?, 'pending', ?) "
+                "ON CONFLICT(path) DO UPDATE SET status = 'pending', error = NULL, queued_at = excluded.queued_at "
+                "WHERE status != 'running'",
+                [(path, now) for path in paths],
+            )
+            return self.connection.total_changes - before
+
+    def claim(self) -> Optional[str]:
+        """Mark the oldest pending job as running and return its path."""
+        with self._lock, self.connection:
+            row = self.connection.execute(
+                "SELECT path FROM jobs WHERE status = 'pending' ORDER BY queued_at, rowid LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute("UPDATE jobs SET status = 'running' WHERE path = ?", row)
+            return row[0]
+
+    def finish(self, path: str, status: str, digest: Optional[str] = None, error: Optional[str] = None) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, digest = ?, error = ?, finished_at = ? WHERE path = ?",
+                (status, digest, error, time.time(), path),
+            )
+
+    def release(self, path: str) -> None:
+        """Put a claimed job back, e.g. when the batch is stopped."""
+        with self._lock, self.connection:
+            self.connection.execute("UPDATE jobs SET status = 'pending' WHERE path = ?", (path,))
+
+    def cached_result(self, cache_key: str) -> Optional[dict]:
+        with self._lock:
+            row = self.connection.execute("SELECT result FROM transcripts WHERE cache_key = ?", (cache_key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store_result(self, cache_key: str, result: dict) -> None:
+        with self._lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO transcripts (cache_key, result) VALUES (?, ?)",
+                (cache_key, json.dumps(result, ensure_ascii=False)),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self.connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+
+    def failures(self) -> List[tuple]:
+        with self._lock:
+            return self.connection.execute(
+                "SELECT path, error FROM jobs WHERE status = 'failed' ORDER BY finished_at"
+            ).fetchall()
+
+
+class BatchTranscriber:
+    """
+    Work through a JobQueue with a bounded pool of threads sharing one model.
+
+    on_file_done(path, status, error) is called from the worker threads after
+    each file; is_running() is checked before each new file is started.
+    model_name and compute_type describe the model, so cached transcripts are
+    only reused for the same model and transcribe_options.
+    """
+
+    def __init__(
+        self,
+        model,
+        queue: JobQueue,
+        workers: int = 2,
+        formats=OUTPUT_FORMATS,
+        transcribe_options: Optional[dict] = None,
+        model_name: str = "",
+        compute_type: str = "",
+        is_running: Optional[Callable[[], bool]] = None,
+        on_file_done: Optional[Callable[[str, str, Optional[str]], None]] = None,
+    ):
+        self.model = model
+        self.queue = queue
+        self.workers = max(1, workers)
+        self.formats = tuple(formats)
+        self.transcribe_options = transcribe_options or {}
+        self.model_name = model_name
+        self.compute_type = compute_type
+        self.is_running = is_running or (lambda: True)
+        self.on_file_done = on_file_done
+        self._counts_lock = threading.Lock()
+        self.counts: Dict[str, int] = {"done": 0, "skipped": 0, "failed": 0}
+
+    def run(self) -> Dict[str, int]:
+        """Process jobs until the queue is empty or the batch is stopped."""
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="whisper-batch") as pool:
+            for future in [pool.submit(self._work) for _ in range(self.workers)]:
+                future.result()
+        return dict(self.counts)
+
+    def _work(self) -> None:
+        while self.is_running():
+            path = self.queue.claim()
+            if path is None:
+                return
+            if not self.is_running():
+                self.queue.release(path)
+                return
+            digest = None
+            try:
+                digest = file_digest(path)
+                status = self.process(path, digest)
+                error = None
+            except BatchStopped:
+                self.queue.release(path)
+                return
+            except Exception as e:
+                logger.error(f"Batch transcription of {path} failed: {e}")
+                status, error = "failed", str(e)
+            self.queue.finish(path, status, digest, error)
+            with self._counts_lock:
+                self.counts[status] += 1
+            if self.on_file_done is not None:
+                self.on_file_done(path, status, error)
+
+    def process(self, path: str, digest: str) -> str:
+        cache_key = result_key(digest, self.model_name, self.compute_type, self.transcribe_options)
+        result = self.queue.cached_result(cache_key)
+        if result is not None:
+            # Same audio transcribed before with the same settings: only fill in missing outputs
+            write_outputs(path, result, self.formats, overwrite=False)
+            return "skipped"
+        result = self.transcribe(path)
+        self.queue.store_result(cache_key, result)
+        write_outputs(path, result, self.formats)
+        return "done"
+
+    def transcribe(self, path: str) -> dict:
+        segments, info = self.model.transcribe(path, **self.transcribe_options)
+        collected = []
+        # Segments are decoded lazily, so a stop request takes effect mid-file
+        for segment in segments:
+            if not self.is_running():
+                raise BatchStopped()
+            collected.append({"start": round(segment.start, 3), "end": round(segment.end, 3), "text": segment.text})
+        return {
+            "source": os.path.basename(path),
+            "language": info.language,
+            "duration": info.duration,
+            "segments": collected,
+        }
+
+
+def default_queue_path(config: dict) -> str:
+    cache_dir = config.get("cache_dir", ".whisper_cache")
+    if not os.path.isabs(cache_dir):
+        cache_dir = os.path.join(os.path.expanduser("~"), cache_dir)
+    return os.path.join(cache_dir, config.get("batch_queue_file", "batch_queue.db"))
+
+def model_options(config: dict) -> dict:
+    """WhisperModel arguments for the shared batch model."""
+    return {
+        "cpu_threads": config.get("batch_cpu_threads", 0),
+        "num_workers": config.get("batch_workers", 2),
+    }
+
+def transcribe_options(config: dict) -> dict:
+    """WhisperModel.transcribe() arguments for batch jobs."""
+    return {"language": config.get("language")}
+
+def main(argv=None) -> int:
+    with open(CONFIG_PATH, 'r') as config_file:
+        config = json.load(config_file)
+
+    parser = argparse.ArgumentParser(description="Transcribe folders of audio files with faster-whisper.")
+    parser.add_argument("paths", nargs="*", help="Audio files or folders to add; none resumes the queue")
+    parser.add_argument("--model", default=config.get("model_name", "base"))
+    parser.add_argument("--device", default=config.get("device", "cpu"))
+    parser.add_argument("--compute-type", default=config.get("compute_type", "auto"))
+    parser.add_argument("--language", default=config.get("language"), help="Language code; detected when not set")
+    parser.add_argument("--workers", type=int, default=config.get("batch_workers", 2))
+    parser.add_argument("--cpu-threads", type=int, default=config.get("batch_cpu_threads", 0))
+    parser.add_argument("--formats", default=",".join(config.get("batch_formats", OUTPUT_FORMATS)))
+    parser.add_argument("--queue", default=default_queue_path(config), help="Job queue database")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    queue = JobQueue(args.queue)
+    try:
+        if args.paths:
+            added = queue.add(find_audio_files(args.paths))
+            logger.info(f"Queued {added} files.")
+
+        # faster-whisper is only needed once there is something to transcribe
+        from modules.fast_whisper_v2.model_cache import ModelCache
+        cache = ModelCache.get_instance(config)
+        model = cache.get_model(
+            args.model, args.device, args.compute_type,
+            cpu_threads=args.cpu_threads, num_workers=args.workers,
+        )
+        batch = BatchTranscriber(
+            model, queue, workers=args.workers, formats=args.formats.split(","),
+            transcribe_options=transcribe_options(dict(config, language=args.language)),
+            model_name=args.model,
+            compute_type=cache.known_compute_type(args.model, args.device, args.compute_type),
+            on_file_done=lambda path, status, error: logger.info(f"{status}: {path}" + (f" ({error})" if error else "")),
+        )
+        counts = batch.run()
+        logger.info(f"Finished: {counts['done']} transcribed, {counts['skipped']} skipped, {counts['failed']} failed.")
+        return 1 if counts["failed"] else 0
+    finally:
+        queue.close()
+
+if __name__ == "__main__":
+    raise SystemExit(main())
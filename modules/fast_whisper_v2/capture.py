@@ -0,0 +1,134 @@
+# ./fast_whisper_v2/capture.py
+
+"""
+Audio capture helpers for RecordingThread.
+
+When recording from the microphone and computer audio at once, each stream's
+chunks are written into their own SampleRingBuffer and StreamMixer sums them
+sample by sample as soon as every stream has delivered audio for the same
+stretch of time. If one stream falls more than max_lag samples behind (a
+stalled device, clock drift) the others are mixed without it, so output never
+waits indefinitely and memory stays bounded by the ring sizes. When the
+stalled stream resumes it is fast-forwarded to the mix position and rejoins
+the mix from there.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+class SampleRingBuffer:
+    """
+    Fixed-size NumPy ring holding the most recent samples.
+
+    Positions are absolute sample offsets into the stream, so readers can
+    address audio by when it was recorded, as long as it hasn't been
+    overwritten.
+    """
+
+    def __init__(self, capacity: int, dtype=np.int32):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self.position = 0  # total samples ever written
+
+    @property
+    def oldest(self) -> int:
+        """Oldest position that can still be read."""
+        return max(0, self.position - self.capacity)
+
+    def write(self, samples: np.ndarray) -> None:
+        if len(samples) > self.capacity:
+            self.position += len(samples) - self.capacity
+            samples = samples[-self.capacity:]
+        start = self.position % self.capacity
+        first = min(len(samples), self.capacity - start)
+        self._buffer[start:start + first] = samples[:first]
+        self._buffer[:len(samples) - first] = samples[first:]
+        self.position += len(samples)
+
+    def skip_to(self, position: int) -> None:
+        """Jump ahead to position, as if the samples in between had been written."""
+        if position > self.position:
+            self.position = position
+
+    def read(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        """Copy of the samples between two absolute positions (end defaults to the newest)."""
+        end = self.position if end is None else end
+        if start < self.oldest or end > self.position or start > end:
+            raise ValueError(f"range {start}-{end} is not in the buffer ({self.oldest}-{self.position})")
+        if end == start:
+            return self._buffer[:0].copy()
+        a, b = start % self.capacity, end % self.capacity
+        if a < b:
+            return self._buffer[a:b].copy()
+        return np.concatenate((self._buffer[a:], self._buffer[:b]))
+
+
+def pcm_to_int(data: bytes, sample_width: int) -> np.ndarray:
+    """Little-endian 16 or 24-bit PCM to int32 samples (channels stay interleaved)."""
+    if sample_width == 2:
+        return np.frombuffer(data, dtype='<i2').astype(np.int32)
+    if sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        return np.where(values >= 1 << 23, values - (1 << 24), values)
+    raise ValueError(f"Unsupported sample width: {sample_width}")
+
+def int_to_pcm(samples: np.ndarray, sample_width: int) -> bytes:
+    """Inverse of pcm_to_int; samples must already be in range."""
+    if sample_width == 2:
+        return samples.astype('<i2').tobytes()
+    if sample_width == 3:
+        return samples.astype('<i4').view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    raise ValueError(f"Unsupported sample width: {sample_width}")
+
+
+class StreamMixer:
+    """
+    Align and mix several PCM streams of the same format.
+
+    push() takes the chunk just read from one stream and returns whatever
+    mixed PCM has become complete, in the same format. With a single stream
+    chunks are passed through untouched.
+    """
+
+    def __init__(self, streams: int, sample_width: int, channels: int = 1, max_lag_frames: int = 8000):
+        self.sample_width = sample_width
+        self.max_lag = max_lag_frames * channels
+        # Room for the allowed lag plus the chunks arriving while at it
+        self.rings: List[SampleRingBuffer] = [SampleRingBuffer(2 * self.max_lag) for _ in range(streams)]
+        self.position = 0  # samples mixed so far
+        self._limit = 1 << (8 * sample_width - 1)
+
+    def push(self, index: int, data: bytes) -> bytes:
+        if len(self.rings) == 1:
+            return data
+        ring = self.rings[index]
+        # A stream that fell behind the mix restarts at the mix position, so
+        # its new audio lands in time that hasn't been mixed yet
+        ring.skip_to(self.position)
+        ring.write(pcm_to_int(data, self.sample_width))
+        positions = [ring.position for ring in self.rings]
+        return self._mix_until(max(min(positions), max(positions) - self.max_lag))
+
+    def flush(self) -> bytes:
+        """Mix everything still buffered, treating missing audio as silence."""
+        if len(self.rings) == 1:
+            return b''
+        return self._mix_until(max(ring.position for ring in self.rings))
+
+    def _mix_until(self, end: int) -> bytes:
+        if end <= self.position:
+            return b''
+        mixed = np.zeros(end - self.position, dtype=np.int32)
+        for ring in self.rings:
+            # Samples a lagging stream delivers for time already mixed are dropped
+            start = max(self.position, ring.oldest)
+            stop = min(end, ring.position)
+            if stop > start:
+                mixed[start - self.position:stop - self.position] += ring.read(start, stop)
+        self.position = end
+        np.clip(mixed, -self._limit, self._limit - 1, out=mixed)
+        return int_to_pcm(mixed, self.sample_width)
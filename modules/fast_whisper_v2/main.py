@@ -6,9 +6,7 @@ import string
 import sys
 import traceback
 import wave
-from pathlib import Path
-import pickle
-import threading
+import queue
 
 import keyboard
 import pyaudio
@@ -16,10 +14,16 @@ from PySide6.QtCore import QThread, Signal, Property, QPropertyAnimation, QEasin
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QMessageBox, QWidget, QVBoxLayout, 
     QHBoxLayout, QPushButton, QLabel, QComboBox, QLineEdit, QTextEdit, 
-    QGridLayout, QFrame, QDialog, QProgressBar
+    QGridLayout, QFrame, QDialog, QProgressBar, QFileDialog
 )
 
-from faster_whisper import WhisperModel
+from modules.fast_whisper_v2.batch import (
+    BatchTranscriber, JobQueue, OUTPUT_FORMATS, default_queue_path, find_audio_files, model_options,
+    transcribe_options
+)
+from modules.fast_whisper_v2.capture import StreamMixer
+from modules.fast_whisper_v2.model_cache import ModelCache
+from modules.fast_whisper_v2.streaming import UtteranceSegmenter
 
 import json
 
@@ -55,76 +59,12 @@ def list_input_devices():
     p.terminate()
     return device_list
 
-class ModelCache:
-    _instance = None
-    _lock = threading.Lock()
-
-    @classmethod
-    def get_instance(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
-
-    def __init__(self):
-        self.cache = {}
-        self.initialize_cache_dir()
-
-    def initialize_cache_dir(self):
-        cache_dir = Path(config.get("cache_dir", ".whisper_cache"))
-        cache_dir = Path.home() / cache_dir if not Path(config.get("cache_dir")).is_absolute() else Path(config.get("cache_dir"))
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Cache directory set to: {cache_dir}")
-        self.cache_dir = cache_dir
-        self.cache_file = cache_dir / config.get("cache_file", "model_cache_metadata.pkl")
-
-    def get_model(self, model_name: str, device: str, compute_type: str):
-        cache_key = f"{model_name}_{device}_{compute_type}"
-
-        # Try to load from memory cache first
-        if cache_key in self.cache:
-            logger.debug(f"Model '{cache_key}' loaded from memory cache.")
-            return self.cache[cache_key]
-
-        # Check for an existing metadata file
-        if self.cache_file.exists() and os.path.getsize(self.cache_file) > 0:  # Check file size
-            try:
-                with open(self.cache_file, 'rb') as f:
-                    metadata = pickle.load(f)
-                    if cache_key in metadata:
-                        logger.debug(f"Metadata for model '{cache_key}' loaded from disk cache.")
-                        # Recreate the model based on metadata
-                        model = WhisperModel(model_name, device=device, compute_type=compute_type)
-                        self.cache[cache_key] = model
-                        return model
-            except (EOFError, pickle.UnpicklingError) as e:
-                logger.warning(f"Failed to load model metadata: {e}")
-                # Optionally, recreate the metadata file if it's corrupted
-                os.remove(self.cache_file)  # Delete corrupted cache file
-
-        # Create new model if not found in cache
-        model = WhisperModel(model_name, device=device, compute_type=compute_type)
-        self.cache[cache_key] = model
-        logger.debug(f"Model '{cache_key}' created and added to cache.")
-
-        # Save metadata to disk cache
-        try:
-            with open(self.cache_file, 'wb') as f:
-                metadata = {k: None for k in self.cache}  # Adjust to store metadata only
-                pickle.dump(metadata, f)
-            logger.debug(f"Cache metadata saved to disk at '{self.cache_file}'.")
-        except Exception as e:
-            logger.warning(f"Failed to save cache metadata: {e}")
-
-        return model
-
 class ModelLoader(QThread):
     progress_update = Signal(int)
     model_ready = Signal(object)
     
-    def __init__(self, model_name, device, compute_type):
-        super().__init__()
+    def __init__(self, model_name, device, compute_type, parent=None):
+        super().__init__(parent)
         self.model_name = model_name
         self.device = device
         self.compute_type = compute_type
@@ -132,7 +72,7 @@ class ModelLoader(QThread):
     def run(self):
         try:
             self.progress_update.emit(10)
-            cache = ModelCache.get_instance()
+            cache = ModelCache.get_instance(config)
             self.progress_update.emit(50)
             model = cache.get_model(self.model_name, self.device, self.compute_type)
             self.progress_update.emit(100)
@@ -299,11 +239,120 @@ class TranscriptionThread(QThread):
                 text = text.translate(str.maketrans('', '', string.punctuation))
             self.transcription_complete.emit(text)
 
+class StreamingTranscriptionThread(QThread):
+    """
+    Transcribes utterances handed over by RecordingThread while recording
+    continues. Text is emitted segment by segment as soon as it is decoded;
+    the thread finishes once close() has been called and the queue is empty.
+    """
+    transcription_complete = Signal(str)
+    error_occurred = Signal(str)
+
+    def __init__(self, model, remove_punctuation, language=None, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.remove_punctuation = remove_punctuation
+        # Detected once on the first utterance instead of on every one
+        self.language = language
+        self._previous_text = ""
+        self._utterances = queue.Queue()
+        self._cancelled = False
+
+    def submit(self, audio):
+        self._utterances.put(audio)
+
+    def close(self):
+        """No more utterances will follow."""
+        self._utterances.put(None)
+
+    def cancel(self):
+        """Drop utterances that haven't been transcribed yet."""
+        self._cancelled = True
+        self.close()
+
+    def run(self):
+        while True:
+            audio = self._utterances.get()
+            if audio is None or self._cancelled:
+                break
+            try:
+                self.transcribe(audio)
+            except Exception as e:
+                logger.error(f"Fel vid transkribering: {e}")
+                self.error_occurred.emit(str(e))
+
+    def transcribe(self, audio):
+        segments, info = self.model.transcribe(
+            audio,
+            language=self.language,
+            # Short utterances: carry context through the prompt instead
+            condition_on_previous_text=False,
+            initial_prompt=self._previous_text or None,
+            without_timestamps=True,
+        )
+        if self.language is None:
+            self.language = info.language
+        texts = []
+        for segment in segments:
+            if self._cancelled:
+                return
+            text = segment.text
+            texts.append(text)
+            if self.remove_punctuation:
+                text = text.translate(str.maketrans('', '', string.punctuation))
+            self.transcription_complete.emit(text)
+        if texts:
+            self._previous_text = "".join(texts)[-200:]
+
+class BatchTranscriptionThread(QThread):
+    """Queues a folder of recordings and transcribes everything pending in the batch queue."""
+    file_done = Signal(str, str, str)   # path, status, error
+    batch_finished = Signal(dict)
+    error_occurred = Signal(str)
+
+    def __init__(self, paths, parent=None):
+        super().__init__(parent)
+        self.paths = paths
+        self._running = True
+
+    def run(self):
+        queue = None
+        try:
+            queue = JobQueue(default_queue_path(config))
+            queue.add(find_audio_files(self.paths))
+            cache = ModelCache.get_instance(config)
+            model_name = config.get("model_name", "base")
+            device = config.get("device", "cpu")
+            compute_type = config.get("compute_type", "auto")
+            model = cache.get_model(model_name, device, compute_type, **model_options(config))
+            batch = BatchTranscriber(
+                model, queue,
+                workers=config.get("batch_workers", 2),
+                formats=config.get("batch_formats", OUTPUT_FORMATS),
+                transcribe_options=transcribe_options(config),
+                model_name=model_name,
+                compute_type=cache.known_compute_type(model_name, device, compute_type),
+                is_running=lambda: self._running,
+                on_file_done=lambda path, status, error: self.file_done.emit(path, status, error or ""),
+            )
+            self.batch_finished.emit(batch.run())
+        except Exception as e:
+            logger.error(f"Batch transcription failed: {e}")
+            self.error_occurred.emit(str(e))
+        finally:
+            if queue is not None:
+                queue.close()
+
+    def stop(self):
+        """Stop after the files in progress; the rest stay queued for next time."""
+        self._running = False
+
 class RecordingThread(QThread):
     recording_complete = Signal()
     error_occurred = Signal(str)
     
-    def __init__(self, audio_format, channels, rate, chunk, filename, input_source, mic_device_index=None, computer_device_index=None):
+    def __init__(self, audio_format, channels, rate, chunk, filename, input_source, mic_device_index=None, computer_device_index=None,
+                 transcriber=None, vad_settings=None, mix_max_lag_ms=500):
         super().__init__()
         self.audio_format = audio_format
         self.channels = channels
@@ -317,6 +366,13 @@ class RecordingThread(QThread):
         self.audio = None
         self.streams = []
         self._sample_width = None
+        # Streaming mode: utterances go to the transcriber instead of a WAV file
+        self.transcriber = transcriber
+        self.vad_settings = vad_settings or {}
+        # "both": how far one stream may fall behind before the other is mixed without it
+        self.mix_max_lag_ms = mix_max_lag_ms
+        self._wav_file = None
+        self._wav_failed = False
         
     def run(self):
         try:
@@ -352,17 +408,30 @@ class RecordingThread(QThread):
                     raise ValueError("Ingen datorljudenhet vald.")
             
             self._sample_width = self.audio.get_sample_size(self.audio_format)
-            frames = []
+            # Each stream gets its own ring; mixed audio is passed on as soon as it is complete
+            mixer = StreamMixer(
+                len(self.streams), self._sample_width, self.channels,
+                max_lag_frames=self.rate * self.mix_max_lag_ms // 1000
+            )
+            segmenter = None
+            if self.transcriber is not None:
+                segmenter = UtteranceSegmenter(self.rate, self._sample_width, self.channels, **self.vad_settings)
             self.is_recording = True
             
             while self.is_recording:
-                for stream in self.streams:
+                for index, stream in enumerate(self.streams):
                     try:
                         data = stream.read(self.chunk, exception_on_overflow=False)
-                        frames.append(data)
                     except IOError as e:
                         logging.error(f"IOError under inspelning: {e}")
-                        continue
+                        # Silence keeps this stream in step with the others
+                        data = bytes(self.chunk * self._sample_width * self.channels)
+                    self.deliver(mixer.push(index, data), segmenter)
+            
+            self.deliver(mixer.flush(), segmenter)
+            if segmenter is not None:
+                for utterance in segmenter.flush():
+                    self.transcriber.submit(utterance)
             
             # Stäng strömmar
             for stream in self.streams:
@@ -370,24 +439,55 @@ class RecordingThread(QThread):
                 stream.close()
             self.streams = []
             
-            # Spara WAV-fil
-            if frames:
-                try:
-                    with wave.open(self.filename, 'wb') as wf:
-                        wf.setnchannels(self.channels)
-                        wf.setsampwidth(self._sample_width)
-                        wf.setframerate(self.rate)
-                        wf.writeframes(b''.join(frames))
-                    self.recording_complete.emit()
-                except Exception as e:
-                    self.error_occurred.emit(f"Fel vid sparning av inspelning: {str(e)}")
+            # Avsluta WAV-fil
+            if self._wav_file is not None and self.close_wav():
+                self.recording_complete.emit()
             
         except Exception as e:
             self.error_occurred.emit(f"Inspelningsfel: {str(e)}")
             traceback.print_exc()
         finally:
+            if self.transcriber is not None:
+                self.transcriber.close()
+            self.close_wav()
             self.cleanup_resources()
 
+    def deliver(self, data, segmenter):
+        """Pass mixed audio to the transcriber, or append it to the WAV file."""
+        if not data:
+            return
+        if segmenter is not None:
+            for utterance in segmenter.feed(data):
+                self.transcriber.submit(utterance)
+            return
+        if self._wav_failed:
+            return
+        try:
+            if self._wav_file is None:
+                self._wav_file = wave.open(self.filename, 'wb')
+                self._wav_file.setnchannels(self.channels)
+                self._wav_file.setsampwidth(self._sample_width)
+                self._wav_file.setframerate(self.rate)
+            # The header's frame count is patched once, on close
+            self._wav_file.writeframesraw(data)
+        except Exception as e:
+            self._wav_failed = True
+            self.is_recording = False
+            self.error_occurred.emit(f"Fel vid sparning av inspelning: {str(e)}")
+
+    def close_wav(self):
+        """Close the WAV file if one is open; True if it was saved."""
+        wav_file, self._wav_file = self._wav_file, None
+        if wav_file is None:
+            return False
+        try:
+            wav_file.close()
+        except Exception as e:
+            if not self._wav_failed:
+                self._wav_failed = True
+                self.error_occurred.emit(f"Fel vid sparning av inspelning: {str(e)}")
+        return not self._wav_failed
+
     def cleanup_resources(self):
         try:
             for stream in self.streams:
@@ -419,6 +519,7 @@ class WhisperTranscription(QWidget):
         self.update_record_button_text()
         self.recording_thread = None
         self.transcription_thread = None
+        self.batch_thread = None
         self.is_recording = False
         self.hotkey_pressed = False
         
@@ -442,6 +543,16 @@ class WhisperTranscription(QWidget):
         
         # Remove punctuation setting
         self.remove_punctuation = config.get("remove_punctuation", False)
+        
+        # Streaming transcription: transcribe each utterance while recording
+        self.streaming = config.get("streaming_transcription", True)
+        self.vad_settings = {
+            "threshold": config.get("vad_threshold", 0.015),
+            "silence_ms": config.get("vad_silence_ms", 600),
+            "preroll_ms": config.get("vad_preroll_ms", 300),
+            "min_speech_ms": config.get("vad_min_speech_ms", 250),
+            "max_utterance_s": config.get("max_utterance_s", 20),
+        }
 
     def setup_model_loader(self):
         self.progress_bar = QProgressBar()
@@ -452,11 +563,25 @@ class WhisperTranscription(QWidget):
         else:
             logger.warning("No layout found to insert the progress bar.")
         
-        self.loader = ModelLoader(
-            config.get("model_name", "base"),
-            config.get("device", "cpu"),
-            config.get("compute_type", "float32")
-        )
+        self.loader = None
+        self.load_model(config.get("model_name", "base"))
+
+    def load_model(self, model_name):
+        device = config.get("device", "cpu")
+        compute_type = config.get("compute_type", "auto")
+        
+        # Models used earlier in the session are still warm: switch without a thread
+        model = ModelCache.get_instance(config).peek(model_name, device, compute_type)
+        if model is not None:
+            self.loader = None
+            self.handle_model_loaded(model)
+            return
+        
+        self.record_btn.setEnabled(False)
+        self.status_label.setText("Loading model...")
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.loader = ModelLoader(model_name, device, compute_type, parent=self)
         self.loader.progress_update.connect(self.update_progress)
         self.loader.model_ready.connect(self.handle_model_loaded)
         self.loader.start()
@@ -465,6 +590,8 @@ class WhisperTranscription(QWidget):
         self.progress_bar.setValue(value)
 
     def handle_model_loaded(self, model):
+        if self.sender() is not None and self.sender() is not self.loader:
+            return  # superseded by a later model switch
         if model:
             self.model = model
             self.record_btn.setEnabled(True)
@@ -476,13 +603,6 @@ class WhisperTranscription(QWidget):
         
         self.progress_bar.hide()
 
-    def init_model(self):
-        self.model = WhisperModel(
-            config.get("model_name", "base"),
-            device=config.get("device", "cpu"),
-            compute_type=config.get("compute_type", "float32")
-        )
-
     def setup_ui(self):
         layout = QVBoxLayout()
         
@@ -594,9 +714,11 @@ class WhisperTranscription(QWidget):
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setEnabled(False)
         self.clear_btn = QPushButton("Clear")
+        self.batch_btn = QPushButton("Transcribe files...")
         controls_layout.addWidget(self.record_btn)
         controls_layout.addWidget(self.stop_btn)
         controls_layout.addWidget(self.clear_btn)
+        controls_layout.addWidget(self.batch_btn)
         layout.addLayout(controls_layout)
         
         # Output
@@ -617,6 +739,7 @@ class WhisperTranscription(QWidget):
         self.record_btn.clicked.connect(self.toggle_recording)
         self.stop_btn.clicked.connect(self.stop_recording)
         self.clear_btn.clicked.connect(self.output_text.clear)
+        self.batch_btn.clicked.connect(self.toggle_batch)
         self.model_combo.currentTextChanged.connect(self.update_model)
         self.format_combo.currentTextChanged.connect(self.update_audio_format)
         self.channels_input.editingFinished.connect(self.update_channels)
@@ -713,6 +836,18 @@ class WhisperTranscription(QWidget):
             mic_device_index = config.get("input_device_index")
             computer_device_index = config.get("computer_device_index")
             
+            transcriber = None
+            if self.streaming:
+                transcriber = StreamingTranscriptionThread(
+                    self.model, self.remove_punctuation, config.get("language"), parent=self
+                )
+                transcriber.transcription_complete.connect(self.handle_transcription)
+                transcriber.error_occurred.connect(self.handle_transcription_error)
+                transcriber.finished.connect(self.handle_stream_finished)
+                transcriber.finished.connect(transcriber.deleteLater)
+                self.transcription_thread = transcriber
+                transcriber.start()
+            
             self.recording_thread = RecordingThread(
                 self.audio_format,
                 self.channels,
@@ -721,7 +856,10 @@ class WhisperTranscription(QWidget):
                 self.filename,
                 input_source,
                 mic_device_index=mic_device_index,
-                computer_device_index=computer_device_index
+                computer_device_index=computer_device_index,
+                transcriber=transcriber,
+                vad_settings=self.vad_settings,
+                mix_max_lag_ms=config.get("mix_max_lag_ms", 500)
             )
             self.recording_thread.recording_complete.connect(self.handle_recording_complete)
             self.recording_thread.error_occurred.connect(self.handle_recording_error)
@@ -753,6 +891,10 @@ class WhisperTranscription(QWidget):
 
     def handle_recording_error(self, error_message):
         logger.error(f"Inspelningsfel: {error_message}")
+        if isinstance(self.transcription_thread, StreamingTranscriptionThread):
+            # Keep the error visible instead of "Ready" once the stream ends
+            self.transcription_thread.cancel()
+            self.transcription_thread = None
         self.update_status(f"Error: {error_message}", False)
         self.record_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -760,7 +902,55 @@ class WhisperTranscription(QWidget):
         self.is_recording = False
         self.hotkey_pressed = False
 
+    def toggle_batch(self):
+        if self.batch_thread is not None:
+            self.batch_thread.stop()
+            self.batch_btn.setEnabled(False)
+            self.batch_btn.setText("Stopping...")
+            return
+        
+        folder = QFileDialog.getExistingDirectory(self, "Choose a folder of recordings")
+        if not folder:
+            return
+        self.batch_counts = {"done": 0, "skipped": 0, "failed": 0}
+        self.batch_thread = BatchTranscriptionThread([folder], parent=self)
+        self.batch_thread.file_done.connect(self.handle_batch_file_done)
+        self.batch_thread.batch_finished.connect(self.handle_batch_finished)
+        self.batch_thread.error_occurred.connect(self.handle_transcription_error)
+        self.batch_thread.finished.connect(self.handle_batch_thread_finished)
+        self.batch_thread.start()
+        self.batch_btn.setText("Stop batch")
+        logger.debug(f"Batch transcription started for {folder}.")
+
+    def handle_batch_file_done(self, path, status, error):
+        self.batch_counts[status] += 1
+        if error:
+            logger.error(f"Batch: {path}: {error}")
+        if not self.is_recording:
+            self.status_label.setText(
+                f"Batch: {self.batch_counts['done']} transcribed, {self.batch_counts['skipped']} skipped, "
+                f"{self.batch_counts['failed']} failed"
+            )
+
+    def handle_batch_finished(self, counts):
+        if not self.is_recording:
+            self.status_label.setText(
+                f"Batch finished: {counts['done']} transcribed, {counts['skipped']} skipped, {counts['failed']} failed"
+            )
+        logger.debug(f"Batch transcription finished: {counts}")
+
+    def handle_batch_thread_finished(self):
+        self.batch_thread.deleteLater()
+        self.batch_thread = None
+        self.batch_btn.setText("Transcribe files...")
+        self.batch_btn.setEnabled(True)
+
     def cleanup(self):
+        if self.batch_thread is not None:
+            self.batch_thread.stop()
+            self.batch_thread.wait()
+        if isinstance(self.transcription_thread, StreamingTranscriptionThread):
+            self.transcription_thread.cancel()
         if self.recording_thread:
             self.recording_thread.cleanup_resources()
             self.recording_thread.wait()
@@ -783,14 +973,29 @@ class WhisperTranscription(QWidget):
 
     def handle_transcription(self, text):
         self.output_text.append(text)
+        if self.streaming:
+            # Partial text; handle_stream_finished resets the status
+            return
         self.update_status("Ready", False)
         self.record_btn.setEnabled(True)
         logger.debug("Transcription complete.")
 
+    def handle_transcription_error(self, error_message):
+        self.update_status(f"Error: {error_message}", self.is_recording)
+
+    def handle_stream_finished(self):
+        if self.sender() is not self.transcription_thread:
+            return
+        self.transcription_thread = None
+        if not self.is_recording:
+            self.update_status("Ready", False)
+            self.record_btn.setEnabled(True)
+        logger.debug("Streaming transcription complete.")
+
     def update_model(self, model_name):
         config["model_name"] = model_name
         save_config(config)
-        self.init_model()
+        self.load_model(model_name)
         logger.debug(f"Model uppdaterad till '{model_name}'.")
 
     def handle_hotkey_press(self, event):
@@ -844,7 +1049,7 @@ class WhisperHub(QMainWindow):
         self.defining_all_config_variables_from_config()
         
         # Pre-initialize cache in background
-        threading.Thread(target=self.init_cache, daemon=True).start()
+        self.init_cache()
         
         self.init_ui()
         #ThemeManager.apply_widget_theme(self)
@@ -867,7 +1072,12 @@ class WhisperHub(QMainWindow):
         logger.debug("Window title set to 'Whisper Hub'.")
 
     def init_cache(self):
-        ModelCache.get_instance()
+        # Warm the configured model in the background while the window is being built
+        ModelCache.get_instance(config).preload(
+            config.get("model_name", "base"),
+            config.get("device", "cpu"),
+            config.get("compute_type", "auto")
+        )
 
     def init_ui(self):
         self.tabs = QTabWidget()
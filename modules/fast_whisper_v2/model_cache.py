@@ -0,0 +1,262 @@
+# ./fast_whisper_v2/model_cache.py
+
+"""
+Warm Whisper model residency.
+
+ModelCache keeps recently used WhisperModel instances in memory (least
+recently used first out, bounded by an estimated memory budget), so switching
+back to a model used earlier in the session is instant. On disk it records,
+in a small JSON file in the cache directory:
+
+- the local path of every downloaded model, so later loads go straight to the
+  files instead of asking the Hugging Face hub first
+- per machine, the fastest compute type for each model/device, measured once
+  with a short benchmark when config.json asks for compute_type "auto"
+"""
+
+import json
+import logging
+import os
+import platform
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+import ctranslate2
+import numpy as np
+from faster_whisper import WhisperModel
+from faster_whisper.utils import download_model
+
+logger = logging.getLogger(__name__)
+
+AUTO_COMPUTE_TYPE = "auto"
+
+# Tried in order by the benchmark; unsupported types are skipped
+CANDIDATE_COMPUTE_TYPES = {
+    "cpu": ["int8", "int8_float32", "float32"],
+    "cuda": ["float16", "int8_float16", "int8"],
+}
+
+def machine_id() -> str:
+    """Identifies the hardware a compute-type benchmark was run on."""
+    return "|".join([platform.node(), platform.machine(), platform.processor(), str(os.cpu_count())])
+
+def estimate_model_mb(model_path: str, compute_type: str) -> float:
+    """
+    Rough resident size of a loaded model.
+
+    Converted Whisper checkpoints are stored as float16, so the weights take
+    about half the file size as int8 and twice as float32.
+    """
+    try:
+        stored_mb = os.path.getsize(os.path.join(model_path, "model.bin")) / 2**20
+    except OSError:
+        return 0.0
+    if compute_type.startswith("int8"):
+        return stored_mb / 2
+    if compute_type == "float32":
+        return stored_mb * 2
+    return stored_mb
+
+
+class ModelCache:
+    _instance = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, settings: Optional[dict] = None):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(settings)
+        return cls._instance
+
+    def __init__(self, settings: Optional[dict] = None, model_factory=WhisperModel, download=download_model):
+        settings = settings or {}
+        self.model_factory = model_factory
+        self.download = download
+        self.max_memory_mb = settings.get("model_cache_max_mb", 3000)
+        self.models = OrderedDict()  # cache key -> (model, estimated MB), least recently used first
+        self._state_lock = threading.RLock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._benchmark_lock = threading.Lock()
+        self.initialize_cache_dir(settings)
+        self.metadata = self.load_metadata()
+
+    def initialize_cache_dir(self, settings: dict):
+        cache_dir = Path(settings.get("cache_dir", ".whisper_cache"))
+        if not cache_dir.is_absolute():
+            cache_dir = Path.home() / cache_dir
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.debug(f"Cache directory set to: {cache_dir}")
+        self.cache_dir = cache_dir
+        self.cache_file = cache_dir / settings.get("cache_file", "model_cache.json")
+
+    def load_metadata(self) -> dict:
+        metadata = {"model_paths": {}, "compute_types": {}}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            for section in metadata:
+                metadata[section].update(stored.get(section, {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable model cache metadata: {e}")
+        return metadata
+
+    def save_metadata(self):
+        with self._state_lock:
+            try:
+                temp_file = self.cache_file.with_suffix(".tmp")
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.metadata, f, indent=4)
+                os.replace(temp_file, self.cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to save model cache metadata: {e}")
+
+    @staticmethod
+    def cache_key(model_name: str, device: str, compute_type: str, **options) -> str:
+        """Options are extra WhisperModel arguments such as cpu_threads or num_workers."""
+        return "_".join([model_name, device, compute_type] + [f"{k}={v}" for k, v in sorted(options.items())])
+
+    def model_path(self, model_name: str) -> str:
+        """Local directory of a model, downloading it the first time."""
+        if os.path.isdir(model_name):
+            return model_name
+        with self._state_lock:
+            path = self.metadata["model_paths"].get(model_name)
+        if path and os.path.isfile(os.path.join(path, "model.bin")):
+            return path
+        path = self.download(model_name)
+        with self._state_lock:
+            self.metadata["model_paths"][model_name] = path
+        self.save_metadata()
+        return path
+
+    def known_compute_type(self, model_name: str, device: str, compute_type: str) -> Optional[str]:
+        """compute_type, or for "auto" the benchmarked choice if there is one."""
+        if compute_type != AUTO_COMPUTE_TYPE:
+            return compute_type
+        with self._state_lock:
+            entry = self.metadata["compute_types"].get(f"{machine_id()}|{model_name}|{device}")
+        return entry["compute_type"] if entry else None
+
+    def resolve_compute_type(self, model_name: str, device: str, compute_type: str) -> str:
+        known = self.known_compute_type(model_name, device, compute_type)
+        if known is not None:
+            return known
+        with self._benchmark_lock:
+            known = self.known_compute_type(model_name, device, compute_type)
+            if known is not None:
+                return known
+            timings = self.benchmark_compute_types(self.model_path(model_name), device)
+            best = min(timings, key=timings.get) if timings else "default"
+            logger.debug(f"Fastest compute type for '{model_name}' on {device}: {best} {timings}")
+            with self._state_lock:
+                self.metadata["compute_types"][f"{machine_id()}|{model_name}|{device}"] = {
+                    "compute_type": best,
+                    "timings": timings,
+                }
+            self.save_metadata()
+            return best
+
+    def benchmark_compute_types(self, model_path: str, device: str, seconds: float = 5.0) -> Dict[str, float]:
+        """Seconds per short transcription for each compute type this machine supports."""
+        candidates = CANDIDATE_COMPUTE_TYPES.get(device, ["default"])
+        try:
+            supported = ctranslate2.get_supported_compute_types(device)
+            candidates = [c for c in candidates if c in supported] or candidates
+        except Exception as e:
+            logger.warning(f"Could not query supported compute types for {device}: {e}")
+
+        audio = np.random.default_rng(0).normal(0, 0.01, int(16000 * seconds)).astype(np.float32)
+        timings = {}
+        for compute_type in candidates:
+            try:
+                model = self.model_factory(model_path, device=device, compute_type=compute_type)
+                runs = []
+                for _ in range(2):  # the first run includes one-off allocation
+                    start = time.perf_counter()
+                    segments, _ = model.transcribe(
+                        audio, language="en", beam_size=1, without_timestamps=True, max_new_tokens=16
+                    )
+                    list(segments)
+                    runs.append(time.perf_counter() - start)
+                timings[compute_type] = min(runs)
+                del model
+            except Exception as e:
+                logger.warning(f"Compute type {compute_type} failed on {device}: {e}")
+        return timings
+
+    def peek(self, model_name: str, device: str, compute_type: str, **options):
+        """The model if it is already warm, without loading anything."""
+        compute_type = self.known_compute_type(model_name, device, compute_type)
+        if compute_type is None:
+            return None
+        cache_key = self.cache_key(model_name, device, compute_type, **options)
+        with self._state_lock:
+            if cache_key not in self.models:
+                return None
+            self.models.move_to_end(cache_key)
+            return self.models[cache_key][0]
+
+    def get_model(self, model_name: str, device: str, compute_type: str, **options):
+        compute_type = self.resolve_compute_type(model_name, device, compute_type)
+        cache_key = self.cache_key(model_name, device, compute_type, **options)
+
+        with self._state_lock:
+            if cache_key in self.models:
+                self.models.move_to_end(cache_key)
+                logger.debug(f"Model '{cache_key}' loaded from memory cache.")
+                return self.models[cache_key][0]
+            load_lock = self._loading.setdefault(cache_key, threading.Lock())
+
+        # Concurrent requests for the same model wait for a single load
+        with load_lock:
+            with self._state_lock:
+                if cache_key in self.models:
+                    self.models.move_to_end(cache_key)
+                    return self.models[cache_key][0]
+            try:
+                path = self.model_path(model_name)
+                model = self.model_factory(path, device=device, compute_type=compute_type, **options)
+                size_mb = estimate_model_mb(path, compute_type)
+                with self._state_lock:
+                    self.models[cache_key] = (model, size_mb)
+                    self.evict(keep=cache_key)
+            finally:
+                # Also after a failed load, so the next request starts a fresh attempt
+                with self._state_lock:
+                    if self._loading.get(cache_key) is load_lock:
+                        del self._loading[cache_key]
+        logger.debug(f"Model '{cache_key}' created and added to cache ({size_mb:.0f} MB).")
+        return model
+
+    def preload(self, model_name: str, device: str, compute_type: str) -> threading.Thread:
+        """Load a model on a background thread so it is warm when first needed."""
+        def load():
+            try:
+                self.get_model(model_name, device, compute_type)
+            except Exception as e:
+                logger.error(f"Error preloading model '{model_name}': {e}")
+
+        thread = threading.Thread(target=load, name="whisper-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def memory_mb(self) -> float:
+        with self._state_lock:
+            return sum(size for _, size in self.models.values())
+
+    def evict(self, keep: Optional[str] = None):
+        """Drop least recently used models until the cache fits its memory budget."""
+        with self._state_lock:
+            for cache_key in list(self.models):
+                if self.memory_mb() <= self.max_memory_mb:
+                    break
+                if cache_key != keep:
+                    del self.models[cache_key]
+                    logger.debug(f"Model '{cache_key}' evicted from memory cache.")
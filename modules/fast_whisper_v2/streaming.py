@@ -0,0 +1,160 @@
+# ./fast_whisper_v2/streaming.py
+
+"""
+Utterance segmentation for streaming transcription.
+
+While recording, every chunk read from PyAudio is written into an
+AudioRingBuffer and scored by a simple energy-based voice-activity detector.
+UtteranceSegmenter cuts the stream into utterances (speech plus a little
+pre-roll, ended by a stretch of silence or a maximum length), so each one can
+be transcribed while recording continues instead of after the whole WAV has
+been written.
+"""
+
+import logging
+from typing import List, Optional
+
+import numpy as np
+
+from modules.fast_whisper_v2.capture import SampleRingBuffer, pcm_to_int
+
+logger = logging.getLogger(__name__)
+
+WHISPER_SAMPLE_RATE = 16000
+
+class AudioRingBuffer(SampleRingBuffer):
+    """Byte-addressed SampleRingBuffer holding raw PCM."""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity, dtype=np.uint8)
+
+    def write(self, data: bytes) -> None:
+        super().write(np.frombuffer(data, dtype=np.uint8))
+
+    def read(self, start: int, end: Optional[int] = None) -> bytes:
+        return super().read(start, end).tobytes()
+
+
+def pcm_to_float32(data: bytes, sample_width: int, channels: int = 1) -> np.ndarray:
+    """Interleaved little-endian PCM (16 or 24 bit) to mono float32 in [-1, 1]."""
+    samples = pcm_to_int(data, sample_width).astype(np.float32) / float(1 << (8 * sample_width - 1))
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+    return samples
+
+def resample(samples: np.ndarray, rate: int, target_rate: int = WHISPER_SAMPLE_RATE) -> np.ndarray:
+    """Linear resampling; Whisper expects 16 kHz mono."""
+    if rate == target_rate or len(samples) == 0:
+        return samples
+    duration = len(samples) / rate
+    target_length = max(1, int(round(duration * target_rate)))
+    positions = np.linspace(0, len(samples) - 1, target_length)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+class UtteranceSegmenter:
+    """
+    Energy-based voice-activity detection over a stream of PCM chunks.
+
+    A chunk counts as speech when its RMS level is above both `threshold` and
+    `noise_ratio` times the running noise floor. An utterance starts at the
+    first speech chunk (minus `preroll_ms`) and ends after `silence_ms` of
+    silence, or is cut at `max_utterance_s`. Utterances with less than
+    `min_speech_ms` of speech are dropped as clicks.
+
+    feed() and flush() return finished utterances as float32 mono arrays at
+    16 kHz, ready for WhisperModel.transcribe().
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        sample_width: int,
+        channels: int = 1,
+        threshold: float = 0.015,
+        noise_ratio: float = 3.0,
+        silence_ms: int = 600,
+        preroll_ms: int = 300,
+        min_speech_ms: int = 250,
+        max_utterance_s: float = 20.0,
+    ):
+        self.rate = rate
+        self.sample_width = sample_width
+        self.channels = channels
+        self.threshold = threshold
+        self.noise_ratio = noise_ratio
+
+        bytes_per_second = rate * sample_width * channels
+        self.frame_size = sample_width * channels
+        self.silence_bytes = self._to_bytes(bytes_per_second * silence_ms / 1000)
+        self.preroll_bytes = self._to_bytes(bytes_per_second * preroll_ms / 1000)
+        self.min_speech_bytes = self._to_bytes(bytes_per_second * min_speech_ms / 1000)
+        self.max_utterance_bytes = self._to_bytes(bytes_per_second * max_utterance_s)
+        self.ring = AudioRingBuffer(self.max_utterance_bytes + self.preroll_bytes + self.silence_bytes)
+
+        self.noise_floor = 0.0
+        self._start: Optional[int] = None     # ring position where the current utterance starts
+        self._speech_bytes = 0
+        self._silence_run = 0
+
+    def _to_bytes(self, amount: float) -> int:
+        return int(amount) // self.frame_size * self.frame_size
+
+    @property
+    def in_speech(self) -> bool:
+        return self._start is not None
+
+    def level(self, data: bytes) -> float:
+        samples = pcm_to_float32(data, self.sample_width, self.channels)
+        if len(samples) == 0:
+            return 0.0
+        return float(np.sqrt(np.mean(samples * samples)))
+
+    def is_speech(self, level: float) -> bool:
+        return level >= self.threshold and level >= self.noise_floor * self.noise_ratio
+
+    def feed(self, data: bytes) -> List[np.ndarray]:
+        """Add one recorded chunk; returns any utterances it completed."""
+        finished = []
+        before = self.ring.position
+        self.ring.write(data)
+        level = self.level(data)
+
+        if self.is_speech(level):
+            if self._start is None:
+                self._start = max(self.ring.oldest, before - self.preroll_bytes)
+            self._speech_bytes += len(data)
+            self._silence_run = 0
+        else:
+            # Running estimate of the background level, from non-speech chunks only
+            self.noise_floor = level if self.noise_floor == 0.0 else 0.95 * self.noise_floor + 0.05 * level
+            if self._start is not None:
+                self._silence_run += len(data)
+                if self._silence_run >= self.silence_bytes:
+                    self._finish(finished)
+
+        if self._start is not None and self.ring.position - self._start >= self.max_utterance_bytes:
+            self._finish(finished, keep_going=True)
+        return finished
+
+    def flush(self) -> List[np.ndarray]:
+        """End the stream; returns the utterance in progress, if any."""
+        finished = []
+        if self._start is not None:
+            self._finish(finished)
+        return finished
+
+    def _finish(self, finished: List[np.ndarray], keep_going: bool = False) -> None:
+        end = self.ring.position
+        if not keep_going:
+            # Keep a short tail of the silence that ended the utterance
+            end -= max(0, self._silence_run - self.preroll_bytes)
+        if self._speech_bytes >= self.min_speech_bytes:
+            data = self.ring.read(self._start, end)
+            samples = pcm_to_float32(data, self.sample_width, self.channels)
+            finished.append(resample(samples, self.rate))
+        else:
+            logger.debug("Dropped %d bytes of audio too short to be speech.", end - self._start)
+        self._start = self.ring.position if keep_going else None
+        self._speech_bytes = 0
+        self._silence_run = 0
@@ -18,5 +18,5 @@ class InterpreterInterface(ABC):
         pass
 
     @abstractmethod
-    def terminate(self, processThread):
+    def terminate(self, process):
         pass
\ No newline at end of file
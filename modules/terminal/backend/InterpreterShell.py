@@ -2,7 +2,14 @@ from .InterpreterInterface import InterpreterInterface
 
 import os
 import sys
+import signal
 import subprocess
+import threading
+import time
+
+# Seconds a cancelled command gets to exit after each signal before the next,
+# stronger one is sent (interrupt, then terminate, then kill)
+TERMINATE_TIMEOUTS = (0.5, 1.0)
 
 class InterpreterShell(InterpreterInterface):
 
@@ -22,42 +29,97 @@ class InterpreterShell(InterpreterInterface):
         if os.name != "nt":
             self.process_options["errors"] = "ignore"
 
+        # Every command gets its own process group, so cancelling it reaches
+        # the shell and everything it started without touching the terminal
+        if os.name == "nt":
+            self.process_options["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            self.process_options["start_new_session"] = True
+
         if interpreter_path:
             self.process_options['executable'] = interpreter_path
 
     def execute(self, command):
         return subprocess.Popen(command, cwd=os.getcwd(), **self.process_options)
 
-    def terminate(self, processThread):
-
-        stdout = ""
-        stderr = ""
-
-        if (os.name == 'nt'):
-            process = subprocess.Popen(
-                "TASKKILL /F /PID {} /T".format(processThread.pid),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-
-            for line in process.stdout:
-                stdout += line
-            for line in process.stderr:
-                stderr += line
-
+    def terminate(self, process):
+        """
+        Cancel a command started by execute().
+
+        The command's process group is interrupted straight away; escalation
+        to terminate and kill happens on a background thread, so the caller
+        never waits for a command that ignores the interrupt. Escalation goes
+        on while anything in the group is alive, not just the shell, since
+        any survivor keeps the pipes open. Once the group is gone its pipes
+        close and the reader sees EOF.
+        """
+
+        if os.name == 'nt':
+            # TASKKILL /T reaches the whole tree through the shell
+            alive = lambda: process.poll() is None
+            steps = [
+                lambda: os.kill(process.pid, signal.CTRL_BREAK_EVENT),
+                lambda: self._taskkill(process.pid),
+            ]
         else:
-
-            try:
-                os.system("pkill -TERM -P %s" % processThread.pid)
-                os.system("kill -2 {}".format(processThread.pid))
-                os.system("kill -9 {}".format(processThread.pid))
-            except:
-                pass
-
-        processThread.wait()
-
-        return (stdout, stderr)
+            # The shell leads a new session, so its pid is the group id
+            pgid = process.pid
+            alive = lambda: self._group_alive(process, pgid)
+            steps = [
+                lambda: os.killpg(pgid, signal.SIGINT),
+                lambda: os.killpg(pgid, signal.SIGTERM),
+                lambda: os.killpg(pgid, signal.SIGKILL),
+            ]
+
+        if not alive():
+            return ("", "")
+
+        self._send(steps[0])
+
+        threading.Thread(
+            target=self._escalate, args=(alive, steps[1:]), name="terminal-cancel", daemon=True
+        ).start()
+
+        return ("", "")
+
+    def _escalate(self, alive, steps):
+        for timeout, step in zip(TERMINATE_TIMEOUTS, steps):
+            deadline = time.monotonic() + timeout
+            while alive() and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            if not alive():
+                return
+
+            self._send(step)
+
+    @staticmethod
+    def _group_alive(process, pgid):
+        # Reap the shell if it has exited, so a zombie doesn't keep the group alive
+        process.poll()
+        try:
+            os.killpg(pgid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+    @staticmethod
+    def _send(step):
+        try:
+            step()
+        except (ProcessLookupError, PermissionError, OSError):
+            # The group already exited
+            pass
+
+    @staticmethod
+    def _taskkill(pid):
+        subprocess.run(
+            ["TASKKILL", "/F", "/T", "/PID", str(pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
 
     def get_return_code(self, process):
         return process.poll()
@@ -0,0 +1,97 @@
+#
+# Concurrent stdout/stderr reader for commands run by the terminal
+#
+# Both pipes are drained at the same time in large reads, so a command that
+# fills one pipe while the other is being read can never stall, and output
+# arrives as soon as it is written regardless of how many lines it has.
+#
+
+import codecs
+import io
+import locale
+import os
+import queue
+import selectors
+import threading
+
+# Maximum bytes taken from a pipe in one read
+CHUNK_SIZE = 64 * 1024
+
+STREAMS = ("stdout", "stderr")
+
+def make_decoder(pipe):
+    """ Incremental decoder matching a text-mode pipe, with universal newlines """
+
+    encoding = getattr(pipe, "encoding", None) or locale.getpreferredencoding(False)
+    errors = getattr(pipe, "errors", None) or "strict"
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    return io.IncrementalNewlineDecoder(decoder, translate=True)
+
+def pump_output(process, write, chunk_size=CHUNK_SIZE):
+    """
+    Read a process's stdout and stderr until both reach EOF.
+
+    write(stream, text) is called with "stdout" or "stderr" and each decoded
+    chunk, in order within each stream. Returns once both pipes are closed,
+    which happens when the command and everything it started have exited.
+    """
+
+    pipes = {name: getattr(process, name) for name in STREAMS if getattr(process, name) is not None}
+
+    # Pipes can't be polled with select() on Windows
+    if os.name == "nt":
+        _pump_threads(pipes, write, chunk_size)
+    else:
+        _pump_select(pipes, write, chunk_size)
+
+def _pump_select(pipes, write, chunk_size):
+
+    decoders = {}
+
+    with selectors.DefaultSelector() as selector:
+
+        for name, pipe in pipes.items():
+            selector.register(pipe.fileno(), selectors.EVENT_READ, name)
+            decoders[name] = make_decoder(pipe)
+
+        while selector.get_map():
+            for key, _ in selector.select():
+                # The pipe is readable, so this returns what is there without blocking
+                data = os.read(key.fd, chunk_size)
+
+                if not data:
+                    selector.unregister(key.fd)
+
+                text = decoders[key.data].decode(data, final=not data)
+                if text:
+                    write(key.data, text)
+
+def _pump_threads(pipes, write, chunk_size):
+
+    chunks = queue.Queue()
+
+    def read(name, pipe):
+        decoder = make_decoder(pipe)
+        fd = pipe.fileno()
+        try:
+            while True:
+                data = os.read(fd, chunk_size)
+                text = decoder.decode(data, final=not data)
+                if text:
+                    chunks.put((name, text))
+                if not data:
+                    break
+        finally:
+            chunks.put((name, None))
+
+    for name, pipe in pipes.items():
+        threading.Thread(target=read, args=(name, pipe), name="terminal-" + name, daemon=True).start()
+
+    # write() is only ever called from this thread
+    open_pipes = len(pipes)
+    while open_pipes:
+        name, text = chunks.get()
+        if text is None:
+            open_pipes -= 1
+        else:
+            write(name, text)
@@ -13,7 +13,8 @@ class TkTermConfig():
         "cursorshape"       : "bar",
         "selectbackground"  : "#464E5E",
         "fontfamily"        : "Cascadia Code SemiLight",
-        "fontsize"          : 9
+        "fontsize"          : 9,
+        "scrollback"        : 5000
     }
 
     # Curernt config
@@ -1,10 +1,178 @@
 import tkinter as tk
+import threading
 
 from tkinter import *
 from tkinter import ttk
 
+from modules.terminal.src.Config import TkTermConfig
 from modules.terminal.src.Utils import *
 
+def get_scrollback():
+    """ Maximum number of lines kept on the terminal screen """
+
+    return TkTermConfig.CONFIG.get("scrollback", TkTermConfig.DEFAULT_CONFIG.get("scrollback", 5000))
+
+class OutputQueue():
+    """
+    Output written by command threads, shown on the Tk loop in batches.
+
+    Worker threads never touch Tk: they queue chunks here and every INTERVAL
+    milliseconds everything queued is written to the screen with a single
+    insert carrying its tags, followed by a single range delete to keep the
+    scrollback limit and one scroll to the end. Text that would be trimmed
+    straight away is dropped before it reaches the widget, so a command
+    printing far more than the scrollback costs no more to show than one
+    screenful.
+    """
+
+    # Milliseconds between screen updates while a command is running
+    INTERVAL = 16
+
+    TAGS = {"stdout": "output", "stderr": "error"}
+
+    def __init__(self, widget, autoscroll=True):
+        self.app = widget
+        self.TerminalScreen = widget.TerminalScreen
+        self.autoscroll = autoscroll
+
+        # Tk calls are only made from the thread that created the widget
+        self.thread = threading.current_thread()
+
+        self.lock = threading.Lock()
+        self.pending = []       # (stream, text) chunks and callbacks, in order
+        self.pendingLines = 0
+        self.job = None
+        self.running = False
+
+    def on_tk_thread(self):
+        return threading.current_thread() is self.thread
+
+    def put(self, stream, text):
+        """ Queue a chunk of "stdout" or "stderr" text, from any thread """
+
+        # Output still arriving after Ctrl+C is not shown
+        if self.app.processTerminated:
+            return
+
+        scrollback = get_scrollback()
+
+        with self.lock:
+            self.pending.append((stream, text))
+            self.pendingLines += text.count("\n")
+
+            if self.pendingLines > 2 * scrollback:
+                self._compact(scrollback)
+
+    def call(self, callback):
+        """ Run callback on the Tk loop once everything queued so far is shown """
+
+        with self.lock:
+            self.pending.append(callback)
+
+    def start(self):
+        """ Start showing queued output periodically """
+
+        self.running = True
+
+        if self.job is None:
+            self.job = self.app.after(self.INTERVAL, self._tick)
+
+    def stop(self):
+        """ Stop the periodic updates, showing whatever is still queued """
+
+        self.running = False
+
+        if self.job is not None:
+            self.app.after_cancel(self.job)
+            self.job = None
+
+        self.drain()
+
+    def _tick(self):
+        self.job = None
+        self.drain()
+
+        # A callback run by drain() may have stopped (and restarted) the updates
+        if self.job is None and self.running:
+            self.job = self.app.after(self.INTERVAL, self._tick)
+
+    def _compact(self, limit):
+        """ Drop the oldest queued chunks while at least limit lines remain after them """
+
+        drop = 0
+        for item in self.pending:
+            if callable(item):
+                break
+
+            lines = item[1].count("\n")
+            if self.pendingLines - lines < limit:
+                break
+
+            self.pendingLines -= lines
+            drop += 1
+
+        del self.pending[:drop]
+
+    def drain(self):
+        """ Show everything queued so far; must be called on the Tk thread """
+
+        with self.lock:
+            items = self.pending
+            self.pending = []
+            self.pendingLines = 0
+
+        chunks = []
+        for item in items:
+            if callable(item):
+                self._show(chunks)
+                chunks = []
+                item()
+            else:
+                chunks.append(item)
+
+        self._show(chunks)
+
+    def _show(self, chunks):
+
+        if not chunks:
+            return
+
+        scrollback = get_scrollback()
+
+        # Only the last scrollback lines can still be on screen afterwards
+        lines = 0
+        for i in range(len(chunks) - 1, -1, -1):
+            stream, text = chunks[i]
+            lines += text.count("\n")
+
+            if lines > scrollback:
+                cut = len(text)
+                for _ in range(scrollback - (lines - text.count("\n")) + 1):
+                    cut = text.rfind("\n", 0, cut)
+                chunks = [(stream, text[cut + 1:])] + chunks[i + 1:]
+                break
+
+        # One insert with alternating text and tags, consecutive chunks of a stream merged
+        args = []
+        for stream, text in chunks:
+            tag = self.TAGS.get(stream, "output")
+            if args and args[-1] == tag:
+                args[-2] += text
+            else:
+                args += [text, tag]
+
+        self.TerminalScreen.insert("end", *args)
+        self.app.scrollbackIndex.append("".join(args[::2]))
+
+        self.app.scrollbackIndex.trim(trim_lines(self.TerminalScreen, scrollback))
+
+        if self.autoscroll:
+            self.TerminalScreen.see("end")
+
+        # Clear caret handling on invalid commands
+        if "error" in args[1::2] and self.app.caretHandling:
+            self.app.caretHandling = False
+
 class Redirect():
     """ Redirect stdout and stderr to be written to Text widget """
 
@@ -18,17 +186,25 @@ class Redirect():
 
         text = text + end
 
-        # Keep line limit for Terminal to 5000 lines
-        limit_diff = int(get_last_line(self.TerminalScreen)) - 5000
-        for i in range(limit_diff):
-            self.TerminalScreen.delete("1.0", "2.0")
+        # Command threads queue their output to be shown on the Tk loop
+        if not self.app.output.on_tk_thread():
+            self.app.output.put(self.stream, text)
+            return
+
+        # Anything still queued was written first
+        self.app.output.drain()
+
+        # Keep line limit for Terminal
+        self.app.scrollbackIndex.trim(trim_lines(self.TerminalScreen, get_scrollback()))
 
         # Work out if the current line is a command or output
         start_pos = get_last_line(self.TerminalScreen)
         line = self.TerminalScreen.get(start_pos, END)
         isCmd = True if line.startswith(self.app.get_last_basename()) else False
 
+        insert_start = self.TerminalScreen.index("end-1c")
         self.TerminalScreen.insert("end", text)
+        self.app.scrollbackIndex.append(text)
 
         if self.autoscroll:
             self.TerminalScreen.see("end")
@@ -38,9 +214,9 @@ class Redirect():
         ########################################################################
 
         # Error output
-        # would have added a newline, so start_pos needs -1
+        # may be a chunk of several lines, so tag everything just inserted
         if self.stream == "stderr":
-            start_pos = get_last_line(self.TerminalScreen) - 1
+            start_pos = insert_start
             end_pos = self.TerminalScreen.index("insert")
             self.TerminalScreen.tag_add("error", start_pos, end_pos)
 
@@ -2,14 +2,37 @@ import tkinter as tk
 from tkinter import *
 from tkinter import ttk
 
+import bisect
+import re
+
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.terminal.src.SearchIndex import compile_query, find_matches
 from modules.terminal.src.Tooltip import Tooltip
 from modules.terminal.src.Utils import get_absolute_path
 
 class SearchBar():
+    """
+    Find in the terminal scrollback.
+
+    Queries run once typing pauses, against the terminal's ScrollbackIndex on
+    a background thread, so the widget is never searched from the UI thread.
+    Only the matches currently on screen are tagged; the rest are tagged as
+    they are scrolled into view.
+    """
+
+    # Milliseconds to wait after the last keystroke before searching
+    DEBOUNCE = 150
+
+    # Milliseconds between checks for a finished search
+    POLL = 16
 
     def __init__(self, parent):
+        self.terminal = parent
         self.TerminalScreen = parent.TerminalScreen
         self.frameTerminal = parent.frameTerminal
+        self.scrollbackIndex = parent.scrollbackIndex
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="terminal-search")
         self._init()
 
     def _init(self):
@@ -35,12 +58,17 @@ class SearchBar():
         self.searchCaseSensitive = False
         self.searchRegex = False
 
-        self.foundList.clear()
+        self.foundList = []     # (absolute line, start column, end column)
+        self.foundLines = []    # absolute line of each match, for bisecting
         self.currentSearchIndex = 0
         self.searchFoundCount = 0
         self.frameSearchBar = None
         self.searchRegexTooltip = None
 
+        self.searchJob = None
+        self.searchFuture = None
+        self.tagJob = None
+
     def open_searchbar(self, event):
 
         self.search_config = {
@@ -142,6 +170,13 @@ class SearchBar():
             self.searchField.focus_set()
             self.searchIsOpen = True
 
+            self.TerminalScreen.tag_config("found", background="green")
+            self.TerminalScreen.tag_config("found_selected", background="orange")
+            self.TerminalScreen.tag_raise("found_selected")
+
+            # Tag the matches scrolled into view
+            self.TerminalScreen['yscrollcommand'] = self.on_scroll
+
         ## Destroy searchbar frame
         else:
             self.close_searchbar()
@@ -157,8 +192,14 @@ class SearchBar():
 
     def close_searchbar(self, *args):
 
+        for job in (self.searchJob, self.tagJob):
+            if job is not None:
+                self.TerminalScreen.after_cancel(job)
+
         if self.frameSearchBar:
 
+            self.TerminalScreen['yscrollcommand'] = self.terminal.scrollbar.set
+
             for child in self.frameSearchBar.winfo_children():
                 child.destroy()
 
@@ -174,6 +215,16 @@ class SearchBar():
         self.frameSearchBar = None
 
     def do_search(self, *args):
+        """ Search again once typing pauses """
+
+        if self.searchJob is not None:
+            self.TerminalScreen.after_cancel(self.searchJob)
+
+        self.searchJob = self.TerminalScreen.after(self.DEBOUNCE, self.start_search)
+
+    def start_search(self):
+
+        self.searchJob = None
 
         value = self.searchFieldText.get()
 
@@ -181,7 +232,10 @@ class SearchBar():
         self.TerminalScreen.tag_remove("found_selected", "1.0", END)
         self.searchResultText.set("No results")
 
-        self.foundList.clear()
+        self.foundList = []
+        self.foundLines = []
+        self.searchFoundCount = 0
+        self.currentSearchIndex = 0
 
         if not self.searchRegexTooltip:
             self.searchRegexTooltip = Tooltip(self.searchField, "", manual=True)
@@ -190,60 +244,115 @@ class SearchBar():
 
         self.searchField.configure(bg = "#1d1f23")
 
-        if value:
+        # A search still running is superseded
+        if self.searchFuture is not None:
+            self.searchFuture.cancel()
+            self.searchFuture = None
 
-            idx = "1.0"
-            self.searchFoundCount = 0
-            self.currentSearchIndex = 0
+        if not value:
+            return
 
-            while True:
+        try:
+            pattern = compile_query(value, regex=self.searchRegex, case_sensitive=self.searchCaseSensitive)
+        except re.error as err:
+            self.searchField.configure(bg = "red")
+            self.searchRegexTooltip.text = err
+            self.searchRegexTooltip.create()
+            return
 
-                try:
-                    idx = self.TerminalScreen.search(value, idx, nocase=(not self.searchCaseSensitive), stopindex=END, regexp=self.searchRegex)
-                    self.searchField.configure(bg = "#1d1f23")
-                except Exception as err:
-                    # self.searchField.configure(borderwidth= 2)
-                    self.searchField.configure(bg = "red")
-                    self.searchRegexTooltip.text = err
-                    self.searchRegexTooltip.create()
-                    break
+        self.scrollbackIndex.refresh(self.TerminalScreen)
+        first_line, lines = self.scrollbackIndex.snapshot()
 
-                if not idx:
-                    self.searchResult['fg'] = "#f4875b" if self.searchFoundCount == 0 else "#b2b2b3"
-                    break
+        self.searchFuture = self.executor.submit(find_matches, pattern, lines, first_line)
+        self.wait_for_search(self.searchFuture)
 
-                lastidx = "{}+{}c".format(idx, len(value))
+    def wait_for_search(self, future):
 
-                self.foundList.append((idx, lastidx))
+        # Superseded by a newer search, or the search bar was closed
+        if future is not self.searchFuture:
+            return
 
-                self.TerminalScreen.tag_add("found", idx, lastidx)
-                idx = lastidx
+        if not future.done():
+            self.TerminalScreen.after(self.POLL, lambda: self.wait_for_search(future))
+            return
 
-                self.TerminalScreen.tag_config("found", background="green")
-                self.searchFoundCount += 1
+        self.searchFuture = None
 
+        self.foundList = future.result()
+        self.foundLines = [line for line, _, _ in self.foundList]
+        self.searchFoundCount = len(self.foundList)
 
-            if self.foundList:
-                self.searchResultText.set("{} of {}".format(1, self.searchFoundCount))
-                self.TerminalScreen.tag_add("found_selected", self.foundList[0][0], self.foundList[0][1])
-                self.TerminalScreen.see(self.foundList[0][0])
+        self.searchResult['fg'] = "#f4875b" if self.searchFoundCount == 0 else "#b2b2b3"
 
-            self.TerminalScreen.tag_config("found_selected", background="orange")
+        if self.foundList:
+            self.select_match(0)
 
-    def do_search_next_or_prev(self, isNext):
+    def match_range(self, match):
+        """ Text widget indices of a match, or None if it has been trimmed off the scrollback """
+
+        line, start, end = match
+        widget_line = self.scrollbackIndex.to_widget_line(line)
+
+        if widget_line is None:
+            return None
+
+        return ("{}.{}".format(widget_line, start), "{}.{}".format(widget_line, end))
+
+    def select_match(self, index):
+
+        found_range = self.match_range(self.foundList[index])
+
+        # Output has pushed it out of the scrollback since the search ran
+        if found_range is None:
+            self.start_search()
+            return
+
+        self.currentSearchIndex = index
+        self.searchResultText.set("{} of {}".format(index + 1, self.searchFoundCount))
 
         self.TerminalScreen.tag_remove("found_selected", "1.0", END)
+        self.TerminalScreen.tag_add("found_selected", *found_range)
+        self.TerminalScreen.see(found_range[0])
 
-        if self.foundList:
+        self.tag_visible()
 
-            if isNext:
-                self.currentSearchIndex = (self.currentSearchIndex + 1) % self.searchFoundCount
-            else:
-                self.currentSearchIndex = (self.currentSearchIndex - 1) % self.searchFoundCount
+    def on_scroll(self, *args):
+
+        self.terminal.scrollbar.set(*args)
 
-            self.searchResultText.set("{} of {}".format(self.currentSearchIndex + 1, self.searchFoundCount))
-            self.TerminalScreen.tag_add("found_selected", self.foundList[self.currentSearchIndex][0], self.foundList[self.currentSearchIndex][1])
+        if self.tagJob is None:
+            self.tagJob = self.TerminalScreen.after_idle(self.tag_visible)
 
+    def tag_visible(self):
+        """ Tag only the matches in the visible part of the screen """
+
+        self.tagJob = None
+
+        self.TerminalScreen.tag_remove("found", "1.0", END)
 
-            self.TerminalScreen.see(self.foundList[self.currentSearchIndex][0])
+        if not self.foundList:
+            return
+
+        top = int(self.TerminalScreen.index("@0,0").split('.')[0])
+        bottom = int(self.TerminalScreen.index("@0,{}".format(self.TerminalScreen.winfo_height())).split('.')[0])
+
+        first = bisect.bisect_left(self.foundLines, self.scrollbackIndex.to_absolute_line(top))
+        last = bisect.bisect_right(self.foundLines, self.scrollbackIndex.to_absolute_line(bottom))
+
+        ranges = []
+        for match in self.foundList[first:last]:
+            ranges.extend(self.match_range(match) or ())
+
+        if ranges:
+            self.TerminalScreen.tag_add("found", *ranges)
+
+    def do_search_next_or_prev(self, isNext):
+
+        if self.foundList:
+
+            if isNext:
+                index = (self.currentSearchIndex + 1) % self.searchFoundCount
+            else:
+                index = (self.currentSearchIndex - 1) % self.searchFoundCount
 
+            self.select_match(index)
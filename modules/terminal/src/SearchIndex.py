@@ -0,0 +1,84 @@
+import re
+
+class ScrollbackIndex():
+    """
+    Lines of the terminal screen, kept in step with the Text widget as output
+    is written and the scrollback is trimmed, so searching never has to read
+    the whole widget back.
+
+    Lines are numbered absolutely: trimming the oldest lines doesn't renumber
+    the rest, so matches found on an earlier snapshot can still be placed on
+    screen (see to_widget_line).
+    """
+
+    def __init__(self):
+        self.lines = [""]
+        self.trimmed = 0        # lines dropped from the top so far
+
+    def append(self, text):
+        """ Text was inserted at the end of the widget """
+
+        parts = text.split("\n")
+        self.lines[-1] += parts[0]
+        self.lines.extend(parts[1:])
+
+    def trim(self, count):
+        """ The first count lines were deleted from the widget """
+
+        if count > 0:
+            del self.lines[:count]
+            self.trimmed += count
+
+            if not self.lines:
+                self.lines = [""]
+
+    def clear(self):
+        """ The widget was emptied """
+
+        self.trimmed += len(self.lines)
+        self.lines = [""]
+
+    def refresh(self, widget):
+        """
+        Re-read what can change in place: the command line being typed. If the
+        line count no longer matches the widget, everything is read again.
+        """
+
+        last = int(widget.index("end-1c").split('.')[0])
+
+        if last == len(self.lines):
+            self.lines[-1] = widget.get("{}.0".format(last), "end-1c")
+        else:
+            self.lines = widget.get("1.0", "end-1c").split("\n")
+
+    def snapshot(self):
+        """ (first absolute line number, copy of the lines) for searching on another thread """
+
+        return (self.trimmed, list(self.lines))
+
+    def to_widget_line(self, line):
+        """ Text widget line number of an absolute line, or None if it was trimmed """
+
+        widget_line = line - self.trimmed + 1
+        return widget_line if widget_line >= 1 else None
+
+    def to_absolute_line(self, widget_line):
+        return widget_line - 1 + self.trimmed
+
+def compile_query(value, regex=False, case_sensitive=False):
+    """ Compile a search box query; raises re.error for an invalid regular expression """
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(value if regex else re.escape(value), flags)
+
+def find_matches(pattern, lines, first_line=0):
+    """ (absolute line, start column, end column) of every non-empty match, in order """
+
+    matches = []
+
+    for number, line in enumerate(lines, first_line):
+        for match in pattern.finditer(line):
+            if match.end() > match.start():
+                matches.append((number, match.start(), match.end()))
+
+    return matches
@@ -11,16 +11,24 @@ import threading
 import os
 import sys
 import subprocess
+import time
+
+from collections import deque, namedtuple
+from concurrent.futures import Future
 
 from .Utils import *
 
 from modules.terminal.src.Config import TkTermConfig
 from modules.terminal.src.Interpreter import Interpreter
-from modules.terminal.src.Redirect import Redirect
-from modules.terminal.backend.KThread import KThread
+from modules.terminal.src.Redirect import OutputQueue, Redirect
+from modules.terminal.src.SearchIndex import ScrollbackIndex
+from modules.terminal.backend.OutputPump import pump_output
 
 import traceback
 
+# Posted to the Tk loop when a command finishes
+CommandResult = namedtuple("CommandResult", ["cmd", "returnCode", "duration"])
+
 class TerminalWidget(tk.Frame):
 
     SHELL_MAPPINGS = Interpreter.MAPPINGS
@@ -62,6 +70,8 @@ class TerminalWidget(tk.Frame):
             undo=False
         )
 
+        self.scrollbackIndex = ScrollbackIndex()
+        self.output = OutputQueue(self)
         self.stdout = Redirect(self, stream="stdout")
         self.stderr = Redirect(self, stream="stderr")
 
@@ -178,6 +188,14 @@ class TerminalWidget(tk.Frame):
         self.terminalThread = None
         self.processTerminated = False
 
+        # Commands waiting for the running one to finish, and the Future of
+        # the running one if it was started by run_command()
+        self.commandQueue = deque()
+        self.commandFuture = None
+        self.returnCode = 0
+        self.lastResult = None
+        self.statusJob = None
+
         # Caret handling and multiline commands
         self.multilineCommand = ""
 
@@ -192,13 +210,6 @@ class TerminalWidget(tk.Frame):
             self.stdout = sys.stdout
             self.stderr = sys.stderr
 
-            self.check_process_terminate()
-
-    def check_process_terminate(self):
-
-        if (self.terminalThread is not None) and (self.terminalThread.is_alive()):
-            self.after(100, self.check_process_terminate)
-
 
     def reset(self):
 
@@ -466,11 +477,11 @@ class TerminalWidget(tk.Frame):
             self.insert_new_line()
             self.print_basename()
 
-    class TerminalPrint(KThread):
+    class TerminalPrint(threading.Thread):
 
         def __init__(self, top, cmd):
 
-            KThread.__init__(self)
+            threading.Thread.__init__(self)
             # super().__init__(parent, *args, **kwargs)
 
             self.daemon = True
@@ -484,6 +495,8 @@ class TerminalWidget(tk.Frame):
 
         def run(self):
 
+            start = time.monotonic()
+
             # Modify shell executable based on selected shell combobox variable
             shellSelected = self.top.shellComboBox.get()
 
@@ -497,16 +510,8 @@ class TerminalWidget(tk.Frame):
                     # with subprocess.Popen(self.cmd, **process_options) as self.process:
                     with self.top.currentInterpreter.execute(self.cmd) as self.process:
 
-                        # if hasattr(self.process, "stdout") and hasattr(self.process, "stderr"):
-                        for line in self.process.stdout:
-
-                            # if self.top.processTerminated:
-                            #     break
-
-                            self.top.stdout.write(line, end='')
-
-                        for line in self.process.stderr:
-                            self.top.stderr.write(line, end='')
+                        # Both pipes are read at once, so neither can fill up and stall the command
+                        pump_output(self.process, self.write_output)
 
 
                     self.returnCode = self.top.currentInterpreter.get_return_code(self.process)
@@ -515,18 +520,48 @@ class TerminalWidget(tk.Frame):
                     self.top.stderr.write(traceback.format_exc())
                     self.returnCode = -1
 
-            # Always print basename on a newline
-            insert_pos = self.top.TerminalScreen.index("insert")
-            if insert_pos.split('.')[1] != '0':
-                self.top.insert_new_line()
+            # Completion reaches the Tk loop after all of the command's output
+            result = CommandResult(self.cmd, self.returnCode, time.monotonic() - start)
+            self.top.output.call(lambda: self.top.command_finished(result))
+
+        def write_output(self, stream, text):
+            """ Queue a chunk of command output for the screen, tagged by stream """
+
+            self.top.output.put(stream, text)
+
+    def command_finished(self, result):
+        """ Called on the Tk loop when the running command has finished """
+
+        self.output.stop()
+
+        if self.statusJob is not None:
+            self.after_cancel(self.statusJob)
+            self.statusJob = None
+
+        # Always print basename on a newline
+        insert_pos = self.TerminalScreen.index("insert")
+        if insert_pos.split('.')[1] != '0':
+            self.insert_new_line()
+
+        self.print_basename()
+        self.processTerminated = False
+
+        self.set_returnCode(result.returnCode)
+        self.statusText.set("Status: IDLE")
+        self.terminalThread = None
+        self.lastResult = result
+
+        self.bind_keys()
+
+        self.event_generate("<<eventCommandFinished>>")
 
-            self.top.print_basename()
-            self.top.processTerminated = False
+        self.resolve_command(result)
 
     def clear_screen(self):
         """ Clear screen and print basename """
 
         self.TerminalScreen.delete("1.0", END)
+        self.scrollbackIndex.clear()
         self.print_basename()
 
     def print_basename(self):
@@ -755,10 +790,11 @@ class TerminalWidget(tk.Frame):
 
                 self.terminalThread = self.TerminalPrint(self, cmd)
                 self.terminalThread.start()
+                self.output.start()
 
                 self.count = 0
                 self.unbind_keys()
-                self.monitor(self.terminalThread)
+                self.animate_status()
 
 
         return 'break'
@@ -815,32 +851,27 @@ class TerminalWidget(tk.Frame):
     def insert_new_line(self):
         """ Insert a newline in Terminal """
         self.TerminalScreen.insert(END, "\n")
+        self.scrollbackIndex.append("\n")
         self.TerminalScreen.mark_set("insert", END)
 
-    def monitor(self, progress_thread):
-        """ Monitor running process and update RC and Status on status bar """
+    def animate_status(self):
+        """ Animate the Status on status bar while a command is running """
 
         seq1 = ["⢿", "⣻", "⣽", "⣾", "⣷", "⣯", "⣟", "⡿"]
         seq2 = ["∙∙∙∙∙∙∙", "●∙∙∙∙∙∙", "∙●∙∙∙∙∙", "∙∙●∙∙∙∙", "∙∙∙●∙∙∙", "∙∙∙∙●∙∙", "∙∙∙∙∙●∙", "∙∙∙∙∙∙●"]
 
-        if progress_thread.is_alive():
-
-            string = "{} Status: Working {}".format(seq1[self.count], seq2[self.count])
-            self.count = (self.count + 1) % 8
-            self.statusText.set(string)
-
-            self.after(100, lambda: self.monitor(progress_thread))
-
-        else:
-            self.set_returnCode(progress_thread.returnCode)
-            self.statusText.set("Status: IDLE")
-            self.terminalThread = None
+        string = "{} Status: Working {}".format(seq1[self.count], seq2[self.count])
+        self.count = (self.count + 1) % 8
+        self.statusText.set(string)
 
-            self.bind_keys()
+        # Stopped by command_finished()
+        self.statusJob = self.after(100, self.animate_status)
 
     def set_returnCode(self, rc):
         """ Set return code on status bar """
 
+        self.returnCode = rc
+
         if(rc != 0):
             self.returnCodeLabel.configure(bg="red")
         else:
@@ -849,9 +880,47 @@ class TerminalWidget(tk.Frame):
         self.returnCodeLabel['text'] = "RC: {}".format(rc)
 
     def run_command(self, cmd):
-        """ Print and execute command on terminal """
+        """
+        Print and execute command on terminal, after any command still running
+        or queued. Must be called on the Tk thread.
+
+        Returns a Future resolved with a CommandResult once the command has
+        finished. Wait on it from another thread or add a done callback;
+        calling result() on the Tk thread would block the loop it needs.
+        """
+
+        future = Future()
+        self.commandQueue.append((cmd, future))
+
+        if self.terminalThread is None and self.commandFuture is None:
+            self.run_next_command()
+
+        return future
+
+    def run_next_command(self):
+        """ Start the next queued command, if there is one """
+
+        while self.commandQueue and self.terminalThread is None:
+
+            cmd, self.commandFuture = self.commandQueue.popleft()
+
+            self.returnCode = 0
+            start = time.monotonic()
+
+            self.stdout.write(cmd, end='')
+            self.do_keyReturn()
+
+            # Built-in commands (cd, clear, ...) finish without a thread
+            if self.terminalThread is None:
+                self.resolve_command(CommandResult(cmd, self.returnCode, time.monotonic() - start), run_next=False)
+
+    def resolve_command(self, result, run_next=True):
+        """ Complete the Future of a command started by run_command() """
+
+        future, self.commandFuture = self.commandFuture, None
 
-        while self.terminalThread: pass
+        if future is not None:
+            future.set_result(result)
 
-        self.stdout.write(cmd, end='')
-        self.do_keyReturn()
\ No newline at end of file
+        if run_next:
+            self.run_next_command()
\ No newline at end of file
@@ -7,6 +7,16 @@ def get_last_line(widget):
     pos = float(pos) - 1
     return pos
 
+def trim_lines(widget, limit):
+    """ Delete the oldest lines of a Text widget beyond limit, in one range; returns how many """
+
+    excess = int(widget.index("end-1c").split('.')[0]) - limit
+    if excess > 0:
+        widget.delete("1.0", "{}.0".format(excess + 1))
+        return excess
+
+    return 0
+
 def get_absolute_path(root, *args):
     """ Get absolute path given a root """
 
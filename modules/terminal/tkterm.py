@@ -86,7 +86,7 @@ class Terminal(tk.Frame):
 
         # Get the associated terminal widget
         terminal = self.notebook.nametowidget(tab_id)
-        terminal.run_command(cmd)
+        return terminal.run_command(cmd)
 
     def on_resize(self, event):
         """Auto scroll to bottom when resize event happens"""
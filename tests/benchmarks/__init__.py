@@ -0,0 +1,19 @@
+# ./tests/benchmarks/__init__.py
+
+"""
+Benchmark suite for the code-integration and extraction pipelines.
+
+Run from the project root:
+
+    python -m tests.benchmarks.run                  # run all cases, print a table
+    python -m tests.benchmarks.run --compare        # fail on regressions vs baseline.json
+    python -m tests.benchmarks.run --save-baseline  # record a new baseline
+
+Every case runs in its own subprocess so peak RSS is attributable to that case.
+No network access or API keys are needed; all inputs are generated on the fly.
+
+Whisper transcription speed (real-time factor, model load time, segment
+latency) has its own runner, which needs a locally cached model:
+
+    python -m tests.benchmarks.transcription --model base
+"""
@@ -0,0 +1,202 @@
+# ./tests/benchmarks/cases.py
+
+"""
+Benchmark cases for the code-integration and extraction pipelines.
+
+Each case takes the size parameters from generators.SIZES and a scratch
+directory, prepares its inputs, and returns (func, units, payload_bytes) where
+func runs one iteration of the workload.
+"""
+
+import ast
+import importlib.util
+import logging
+import os
+import sys
+from typing import Any, Callable, Dict, Tuple
+
+from tests.benchmarks.generators import (
+    synthetic_markdown_export,
+    synthetic_module,
+    synthetic_project,
+    synthetic_transcript,
+    synthetic_update_block,
+    write_project_tree,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FULL_BACKEND_PATH = os.path.join(PROJECT_ROOT, 'backends', '_full_backend_.py')
+EXTRACTORZ_PATH = os.path.join(
+    PROJECT_ROOT, 'frontend', 'Pages', 'desktop', 'Layout', '2_Markdown_CSV_Extr', 'extractorz.py'
+)
+
+CaseResult = Tuple[Callable[[], Any], int, int]
+
+_modules: Dict[str, Any] = {}
+
+def load_module(name: str, path: str):
+    """
+    Import a module from its file path. The extractor lives in a directory whose
+    name starts with a digit, and importing backends/ as a package pulls in the
+    controller, so both targets are loaded directly.
+    """
+    if name not in _modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        # _full_backend_ prepends every directory under its grandparent to sys.path
+        saved_path = list(sys.path)
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            sys.path[:] = saved_path
+        # _full_backend_ calls logging.basicConfig(DEBUG); benchmark the code, not the console
+        logging.disable(logging.INFO)
+        _modules[name] = module
+    return _modules[name]
+
+def full_backend():
+    return load_module('bench_full_backend', FULL_BACKEND_PATH)
+
+def extractorz():
+    return load_module('bench_extractorz', EXTRACTORZ_PATH)
+
+class BenchConfig:
+    """Minimal stand-in for ConfigManager (which also installs file logging)."""
+
+    def __init__(self, **values):
+        self.values = {'use_workspace_root': False, 'create_missing_modules': True,
+                       'preserve_formatting': True}
+        self.values.update(values)
+
+    def get_config_value(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+def _write_settings(path: str, output_dir: str, preset_files) -> None:
+    import toml
+    settings = {
+        'paths': {'output_dir': output_dir, 'path_style': 'unix'},
+        'files': {'ignored_extensions': ['.exe', '.dll'], 'ignored_files': []},
+        'directories': {'ignored_directories': ['__pycache__']},
+        'file_specific': {'use_file_specific': False, 'specific_files': []},
+        'output': {'markdown_file_prefix': 'Full_Project', 'csv_file_prefix': 'Detailed_Project'},
+        'metrics': {'size_unit': 'KB'},
+        'presets': {'bench': list(preset_files)},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        toml.dump(settings, f)
+
+# ------------------- Code integration ------------------- #
+def case_code_block_extractor(size: Dict[str, int], workdir: str) -> CaseResult:
+    backend = full_backend()
+    transcript = synthetic_transcript(size['blocks'], size['methods'])
+    extractor = backend.CodeBlockExtractor(BenchConfig())
+    return lambda: extractor.extract_code_blocks(transcript), size['blocks'], len(transcript.encode('utf-8'))
+
+def case_code_integrator(size: Dict[str, int], workdir: str) -> CaseResult:
+    backend = full_backend()
+    original = synthetic_module(size['classes'], size['methods'])
+    update = synthetic_update_block('pkg/module.py', original, size['methods'], seed=1)
+    parser = backend.CodeParser()
+    integrator = backend.CodeIntegrator(parser=parser)
+    new_nodes = parser.parse_code(update).body
+
+    def run():
+        tree = parser.parse_code(original)
+        integrator.integrate_nodes(tree, new_nodes)
+        return parser.ast_to_code(tree)
+
+    units = sum(1 for node in ast.walk(ast.parse(original)) if isinstance(node, ast.FunctionDef))
+    return run, units, len(original.encode('utf-8'))
+
+def case_process_code_block(size: Dict[str, int], workdir: str) -> CaseResult:
+    backend = full_backend()
+    module_path = os.path.join(workdir, 'pkg', 'module.py').replace('\\', '/')
+    original = synthetic_module(size['classes'], size['methods'])
+    os.makedirs(os.path.dirname(module_path), exist_ok=True)
+    with open(module_path, 'w', encoding='utf-8') as f:
+        f.write(original)
+
+    config = BenchConfig()
+    parser = backend.CodeParser()
+    processor = backend.ProcessCodeBlock(
+        logger=logging.getLogger('benchmarks'),
+        file_manager=backend.FileManager(),
+        parser=parser,
+        integrator=backend.CodeIntegrator(parser=parser),
+        validator=backend.SyntaxValidator(),
+        formatter=backend.CodeFormatter(),
+        config=config,
+    )
+    block = {'code_block': synthetic_update_block(module_path, original, size['methods'], seed=1)}
+
+    def run():
+        success, message, _ = processor.implementation_version1(block, return_diff=True)
+        if not success:
+            raise RuntimeError(message)
+
+    return run, 1, len(original.encode('utf-8'))
+
+# ------------------- Extraction ------------------- #
+def _project(size: Dict[str, int], workdir: str):
+    files = synthetic_project(size['files'])
+    project_dir = os.path.join(workdir, 'project')
+    written = write_project_tree(project_dir, files)
+    payload = sum(len(content.encode('utf-8')) for content in files.values())
+    return project_dir, written, payload
+
+def _silence(extractor):
+    extractor.update_status = lambda message: None
+    extractor.update_progress = lambda value: None
+    return extractor
+
+def case_markdown_ex(size: Dict[str, int], workdir: str) -> CaseResult:
+    module = extractorz()
+    project_dir, written, payload = _project(size, workdir)
+    output_dir = os.path.join(workdir, 'out')
+    settings_path = os.path.join(workdir, 'settings.toml')
+    _write_settings(settings_path, output_dir, written)
+    extractor = _silence(module.MarkdownEx(project_dir, output_dir, settings_path))
+    return extractor.run, len(written), payload
+
+def case_csv_ex(size: Dict[str, int], workdir: str) -> CaseResult:
+    module = extractorz()
+    project_dir, written, payload = _project(size, workdir)
+    output_dir = os.path.join(workdir, 'out')
+    settings_path = os.path.join(workdir, 'settings.toml')
+    _write_settings(settings_path, output_dir, written)
+    extractor = _silence(module.CSVEx(project_dir, output_dir, settings_path))
+    return extractor.run, len(written), payload
+
+def _markdown_export(size: Dict[str, int], workdir: str) -> Tuple[str, int, int]:
+    files = synthetic_project(size['files'])
+    markdown_path = os.path.join(workdir, 'Full_Project_00.md')
+    content = synthetic_markdown_export(files)
+    with open(markdown_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return markdown_path, len(files), len(content.encode('utf-8'))
+
+def case_reverse_markdown_extraction(size: Dict[str, int], workdir: str) -> CaseResult:
+    module = extractorz()
+    markdown_path, units, payload = _markdown_export(size, workdir)
+    output_dir = os.path.join(workdir, 'reversed')
+    return lambda: module.reverse_markdown_extraction(markdown_path, output_dir), units, payload
+
+def case_reverse_extract_code_blocks(size: Dict[str, int], workdir: str) -> CaseResult:
+    module = extractorz()
+    markdown_path, units, payload = _markdown_export(size, workdir)
+    with open(markdown_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    extractor = module.ReverseMarkdownEx(markdown_path, os.path.join(workdir, 'reversed'))
+    return lambda: extractor.extract_code_blocks(content), units, payload
+
+CASES: Dict[str, Callable[[Dict[str, int], str], CaseResult]] = {
+    'code_block_extractor': case_code_block_extractor,
+    'code_integrator': case_code_integrator,
+    'process_code_block': case_process_code_block,
+    'markdown_ex': case_markdown_ex,
+    'csv_ex': case_csv_ex,
+    'reverse_markdown_extraction': case_reverse_markdown_extraction,
+    'reverse_extract_code_blocks': case_reverse_extract_code_blocks,
+}
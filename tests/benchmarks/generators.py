@@ -0,0 +1,258 @@
+# ./tests/benchmarks/generators.py
+
+"""
+Deterministic generators for synthetic benchmark inputs.
+
+All generators take a seed so that a given size always produces byte-identical
+input, which keeps timings comparable across runs and machines.
+"""
+
+import math
+import os
+import random
+import sys
+import wave
+from array import array
+from typing import Dict, List
+
+# Parameters for each benchmark size
+SIZES = {
+    'small': {'blocks': 5, 'classes': 5, 'methods': 4, 'files': 20},
+    'medium': {'blocks': 50, 'classes': 20, 'methods': 6, 'files': 200},
+    'large': {'blocks': 250, 'classes': 80, 'methods': 8, 'files': 1000},
+}
+
+_WORDS = [
+    'data', 'config', 'worker', 'page', 'theme', 'token', 'model', 'chat',
+    'buffer', 'result', 'handler', 'state', 'index', 'cache', 'stream', 'path',
+]
+
+_PROSE = [
+    "Here is the updated implementation.",
+    "I refactored the class so the state is only computed once.",
+    "The following block replaces the existing method.",
+    "Note that the imports at the top are unchanged.",
+    "This keeps the public API identical while fixing the edge case.",
+]
+
+def _name(rng: random.Random, parts: int = 2) -> str:
+    return '_'.join(rng.choice(_WORDS) for _ in range(parts))
+
+def _class_name(rng: random.Random) -> str:
+    return ''.join(word.capitalize() for word in _name(rng).split('_')) + str(rng.randint(0, 999))
+
+def _method_source(rng: random.Random, name: str, indent: str = '    ') -> str:
+    arg = _name(rng, 1)
+    body = [
+        f"{indent}def {name}(self, {arg}, limit=10):",
+        f'{indent}    """Process {arg} and return the accumulated result."""',
+        f"{indent}    result = []",
+        f"{indent}    for i in range(limit):",
+        f"{indent}        if i % {rng.randint(2, 5)} == 0:",
+        f"{indent}            result.append(({arg}, i * {rng.randint(1, 9)}))",
+        f"{indent}        else:",
+        f"{indent}            result.append(str(i))",
+        f"{indent}    return result",
+    ]
+    return '\n'.join(body)
+
+def synthetic_class(rng: random.Random, n_methods: int, class_name: str = None) -> str:
+    """Source for a single class with n_methods methods."""
+    class_name = class_name or _class_name(rng)
+    lines = [
+        f"class {class_name}:",
+        f'    """Synthetic class {class_name}."""',
+        "",
+        "    def __init__(self, config=None):",
+        "        self.config = config or {}",
+        f"        self.{_name(rng)} = {rng.randint(0, 100)}",
+        "",
+    ]
+    used = set()
+    for _ in range(n_methods):
+        method = _name(rng)
+        while method in used:
+            method = _name(rng, 3)
+        used.add(method)
+        lines.append(_method_source(rng, method))
+        lines.append("")
+    return '\n'.join(lines)
+
+def synthetic_module(n_classes: int, n_methods: int, seed: int = 0) -> str:
+    """Source for a Python module with imports, constants, classes and functions."""
+    rng = random.Random(seed)
+    lines = [
+        "import os",
+        "import re",
+        "from typing import Dict, List, Optional",
+        "",
+        f"DEFAULT_{_name(rng).upper()} = {rng.randint(1, 1000)}",
+        f"MAX_{_name(rng).upper()} = {rng.randint(1, 1000)}",
+        "",
+    ]
+    for _ in range(n_classes):
+        lines.append(synthetic_class(rng, n_methods))
+        lines.append("")
+    for _ in range(max(1, n_classes // 2)):
+        name = _name(rng, 3)
+        lines.append(f"def {name}(items: List[str]) -> Dict[str, int]:")
+        lines.append("    return {item: len(item) for item in items}")
+        lines.append("")
+    return '\n'.join(lines)
+
+def module_class_names(source: str) -> List[str]:
+    """Class names defined at the top level of a synthetic module."""
+    return [line[6:].split(':')[0].split('(')[0] for line in source.splitlines() if line.startswith('class ')]
+
+def synthetic_update_block(module_path: str, original_source: str, n_methods: int, seed: int = 0) -> str:
+    """
+    A code block as an LLM would emit it: module path comment, one replaced
+    class from original_source, one new function and one special import.
+    """
+    rng = random.Random(seed)
+    class_names = module_class_names(original_source) or [_class_name(rng)]
+    lines = [
+        f"# {module_path}",
+        "#¤# import json",
+        "",
+        synthetic_class(rng, n_methods, class_name=rng.choice(class_names)),
+        "",
+        f"def {_name(rng, 3)}_{seed}(value):",
+        "    return json.dumps(value)",
+    ]
+    return '\n'.join(lines)
+
+def synthetic_transcript(n_blocks: int, n_methods: int = 4, seed: int = 0) -> str:
+    """
+    A chat transcript with prose, python update blocks and the occasional
+    JSON removal block, in the formats CodeBlockExtractor understands.
+    """
+    rng = random.Random(seed)
+    parts = ["Sure! Below are the changes you asked for.\n"]
+    for i in range(n_blocks):
+        parts.append(rng.choice(_PROSE))
+        if i % 10 == 9:
+            parts.append(
+                "```json\n"
+                f'{{"remove": {{"module": "pkg/{_name(rng)}.py", "classes": ["{_class_name(rng)}"]}}}}\n'
+                "```"
+            )
+            continue
+        module_path = f"pkg/{_name(rng)}_{i}.py"
+        body = synthetic_class(rng, n_methods)
+        if i % 3 == 0:
+            method = _method_source(rng, f"{_name(rng)}_updated")
+            body += f"\n# BEGIN UPDATED METHOD\n{method.strip()}\n# END UPDATED METHOD\n"
+        if i % 4 == 0:
+            body += '\n#"""\ndef legacy_helper():\n    pass\n"""\n'
+        parts.append(
+            "```python\n"
+            f"# {module_path}\n"
+            "#¤# from typing import Any\n"
+            f"{body}\n"
+            "## ...\n"
+            "```"
+        )
+    parts.append("Let me know if you want me to add tests for this.")
+    return '\n\n'.join(parts)
+
+_EXTENSIONS = ['.py', '.py', '.py', '.js', '.md', '.toml']
+
+def synthetic_project(n_files: int, seed: int = 0) -> Dict[str, str]:
+    """Relative path -> text content for a nested synthetic project."""
+    rng = random.Random(seed)
+    files = {}
+    for i in range(n_files):
+        depth = rng.randint(0, 3)
+        directory = '/'.join(f"{rng.choice(_WORDS)}_{rng.randint(0, 4)}" for _ in range(depth))
+        ext = rng.choice(_EXTENSIONS)
+        relative_path = f"{directory}/{_name(rng)}_{i}{ext}" if directory else f"{_name(rng)}_{i}{ext}"
+        if ext == '.py':
+            content = synthetic_module(rng.randint(1, 3), rng.randint(2, 5), seed=seed * 100003 + i)
+        elif ext == '.js':
+            content = '\n'.join(
+                f"export function {_name(rng)}{j}(x) {{ return x * {j}; }}" for j in range(rng.randint(5, 40))
+            )
+        elif ext == '.md':
+            content = '\n\n'.join(rng.choice(_PROSE) for _ in range(rng.randint(5, 30)))
+        else:
+            content = '\n'.join(f'{_name(rng)} = "{_name(rng)}"' for _ in range(rng.randint(3, 20)))
+        files[relative_path] = content
+    return files
+
+def write_project_tree(root: str, files: Dict[str, str], binary_files: int = 1) -> List[str]:
+    """Write a synthetic project to disk and return the relative paths written."""
+    written = []
+    for relative_path, content in files.items():
+        full_path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        written.append(relative_path)
+    for i in range(binary_files):
+        relative_path = f"assets/image_{i}.png"
+        full_path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as f:
+            f.write(bytes(range(256)) * 8)
+        written.append(relative_path)
+    return written
+
+def synthetic_markdown_export(files: Dict[str, str]) -> str:
+    """A project export in the format MarkdownEx writes (input for the reverse path)."""
+    sections = ["# Project Details\n\n## Table of Contents\n"]
+    for relative_path in files:
+        sections.append(f"- {relative_path}")
+    sections.append("\n")
+    for relative_path, content in files.items():
+        formatted_path = f"./{relative_path}"
+        ext = os.path.splitext(relative_path)[1].lstrip('.')
+        comment_prefix = '//' if ext == 'js' else '#'
+        sections.append(
+            f"# {formatted_path}\n"
+            f"## File: {formatted_path}\n\n"
+            f"```{ext}\n"
+            f"{comment_prefix} {formatted_path}\n"
+            f"{content}\n"
+            "```\n\n"
+            "---\n"
+        )
+    return '\n'.join(sections)
+
+def synthetic_speech(seconds: float, rate: int = 16000, seed: int = 0) -> array:
+    """
+    Speech-like 16-bit mono samples: phrases of voiced "syllables" (a pitched
+    harmonic series under a smooth envelope) separated by short gaps and
+    longer pauses, over a faint noise floor.
+    """
+    rng = random.Random(seed)
+    samples = array('h', bytes(2 * int(seconds * rate)))
+    position = int(rng.uniform(0.2, 0.5) * rate)
+    while position < len(samples):
+        phrase_end = position + int(rng.uniform(1.5, 4.0) * rate)
+        pitch = rng.uniform(95, 220)
+        while position < min(phrase_end, len(samples)):
+            length = int(rng.uniform(0.12, 0.3) * rate)
+            f0 = pitch * rng.uniform(0.9, 1.15)
+            weights = [rng.uniform(0.2, 1.0) / harmonic for harmonic in range(1, 6)]
+            amplitude = rng.uniform(4000, 9000)
+            for i in range(min(length, len(samples) - position)):
+                envelope = math.sin(math.pi * i / length)
+                phase = 2 * math.pi * f0 * i / rate
+                value = sum(w * math.sin(h * phase) for h, w in enumerate(weights, start=1))
+                samples[position + i] = int(amplitude * envelope * value / 2)
+            position += length + int(rng.uniform(0.02, 0.12) * rate)
+        position += int(rng.uniform(0.3, 0.9) * rate)
+    for i in range(len(samples)):
+        samples[i] = max(-32768, min(32767, samples[i] + rng.randint(-60, 60)))
+    return samples
+
+def write_wav(path: str, samples: array, rate: int = 16000) -> None:
+    if sys.byteorder == 'big':
+        samples = array('h', samples)
+        samples.byteswap()      # WAV data is little-endian
+    with wave.open(path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(samples.tobytes())
@@ -0,0 +1,144 @@
+# ./tests/benchmarks/harness.py
+
+"""
+Measurement and baseline comparison helpers for the benchmark suite.
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# A case regresses when its median time or allocation peak grows by more than this fraction
+DEFAULT_THRESHOLD = 0.25
+
+# Timings below this are too noisy to judge against the threshold
+MIN_COMPARABLE_SECONDS = 0.002
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of the current process in KiB, if the platform exposes it."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and KiB on Linux
+        return peak // 1024 if sys.platform == 'darwin' else peak
+    except ImportError:
+        pass
+    try:
+        import psutil
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, 'peak_wset', memory_info.rss) // 1024
+    except ImportError:
+        return None
+
+def measure(func: Callable[[], Any], units: int, payload_bytes: int = 0,
+            repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Time func() `repeat` times after `warmup` calls, then run it once more
+    under tracemalloc to capture allocations (kept separate so tracing
+    overhead does not skew the timings).
+
+    Args:
+        func: Zero-argument callable running one iteration of the workload.
+        units: Work items processed per call (blocks, files, nodes).
+        payload_bytes: Input size per call, used to report MB/s.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings: List[float] = []
+    gc.collect()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    result = {
+        'units': units,
+        'repeat': repeat,
+        'min_s': min(timings),
+        'median_s': median,
+        'units_per_s': units / median if median else None,
+        'alloc_peak_kb': peak // 1024,
+        'alloc_retained_kb': current // 1024,
+    }
+    if payload_bytes:
+        result['mb_per_s'] = payload_bytes / (1024 * 1024) / median if median else None
+    return result
+
+def machine_info() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_baseline(results: Dict[str, Dict[str, Any]], path: str = BASELINE_PATH) -> None:
+    document = {
+        'machine': machine_info(),
+        'results': {key: value for key, value in sorted(results.items()) if 'error' not in value},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Return a human-readable line for every metric that regressed by more than
+    threshold relative to the baseline. Cases missing from either side are ignored.
+    """
+    regressions = []
+    baseline_results = baseline.get('results', {})
+    for key, current in sorted(results.items()):
+        previous = baseline_results.get(key)
+        if previous is None or 'error' in current:
+            continue
+        if max(current['median_s'], previous['median_s']) >= MIN_COMPARABLE_SECONDS:
+            if current['median_s'] > previous['median_s'] * (1 + threshold):
+                regressions.append(
+                    f"{key}: median {previous['median_s'] * 1000:.2f}ms -> {current['median_s'] * 1000:.2f}ms"
+                )
+        if previous.get('alloc_peak_kb') and current['alloc_peak_kb'] > previous['alloc_peak_kb'] * (1 + threshold):
+            regressions.append(
+                f"{key}: alloc peak {previous['alloc_peak_kb']}KB -> {current['alloc_peak_kb']}KB"
+            )
+    return regressions
+
+def format_table(results: Dict[str, Dict[str, Any]]) -> str:
+    header = f"{'case':<40} {'median':>10} {'units/s':>12} {'MB/s':>8} {'peak RSS':>10} {'alloc peak':>11}"
+    lines = [header, '-' * len(header)]
+    for key, result in sorted(results.items()):
+        if 'error' in result:
+            lines.append(f"{key:<40} {'skipped: ' + result['error']}")
+            continue
+        mb_per_s = result.get('mb_per_s')
+        rss = result.get('peak_rss_kb')
+        lines.append(
+            f"{key:<40} {result['median_s'] * 1000:>8.2f}ms {result['units_per_s'] or 0:>12.1f} "
+            f"{(f'{mb_per_s:.2f}' if mb_per_s else '-'):>8} "
+            f"{(f'{rss // 1024}MB' if rss else '-'):>10} {result['alloc_peak_kb']:>9}KB"
+        )
+    return '\n'.join(lines)
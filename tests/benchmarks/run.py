@@ -0,0 +1,122 @@
+# ./tests/benchmarks/run.py
+
+"""
+Command-line runner for the benchmark suite.
+
+The parent process spawns one child per (case, size) so that peak RSS and
+import side effects do not leak between cases. Children print a single JSON
+line; everything the code under test prints is discarded.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+from tests.benchmarks.generators import SIZES
+from tests.benchmarks.harness import (
+    BASELINE_PATH,
+    DEFAULT_THRESHOLD,
+    compare,
+    format_table,
+    load_baseline,
+    measure,
+    peak_rss_kb,
+    save_baseline,
+)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def run_child(case_name: str, size_name: str, repeat: int) -> Dict[str, Any]:
+    """Run a single case in this process and return its measurements."""
+    from tests.benchmarks.cases import CASES
+
+    workdir = tempfile.mkdtemp(prefix=f"bench_{case_name}_")
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            try:
+                func, units, payload_bytes = CASES[case_name](SIZES[size_name], workdir)
+            except ImportError as e:
+                return {'error': f"missing dependency ({e.name or e})"}
+            result = measure(func, units, payload_bytes, repeat=repeat)
+        result['peak_rss_kb'] = peak_rss_kb()
+        return result
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+def spawn(case_name: str, size_name: str, repeat: int) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get('PYTHONPATH')]))
+    completed = subprocess.run(
+        [sys.executable, '-m', 'tests.benchmarks.run', '--child', case_name, size_name, '--repeat', str(repeat)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        error = completed.stderr.strip().splitlines()
+        return {'error': error[-1] if error else f"exit code {completed.returncode}"}
+    return json.loads(lines[-1])
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the code-integration and extraction pipelines.")
+    parser.add_argument('--cases', nargs='+', help="Cases to run (default: all)")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=5, help="Timed iterations per case")
+    parser.add_argument('--compare', action='store_true', help="Exit non-zero on regressions vs the baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown before a case counts as regressed")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--json', help="Also write the raw results to this file")
+    parser.add_argument('--child', nargs=2, metavar=('CASE', 'SIZE'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_child(args.child[0], args.child[1], args.repeat)))
+        return 0
+
+    from tests.benchmarks.cases import CASES
+    case_names = args.cases or list(CASES)
+    unknown = set(case_names) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for case_name in case_names:
+        for size_name in args.sizes:
+            key = f"{case_name}/{size_name}"
+            print(f"Running {key}...", file=sys.stderr)
+            results[key] = spawn(case_name, size_name, args.repeat)
+
+    print(format_table(results))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.compare:
+        baseline = load_baseline(args.baseline)
+        if not baseline:
+            print(f"\nNo baseline found at {args.baseline}")
+            return 1
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\nRegressions (threshold {args.threshold:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions (threshold {args.threshold:.0%}).")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,239 @@
+# ./tests/benchmarks/transcription.py
+
+"""
+Transcription throughput benchmark for modules/fast_whisper_v2.
+
+Loads the model through ModelCache and transcribes a fixed corpus once per
+configuration (compute type x beam size x chunk length x VAD filter), each in
+its own subprocess so model load time and peak RSS belong to that
+configuration. Results are printed as JSON:
+
+    load_s               ModelCache.get_model() time for a cold process
+    rtf                  transcription time / audio duration (lower is faster)
+    first_segment_s      median time from transcribe() to the first segment
+    segment_latency_ms   median / p95 / max time between consecutive segments
+    peak_rss_kb          peak resident memory of the child
+
+The corpus is three deterministic speech-like WAVs (see generators.py) plus
+any WAV files in tests/benchmarks/audio/ or the --corpus directories, so real
+recordings can be added for realistic numbers.
+
+It never touches the network: the Hugging Face hub is put in offline mode and
+--model must be a local model directory or a model name already downloaded
+(e.g. one the app has used).
+
+    python -m tests.benchmarks.transcription --model base
+    python -m tests.benchmarks.transcription --model /path/to/faster-whisper-small \\
+        --compute-types int8 float32 --beam-sizes 1 5 --json results.json
+    python -m tests.benchmarks.transcription --model base --compare baseline.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from typing import Any, Callable, Dict, List
+
+from tests.benchmarks.generators import synthetic_speech, write_wav
+from tests.benchmarks.harness import DEFAULT_THRESHOLD, machine_info, peak_rss_kb
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'audio')
+WHISPER_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'modules', 'fast_whisper_v2', 'config.json')
+
+# Synthetic corpus: name -> seconds of audio
+SYNTHETIC_CORPUS = {'speech_5s': 5, 'speech_30s': 30, 'speech_120s': 120}
+
+def build_corpus(workdir: str, sample_dirs: List[str]) -> List[str]:
+    """Write the synthetic WAVs into workdir and add the WAV samples found in sample_dirs."""
+    paths = []
+    for seed, (name, seconds) in enumerate(SYNTHETIC_CORPUS.items()):
+        path = os.path.join(workdir, f"{name}.wav")
+        write_wav(path, synthetic_speech(seconds, seed=seed))
+        paths.append(path)
+    for directory in sample_dirs:
+        if os.path.isdir(directory):
+            paths.extend(
+                os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                if name.lower().endswith('.wav')
+            )
+    return paths
+
+def wav_seconds(path: str) -> float:
+    with wave.open(path, 'rb') as wf:
+        return wf.getnframes() / wf.getframerate()
+
+def configurations(compute_types: List[str], beam_sizes: List[int], chunk_lengths: List[int],
+                   vad_filters: List[bool]) -> List[Dict[str, Any]]:
+    return [
+        {'compute_type': compute_type, 'beam_size': beam_size, 'chunk_length': chunk_length, 'vad_filter': vad}
+        for compute_type, beam_size, chunk_length, vad in itertools.product(
+            compute_types, beam_sizes, chunk_lengths, vad_filters
+        )
+    ]
+
+def config_key(config: Dict[str, Any]) -> str:
+    vad = 'vad' if config['vad_filter'] else 'novad'
+    return f"{config['compute_type']}/beam{config['beam_size']}/chunk{config['chunk_length']}/{vad}"
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def measure_transcription(model, corpus: List[str], options: Dict[str, Any],
+                          clock: Callable[[], float] = time.perf_counter) -> Dict[str, Any]:
+    """Transcribe every corpus file once and collect speed and latency figures."""
+    files = {}
+    first_segment, gaps = [], []
+    segment_count = 0
+    for path in corpus:
+        audio_s = wav_seconds(path)
+        start = previous = clock()
+        segments, _ = model.transcribe(path, **options)
+        # Segments are decoded lazily, so the gaps between them are the decoding latency
+        for index, _segment in enumerate(segments):
+            now = clock()
+            (first_segment if index == 0 else gaps).append(now - previous)
+            previous = now
+            segment_count += 1
+        elapsed = clock() - start
+        files[os.path.basename(path)] = {
+            'audio_s': round(audio_s, 3),
+            'transcribe_s': round(elapsed, 4),
+            'rtf': round(elapsed / audio_s, 4) if audio_s else None,
+        }
+
+    audio_total = sum(f['audio_s'] for f in files.values())
+    transcribe_total = sum(f['transcribe_s'] for f in files.values())
+    latencies = first_segment + gaps
+    return {
+        'audio_s': round(audio_total, 3),
+        'transcribe_s': round(transcribe_total, 4),
+        'rtf': round(transcribe_total / audio_total, 4) if audio_total else None,
+        'segments': segment_count,
+        'first_segment_s': round(statistics.median(first_segment), 4) if first_segment else None,
+        'segment_latency_ms': {
+            'median': round(statistics.median(latencies) * 1000, 2),
+            'p95': round(percentile(latencies, 0.95) * 1000, 2),
+            'max': round(max(latencies) * 1000, 2),
+        } if latencies else None,
+        'files': files,
+    }
+
+def run_child(config: Dict[str, Any], model_name: str, device: str, cpu_threads: int,
+              language: str, corpus: List[str]) -> Dict[str, Any]:
+    from faster_whisper.utils import download_model
+    from modules.fast_whisper_v2.model_cache import ModelCache
+
+    with open(WHISPER_CONFIG_PATH, 'r') as f:
+        settings = json.load(f)
+    cache = ModelCache(settings, download=lambda name: download_model(name, local_files_only=True))
+
+    start = time.perf_counter()
+    model = cache.get_model(model_name, device, config['compute_type'], cpu_threads=cpu_threads)
+    load_s = time.perf_counter() - start
+
+    options = dict(config)
+    compute_type = options.pop('compute_type')
+    result = measure_transcription(model, corpus, dict(options, language=language))
+    result['load_s'] = round(load_s, 3)
+    result['compute_type'] = cache.known_compute_type(model_name, device, compute_type)
+    result['peak_rss_kb'] = peak_rss_kb()
+    return result
+
+def spawn(config: Dict[str, Any], args: argparse.Namespace, corpus: List[str]) -> Dict[str, Any]:
+    env = dict(os.environ)
+    env['HF_HUB_OFFLINE'] = '1'
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get('PYTHONPATH')]))
+    command = [
+        sys.executable, '-m', 'tests.benchmarks.transcription', '--child', json.dumps(config),
+        '--model', args.model, '--device', args.device, '--cpu-threads', str(args.cpu_threads),
+        '--language', args.language, '--corpus-files', *corpus,
+    ]
+    completed = subprocess.run(command, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        error = completed.stderr.strip().splitlines()
+        return {'error': error[-1] if error else f"exit code {completed.returncode}"}
+    return json.loads(lines[-1])
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """Lines for configurations whose RTF or load time grew by more than threshold."""
+    regressions = []
+    for key, current in sorted(results.items()):
+        previous = baseline.get('results', {}).get(key)
+        if previous is None or 'error' in current or 'error' in previous:
+            continue
+        for metric in ('rtf', 'load_s'):
+            if previous.get(metric) and current[metric] > previous[metric] * (1 + threshold):
+                regressions.append(f"{key}: {metric} {previous[metric]} -> {current[metric]}")
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark fast_whisper_v2 transcription settings offline.")
+    parser.add_argument('--model', required=True, help="Local model directory or an already downloaded model name")
+    parser.add_argument('--device', default='cpu')
+    parser.add_argument('--compute-types', nargs='+', default=['int8', 'float32'])
+    parser.add_argument('--beam-sizes', nargs='+', type=int, default=[5])
+    parser.add_argument('--chunk-lengths', nargs='+', type=int, default=[30])
+    parser.add_argument('--vad', nargs='+', choices=['on', 'off'], default=['off'])
+    parser.add_argument('--cpu-threads', type=int, default=0)
+    parser.add_argument('--language', default='en', help="Fixed so runs don't include language detection")
+    parser.add_argument('--corpus', nargs='*', default=[], help="Extra directories of WAV samples")
+    parser.add_argument('--json', help="Also write the results to this file")
+    parser.add_argument('--compare', metavar='BASELINE', help="Exit non-zero on regressions vs this results file")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--corpus-files', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        result = run_child(json.loads(args.child), args.model, args.device, args.cpu_threads,
+                           args.language, args.corpus_files)
+        print(json.dumps(result))
+        return 0
+
+    workdir = tempfile.mkdtemp(prefix='bench_transcription_')
+    try:
+        corpus = build_corpus(workdir, [SAMPLES_DIR] + args.corpus)
+        durations = {os.path.basename(path): round(wav_seconds(path), 3) for path in corpus}
+        results = {}
+        for config in configurations(args.compute_types, args.beam_sizes, args.chunk_lengths,
+                                     [vad == 'on' for vad in args.vad]):
+            key = config_key(config)
+            print(f"Running {key}...", file=sys.stderr)
+            results[key] = spawn(config, args, corpus)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    document = {
+        'machine': machine_info(),
+        'model': args.model,
+        'device': args.device,
+        'corpus': durations,
+        'results': results,
+    }
+    print(json.dumps(document, indent=2, sort_keys=True))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"Regression: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 1 if any('error' in result for result in results.values()) else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
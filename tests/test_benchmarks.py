@@ -0,0 +1,104 @@
+import ast
+import os
+import wave
+import pytest
+from tests.benchmarks.generators import (
+    SIZES,
+    synthetic_markdown_export,
+    synthetic_module,
+    synthetic_project,
+    synthetic_speech,
+    synthetic_transcript,
+    synthetic_update_block,
+    write_wav,
+)
+from tests.benchmarks.harness import compare, measure
+from tests.benchmarks.transcription import configurations, measure_transcription
+
+def test_generators_are_deterministic():
+    assert synthetic_transcript(10, seed=3) == synthetic_transcript(10, seed=3)
+    assert synthetic_project(15, seed=3) == synthetic_project(15, seed=3)
+    assert synthetic_project(15, seed=3) != synthetic_project(15, seed=4)
+
+def test_synthetic_code_is_valid_python():
+    size = SIZES['small']
+    module = synthetic_module(size['classes'], size['methods'])
+    ast.parse(module)
+    ast.parse(synthetic_update_block("pkg/module.py", module, size['methods']))
+    for path, content in synthetic_project(size['files']).items():
+        if path.endswith('.py'):
+            ast.parse(content)
+
+def test_transcript_and_export_contain_expected_blocks():
+    transcript = synthetic_transcript(20)
+    assert transcript.count("```python") == 18
+    assert transcript.count("```json") == 2
+
+    files = synthetic_project(5)
+    export = synthetic_markdown_export(files)
+    for path in files:
+        assert f"## File: ./{path}" in export
+
+def test_measure_reports_throughput():
+    result = measure(lambda: [str(i) for i in range(1000)], units=1000, payload_bytes=4096, repeat=3)
+    assert result['repeat'] == 3
+    assert result['min_s'] <= result['median_s']
+    assert result['units_per_s'] > 0
+    assert result['alloc_peak_kb'] >= 0
+    assert 'mb_per_s' in result
+
+def test_compare_flags_only_regressions_over_threshold():
+    baseline = {'results': {
+        'case/small': {'median_s': 0.010, 'alloc_peak_kb': 100},
+        'case/large': {'median_s': 0.100, 'alloc_peak_kb': 1000},
+    }}
+    results = {
+        'case/small': {'median_s': 0.011, 'alloc_peak_kb': 100},   # within 25%
+        'case/large': {'median_s': 0.200, 'alloc_peak_kb': 2000},  # slower and bigger
+        'other/small': {'median_s': 1.0, 'alloc_peak_kb': 1},      # no baseline
+    }
+    regressions = compare(results, baseline, threshold=0.25)
+    assert len(regressions) == 2
+    assert all(line.startswith('case/large') for line in regressions)
+
+def test_synthetic_speech_wav_is_deterministic(temp_dir):
+    samples = synthetic_speech(2, seed=1)
+    assert samples == synthetic_speech(2, seed=1)
+    assert samples != synthetic_speech(2, seed=2)
+    assert max(abs(s) for s in samples) > 1000
+
+    path = os.path.join(temp_dir, "speech.wav")
+    write_wav(path, samples)
+    with wave.open(path, 'rb') as wf:
+        assert (wf.getnchannels(), wf.getsampwidth(), wf.getframerate()) == (1, 2, 16000)
+        assert wf.getnframes() == 32000
+
+def test_measure_transcription_reports_rtf_and_latency(temp_dir):
+    corpus = []
+    for name, seconds in [("a.wav", 2), ("b.wav", 4)]:
+        path = os.path.join(temp_dir, name)
+        write_wav(path, synthetic_speech(seconds))
+        corpus.append(path)
+
+    ticks = iter(range(1000))
+    calls = []
+
+    class FakeModel:
+        def transcribe(self, audio, **options):
+            calls.append(options)
+            return (f"segment {i}" for i in range(3)), None
+
+    result = measure_transcription(FakeModel(), corpus, {'beam_size': 1}, clock=lambda: float(next(ticks)))
+    # Each file: one tick to start, one per segment, one to finish
+    assert calls == [{'beam_size': 1}, {'beam_size': 1}]
+    assert result['audio_s'] == 6.0
+    assert result['files']['a.wav'] == {'audio_s': 2.0, 'transcribe_s': 4.0, 'rtf': 2.0}
+    assert result['rtf'] == round(8.0 / 6.0, 4)
+    assert result['segments'] == 6
+    assert result['first_segment_s'] == 1.0
+    assert result['segment_latency_ms'] == {'median': 1000.0, 'p95': 1000.0, 'max': 1000.0}
+
+def test_transcription_configurations_cover_every_combination():
+    configs = configurations(['int8', 'float32'], [1, 5], [30], [False, True])
+    assert len(configs) == 8
+    assert {'compute_type': 'int8', 'beam_size': 5, 'chunk_length': 30, 'vad_filter': True} in configs
@@ -0,0 +1,65 @@
+import os
+import threading
+import pytest
+
+from Utils.file_sync import file_digest, content_digest, sync_file, text_bytes, write_files
+
+def test_sync_file_skips_identical_content(temp_dir):
+    path = os.path.join(temp_dir, "pkg", "module.py")
+    data = text_bytes("print('hi')\n")
+    assert sync_file(path, data) is True
+    assert file_digest(path) == content_digest(data)
+
+    os.utime(path, ns=(1, 1))
+    assert sync_file(path, data) is False
+    assert os.stat(path).st_mtime_ns == 1
+
+    assert sync_file(path, text_bytes("print('bye')\n")) is True
+    assert sync_file(path, data, current=text_bytes("print('bye')\n")) is True
+    with open(path, "rb") as f:
+        assert f.read() == data
+
+def test_file_digest_of_missing_file(temp_dir):
+    assert file_digest(os.path.join(temp_dir, "missing.txt")) is None
+
+def test_write_files_counts_and_reports_errors(temp_dir):
+    existing = os.path.join(temp_dir, "same.txt")
+    sync_file(existing, b"same")
+
+    def fail():
+        raise OSError("disk full")
+
+    errors, progress = [], []
+    summary = write_files(
+        {
+            existing: lambda: sync_file(existing, b"same"),
+            os.path.join(temp_dir, "new.txt"): lambda: sync_file(os.path.join(temp_dir, "new.txt"), b"new"),
+            "broken.txt": fail,
+        },
+        max_workers=2,
+        on_progress=lambda done, total: progress.append((done, total)),
+        on_error=lambda path, e: errors.append((path, str(e))),
+    )
+    assert (summary.written, summary.unchanged, summary.failed, summary.cancelled) == (1, 1, 1, 0)
+    assert errors == [("broken.txt", "disk full")]
+    assert progress[-1] == (3, 3)
+
+def test_write_files_stops_starting_jobs(temp_dir):
+    running = threading.Event()
+    running.set()
+    started = []
+
+    def job(index):
+        started.append(index)
+        if index == 2:
+            running.clear()
+        return True
+
+    summary = write_files(
+        {str(i): (lambda i=i: job(i)) for i in range(100)},
+        max_workers=1,
+        is_running=running.is_set,
+    )
+    assert summary.written == len(started)
+    assert summary.cancelled == 100 - len(started)
+    assert len(started) < 10
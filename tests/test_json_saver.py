@@ -0,0 +1,74 @@
+import importlib.util
+import json
+import os
+import threading
+import pytest
+
+JSON_SAVER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'frontend', 'Pages', 'desktop', 'Layout', '3_Dashboard', 'utils', 'json_saver.py'
+)
+
+@pytest.fixture(scope="module")
+def json_saver():
+    spec = importlib.util.spec_from_file_location('dashboard_json_saver', JSON_SAVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def writer(json_saver):
+    writer = json_saver.BackgroundJsonWriter()
+    yield writer
+    writer.close(timeout=5)
+
+def test_writes_latest_snapshot_atomically(writer, temp_dir):
+    path = os.path.join(temp_dir, "search_fields.json")
+    writer.submit(path, [{"id": "0", "items": ["a"]}])
+    assert writer.flush(timeout=5)
+    with open(path) as f:
+        assert json.load(f) == [{"id": "0", "items": ["a"]}]
+    assert not os.path.exists(f"{path}.tmp")
+
+def test_bursts_are_coalesced_per_file(json_saver, temp_dir, monkeypatch):
+    writes = []
+    release = threading.Event()
+    original_write = json_saver.BackgroundJsonWriter._write
+
+    def slow_write(path, data):
+        release.wait(5)
+        writes.append((os.path.basename(path), data))
+        original_write(path, data)
+
+    monkeypatch.setattr(json_saver.BackgroundJsonWriter, "_write", staticmethod(slow_write))
+    writer = json_saver.BackgroundJsonWriter()
+    try:
+        first = os.path.join(temp_dir, "first.json")
+        second = os.path.join(temp_dir, "second.json")
+        writer.submit(first, 0)
+        for version in range(1, 50):
+            writer.submit(first, version)
+        writer.submit(second, "other")
+        release.set()
+        assert writer.flush(timeout=5)
+    finally:
+        writer.close(timeout=5)
+
+    # At most the in-flight write plus the newest version of each file
+    assert len(writes) <= 3
+    assert ("first.json", 49) in writes and ("second.json", "other") in writes
+    with open(first) as f:
+        assert json.load(f) == 49
+
+def test_write_errors_are_reported(json_saver, temp_dir):
+    errors = []
+    writer = json_saver.BackgroundJsonWriter(on_error=lambda path, e: errors.append(path))
+    try:
+        missing_dir = os.path.join(temp_dir, "missing", "page.json")
+        writer.submit(missing_dir, [])
+        assert writer.flush(timeout=5)
+        assert errors == [missing_dir]
+    finally:
+        writer.close(timeout=5)
+    with pytest.raises(RuntimeError):
+        writer.submit(missing_dir, [])
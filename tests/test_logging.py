@@ -0,0 +1,72 @@
+import json
+import logging
+import sys
+import pytest
+from log.logger import SensitiveDataFilter, SamplingFilter, JsonLinesFormatter, LazyQueueHandler
+
+def make_record(msg, args=None, level=logging.INFO, pathname="Page.py", func="send_message"):
+    return logging.LogRecord("app_logger", level, pathname, 1, msg, args, None, func=func)
+
+def test_sensitive_filter_redacts_and_merges_args():
+    record = make_record("api_key = 'abc123' for %s", ("user",))
+    redaction = SensitiveDataFilter()
+    assert redaction.filter(record)
+    assert record.getMessage() == "api_key=****** for user"
+    # Running the filter again (second handler) must be a no-op
+    assert redaction.filter(record)
+    assert record.getMessage() == "api_key=****** for user"
+
+def test_sensitive_filter_leaves_plain_messages():
+    record = make_record("Response received in %.1fs", (1.25,))
+    SensitiveDataFilter().filter(record)
+    assert record.getMessage() == "Response received in 1.2s"
+
+def test_sampling_filter_keeps_every_nth_debug_record():
+    sampler = SamplingFilter({"Page.handle_ai_response": 0.25})
+    kept = [
+        sampler.filter(make_record("x", level=logging.DEBUG, func="handle_ai_response"))
+        for _ in range(8)
+    ]
+    assert kept.count(True) == 2
+    # INFO and unconfigured categories are never sampled
+    assert sampler.filter(make_record("x", level=logging.INFO, func="handle_ai_response"))
+    assert sampler.filter(make_record("x", level=logging.DEBUG, func="send_message"))
+
+def test_json_lines_formatter_is_single_line():
+    record = make_record("line one\nline %d", (2,))
+    line = JsonLinesFormatter().format(record)
+    assert "\n" not in line
+    entry = json.loads(line)
+    assert entry["msg"] == "line one\nline 2"
+    assert entry["level"] == "INFO"
+    assert entry["func"] == "send_message"
+
+def test_lazy_queue_handler_defers_primitive_args():
+    record = make_record("Response %d in %.1fs: %s", (200, 1.25, "ok"))
+    prepared = LazyQueueHandler(None).prepare(record)
+    assert prepared.args == (200, 1.25, "ok")
+    assert prepared.msg == "Response %d in %.1fs: %s"
+
+def test_lazy_queue_handler_formats_mutable_args_before_queueing():
+    payload = ["a", "b"]
+    record = make_record("payload %s", (payload,))
+    prepared = LazyQueueHandler(None).prepare(record)
+    payload.append("added after the log call")
+    assert prepared.args is None
+    assert prepared.getMessage() == "payload ['a', 'b']"
+
+    state = {"step": 1}
+    record = make_record("%(step)s of %(total)s", ({"step": state, "total": 3},))
+    LazyQueueHandler(None).prepare(record)
+    state["step"] = 2
+    assert record.getMessage() == "{'step': 1} of 3"
+
+def test_lazy_queue_handler_renders_tracebacks_before_queueing():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app_logger", logging.ERROR, "Page.py", 1, "failed", None, sys.exc_info())
+    prepared = LazyQueueHandler(None).prepare(record)
+    assert prepared.exc_info is None
+    assert prepared.exc_text.endswith("ValueError: boom")
+    assert json.loads(JsonLinesFormatter().format(prepared))["exc"] == prepared.exc_text
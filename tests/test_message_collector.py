@@ -0,0 +1,82 @@
+import threading
+import pytest
+from log.message_collector import MessageCollector
+
+@pytest.fixture
+def collector():
+    collector = MessageCollector()
+    collector.flush()
+    output = []
+    previous = collector.log_function
+    collector.log_function = output.append
+    collector.output = output
+    yield collector
+    collector.flush()
+    collector.log_function = previous
+
+def test_flush_groups_discovered_pages(collector):
+    collector.add_message("discovered_page", "1_chat")
+    collector.add_message("discovered_page", "3_Dashboard")
+    collector.flush()
+    assert collector.output == ["INFO: Discovered pages: '1_chat', '3_Dashboard'"]
+    assert collector.pending == 0
+
+def test_threshold_does_not_deadlock(collector):
+    # The old implementation re-entered its own lock when the threshold was hit
+    done = threading.Event()
+
+    def produce():
+        for i in range(collector._flush_threshold * 3):
+            collector.add_message("theme_applied", f"THEME_NAME = {i}")
+        done.set()
+
+    worker = threading.Thread(target=produce)
+    worker.start()
+    worker.join(timeout=5)
+    assert done.is_set()
+    collector.flush()
+    assert len(collector.output) == collector._flush_threshold * 3
+
+def test_log_function_may_add_messages(collector):
+    def reentrant_log(line):
+        collector.output.append(line)
+        if "RECURSE" in line:
+            collector.add_message("nested", "from log function")
+    collector.log_function = reentrant_log
+    collector.add_message("recurse", "RECURSE")
+    collector.flush()
+    collector.flush()
+    assert any("NESTED" in line for line in collector.output)
+
+def test_bounded_buffer_counts_drops(collector):
+    max_pending = collector._max_pending
+    collector._max_pending = 3
+    try:
+        for i in range(5):
+            collector.add_message("bulk", str(i))
+        assert collector.dropped == 2
+        collector.flush()
+        assert collector.output[-1] == "WARNING: MessageCollector buffer full, dropped messages: bulk=2"
+        assert collector.dropped == 0
+    finally:
+        collector._max_pending = max_pending
+
+def test_concurrent_drops_are_all_counted(collector):
+    max_pending = collector._max_pending
+    collector._max_pending = 0
+    try:
+        def produce():
+            for i in range(5000):
+                collector.add_message("bulk", str(i))
+
+        threads = [threading.Thread(target=produce) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        collector.flush()
+        warnings = [line for line in collector.output if line.startswith("WARNING: MessageCollector buffer full")]
+        assert sum(int(line.rsplit("bulk=", 1)[1]) for line in warnings) == 8 * 5000
+        assert collector.dropped == 0
+    finally:
+        collector._max_pending = max_pending
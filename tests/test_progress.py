@@ -0,0 +1,128 @@
+import threading
+import time
+import pytest
+
+from Utils.progress import ProgressThrottle
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def emitted():
+    return {"progress": [], "status": []}
+
+@pytest.fixture
+def throttle(clock, emitted):
+    return ProgressThrottle(
+        emitted["progress"].append, emitted["status"].append, max_per_second=10, clock=clock
+    )
+
+def test_bursts_are_coalesced_to_the_latest_values(throttle, clock, emitted):
+    for i in range(1000):
+        throttle.progress(i // 10)
+        throttle.status(f"Processing file {i}")
+        clock.now += 0.0005     # 1000 files in half a second
+    throttle.flush()
+
+    # First update goes out immediately, then at most one per 100ms, then the flush
+    assert len(emitted["progress"]) <= 7
+    assert emitted["progress"][0] == 0
+    assert emitted["progress"][-1] == 99
+    assert emitted["status"][-1] == "Processing file 999"
+    assert throttle.dropped > 1900
+
+def test_updates_pass_through_when_slow(throttle, clock, emitted):
+    for i in range(5):
+        throttle.progress(i * 25)
+        clock.now += 0.2
+    assert emitted["progress"] == [0, 25, 50, 75, 100]
+    throttle.flush()
+    assert emitted["progress"] == [0, 25, 50, 75, 100]
+
+def test_flush_emits_only_pending_values(throttle, clock, emitted):
+    throttle.status("Starting extraction process...")
+    throttle.status("Gathering file list...")
+    assert emitted["status"] == ["Starting extraction process..."]
+    throttle.flush()
+    assert emitted["status"] == ["Starting extraction process...", "Gathering file list..."]
+    assert emitted["progress"] == []
+
+def test_unlimited_rate_and_missing_emitters(clock):
+    received = []
+    throttle = ProgressThrottle(received.append, None, max_per_second=0, clock=clock)
+    for i in range(3):
+        throttle.progress(i)
+        throttle.status("ignored")
+    assert received == [0, 1, 2]
+
+def test_concurrent_reporting_keeps_the_final_value(emitted):
+    throttle = ProgressThrottle(emitted["progress"].append, emitted["status"].append, max_per_second=50)
+
+    def report(offset):
+        for i in range(2000):
+            throttle.progress(offset + i)
+
+    threads = [threading.Thread(target=report, args=(n * 10000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    throttle.progress(-1)
+    throttle.flush()
+    assert emitted["progress"][-1] == -1
+    assert throttle.emitted + throttle.dropped == 8001
+
+def test_held_back_value_is_sent_when_the_interval_ends(emitted):
+    throttle = ProgressThrottle(emitted["progress"].append, emitted["status"].append, max_per_second=20)
+    throttle.status("Loading Markdown file...")
+    throttle.status("Writing 5000 files...")
+    assert emitted["status"] == ["Loading Markdown file..."]
+
+    # No further report() during a long step: the timer sends the held status
+    deadline = time.monotonic() + 2
+    while len(emitted["status"]) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert emitted["status"] == ["Loading Markdown file...", "Writing 5000 files..."]
+
+    throttle.flush()
+    assert emitted["status"] == ["Loading Markdown file...", "Writing 5000 files..."]
+
+def test_flush_cancels_the_trailing_emit(clock, emitted):
+    timers = []
+
+    class FakeTimer:
+        def __init__(self, delay, callback):
+            self.delay, self.callback, self.cancelled = delay, callback, False
+            timers.append(self)
+
+        def start(self):
+            pass
+
+        def cancel(self):
+            self.cancelled = True
+
+    throttle = ProgressThrottle(emitted["progress"].append, None, max_per_second=10, clock=clock, timer=FakeTimer)
+    throttle.progress(1)
+    clock.now += 0.03
+    throttle.progress(2)
+    throttle.progress(3)
+    assert len(timers) == 1 and timers[0].delay == pytest.approx(0.07)
+
+    clock.now += 0.07
+    timers[0].callback()
+    assert emitted["progress"] == [1, 3]
+
+    # The trailing emit starts a new interval
+    throttle.progress(4)
+    assert emitted["progress"] == [1, 3]
+    throttle.flush()
+    assert timers[1].cancelled
+    assert emitted["progress"] == [1, 3, 4]
@@ -0,0 +1,91 @@
+import importlib.util
+import json
+import os
+import sqlite3
+import pytest
+
+PROMPT_STORE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'frontend', 'Pages', 'desktop', 'Layout', '3_Dashboard', 'utils', 'prompt_store.py'
+)
+
+LEGACY_VAULT = {
+    "Coding": ["Refactor this Python function", "Explain the asyncio event loop"],
+    "Writing": ["Draft a blog post about sourdough baking"],
+    "tags": {"Coding": ["Dev", "python"]},
+}
+
+@pytest.fixture(scope="module")
+def prompt_store():
+    spec = importlib.util.spec_from_file_location('dashboard_prompt_store', PROMPT_STORE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def store(prompt_store, temp_dir):
+    store = prompt_store.PromptStore(os.path.join(temp_dir, "prompt_vault.db"))
+    store.import_data(LEGACY_VAULT)
+    yield store
+    store.close()
+
+def test_json_round_trip(store, temp_dir):
+    assert store.categories() == ["Coding", "Writing"]
+    export_path = os.path.join(temp_dir, "export.json")
+    store.export_json(export_path)
+    with open(export_path) as f:
+        assert json.load(f) == {**LEGACY_VAULT, "tags": {"Coding": ["dev", "python"]}}
+
+def test_paged_listing(store):
+    for i in range(25):
+        store.add_prompt("Writing", f"prompt {i}")
+    assert store.count_prompts("Writing") == 26
+    first = store.list_prompts("Writing", offset=0, limit=10)
+    second = store.list_prompts("Writing", offset=10, limit=10)
+    assert [text for _, text in first][:2] == ["Draft a blog post about sourdough baking", "prompt 0"]
+    assert len(second) == 10 and second[0][1] == "prompt 9"
+
+def test_full_text_search_follows_edits(store):
+    assert [text for _, _, text in store.search("asyncio")] == ["Explain the asyncio event loop"]
+    # Prefix matching, and category names are searchable too
+    assert [category for _, category, _ in store.search("sourd")] == ["Writing"]
+    assert len(store.search("coding")) == 2
+
+    prompt_id = store.search("asyncio")[0][0]
+    store.update_prompt(prompt_id, "Explain the trio nursery model")
+    assert store.search("asyncio") == []
+    assert store.search("nursery")[0][0] == prompt_id
+
+    store.rename_category("Coding", "Engineering")
+    assert len(store.search("engineering")) == 2
+
+    store.delete_prompt(prompt_id)
+    assert store.search("nursery") == []
+    store.delete_category("Engineering")
+    assert store.search("refactor") == []
+    assert store.categories() == ["Writing"]
+
+def test_categories_matching_uses_names_and_tags(store):
+    assert store.categories_matching("dev") == ["Coding"]
+    assert store.categories_matching("WRIT") == ["Writing"]
+
+def test_failed_transaction_rolls_back(store):
+    with pytest.raises(sqlite3.IntegrityError):
+        with store.transaction() as connection:
+            connection.execute("INSERT INTO categories (name, position) VALUES ('Scratch', 99)")
+            connection.execute("INSERT INTO categories (name, position) VALUES ('Writing', 100)")
+    assert store.categories() == ["Coding", "Writing"]
+
+def test_search_with_special_characters(store):
+    store.add_prompt("Writing", 'Say "hello" (politely)')
+    assert [text for _, _, text in store.search('"hello" (pol')] == ['Say "hello" (politely)']
+
+def test_search_thousands_of_prompts(prompt_store):
+    store = prompt_store.PromptStore(":memory:")
+    store.add_category("Bulk")
+    with store.transaction():
+        for i in range(5000):
+            store._insert_prompt(store._category_id("Bulk"), "Bulk", f"generated prompt number {i} about topic{i % 97}")
+    results = store.search("topic42", limit=100)
+    assert len(results) == 52
+    store.close()
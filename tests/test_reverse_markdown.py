@@ -0,0 +1,126 @@
+import dataclasses
+import glob
+import importlib.util
+import json
+import os
+import re
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXTRACTORZ_PATH = os.path.join(
+    PROJECT_ROOT, 'frontend', 'Pages', 'desktop', 'Layout', '2_Markdown_CSV_Extr', 'extractorz.py'
+)
+GOLDEN_DIR = os.path.join(PROJECT_ROOT, 'tests', 'golden', 'reverse_markdown')
+GOLDEN_INPUTS = sorted(glob.glob(os.path.join(GOLDEN_DIR, '*.md')))
+
+@pytest.fixture(scope="module")
+def extractorz():
+    # The page directory name starts with a digit, so load the module from its path
+    spec = importlib.util.spec_from_file_location('reverse_markdown_extractorz', EXTRACTORZ_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def extractor(extractorz, temp_dir):
+    return extractorz.ReverseMarkdownEx(os.path.join(temp_dir, 'export.md'), temp_dir)
+
+def read_exact(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+@pytest.mark.parametrize('markdown_path', GOLDEN_INPUTS, ids=os.path.basename)
+def test_extract_code_blocks_matches_golden_output(extractor, markdown_path):
+    with open(markdown_path[:-3] + '.json', 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    blocks = extractor.extract_code_blocks(read_exact(markdown_path))
+    assert [dataclasses.asdict(block) for block in blocks] == expected
+
+def sections(extractor, content):
+    return [content[start:end] for start, end in extractor._section_spans(content)]
+
+def test_section_spans_follow_delimiter_lines(extractor):
+    content = "intro\n# a.py\nbody\n  ---  \n-- -\n***x\n\n___\n#"
+    assert sections(extractor, content) == ["intro", "# a.py\nbody", "  ---  \n-- -\n***x\n", "___", "#"]
+    assert sections(extractor, "") == [""]
+    assert sections(extractor, "---\n# b.py") == ["---", "# b.py"]
+
+def test_fence_scan_matches_lazy_dotall_regex(extractor):
+    content = "````python\nquad\n```` x ```js\nlet a\n``` ```py\nunclosed"
+    expected = [match.groups() for match in re.finditer(r'```(\w+)\n(.*?)```', content, re.DOTALL)]
+    assert expected == [("python", "quad\n"), ("js", "let a\n")]
+    assert list(extractor._code_fences(content, 0, len(content))) == expected
+
+def restore(extractorz, markdown_path, output_dir):
+    extractor = extractorz.ReverseMarkdownEx(markdown_path, output_dir)
+    statuses = []
+    extractor.update_status = statuses.append
+    extractor.run()
+    return statuses[-1]
+
+def test_restoring_twice_leaves_files_untouched(extractorz, temp_dir):
+    markdown_path = os.path.join(GOLDEN_DIR, 'headers.md')
+    output_dir = os.path.join(temp_dir, 'restored')
+    assert restore(extractorz, markdown_path, output_dir).endswith("(0 already up to date)")
+
+    restored = sorted(glob.glob(os.path.join(output_dir, '**', '*.*'), recursive=True))
+    assert len(restored) == 9
+    for path in restored:
+        os.utime(path, ns=(1, 1))
+
+    assert restore(extractorz, markdown_path, output_dir).endswith("(9 already up to date)")
+    assert all(os.stat(path).st_mtime_ns == 1 for path in restored)
+    with open(os.path.join(output_dir, 'src', 'app', 'main.py'), encoding='utf-8') as f:
+        assert f.read() == "def main():\n    return 0"
+
+def test_class_updates_to_one_file_are_applied_in_one_write(extractorz, extractor, temp_dir, monkeypatch):
+    path = os.path.join(temp_dir, 'shapes.py')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("class Circle:\n    r = 1\n\nclass Square:\n    side = 1\n")
+
+    writes = []
+    original_sync_file = extractorz.sync_file
+    monkeypatch.setattr(extractorz, 'sync_file', lambda *args: writes.append(args[0]) or original_sync_file(*args))
+
+    blocks = [
+        extractorz.CodeBlock(path, 'python', "class Circle:\n    r = 2\n", 'unix', update_class='Circle'),
+        extractorz.CodeBlock(path, 'python', "class Square:\n    side = 2\n", 'unix', update_class='Square'),
+        extractorz.CodeBlock(path, 'python', "class Missing:\n    pass\n", 'unix', update_class='Missing'),
+    ]
+    assert extractor._restore_file(path, blocks) == (True, 2)
+    assert writes == [path]
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    assert "r = 2" in content and "side = 2" in content and "Missing" not in content
+
+    # A whole-file block matching what is on disk is not written again
+    full = extractorz.CodeBlock(path, 'python', content, 'unix')
+    assert extractor._restore_file(path, [full]) == (True, 1)
+    assert extractor._restore_file(path, [full]) == (False, 1)
+
+def test_spellings_of_one_path_share_a_write_job(extractorz, extractor, temp_dir, monkeypatch):
+    jobs = []
+    original_write_files = extractorz.write_files
+    monkeypatch.setattr(extractorz, 'write_files', lambda files, **kwargs: jobs.append(list(files)) or original_write_files(files, **kwargs))
+
+    blocks = [
+        extractorz.CodeBlock('src/a.py', 'python', "first", 'unix'),
+        extractorz.CodeBlock('src//a.py', 'python', "second", 'unix'),
+        extractorz.CodeBlock('src/./a.py', 'python', "third", 'unix'),
+    ]
+    monkeypatch.setattr(extractor, 'extract_code_blocks', lambda content: blocks)
+    with open(extractor.markdown_path, 'w', encoding='utf-8') as f:
+        f.write("")
+    extractor.run()
+
+    assert len(jobs[-1]) == 1
+    assert read_exact(os.path.join(temp_dir, 'src', 'a.py')) == "third"
+
+    # The CSV sheet keeps the last row for the file, however its path is spelled
+    pd = pytest.importorskip('pandas')
+    rows = pd.DataFrame({'Path': ['b.py', './b.py', 'x/../b.py'], 'Code': ['one', 'two', 'three']})
+    monkeypatch.setattr(extractorz.pd, 'read_excel', lambda path: rows)
+    extractorz.ReverseCSVEx(os.path.join(temp_dir, 'sheet.xlsx'), temp_dir).run()
+
+    assert len(jobs[-1]) == 1
+    assert read_exact(os.path.join(temp_dir, 'b.py')) == "three"
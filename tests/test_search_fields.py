@@ -0,0 +1,96 @@
+import importlib.util
+import os
+import pytest
+
+UTILS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'frontend', 'Pages', 'desktop', 'Layout', '3_Dashboard', 'utils'
+)
+
+def load(name):
+    # The page directory name starts with a digit, so load the modules from their paths
+    spec = importlib.util.spec_from_file_location(f'dashboard_{name}', os.path.join(UTILS_DIR, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope="module")
+def modules():
+    return load('search_index'), load('search_fields')
+
+def field(field_id, items, tags=()):
+    return {"id": field_id, "name": f"Field {field_id}", "items": list(items), "tags": list(tags)}
+
+@pytest.fixture
+def model(modules):
+    search_index, search_fields = modules
+    model = search_fields.SearchFieldsModel(search_index.SearchIndex(), history_limit=3)
+    model.load("search_fields.json", [
+        field("0", ['"a"', '"b"', '"a"'], tags=["code"]),
+        field("1", ['"news"']),
+        field("2", ['"c"'], tags=["code"]),
+    ])
+    return model
+
+def items(model, field_id):
+    return model.find_field(field_id)[1]["items"]
+
+def test_undo_and_redo_touch_the_recorded_entry_of_duplicates(model):
+    # Remove the second '"a"', not the first one
+    assert model.perform({"op": "remove_item", "field_id": "0", "item": '"a"', "position": 2})
+    assert items(model, "0") == ['"a"', '"b"']
+
+    assert model.undo() == {"op": "add_item", "field_id": "0", "item": '"a"', "position": 2}
+    assert items(model, "0") == ['"a"', '"b"', '"a"']
+
+    model.perform({"op": "add_item", "field_id": "0", "item": '"b"', "position": 0})
+    assert items(model, "0") == ['"b"', '"a"', '"b"', '"a"']
+    model.undo()
+    assert items(model, "0") == ['"a"', '"b"', '"a"']
+    model.redo()
+    assert items(model, "0") == ['"b"', '"a"', '"b"', '"a"']
+
+def test_removing_a_stale_position_is_refused(model):
+    assert not model.perform({"op": "remove_item", "field_id": "0", "item": '"b"', "position": 0})
+    assert items(model, "0") == ['"a"', '"b"', '"a"']
+    assert model.undo() is None
+
+def test_field_operations_round_trip_and_keep_the_index_in_step(model):
+    assert model.perform({"op": "remove_field", "field": field("1", ['"news"']), "position": 1})
+    assert [f["id"] for f in model.fields] == ["0", "2"]
+    assert model.search_index.search("news") == []
+
+    model.undo()
+    assert [f["id"] for f in model.fields] == ["0", "1", "2"]
+    assert [r.item for r in model.search_index.search("news")] == ['"news"']
+
+    # A new operation clears what could be redone
+    model.perform({"op": "add_item", "field_id": "1", "item": '"more news"', "position": 1})
+    assert model.redo() is None
+
+def test_history_is_bounded(model):
+    for n in range(5):
+        model.perform({"op": "add_item", "field_id": "1", "item": f'"{n}"', "position": n + 1})
+    while model.undo():
+        pass
+    assert items(model, "1") == ['"news"', '"0"', '"1"']
+
+def test_filter_narrows_the_view_but_saves_every_field(model):
+    model.set_filter({"0", "2"})
+    assert [f["id"] for f in model.visible_fields()] == ["0", "2"]
+
+    model.perform({"op": "add_item", "field_id": "2", "item": '"d"', "position": 1})
+    model.perform({"op": "add_field", "field": field("3", []), "position": 3})
+    assert [f["id"] for f in model.visible_fields()] == ["0", "2", "3"]
+
+    snapshot = model.snapshot()
+    assert [f["id"] for f in snapshot] == ["0", "1", "2", "3"]
+    assert snapshot[1]["items"] == ['"news"']
+    assert snapshot[2]["items"] == ['"c"', '"d"']
+
+    # The snapshot is a copy the writer thread can own
+    snapshot[0]["items"].append('"x"')
+    assert items(model, "0") == ['"a"', '"b"', '"a"']
+
+    model.clear_filter()
+    assert [f["id"] for f in model.visible_fields()] == ["0", "1", "2", "3"]
@@ -0,0 +1,95 @@
+import importlib.util
+import os
+import time
+import pytest
+
+SEARCH_INDEX_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'frontend', 'Pages', 'desktop', 'Layout', '3_Dashboard', 'utils', 'search_index.py'
+)
+
+@pytest.fixture(scope="module")
+def search_index_module():
+    # The page directory name starts with a digit, so load the module from its path
+    spec = importlib.util.spec_from_file_location('dashboard_search_index', SEARCH_INDEX_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def field(field_id, name, items, tags=()):
+    return {"id": field_id, "name": name, "items": list(items), "tags": list(tags)}
+
+@pytest.fixture
+def index(search_index_module):
+    index = search_index_module.SearchIndex()
+    index.index_page("search_fields.json", [
+        field("0", "Python", ['"asyncio tutorial"', 'site:docs.python.org', '"pandas dataframe"'], tags=["Code"]),
+        field("1", "News", ['site:news.ycombinator.com', '"python release"'], tags=["daily"]),
+    ])
+    index.index_page("search_fields_1.json", [
+        field("0", "Recipes", ['"sourdough bread"', '"python snake care"'], tags=["code"]),
+    ])
+    return index
+
+def test_exact_matches_across_pages_ranked_by_quality(index):
+    results = index.search("python")
+    assert {(r.page, r.item) for r in results} == {
+        ("search_fields.json", 'site:docs.python.org'),
+        ("search_fields.json", '"python release"'),
+        ("search_fields_1.json", '"python snake care"'),
+    }
+    assert [r.item for r in index.search("python", page="search_fields_1.json")] == ['"python snake care"']
+    assert results[0].field_name in ("Python", "News")
+
+def test_prefix_and_fuzzy_matches(index):
+    assert [r.item for r in index.search("sourd")] == ['"sourdough bread"']
+    # One transposed and one substituted character
+    assert [r.item for r in index.search("asyncoi")] == ['"asyncio tutorial"']
+    assert [r.item for r in index.search("dataframs")] == ['"pandas dataframe"']
+    # Exact hits outrank fuzzy ones
+    index.add_item("search_fields.json", "1", '"pandas"')
+    assert [r.item for r in index.search("pandas")][0] == '"pandas"'
+
+def test_all_query_tokens_must_match(index):
+    assert [r.item for r in index.search("python release")] == ['"python release"']
+    assert index.search("python bread") == []
+    assert index.search("   ") == []
+
+def test_incremental_updates(index):
+    index.add_item("search_fields.json", "0", '"zeromq bindings"')
+    assert [r.item for r in index.search("zeromq")] == ['"zeromq bindings"']
+
+    index.remove_item("search_fields.json", "0", '"zeromq bindings"')
+    assert index.search("zeromq") == []
+    assert "zeromq" not in index.vocabulary
+
+    index.remove_field("search_fields.json", "1")
+    assert all(r.field_id != "1" or r.page != "search_fields.json" for r in index.search("python"))
+
+    index.remove_page("search_fields_1.json")
+    assert index.search("sourdough") == []
+
+def test_duplicate_items_are_reference_counted(index):
+    index.add_item("search_fields.json", "0", '"asyncio tutorial"')
+    index.remove_item("search_fields.json", "0", '"asyncio tutorial"')
+    assert index.search("asyncio")
+
+def test_fields_with_tag_is_case_insensitive(index):
+    assert index.fields_with_tag("CODE") == {("search_fields.json", "0"), ("search_fields_1.json", "0")}
+    assert index.fields_with_tag("code", page="search_fields_1.json") == {("search_fields_1.json", "0")}
+
+def test_search_scales_to_tens_of_thousands_of_items(search_index_module):
+    index = search_index_module.SearchIndex()
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+    for page in range(4):
+        fields = [
+            field(str(f), f"Field {f}", [f'"{words[i % 8]} {words[(i * 3) % 8]} item{page}x{f}x{i}"' for i in range(250)])
+            for f in range(20)
+        ]
+        index.index_page(f"search_fields_{page}.json", fields)
+    assert len(index) == 20000
+
+    start = time.perf_counter()
+    results = index.search("item3x7x12", limit=10)
+    assert time.perf_counter() - start < 0.1
+    assert results[0].item.endswith('item3x7x12"')
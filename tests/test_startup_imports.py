@@ -0,0 +1,91 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from Config.AppConfig.config import (
+    STARTUP_CRITICAL_MODULES,
+    STARTUP_HEAVY_MODULES,
+    STARTUP_IMPORT_BUDGET_MS,
+)
+from Utils.import_profiler import ImportProfiler, heavy_modules_loaded
+from Utils.lazy_import import is_loaded, lazy_import
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports the critical startup path in a clean interpreter under the profiler
+CHILD_SCRIPT = """
+import importlib, json, sys
+from Utils.import_profiler import import_profiler
+import_profiler.start()
+missing = None
+for name in sys.argv[1:]:
+    try:
+        importlib.import_module(name)
+    except ImportError as e:
+        missing = e.name or str(e)
+        break
+import_profiler.stop()
+print(json.dumps({'missing': missing, 'modules': sorted(sys.modules),
+                  'import_ms': import_profiler.report()['import_ms']}))
+"""
+
+@pytest.fixture(scope="module")
+def startup_imports():
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PYTHONPATH=PROJECT_ROOT)
+    completed = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, *STARTUP_CRITICAL_MODULES],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    if result['missing']:
+        if result['missing'].split('.', 1)[0] in STARTUP_HEAVY_MODULES:
+            pytest.fail(f"critical startup path imports heavy module {result['missing']}")
+        pytest.skip(f"startup dependency not installed: {result['missing']}")
+    return result
+
+def test_critical_path_does_not_import_heavy_modules(startup_imports):
+    assert heavy_modules_loaded(STARTUP_HEAVY_MODULES, startup_imports['modules']) == []
+
+def test_critical_path_stays_within_import_budget(startup_imports):
+    assert startup_imports['import_ms'] < STARTUP_IMPORT_BUDGET_MS
+
+def test_profiler_records_self_and_cumulative_time(temp_dir, monkeypatch):
+    package = os.path.join(temp_dir, 'profiled_pkg')
+    os.makedirs(package)
+    with open(os.path.join(package, '__init__.py'), 'w') as f:
+        f.write("import time\ntime.sleep(0.02)\nfrom . import child\n")
+    with open(os.path.join(package, 'child.py'), 'w') as f:
+        f.write("import time\ntime.sleep(0.03)\n")
+    monkeypatch.syspath_prepend(temp_dir)
+
+    profiler = ImportProfiler()
+    profiler.start()
+    try:
+        import profiled_pkg  # noqa: F401
+    finally:
+        profiler.stop()
+        sys.modules.pop('profiled_pkg', None)
+        sys.modules.pop('profiled_pkg.child', None)
+
+    parent = profiler.records['profiled_pkg']
+    child = profiler.records['profiled_pkg.child']
+    assert child['parent'] == 'profiled_pkg'
+    assert child['self_ms'] >= 25
+    assert 15 <= parent['self_ms'] < parent['cumulative_ms']
+    assert parent['cumulative_ms'] >= parent['self_ms'] + child['self_ms'] - 1
+    assert profiler not in sys.meta_path
+
+    report_path = profiler.write_report(temp_dir)
+    with open(report_path) as f:
+        assert 'profiled_pkg.child' in f.read()
+
+def test_lazy_import_defers_until_attribute_access():
+    sys.modules.pop('colorsys', None)
+    module = lazy_import('colorsys')
+    assert 'colorsys' not in sys.modules
+    assert not is_loaded(module)
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert is_loaded(module)
+    assert lazy_import('colorsys') is sys.modules['colorsys']
@@ -0,0 +1,66 @@
+import json
+import os
+import time
+import pytest
+from unittest.mock import MagicMock
+from ai_agent.utils.telemetry import ModelTelemetry, ModelCallRecord, extract_usage, percentile
+
+def test_percentile_nearest_rank():
+    values = sorted(float(v) for v in range(1, 101))
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) is None
+
+def test_ring_buffer_is_bounded():
+    telemetry = ModelTelemetry(capacity=5)
+    for i in range(12):
+        telemetry.add(ModelCallRecord(model="m", latency=float(i)))
+    records = telemetry.records()
+    assert len(records) == 5
+    assert records[0].latency == 7.0
+
+def test_track_records_latency_queue_wait_and_errors():
+    telemetry = ModelTelemetry()
+    with telemetry.track("gpt-4o", queued_at=time.monotonic()) as call:
+        call.set_usage(prompt_tokens=10, completion_tokens=5)
+
+    with pytest.raises(RuntimeError):
+        with telemetry.track("gpt-4o"):
+            raise RuntimeError("provider down")
+
+    ok, failed = telemetry.records()
+    assert ok.latency is not None and ok.queue_wait is not None
+    assert ok.time_to_first_token == ok.latency
+    assert "provider down" in failed.error
+
+    stats = telemetry.aggregates()["gpt-4o"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["prompt_tokens"] == 10
+    assert stats["latency_p50"] == ok.latency
+
+def test_extract_usage_from_langchain_message():
+    response = MagicMock()
+    response.usage_metadata = {"input_tokens": 12, "output_tokens": 3,
+                               "input_token_details": {"cache_read": 8}}
+    response.response_metadata = {}
+    usage = extract_usage(response)
+    assert usage == {"prompt_tokens": 12, "completion_tokens": 3, "cache_hit": True}
+    assert extract_usage("plain text") == {}
+
+def test_extract_usage_falls_back_to_provider_usage_for_missing_counts():
+    response = MagicMock()
+    response.usage_metadata = {"output_tokens": 3}
+    response.response_metadata = {"token_usage": {"prompt_tokens": 40, "completion_tokens": 5}}
+    assert extract_usage(response) == {"prompt_tokens": 40, "completion_tokens": 3}
+
+def test_export_jsonl(temp_dir):
+    telemetry = ModelTelemetry()
+    telemetry.add(ModelCallRecord(model="a", latency=0.5))
+    telemetry.add(ModelCallRecord(model="b", latency=1.5))
+    path = os.path.join(temp_dir, "telemetry.jsonl")
+    assert telemetry.export_jsonl(path) == 2
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert [line["model"] for line in lines] == ["a", "b"]
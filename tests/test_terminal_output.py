@@ -0,0 +1,275 @@
+import os
+import threading
+import time
+import pytest
+
+from collections import deque
+
+from modules.terminal.backend.InterpreterShell import InterpreterShell
+from modules.terminal.src.Config import TkTermConfig
+from modules.terminal.src.Redirect import OutputQueue
+from modules.terminal.src.SearchIndex import ScrollbackIndex
+from modules.terminal.src.TerminalScreen import TerminalWidget
+
+class FakeText:
+    """ Just enough of tkinter.Text for OutputQueue: a list of (text, tag) runs """
+
+    def __init__(self):
+        self.runs = []
+        self.inserts = 0
+        self.deletes = 0
+
+    def content(self):
+        return "".join(text for text, _ in self.runs)
+
+    def insert(self, index, *args):
+        assert index == "end"
+        self.inserts += 1
+        self.runs += list(zip(args[::2], args[1::2]))
+
+    def index(self, index):
+        assert index in ("end-1c", "insert")
+        content = self.content()
+        return "{}.{}".format(content.count("\n") + 1, len(content) - content.rfind("\n") - 1)
+
+    def delete(self, start, end):
+        assert start == "1.0"
+        lines = int(end.split('.')[0]) - 1
+        self.deletes += 1
+        content = self.content()
+        cut = 0
+        for _ in range(lines):
+            cut = content.index("\n", cut) + 1
+        runs, skipped = [], 0
+        for text, tag in self.runs:
+            if skipped + len(text) <= cut:
+                skipped += len(text)
+                continue
+            runs.append((text[max(0, cut - skipped):], tag))
+            skipped += len(text)
+        self.runs = runs
+
+    def see(self, index):
+        pass
+
+class FakeTerminal:
+
+    def __init__(self):
+        self.TerminalScreen = FakeText()
+        self.scrollbackIndex = ScrollbackIndex()
+        self.caretHandling = True
+        self.processTerminated = False
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, job):
+        pass
+
+@pytest.fixture
+def scrollback():
+    previous = TkTermConfig.CONFIG
+    TkTermConfig.CONFIG = dict(previous, scrollback=100)
+    yield 100
+    TkTermConfig.CONFIG = previous
+
+def test_drain_inserts_queued_chunks_once_with_tags(scrollback):
+    terminal = FakeTerminal()
+    output = OutputQueue(terminal)
+    output.put("stdout", "one\n")
+    output.put("stdout", "two\n")
+    output.put("stderr", "oops\n")
+    output.put("stdout", "three\n")
+    output.drain()
+
+    screen = terminal.TerminalScreen
+    assert screen.inserts == 1
+    assert screen.runs == [("one\ntwo\n", "output"), ("oops\n", "error"), ("three\n", "output")]
+    assert terminal.caretHandling is False
+
+def test_scrollback_is_trimmed_in_one_delete(scrollback):
+    terminal = FakeTerminal()
+    output = OutputQueue(terminal)
+    for i in range(60):
+        output.put("stdout", "line {}\n".format(i))
+    output.drain()
+    for i in range(60, 120):
+        output.put("stdout", "line {}\n".format(i))
+    output.drain()
+
+    screen = terminal.TerminalScreen
+    lines = screen.content().split("\n")
+    assert screen.deletes == 1
+    assert len(lines) == 100
+    assert lines[-2] == "line 119"
+
+    # The search index follows the same appends and trims
+    assert terminal.scrollbackIndex.lines == lines
+    assert terminal.scrollbackIndex.trimmed == 21
+
+def test_output_beyond_scrollback_never_reaches_the_widget(scrollback):
+    terminal = FakeTerminal()
+    output = OutputQueue(terminal)
+
+    def chatty():
+        for i in range(1000):
+            output.put("stdout", "".join("line {}\n".format(i * 50 + j) for j in range(50)))
+
+    thread = threading.Thread(target=chatty)
+    thread.start()
+    thread.join()
+    assert output.pendingLines <= 2 * scrollback
+
+    output.drain()
+    content = terminal.TerminalScreen.content()
+    assert len(content) < 2000
+    assert content.endswith("line 49999\n")
+    # The empty line after the last newline counts towards the scrollback
+    lines = content.split("\n")
+    assert len(lines) == 100
+    assert lines[0] == "line 49901"
+
+def test_callbacks_run_after_earlier_output_and_writes_from_other_threads_are_queued(scrollback):
+    terminal = FakeTerminal()
+    output = OutputQueue(terminal)
+    seen = []
+    output.put("stdout", "result\n")
+    output.call(lambda: seen.append(terminal.TerminalScreen.content()))
+
+    thread = threading.Thread(target=lambda: seen.append(output.on_tk_thread()))
+    thread.start()
+    thread.join()
+
+    output.start()
+    assert terminal.scheduled == [output._tick]
+    output.stop()
+    assert seen == [False, "result\n"]
+    assert output.pending == []
+
+def test_output_after_cancel_is_dropped(scrollback):
+    terminal = FakeTerminal()
+    output = OutputQueue(terminal)
+    terminal.processTerminated = True
+    output.put("stdout", "late\n")
+    output.drain()
+    assert terminal.TerminalScreen.content() == ""
+
+class FakeStatus:
+
+    def set(self, text):
+        self.text = text
+
+class FakeWidget(FakeTerminal):
+    """ TerminalWidget's command handling on top of a fake Tk loop """
+
+    TerminalPrint = TerminalWidget.TerminalPrint
+    command_finished = TerminalWidget.command_finished
+    run_command = TerminalWidget.run_command
+    run_next_command = TerminalWidget.run_next_command
+    resolve_command = TerminalWidget.resolve_command
+
+    def __init__(self):
+        FakeTerminal.__init__(self)
+        self.caretHandling = False
+        self.jobs = {}
+        self.events = []
+        self.output = OutputQueue(self)
+        self.currentInterpreter = InterpreterShell("/bin/sh")
+        self.shellComboBox = self.statusText = FakeStatus()
+        self.shellComboBox.get = lambda: "sh"
+        self.stdout = self.stderr = self
+        self.commandQueue = deque()
+        self.commandFuture = None
+        self.terminalThread = None
+        self.returnCode = 0
+        self.statusJob = None
+        self.lastResult = None
+
+    def after(self, ms, callback):
+        job = len(self.scheduled) + 1
+        self.scheduled.append(callback)
+        self.jobs[job] = callback
+        return job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_loop(self, until, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            jobs, self.jobs = self.jobs, {}
+            for callback in jobs.values():
+                callback()
+            time.sleep(0.005)
+
+    def write(self, text, end="\n"):
+        self.output.drain()
+        self.TerminalScreen.insert("end", text + end, "output")
+        self.typed = text
+
+    def do_keyReturn(self):
+        cmd = self.typed
+        self.insert_new_line()
+        if cmd.startswith("cd "):
+            self.set_returnCode(0 if os.path.isdir(cmd[3:]) else 1)
+            self.print_basename()
+        else:
+            self.terminalThread = self.TerminalPrint(self, cmd)
+            self.terminalThread.start()
+            self.output.start()
+            self.statusJob = self.after(100, lambda: None)
+
+    def insert_new_line(self):
+        self.TerminalScreen.insert("end", "\n", "output")
+
+    def print_basename(self):
+        self.TerminalScreen.insert("end", "$ ", "basename")
+
+    def set_returnCode(self, rc):
+        self.returnCode = rc
+
+    def bind_keys(self):
+        pass
+
+    def event_generate(self, event):
+        self.events.append(event)
+
+def test_queued_commands_run_back_to_back_and_resolve_in_order(scrollback):
+    widget = FakeWidget()
+    futures = [
+        widget.run_command("echo one"),
+        widget.run_command("echo two >&2; exit 3"),
+        widget.run_command("cd /definitely/missing"),
+        widget.run_command("echo three"),
+    ]
+    # Only the first command is running; the rest wait without a thread
+    assert len(widget.commandQueue) == 3
+
+    widget.run_loop(lambda: all(future.done() for future in futures))
+
+    results = [future.result(timeout=0) for future in futures]
+    assert [r.cmd for r in results] == ["echo one", "echo two >&2; exit 3", "cd /definitely/missing", "echo three"]
+    assert [r.returnCode for r in results] == [0, 3, 1, 0]
+    assert all(r.duration >= 0 for r in results)
+    assert widget.lastResult == results[-1]
+    assert widget.events == ["<<eventCommandFinished>>"] * 3
+
+    # Idle once the last command finished: nothing left scheduled on the loop
+    assert widget.terminalThread is None and widget.jobs == {}
+
+    runs = [(text, tag) for text, tag in widget.TerminalScreen.runs if text.strip()]
+    assert [text.strip() for text, _ in runs] == [
+        "echo one", "one", "$", "echo two >&2; exit 3", "two", "$", "cd /definitely/missing", "$", "echo three", "three", "$"
+    ]
+    assert ("two\n", "error") in runs
+
+def test_done_callbacks_can_chain_further_commands(scrollback):
+    widget = FakeWidget()
+    chained = []
+    first = widget.run_command("true")
+    first.add_done_callback(lambda future: chained.append(widget.run_command("false")))
+
+    widget.run_loop(lambda: chained and chained[0].done())
+    assert chained[0].result(timeout=0).returnCode == 1
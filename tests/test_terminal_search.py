@@ -0,0 +1,71 @@
+import re
+import pytest
+
+from modules.terminal.src.SearchIndex import ScrollbackIndex, compile_query, find_matches
+
+class FakeText:
+
+    def __init__(self, content):
+        self.content = content
+
+    def index(self, index):
+        assert index == "end-1c"
+        return "{}.0".format(self.content.count("\n") + 1)
+
+    def get(self, start, end):
+        assert end == "end-1c"
+        line = int(start.split('.')[0])
+        return "\n".join(self.content.split("\n")[line - 1:])
+
+def test_index_follows_appends_trims_and_clears():
+    index = ScrollbackIndex()
+    index.append("$ make\n")
+    index.append("gcc -c a.c\ngcc -c b")
+    index.append(".c\n")
+    assert index.lines == ["$ make", "gcc -c a.c", "gcc -c b.c", ""]
+
+    index.trim(2)
+    assert index.lines == ["gcc -c b.c", ""]
+    assert index.to_widget_line(2) == 1
+    assert index.to_widget_line(1) is None
+    assert index.to_absolute_line(1) == 2
+
+    index.clear()
+    assert index.lines == [""]
+    assert index.to_widget_line(3) is None
+    assert index.to_widget_line(index.trimmed) == 1
+
+def test_refresh_rereads_the_command_line_or_everything_on_drift():
+    index = ScrollbackIndex()
+    index.append("output\n$ ")
+    index.refresh(FakeText("output\n$ ls -la"))
+    assert index.lines == ["output", "$ ls -la"]
+
+    # A paste added lines the index never saw
+    index.refresh(FakeText("output\n$ echo a\nb"))
+    assert index.lines == ["output", "$ echo a", "b"]
+
+def test_find_matches_on_snapshot_uses_absolute_lines():
+    index = ScrollbackIndex()
+    index.append("".join("warning {}: Error here\n".format(i) for i in range(6000)))
+    index.trim(1000)
+
+    first_line, lines = index.snapshot()
+    matches = find_matches(compile_query("error"), lines, first_line)
+    assert len(matches) == 5000
+    assert matches[0] == (1000, 14, 19)
+    assert index.to_widget_line(matches[0][0]) == 1
+
+    # Appending after the snapshot doesn't change it
+    index.append("error\n")
+    assert len(lines) == 5001
+
+def test_compile_query_options():
+    assert compile_query("a.c").search("abc") is None
+    assert compile_query("a.c", regex=True).search("abc")
+    assert compile_query("ERROR", case_sensitive=True).search("error") is None
+    with pytest.raises(re.error):
+        compile_query("(", regex=True)
+
+def test_empty_matches_are_skipped():
+    assert find_matches(compile_query("x*", regex=True), ["ab", "axxb"]) == [(1, 1, 3)]
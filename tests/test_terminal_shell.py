@@ -0,0 +1,93 @@
+import os
+import sys
+import threading
+import time
+import pytest
+
+from modules.terminal.backend.InterpreterShell import InterpreterShell
+from modules.terminal.backend.OutputPump import CHUNK_SIZE, _pump_threads, pump_output
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="POSIX process groups")
+
+def wait_for_exit(process, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while process.poll() is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return process.poll()
+
+def test_commands_run_in_their_own_process_group():
+    shell = InterpreterShell("/bin/sh")
+    with shell.execute("sleep 5") as process:
+        assert os.getpgid(process.pid) == process.pid != os.getpgid(0)
+        shell.terminate(process)
+        assert wait_for_exit(process) is not None
+
+def test_cancel_reaches_child_processes_and_output_reaches_eof():
+    shell = InterpreterShell("/bin/sh")
+    # The shell itself stays alive after its first child, so the whole group must be signalled
+    with shell.execute("echo started; sleep 30; sleep 30") as process:
+        assert process.stdout.readline() == "started\n"
+        start = time.monotonic()
+        assert shell.terminate(process) == ("", "")
+        assert process.stdout.read() == ""  # EOF once the whole group is gone
+        assert wait_for_exit(process) is not None
+        assert time.monotonic() - start < 2
+
+def test_cancel_escalates_when_interrupt_is_ignored():
+    shell = InterpreterShell("/bin/sh")
+    script = "import signal, time; signal.signal(signal.SIGINT, signal.SIG_IGN); print('ready', flush=True); time.sleep(30)"
+    with shell.execute(f'"{sys.executable}" -c "{script}"') as process:
+        assert process.stdout.readline() == "ready\n"
+        start = time.monotonic()
+        shell.terminate(process)
+        assert wait_for_exit(process) is not None
+        assert 0.3 < time.monotonic() - start < 5
+
+def test_cancel_keeps_escalating_while_children_outlive_the_shell():
+    shell = InterpreterShell("/bin/sh")
+    # SIGTERM kills the shell, but the child ignoring it still holds stdout open
+    script = ("import signal, time; signal.signal(signal.SIGINT, signal.SIG_IGN); "
+              "signal.signal(signal.SIGTERM, signal.SIG_IGN); print('ready', flush=True); time.sleep(8)")
+    with shell.execute(f'"{sys.executable}" -c "{script}"; echo after') as process:
+        assert process.stdout.readline() == "ready\n"
+        start = time.monotonic()
+        shell.terminate(process)
+        assert process.stdout.read() == ""
+        assert time.monotonic() - start < 4
+
+def test_terminate_finished_process_is_a_no_op():
+    shell = InterpreterShell("/bin/sh")
+    with shell.execute("true") as process:
+        process.wait()
+        assert shell.terminate(process) == ("", "")
+
+def run_pump(pump, process, timeout=10.0):
+    chunks = []
+    thread = threading.Thread(target=pump, args=(process, lambda stream, text: chunks.append((stream, text))))
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "output pump stalled"
+    return chunks
+
+def joined(chunks, stream):
+    return "".join(text for name, text in chunks if name == stream)
+
+@pytest.mark.parametrize("pump", [pump_output, lambda process, write: _pump_threads(
+    {"stdout": process.stdout, "stderr": process.stderr}, write, CHUNK_SIZE)])
+def test_pump_drains_a_full_stderr_pipe_while_reading_stdout(pump):
+    # 1 MB of stderr before any stdout fills the pipe buffer many times over
+    script = "import sys; sys.stderr.write('e' * 1000000); sys.stderr.flush(); print('done')"
+    shell = InterpreterShell("/bin/sh")
+    with shell.execute(f'"{sys.executable}" -c "{script}"') as process:
+        chunks = run_pump(pump, process)
+    assert joined(chunks, "stderr") == "e" * 1000000
+    assert joined(chunks, "stdout") == "done\n"
+    assert len(chunks) < 1000  # large reads, not one write per line or byte
+
+def test_pump_keeps_stream_order_and_translates_newlines():
+    shell = InterpreterShell("/bin/sh")
+    command = "printf 'a\\r\\nb\\n'; echo oops >&2; for i in 1 2 3; do echo $i; done"
+    with shell.execute(command) as process:
+        chunks = run_pump(pump_output, process)
+    assert joined(chunks, "stdout") == "a\nb\n1\n2\n3\n"
+    assert joined(chunks, "stderr") == "oops\n"
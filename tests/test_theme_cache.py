@@ -0,0 +1,72 @@
+import json
+import os
+import pytest
+from Styles.theme_manager import ThemeManager
+
+THEME = {
+    "TYPOGRAPHY": {"font_family": "Arial", "body_font_size": "14px"},
+    "BASE": {"primary_color": "#2B2B2B", "text_color": "#E0E0E0"},
+    "QPushButton_style": {"background_color": "#333333", "color": "#FFFFFF"},
+}
+
+@pytest.fixture
+def theme_dir(temp_dir):
+    os.makedirs(os.path.join(temp_dir, "dark"))
+    with open(os.path.join(temp_dir, "dark", "style.json"), "w") as f:
+        json.dump(THEME, f)
+    yield temp_dir
+    ThemeManager.theme_paths.clear()
+    ThemeManager.compiled_themes.clear()
+    ThemeManager.themes.clear()
+
+def test_compile_writes_cache_next_to_style_json(theme_dir):
+    ThemeManager.theme_paths["dark"] = os.path.join(theme_dir, "dark", "style.json")
+    compiled = ThemeManager.compile_theme("dark")
+    assert "QPushButton {" in compiled["qss"]
+    assert compiled["palette"]["Window"] == "#2B2B2B"
+
+    with open(os.path.join(theme_dir, "dark", "style.compiled.json")) as f:
+        cached = json.load(f)
+    assert cached["hash"] == compiled["hash"]
+    assert cached["qss"] == compiled["qss"]
+
+def test_cache_is_reused_until_theme_changes(theme_dir, monkeypatch):
+    ThemeManager.theme_paths["dark"] = os.path.join(theme_dir, "dark", "style.json")
+    ThemeManager.compile_theme("dark")
+    ThemeManager.compiled_themes.clear()
+
+    # A matching cache is read back without rebuilding anything
+    monkeypatch.setattr(ThemeManager, "construct_qss", staticmethod(lambda theme: pytest.fail("rebuilt")))
+    assert ThemeManager._read_compiled_cache("dark") is not None
+
+    with open(ThemeManager.theme_paths["dark"], "w") as f:
+        json.dump({**THEME, "BASE": {"primary_color": "#000000"}}, f)
+    assert ThemeManager._read_compiled_cache("dark") is None
+
+def test_load_themes_rebuilds_stale_caches_in_background(theme_dir):
+    ThemeManager.load_themes(theme_dir)
+    assert "dark" in ThemeManager.theme_paths
+    # The background compile and a direct request share the same lock and result
+    compiled = ThemeManager.compile_theme("dark")
+    assert ThemeManager.compiled_themes["dark"] is compiled
+
+def test_applying_a_cached_theme_does_not_parse_style_json(theme_dir, monkeypatch):
+    ThemeManager.theme_paths["dark"] = os.path.join(theme_dir, "dark", "style.json")
+    ThemeManager.compile_theme("dark")
+    ThemeManager.compiled_themes.clear()
+    ThemeManager.themes.clear()
+
+    # What load_themes() does on startup with an up-to-date cache
+    ThemeManager.compiled_themes["dark"] = ThemeManager._read_compiled_cache("dark")
+    monkeypatch.setattr(ThemeManager, "_get_theme_data", staticmethod(lambda name: pytest.fail("parsed style.json")))
+    monkeypatch.setattr(ThemeManager, "current_theme_name", None)
+    monkeypatch.setattr(ThemeManager, "current_theme", None)
+    applied = []
+    monkeypatch.setattr(ThemeManager, "_apply_palette_values", staticmethod(applied.append))
+    monkeypatch.setattr(ThemeManager, "apply_code_block_style_to_all", staticmethod(applied.append))
+    monkeypatch.setattr("Styles.theme_manager.QApplication.instance", lambda: type("App", (), {"setStyleSheet": applied.append})())
+
+    ThemeManager.apply_theme("dark")
+    assert ThemeManager.current_theme == THEME
+    assert ThemeManager.get_color("BASE.primary_color") == "#2B2B2B"
+    assert applied[-1] == {}    # this theme has no CODE_BLOCK_STYLE section
@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+import pytest
+from log.tracer import Tracer
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+
+    @tracer.traced()
+    def work():
+        return 42
+
+    with tracer.span("outer"):
+        assert work() == 42
+    tracer.instant("marker")
+    assert tracer.events() == []
+
+def test_spans_and_decorator_are_recorded():
+    tracer = Tracer(enabled=True)
+
+    @tracer.traced("DataService.auto_generate_data")
+    def work():
+        return "ok"
+
+    with tracer.span("WorkerThread.run", model="gpt-4o") as s:
+        work()
+        s.set(blocks=2)
+
+    names = [event[0] for event in tracer.events()]
+    # Inner span finishes first
+    assert names == ["DataService.auto_generate_data", "WorkerThread.run"]
+    outer = tracer.events()[1]
+    assert outer[2] >= tracer.events()[0][2]
+    assert outer[5] == {"model": "gpt-4o", "blocks": 2}
+
+def test_span_marks_errors():
+    tracer = Tracer(enabled=True)
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError("bad")
+    assert tracer.events()[0][5]["error"] == "ValueError"
+
+def test_ring_buffer_is_bounded():
+    tracer = Tracer(enabled=True, capacity=10)
+    for i in range(25):
+        tracer.instant(f"event{i}")
+    events = tracer.events()
+    assert len(events) == 10
+    assert events[0][0] == "event15"
+
+def test_chrome_trace_export(temp_dir):
+    tracer = Tracer(enabled=True)
+
+    def run():
+        with tracer.span("worker"):
+            pass
+
+    worker = threading.Thread(target=run, name="Worker-1")
+    worker.start()
+    worker.join()
+    with tracer.span("main"):
+        pass
+
+    path = tracer.export_chrome_trace(os.path.join(temp_dir, "trace.json"))
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    complete = [e for e in document["traceEvents"] if e["ph"] == "X"]
+    assert {e["name"] for e in complete} == {"worker", "main"}
+    assert len({e["tid"] for e in complete}) == 2
+    metadata = [e for e in document["traceEvents"] if e["ph"] == "M"]
+    assert "Worker-1" in {e["args"]["name"] for e in metadata}
+
+def test_profiler_runs_once_when_armed(temp_dir):
+    tracer = Tracer(enabled=False)
+    tracer.arm_profiler(output_dir=temp_dir)
+    with tracer.profile("chat_request"):
+        sum(range(1000))
+    with tracer.profile("chat_request"):
+        sum(range(1000))
+    profiles = [name for name in os.listdir(temp_dir) if name.endswith(".prof")]
+    assert len(profiles) == 1
@@ -0,0 +1,150 @@
+import json
+import os
+import shutil
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+
+from modules.fast_whisper_v2.batch import BatchTranscriber, JobQueue, find_audio_files, format_timestamp
+
+class FakeModel:
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, path, **kwargs):
+        if self.fail_on and path.endswith(self.fail_on):
+            raise RuntimeError("corrupt audio")
+        with self._lock:
+            self.calls.append(os.path.basename(path))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        name = os.path.basename(path)
+        segments = iter([
+            SimpleNamespace(start=0.0, end=1.5, text=f" Hello from {name}."),
+            SimpleNamespace(start=1.5, end=3661.25, text=" Bye."),
+        ])
+        return segments, SimpleNamespace(language="en", duration=3661.25)
+
+@pytest.fixture
+def recordings(temp_dir):
+    folder = os.path.join(temp_dir, "meetings")
+    os.makedirs(os.path.join(folder, "week2"))
+    for name, content in [("a.wav", b"aaa"), ("b.mp3", b"bbb"), ("week2/c.m4a", b"ccc"), ("notes.txt", b"x")]:
+        with open(os.path.join(folder, name), "wb") as f:
+            f.write(content)
+    return folder
+
+@pytest.fixture
+def queue(temp_dir):
+    queue = JobQueue(os.path.join(temp_dir, "queue", "batch.db"))
+    yield queue
+    queue.close()
+
+def test_folders_are_expanded_to_audio_files(recordings):
+    files = find_audio_files([recordings])
+    assert [os.path.relpath(f, recordings) for f in files] == ["a.wav", "b.mp3", os.path.join("week2", "c.m4a")]
+    assert find_audio_files([os.path.join(recordings, "notes.txt")]) == [os.path.join(recordings, "notes.txt")]
+
+def test_results_are_written_next_to_each_file(recordings, queue):
+    assert queue.add(find_audio_files([recordings])) == 3
+    model = FakeModel(delay=0.05)
+    counts = BatchTranscriber(model, queue, workers=3).run()
+
+    assert counts == {"done": 3, "skipped": 0, "failed": 0}
+    assert model.peak > 1
+    with open(os.path.join(recordings, "a.wav.txt"), encoding="utf-8") as f:
+        assert f.read() == "Hello from a.wav.\nBye.\n"
+    with open(os.path.join(recordings, "a.wav.srt"), encoding="utf-8") as f:
+        assert f.read().startswith("1\n00:00:00,000 --> 00:00:01,500\nHello from a.wav.\n\n2\n")
+    with open(os.path.join(recordings, "week2", "c.m4a.json"), encoding="utf-8") as f:
+        assert json.load(f)["language"] == "en"
+    assert queue.counts() == {"done": 3}
+
+def test_sources_with_the_same_stem_keep_separate_outputs(recordings, queue):
+    with open(os.path.join(recordings, "a.mp3"), "wb") as f:
+        f.write(b"different audio")
+    queue.add([os.path.join(recordings, "a.wav"), os.path.join(recordings, "a.mp3")])
+    assert BatchTranscriber(FakeModel(), queue, formats=["txt"]).run()["done"] == 2
+
+    for name in ("a.wav", "a.mp3"):
+        with open(os.path.join(recordings, f"{name}.txt"), encoding="utf-8") as f:
+            assert f.read() == f"Hello from {name}.\nBye.\n"
+
+def test_already_transcribed_audio_is_skipped(recordings, queue):
+    files = find_audio_files([recordings])
+    queue.add(files)
+    BatchTranscriber(FakeModel(), queue, formats=["txt"]).run()
+
+    # The same files again, plus a copy of one under a new name
+    copy = os.path.join(recordings, "copy_of_a.wav")
+    shutil.copy(os.path.join(recordings, "a.wav"), copy)
+    queue.add(files + [copy])
+    model = FakeModel()
+    counts = BatchTranscriber(model, queue, formats=["txt"]).run()
+
+    assert counts == {"done": 0, "skipped": 4, "failed": 0}
+    assert model.calls == []
+    with open(os.path.join(recordings, "copy_of_a.wav.txt"), encoding="utf-8") as f:
+        assert "Hello from a.wav." in f.read()
+
+def test_cached_results_are_only_reused_with_the_same_settings(recordings, queue):
+    files = find_audio_files([recordings])
+    queue.add(files)
+    BatchTranscriber(FakeModel(), queue, formats=["txt"], model_name="tiny", compute_type="int8").run()
+
+    for settings in [
+        {"model_name": "small", "compute_type": "int8"},
+        {"model_name": "tiny", "compute_type": "float32"},
+        {"model_name": "tiny", "compute_type": "int8", "transcribe_options": {"language": "sv"}},
+    ]:
+        queue.add(files)
+        model = FakeModel()
+        counts = BatchTranscriber(model, queue, formats=["txt"], **settings).run()
+        assert counts == {"done": 3, "skipped": 0, "failed": 0}, settings
+        assert len(model.calls) == 3
+
+    queue.add(files)
+    counts = BatchTranscriber(FakeModel(), queue, formats=["txt"], model_name="small", compute_type="int8").run()
+    assert counts["skipped"] == 3
+
+def test_interrupted_batch_resumes(recordings, temp_dir):
+    db_path = os.path.join(temp_dir, "batch.db")
+    queue = JobQueue(db_path)
+    queue.add(find_audio_files([recordings]))
+    running = queue.claim()
+    queue.close()   # crash while the first file was being transcribed
+
+    queue = JobQueue(db_path)
+    assert queue.counts() == {"pending": 3}
+    model = FakeModel()
+    assert BatchTranscriber(model, queue, workers=1).run()["done"] == 3
+    assert model.calls[0] == os.path.basename(running)
+    queue.close()
+
+def test_failures_are_recorded_and_stop_keeps_jobs_queued(recordings, queue):
+    queue.add(find_audio_files([recordings]))
+    counts = BatchTranscriber(FakeModel(fail_on="b.mp3"), queue, workers=1).run()
+    assert counts["failed"] == 1
+    assert queue.failures() == [(os.path.join(recordings, "b.mp3"), "corrupt audio")]
+
+    queue.add(find_audio_files([recordings]))
+    running = threading.Event()
+    running.set()
+    batch = BatchTranscriber(FakeModel(), queue, workers=1, is_running=running.is_set,
+                             on_file_done=lambda path, status, error: running.clear())
+    counts = batch.run()
+    assert sum(counts.values()) == 1
+    assert queue.counts()["pending"] == 2
+
+def test_srt_timestamps():
+    assert format_timestamp(0) == "00:00:00,000"
+    assert format_timestamp(3661.2504) == "01:01:01,250"
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from modules.fast_whisper_v2.capture import SampleRingBuffer, StreamMixer, int_to_pcm, pcm_to_int
+
+CHUNK = 1024
+
+def pcm(values):
+    return np.asarray(values, dtype='<i2').tobytes()
+
+def samples(data):
+    return np.frombuffer(data, dtype='<i2')
+
+def test_single_stream_is_passed_through():
+    mixer = StreamMixer(1, 2)
+    data = pcm(range(CHUNK))
+    assert mixer.push(0, data) is data
+    assert mixer.flush() == b''
+
+def test_aligned_streams_are_summed_once_both_have_audio():
+    mixer = StreamMixer(2, 2, max_lag_frames=4 * CHUNK)
+    rng = np.random.default_rng(1)
+    mic, system = rng.integers(-1000, 1000, (2, 10 * CHUNK))
+    out = b''
+    for i in range(0, len(mic), CHUNK):
+        assert mixer.push(0, pcm(mic[i:i + CHUNK])) == b''
+        out += mixer.push(1, pcm(system[i:i + CHUNK]))
+    out += mixer.flush()
+    # Same length as one stream, not both appended after each other
+    np.testing.assert_array_equal(samples(out), mic + system)
+
+def test_mix_is_clipped_to_the_sample_range():
+    mixer = StreamMixer(2, 2)
+    mixer.push(0, pcm([30000, -30000, 100]))
+    np.testing.assert_array_equal(samples(mixer.push(1, pcm([10000, -10000, 100]))), [32767, -32768, 200])
+
+def test_stalled_stream_does_not_hold_back_the_other():
+    mixer = StreamMixer(2, 2, max_lag_frames=2 * CHUNK)
+    mixer.push(1, pcm(np.full(CHUNK, 5)))
+    out = b''
+    for _ in range(50):
+        out += mixer.push(0, pcm(np.full(CHUNK, 1)))
+    assert len(samples(out)) == 48 * CHUNK
+    assert samples(out)[0] == 6 and samples(out)[-1] == 1
+    assert all(ring.capacity == 4 * CHUNK for ring in mixer.rings)
+
+    # The stalled stream rejoins at the mix position instead of filling in the past
+    out = samples(mixer.push(1, pcm(np.full(CHUNK, 5))) + mixer.flush())
+    assert len(out) == 2 * CHUNK
+    assert set(out[:CHUNK]) == {6} and set(out[CHUNK:]) == {1}
+
+def test_stream_rejoins_the_mix_after_a_stall():
+    mixer = StreamMixer(2, 2, max_lag_frames=2 * CHUNK)
+    out = b''
+    for _ in range(10):
+        out += mixer.push(0, pcm(np.full(CHUNK, 1)))
+    stalled = len(samples(out))
+    for _ in range(80):
+        out += mixer.push(0, pcm(np.full(CHUNK, 1)))
+        out += mixer.push(1, pcm(np.full(CHUNK, 5)))
+    out = samples(out + mixer.flush())
+
+    assert len(out) == 90 * CHUNK
+    # Stream 1 is heard again from the mix position onwards
+    resumed = out[stalled:]
+    assert np.count_nonzero(resumed == 6) >= 79 * CHUNK
+
+def test_stereo_lag_stays_frame_aligned():
+    mixer = StreamMixer(2, 2, channels=2, max_lag_frames=3)
+    out = mixer.push(0, pcm(range(16)))
+    assert len(samples(out)) == 16 - 6
+
+def test_24_bit_round_trip():
+    values = np.array([0, 1, -1, (1 << 23) - 1, -(1 << 23)], dtype=np.int32)
+    data = int_to_pcm(values, 3)
+    assert len(data) == 15
+    np.testing.assert_array_equal(pcm_to_int(data, 3), values)
+
+def test_sample_ring_reads_across_the_wrap():
+    ring = SampleRingBuffer(5)
+    ring.write(np.arange(4))
+    ring.write(np.arange(4, 7))
+    np.testing.assert_array_equal(ring.read(ring.oldest), [2, 3, 4, 5, 6])
+    with pytest.raises(ValueError):
+        ring.read(1, 3)
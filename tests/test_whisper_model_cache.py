@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+import pytest
+
+pytest.importorskip("faster_whisper")
+
+from modules.fast_whisper_v2 import model_cache
+from modules.fast_whisper_v2.model_cache import ModelCache
+
+class FakeModel:
+    created = []
+    speed = {"int8": 0.01, "int8_float32": 0.02, "float32": 0.04}
+
+    def __init__(self, path, device, compute_type):
+        self.path = path
+        self.compute_type = compute_type
+        FakeModel.created.append((os.path.basename(path), compute_type))
+
+    def transcribe(self, audio, **kwargs):
+        time.sleep(self.speed.get(self.compute_type, 0.01))
+        return iter([]), None
+
+@pytest.fixture
+def make_cache(temp_dir, monkeypatch):
+    FakeModel.created = []
+    downloads = []
+    monkeypatch.setattr(model_cache.ctranslate2, "get_supported_compute_types",
+                        lambda device: {"int8", "int8_float32", "float32"})
+
+    def download(name):
+        downloads.append(name)
+        path = os.path.join(temp_dir, "models", name)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "model.bin"), "wb") as f:
+            f.truncate({"tiny": 2, "base": 4, "small": 8}[name] * 2**20)
+        return path
+
+    def make(max_mb=3000):
+        settings = {"cache_dir": os.path.join(temp_dir, "cache"), "model_cache_max_mb": max_mb}
+        return ModelCache(settings, model_factory=FakeModel, download=download)
+
+    make.downloads = downloads
+    return make
+
+def test_auto_compute_type_is_benchmarked_once_per_machine(make_cache):
+    cache = make_cache()
+    model = cache.get_model("tiny", "cpu", "auto")
+    assert model.compute_type == "int8"
+    assert [ct for _, ct in FakeModel.created] == ["int8", "int8_float32", "float32", "int8"]
+
+    # A new session reads the choice and the model path from disk
+    FakeModel.created = []
+    restarted = make_cache()
+    assert restarted.get_model("tiny", "cpu", "auto").compute_type == "int8"
+    assert FakeModel.created == [("tiny", "int8")]
+    assert make_cache.downloads == ["tiny"]
+
+def test_switching_back_to_a_warm_model_is_instant(make_cache):
+    cache = make_cache()
+    tiny = cache.get_model("tiny", "cpu", "float32")
+    cache.get_model("base", "cpu", "float32")
+    assert cache.peek("tiny", "cpu", "float32") is tiny
+    assert cache.get_model("tiny", "cpu", "float32") is tiny
+    assert len(FakeModel.created) == 2
+    assert cache.peek("small", "cpu", "float32") is None
+    assert cache.peek("tiny", "cpu", "auto") is None    # not benchmarked yet
+
+def test_least_recently_used_models_are_evicted_over_budget(make_cache):
+    cache = make_cache(max_mb=19)   # float32 doubles the float16 file size
+    cache.get_model("tiny", "cpu", "float32")      # 4 MB
+    cache.get_model("base", "cpu", "float32")      # 8 MB
+    cache.get_model("tiny", "cpu", "float32")      # tiny is now the most recent
+    cache.get_model("small", "cpu", "float32")     # 16 MB: base goes, then tiny
+    assert list(cache.models) == ["small_cpu_float32"]
+    assert cache.memory_mb() == pytest.approx(16)
+
+    # A model larger than the budget is still kept while it is in use
+    cache.max_memory_mb = 1
+    cache.get_model("base", "cpu", "float32")
+    assert list(cache.models) == ["base_cpu_float32"]
+
+def test_concurrent_requests_share_one_load(make_cache):
+    cache = make_cache()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_model("base", "cpu", "int8")))
+               for _ in range(4)]
+    threads.append(cache.preload("base", "cpu", "int8"))
+    for thread in threads[:4]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(model) for model in results}) == 1
+    assert FakeModel.created == [("base", "int8")]
+
+def test_failed_load_can_be_retried(make_cache):
+    cache = make_cache()
+    failures = [RuntimeError("out of memory")]
+
+    def flaky_factory(path, device, compute_type):
+        if failures:
+            raise failures.pop()
+        return FakeModel(path, device, compute_type)
+
+    cache.model_factory = flaky_factory
+    with pytest.raises(RuntimeError):
+        cache.get_model("tiny", "cpu", "int8")
+    assert cache._loading == {}
+
+    model = cache.get_model("tiny", "cpu", "int8")
+    assert cache.get_model("tiny", "cpu", "int8") is model
+    assert cache._loading == {}
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from modules.fast_whisper_v2.streaming import AudioRingBuffer, UtteranceSegmenter, pcm_to_float32, resample
+
+RATE = 16000
+CHUNK = 1024
+
+def tone(seconds, amplitude=0.3, rate=RATE):
+    t = np.arange(int(seconds * rate)) / rate
+    return (amplitude * np.sin(2 * np.pi * 220 * t) * 32767).astype('<i2').tobytes()
+
+def silence(seconds, rate=RATE):
+    noise = np.random.default_rng(0).normal(0, 30, int(seconds * rate))
+    return noise.astype('<i2').tobytes()
+
+def feed_in_chunks(segmenter, audio):
+    utterances, fed = [], []
+    for i in range(0, len(audio), CHUNK * 2):
+        finished = segmenter.feed(audio[i:i + CHUNK * 2])
+        utterances.extend(finished)
+        fed.append(len(finished))
+    return utterances, fed
+
+def test_ring_buffer_wraps_and_reads_by_position():
+    ring = AudioRingBuffer(8)
+    ring.write(b"abcdef")
+    ring.write(b"ghij")
+    assert ring.position == 10
+    assert ring.oldest == 2
+    assert ring.read(2) == b"cdefghij"
+    assert ring.read(5, 9) == b"fghi"
+    with pytest.raises(ValueError):
+        ring.read(1)
+    ring.write(b"0123456789ABC")
+    assert ring.read(ring.oldest) == b"56789ABC"
+
+def test_utterances_are_cut_on_silence_while_streaming():
+    segmenter = UtteranceSegmenter(RATE, 2, silence_ms=600, preroll_ms=300)
+    audio = silence(1) + tone(2) + silence(1) + tone(1.5) + silence(0.2)
+    utterances, fed = feed_in_chunks(segmenter, audio)
+
+    # The first utterance is ready ~600ms after speech stops, before the stream ends
+    assert len(utterances) == 1
+    first_ready = next(i for i, n in enumerate(fed) if n)
+    assert (first_ready + 1) * CHUNK / RATE < 3.7
+    assert 2.0 <= len(utterances[0]) / RATE <= 2.7
+
+    utterances += segmenter.flush()
+    assert len(utterances) == 2
+    assert 1.5 <= len(utterances[1]) / RATE <= 2.1
+    assert all(u.dtype == np.float32 for u in utterances)
+    assert segmenter.flush() == []
+
+def test_clicks_and_noise_are_ignored():
+    segmenter = UtteranceSegmenter(RATE, 2)
+    utterances, _ = feed_in_chunks(segmenter, silence(1) + tone(0.1) + silence(1))
+    assert utterances + segmenter.flush() == []
+
+def test_long_speech_is_cut_at_the_maximum_length():
+    segmenter = UtteranceSegmenter(RATE, 2, max_utterance_s=2)
+    utterances, _ = feed_in_chunks(segmenter, tone(5))
+    utterances += segmenter.flush()
+    assert len(utterances) == 3
+    assert sum(len(u) for u in utterances) == pytest.approx(5 * RATE, abs=CHUNK)
+
+def test_pcm_conversion_and_resampling():
+    samples = np.array([0, 16384, -32768], dtype='<i2').tobytes()
+    np.testing.assert_allclose(pcm_to_float32(samples, 2), [0.0, 0.5, -1.0])
+
+    packed = bytes([0x00, 0x00, 0x40, 0x00, 0x00, 0x80])   # +0.5, -1.0 in 24-bit
+    np.testing.assert_allclose(pcm_to_float32(packed, 3), [0.5, -1.0])
+
+    stereo = np.array([1000, 3000, -2000, 0], dtype='<i2').tobytes()
+    np.testing.assert_allclose(pcm_to_float32(stereo, 2, channels=2) * 32768, [2000, -1000])
+
+    assert len(resample(np.zeros(44100, dtype=np.float32), 44100)) == RATE
@@ -0,0 +1,60 @@
+import pytest
+from PySide6.QtWidgets import QApplication, QFrame, QLabel, QTextBrowser, QTextEdit, QVBoxLayout, QWidget
+
+from Styles import theme_manager
+from Styles.theme_manager import ThemeManager
+
+THEME = {
+    "TYPOGRAPHY": {"font_family": "Arial", "body_font_size": "14px"},
+    "CODE_BLOCK_STYLE": {"background_color": "#1E1E1E", "keyword_color": "#569CD6"},
+}
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def styled(app, monkeypatch):
+    """Widgets passed to apply_code_block_style, in call order."""
+    calls = []
+    monkeypatch.setattr(theme_manager, "apply_code_block_style", lambda widget, styles: calls.append((widget, styles)))
+    monkeypatch.setattr(ThemeManager, "current_theme", THEME)
+    monkeypatch.setattr(ThemeManager, "text_widgets", type(ThemeManager.text_widgets)())
+    return calls
+
+def build_tree(depth=4):
+    """Nested frames, each holding a label, a text edit and the next level."""
+    root = QWidget()
+    parent, text_widgets, all_widgets = root, [], [root]
+    for level in range(depth):
+        frame = QFrame(parent)
+        QVBoxLayout(frame)
+        label = QLabel(f"level {level}", frame)
+        text = (QTextEdit if level % 2 else QTextBrowser)(frame)
+        frame.layout().addWidget(label)
+        frame.layout().addWidget(text)
+        text_widgets.append(text)
+        all_widgets += [frame, label, text]
+        parent = frame
+    return root, text_widgets, all_widgets
+
+def test_every_text_widget_is_styled_exactly_once(styled):
+    root, text_widgets, all_widgets = build_tree()
+    ThemeManager.apply_widget_theme(root, "dark")
+
+    assert sorted(map(id, (widget for widget, _ in styled))) == sorted(map(id, text_widgets))
+    assert all(styles == THEME["CODE_BLOCK_STYLE"] for _, styles in styled)
+    # Fonts come from the application stylesheet, not from per-widget stylesheets
+    assert all(widget.styleSheet() == "" for widget in all_widgets)
+    assert "QWidget {\n    font-family: Arial;\n    font-size: 14px;" in ThemeManager.construct_qss(THEME)
+
+def test_repeat_passes_only_style_new_text_widgets(styled):
+    root, text_widgets, _ = build_tree()
+    ThemeManager.apply_widget_theme(root, "dark")
+    ThemeManager.apply_widget_theme(text_widgets[0].parentWidget(), "dark")
+    assert len(styled) == len(text_widgets)
+
+    added = QTextEdit(text_widgets[-1].parentWidget())
+    ThemeManager.apply_widget_theme(root, "dark")
+    assert len(styled) == len(text_widgets) + 1
+    assert styled[-1][0] is added